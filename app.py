@@ -1,9 +1,19 @@
-import os
+import csv
+import io
+import time
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, url_for, g, Response, stream_with_context
 
-from src.mlops_water_potability_prediction_project.components.frontend import FrontendPrediction
+from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.classes.metrics import REGISTRY
+from src.mlops_water_potability_prediction_project.classes.prediction_cache import create_prediction_cache
+from src.mlops_water_potability_prediction_project.components.frontend import FrontendPrediction, STAGE_SECONDS
+from src.mlops_water_potability_prediction_project.components.stream_scoring import StreamingScorer, InvalidCSVHeader
+from src.mlops_water_potability_prediction_project.components.warmup import ServingWarmup
+from src.mlops_water_potability_prediction_project.components.training_jobs import TrainingJobManager, \
+    TrainingAlreadyRunning
 from src.mlops_water_potability_prediction_project.config.configuration import ConfigurationManager
+from src.mlops_water_potability_prediction_project.utilities.helpers import promote_file
 
 # Assuming 'data' is a dictionary containing input values
 SAMPLE_DATA = {
@@ -27,6 +37,109 @@ templates_dir = frontend_config.template_dir
 
 app = Flask(__name__, static_folder=static_dir, template_folder=templates_dir)
 
+# The predictor shares a process-wide artifact cache, so the model, scaler and schema are loaded only once
+prediction_cache = create_prediction_cache(config.get_prediction_cache_config())
+frontend_predictor = FrontendPrediction(config=frontend_config, prediction_cache=prediction_cache)
+streaming_scorer = StreamingScorer(config=config.get_streaming_config(), frontend_predictor=frontend_predictor)
+
+# Artifacts are loaded and the inference path primed in the background; /ready reports when it is done
+warmup = ServingWarmup(config=config.get_warmup_config(), frontend_predictor=frontend_predictor)
+warmup.start()
+
+
+def swap_in_new_model():
+    """
+    Promotes the newly trained inference bundle, loads it and warms it up before requests reach it.
+    """
+    promote_file(frontend_config.staged_inference_bundle, frontend_config.inference_bundle)
+    frontend_predictor.artifact_cache.reload()
+    if warmup.is_ready():
+        warmup.prime()
+    else:
+        warmup.run()
+
+
+# Training runs in a background process; the new model is swapped in once a run succeeds. The job states
+# and the one-job-at-a-time lock live in the jobs directory, shared by all workers of the pre-fork server
+training_jobs = TrainingJobManager(config=config.get_training_jobs_config(), on_success=swap_in_new_model)
+
+# Metrics are kept per process: under the pre-fork server every worker exposes its own
+REQUEST_SECONDS = REGISTRY.histogram("water_potability_http_request_seconds",
+                                     "Latency of the route handlers, in seconds.", labelnames=("route", "method"))
+REQUESTS = REGISTRY.counter("water_potability_http_requests_total",
+                            "Handled requests by route, method and status code.",
+                            labelnames=("route", "method", "status"))
+REGISTRY.callback("water_potability_artifact_cache_reloads_total",
+                  "Number of times the inference bundle was loaded from disk.", "counter",
+                  lambda: frontend_predictor.artifact_cache.reloads)
+if prediction_cache is not None:
+    REGISTRY.callback("water_potability_prediction_cache_events_total",
+                      "Prediction cache lookups and evictions by outcome.", "counter",
+                      lambda: {(event,): prediction_cache.stats()[event]
+                               for event in ("hits", "misses", "evictions", "invalidations")},
+                      labelnames=("event",))
+
+
+@app.before_request
+def start_timer():
+    """
+    Records the start time of the request.
+    """
+    g.request_start = time.perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response):
+    """
+    Records the latency and the status code of the request.
+
+    Parameters:
+    - response (Response): The response about to be sent.
+
+    Returns:
+    - Response: The unchanged response.
+    """
+    start = g.get("request_start")
+    if start is not None:
+        # The URL rule, not the raw path, so job ids do not create a label value per request
+        route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        REQUEST_SECONDS.observe((route, request.method), time.perf_counter() - start)
+        REQUESTS.inc((route, request.method, str(response.status_code)))
+    return response
+
+
+@app.route('/live', methods=['GET'])
+def live():
+    """
+    Handles liveness probes. Does not touch the artifacts or the model.
+
+    Returns:
+    - Response: JSON with status "alive".
+    """
+    return jsonify({"status": "alive"})
+
+
+@app.route('/ready', methods=['GET'])
+def ready():
+    """
+    Handles readiness probes.
+
+    Returns:
+    - Response: JSON with the warm-up status, 200 once warm-up has finished and 503 before (or if it failed).
+    """
+    return jsonify(warmup.status()), 200 if warmup.is_ready() else 503
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """
+    Handles requests for the serving metrics.
+
+    Returns:
+    - Response: The metrics in the Prometheus text exposition format.
+    """
+    return REGISTRY.render(), 200, {"Content-Type": REGISTRY.CONTENT_TYPE}
+
 
 @app.route('/', methods=['GET', 'POST'])
 def index():
@@ -46,30 +159,123 @@ def index():
         try:
             if request.form:
                 data_req = dict(request.form)
-                frontend_predictor = FrontendPrediction(config=frontend_config)
                 response = frontend_predictor.form_response(data_req)
-                print(response)
-                return render_template('index.html', response=response)
+                start = time.perf_counter()
+                page = render_template('index.html', response=response)
+                STAGE_SECONDS.observe(("render_template", "single"), time.perf_counter() - start)
+                return page
         except Exception as e:
-            print(e)
+            logger.warning(f"Prediction failed: {type(e).__name__}: {e}")
             error_message = {"error": e}
             return render_template('error.html', error=error_message)
     else:
         return render_template('index.html')
 
 
-@app.route('/train', methods=['GET'])
+@app.route('/predict/batch', methods=['POST'])
+def predict_batch():
+    """
+    Handles batch prediction requests.
+
+    Accepts either a JSON body (a list of records, or an object with a "records" list) or a
+    CSV body (Content-Type: text/csv) with a header row of feature names. All rows are
+    validated, scaled and predicted together.
+
+    Returns:
+    - Response: JSON with one result per row, holding either the prediction or the validation errors.
+    """
+    try:
+        if request.mimetype == 'text/csv':
+            records = list(csv.DictReader(io.StringIO(request.get_data(as_text=True))))
+        else:
+            payload = request.get_json(force=True)
+            records = payload.get("records") if isinstance(payload, dict) else payload
+    except Exception as e:
+        return jsonify({"error": f"Could not parse the request body: {e}"}), 400
+    if not isinstance(records, list):
+        return jsonify({"error": "Expected a list of records"}), 400
+
+    try:
+        results = frontend_predictor.batch_response(records)
+        n_errors = sum(1 for result in results if "errors" in result)
+        return jsonify({"n_rows": len(results), "n_errors": n_errors, "results": results})
+    except Exception as e:
+        logger.exception(e)
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route('/predict/stream', methods=['POST'])
+def predict_stream():
+    """
+    Handles streaming scoring of large CSV uploads.
+
+    Accepts a CSV in the schema.yaml column layout, either as the raw request body (Content-Type:
+    text/csv) or as the "file" field of a multipart upload. The rows are parsed, validated and
+    predicted in chunks while the results stream back, so memory stays bounded whatever the file size.
+    The response format is chosen with ?format=csv (default) or ?format=ndjson.
+
+    Returns:
+    - Response: A chunked CSV or NDJSON response with one result per row, or 400 for a bad upload.
+    """
+    output_format = request.args.get("format", "csv")
+    if output_format not in StreamingScorer.OUTPUT_FORMATS:
+        return jsonify({"error": f"Unknown format: {output_format}, expected one of "
+                                 f"{', '.join(StreamingScorer.OUTPUT_FORMATS)}"}), 400
+
+    if request.mimetype == 'multipart/form-data':
+        upload = request.files.get("file")
+        if upload is None:
+            return jsonify({"error": "Expected the CSV in a 'file' field"}), 400
+        binary_stream = upload.stream
+    else:
+        binary_stream = request.stream
+
+    # Score the whole upload with one snapshot, even if the model is reloaded meanwhile
+    artifacts = frontend_predictor.artifact_cache.get()
+    try:
+        header, reader = streaming_scorer.open_csv(binary_stream, artifacts)
+    except InvalidCSVHeader as e:
+        return jsonify({"error": e.message}), 400
+    except (csv.Error, UnicodeDecodeError) as e:
+        return jsonify({"error": f"Could not parse the CSV upload: {e}"}), 400
+
+    results = streaming_scorer.stream(header, reader, artifacts, output_format)
+    mimetype = "text/csv" if output_format == "csv" else "application/x-ndjson"
+    return Response(stream_with_context(results), mimetype=mimetype)
+
+
+@app.route('/train', methods=['POST'])
 def train_model():
     """
     Handles requests to trigger the model training process.
 
-    Executes the 'main.py' script to train the machine learning model.
+    Starts the 'main.py' pipeline stages in a background worker process and returns immediately.
+    Only one training job can run at a time, across all server processes.
+
+    Returns:
+    - Response: JSON with the job id and status URL (202), or the running job id (409).
+    """
+    try:
+        job = training_jobs.start()
+    except TrainingAlreadyRunning as e:
+        return jsonify({"error": e.message, "job_id": e.job_id,
+                        "status_url": url_for('train_status', job_id=e.job_id)}), 409
+    return jsonify({"job_id": job["job_id"], "status": job["status"],
+                    "status_url": url_for('train_status', job_id=job["job_id"])}), 202
+
+
+@app.route('/train/<job_id>', methods=['GET'])
+def train_status(job_id):
+    """
+    Handles requests for the status of a training job.
 
     Returns:
-    - str: A message indicating the success of the training process.
+    - Response: JSON with the job status, per-stage progress and timings, or 404 if the job does not exist.
     """
-    os.system("python main.py")
-    return "Training Successful!"
+    job = training_jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": f"Unknown training job: {job_id}"}), 404
+    return jsonify(job)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,163 @@
+"""
+Async serving mode with micro-batching.
+
+Concurrent requests are coalesced by the MicroBatcher into vectorized scale+predict calls.
+Run with any ASGI server, e.g.:
+    uvicorn asgi:app --host 0.0.0.0 --port 8000
+"""
+import json
+
+from src.mlops_water_potability_prediction_project.classes.metrics import REGISTRY
+from src.mlops_water_potability_prediction_project.classes.prediction_cache import create_prediction_cache
+from src.mlops_water_potability_prediction_project.components.frontend import FrontendPrediction
+from src.mlops_water_potability_prediction_project.components.warmup import ServingWarmup
+from src.mlops_water_potability_prediction_project.components.micro_batching import MicroBatcher, \
+    InferenceQueueFull
+from src.mlops_water_potability_prediction_project.config.configuration import ConfigurationManager
+
+# Create a configuration manager instance
+config = ConfigurationManager()
+frontend_config = config.get_frontend_config()
+micro_batching_config = config.get_micro_batching_config()
+
+prediction_cache = create_prediction_cache(config.get_prediction_cache_config())
+frontend_predictor = FrontendPrediction(config=frontend_config, prediction_cache=prediction_cache)
+batcher = MicroBatcher(config=micro_batching_config, predict_fn=frontend_predictor.batch_response)
+warmup = ServingWarmup(config=config.get_warmup_config(), frontend_predictor=frontend_predictor)
+
+REGISTRY.callback("water_potability_artifact_cache_reloads_total",
+                  "Number of times the inference bundle was loaded from disk.", "counter",
+                  lambda: frontend_predictor.artifact_cache.reloads)
+
+
+async def read_body(receive):
+    """
+    Reads the full request body.
+
+    Parameters:
+    - receive (callable): The ASGI receive channel.
+
+    Returns:
+    - bytes: The request body.
+    """
+    body = b""
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get("body", b"")
+        more_body = message.get("more_body", False)
+    return body
+
+
+async def send_json(send, status, payload):
+    """
+    Sends a JSON response.
+
+    Parameters:
+    - send (callable): The ASGI send channel.
+    - status (int): The HTTP status code.
+    - payload: The JSON-serializable response body.
+    """
+    body = json.dumps(payload).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def lifespan(receive, send):
+    """
+    Starts the micro-batching worker and the warm-up on startup and stops the worker on shutdown.
+
+    Parameters:
+    - receive (callable): The ASGI receive channel.
+    - send (callable): The ASGI send channel.
+    """
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            batcher.start()
+            warmup.start()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await batcher.stop()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    """
+    The ASGI application.
+
+    Routes:
+    - POST /predict: Scores a single JSON record.
+    - POST /predict/batch: Scores a JSON list of records (or an object with a "records" list).
+    - GET /metrics: Returns the serving metrics in the Prometheus text format.
+    - GET /live: Liveness probe, does not touch the model.
+    - GET /ready: Readiness probe, 200 once warm-up has finished and 503 before.
+
+    Parameters:
+    - scope (dict): The ASGI connection scope.
+    - receive (callable): The ASGI receive channel.
+    - send (callable): The ASGI send channel.
+    """
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+        return
+
+    path, method = scope["path"], scope["method"]
+    if path == "/live" and method == "GET":
+        await send_json(send, 200, {"status": "alive"})
+        return
+    if path == "/ready" and method == "GET":
+        await send_json(send, 200 if warmup.is_ready() else 503, warmup.status())
+        return
+    if path == "/metrics" and method == "GET":
+        body = REGISTRY.render().encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", REGISTRY.CONTENT_TYPE.encode()), (b"content-length", str(len(body)).encode())]
+        })
+        await send({"type": "http.response.body", "body": body})
+        return
+    if path not in ("/predict", "/predict/batch"):
+        await send_json(send, 404, {"error": "Not found"})
+        return
+    if method != "POST":
+        await send_json(send, 405, {"error": "Method not allowed"})
+        return
+
+    try:
+        payload = json.loads(await read_body(receive))
+    except ValueError as e:
+        await send_json(send, 400, {"error": f"Could not parse the request body: {e}"})
+        return
+
+    if path == "/predict":
+        records = [payload]
+    else:
+        records = payload.get("records") if isinstance(payload, dict) else payload
+        if not isinstance(records, list):
+            await send_json(send, 400, {"error": "Expected a list of records"})
+            return
+
+    try:
+        results = await batcher.submit(records)
+    except InferenceQueueFull as e:
+        await send_json(send, 503, {"error": e.message})
+        return
+    except Exception as e:
+        await send_json(send, 500, {"error": str(e)})
+        return
+
+    # Row numbers refer to the coalesced batch, renumber them for this request
+    results = [{**result, "row": row} for row, result in enumerate(results)]
+    if path == "/predict":
+        result = results[0]
+        await send_json(send, 422 if "errors" in result else 200, result)
+    else:
+        n_errors = sum(1 for result in results if "errors" in result)
+        await send_json(send, 200, {"n_rows": len(results), "n_errors": n_errors, "results": results})
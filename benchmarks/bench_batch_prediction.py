@@ -0,0 +1,33 @@
+"""
+Benchmark the batch prediction path against the single-row form path.
+
+Usage (from the repository root, after running main.py):
+    python -m benchmarks.bench_batch_prediction
+"""
+from benchmarks.common import best_time, load_frontend_config, load_schema, synthetic_records
+from src.mlops_water_potability_prediction_project.components.frontend import FrontendPrediction
+
+BATCH_SIZES = [1, 100, 10_000, 100_000]
+SINGLE_ROW_LIMIT = 1_000
+
+
+def main():
+    config = load_frontend_config()
+    predictor = FrontendPrediction(config=config)
+    schema = load_schema(config.dataset_schema)
+    predictor.artifact_cache.get()
+
+    print(f"{'batch size':>12} {'batch rows/s':>14} {'single-row rows/s':>18}")
+    for batch_size in BATCH_SIZES:
+        records = synthetic_records(schema, batch_size, target_column=config.target_column)
+        batch_seconds = best_time(lambda: predictor.batch_response(records))
+
+        # The single-row path is timed on a bounded sample to keep the benchmark short
+        sample = records[:SINGLE_ROW_LIMIT]
+        single_seconds = best_time(lambda: [predictor.form_response(record) for record in sample], repeat=1)
+
+        print(f"{batch_size:>12} {batch_size / batch_seconds:>14.0f} {len(sample) / single_seconds:>18.0f}")
+
+
+if __name__ == '__main__':
+    main()
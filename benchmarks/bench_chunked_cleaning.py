@@ -0,0 +1,84 @@
+"""
+Benchmark the chunked (out-of-core) data cleaning against cleaning the whole dataset in memory.
+
+A zipped water potability like CSV with about 5% missing values per column is cleaned in memory
+and in chunks of several sizes, with a CSV and a feather clean dataset. Every run is a fresh
+process, so its peak RSS (which includes the interpreter and the imported libraries) is the peak
+of that cleaning alone. The clean datasets and the dataset schemas of the chunked runs are
+checked to be identical (byte for byte for CSV) to the in-memory ones.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_chunked_cleaning --rows 2000000 --chunk-sizes 10000 100000 1000000
+"""
+import argparse
+import filecmp
+import os
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from src.mlops_water_potability_prediction_project.classes.dataloadersaver import dataset_loader_saver
+from src.mlops_water_potability_prediction_project.components.data_cleaning import DataCleaning
+from src.mlops_water_potability_prediction_project.config.configuration import ConfigurationManager
+from src.mlops_water_potability_prediction_project.entity.config_entity import DataCleaningConfig
+from tests.dataset_source import make_archive
+
+
+def clean(config):
+    """
+    Cleans the dataset, in the process the benchmark runs it in.
+
+    Returns:
+    - tuple: The wall time in seconds and the peak RSS of the process in MB.
+    """
+    start = time.perf_counter()
+    DataCleaning(config).clean_data()
+    wall = time.perf_counter() - start
+    return wall, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--formats", nargs="+", default=["csv", "feather"])
+    args = parser.parse_args()
+
+    schema = dict(ConfigurationManager().schema.COLUMNS)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        raw_path = os.path.join(tmp_dir, "water_potability_dataset.zip")
+        with open(raw_path, 'wb') as f:
+            f.write(make_archive(args.rows, seed=1))
+        print(f"Raw data: {os.path.getsize(raw_path) / 1e6:.1f} MB zipped ({args.rows} rows)")
+        print(f"{'format':>8} {'chunk size':>11} {'wall s':>8} {'peak RSS MB':>12} {'identical':>10}")
+
+        for dataset_format in args.formats:
+            outputs = {}
+            for chunk_size in [None] + args.chunk_sizes:
+                root_dir = os.path.join(tmp_dir, f"{dataset_format}_{chunk_size}")
+                os.makedirs(root_dir)
+                config = DataCleaningConfig(
+                    root_dir=root_dir, unclean_data_path=raw_path,
+                    clean_data_path=os.path.join(root_dir, f"water_potability_dataset.{dataset_format}"),
+                    watermark_file=os.path.join(root_dir, "watermark.json"), incremental=False,
+                    chunk_size=chunk_size, data_schema=schema, dataset_format=dataset_format)
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+                    wall, peak_rss = pool.submit(clean, config).result()
+                outputs[chunk_size] = config
+
+                reference = outputs[None]
+                if dataset_format == "csv":
+                    identical = filecmp.cmp(reference.clean_data_path, config.clean_data_path, shallow=False)
+                else:
+                    loader = dataset_loader_saver(config.clean_data_path)
+                    identical = loader.load(reference.clean_data_path).equals(loader.load(config.clean_data_path))
+                identical = identical and filecmp.cmp(os.path.join(reference.root_dir, "dataset_schema.json"),
+                                                      os.path.join(root_dir, "dataset_schema.json"), shallow=False)
+                print(f"{dataset_format:>8} {str(chunk_size or 'in memory'):>11} {wall:>8.2f} {peak_rss:>12.1f} "
+                      f"{str(identical):>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark the cold start of the serving process, from interpreter start to the first served prediction.
+
+Every run starts a fresh interpreter with `-X importtime`, imports app.py, serves one form
+prediction through the Flask test client and reports:
+- the wall time to import app.py and to the first prediction;
+- the heaviest imports by cumulative time (from the -X importtime log);
+- whether the training-only libraries (pandas, mlflow, sklearn, catboost) were imported at all.
+
+Usage (from the repository root, after running main.py):
+    python -m benchmarks.bench_cold_start --runs 5
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ["pandas", "mlflow", "sklearn", "catboost", "dagshub", "matplotlib"]
+
+CHILD_SCRIPT = f"""
+import json, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+response = app.app.test_client().post('/', data=app.SAMPLE_DATA)
+assert response.status_code == 200
+served = time.perf_counter()
+print(json.dumps({{
+    "import_s": imported - start,
+    "first_prediction_s": served - start,
+    "heavy_modules": [name for name in {HEAVY_MODULES!r} if name in sys.modules],
+}}))
+"""
+
+
+def parse_importtime(log, top):
+    """
+    Extracts the heaviest top-level imports from a -X importtime log.
+
+    Parameters:
+    - log (str): The stderr of the child process.
+    - top (int): The number of imports to return.
+
+    Returns:
+    - list: (module, cumulative seconds) pairs, heaviest first.
+    """
+    imports = []
+    for line in log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        # Nesting is shown by extra indentation, nested imports are included in their parent's cumulative time
+        if not name[1:].startswith(" "):
+            imports.append((name.strip(), int(cumulative_us) / 1e6))
+    return sorted(imports, key=lambda item: item[1], reverse=True)[:top]
+
+
+def run_once():
+    """
+    Runs one cold start in a fresh interpreter.
+
+    Returns:
+    - tuple: The measurements reported by the child and its -X importtime log.
+    """
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", CHILD_SCRIPT],
+                               capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1]), completed.stderr
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    # The first run warms the OS page cache, it is reported separately
+    results = [run_once() for _ in range(args.runs + 1)]
+    first, _ = results[0]
+    warm = [measurements for measurements, _ in results[1:]]
+
+    print(f"first run:    import app {first['import_s'] * 1000:.0f} ms, "
+          f"first prediction {first['first_prediction_s'] * 1000:.0f} ms")
+    print(f"median of {args.runs}: import app {statistics.median(m['import_s'] for m in warm) * 1000:.0f} ms, "
+          f"first prediction {statistics.median(m['first_prediction_s'] for m in warm) * 1000:.0f} ms")
+    print(f"heavy modules loaded: {', '.join(warm[-1]['heavy_modules']) or 'none'}")
+
+    print(f"\n{'top-level import':<50} {'cumulative ms':>14}")
+    for name, seconds in parse_importtime(results[-1][1], args.top):
+        print(f"{name:<50} {seconds * 1000:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark the intermediate dataset formats (csv, parquet, feather, npy) against each other.
+
+A scaled training set like the one the transformation stage writes (nine float64 features and the
+target) is saved and loaded with every DataLoaderSaver and the following are reported:
+- the write time, the read time and the file size;
+- the time to sum every column after the read, which includes paging in a memory-mapped file;
+- whether the loaded data matches the saved data exactly (float64 text round-trips may not).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_dataset_formats --rows 100000 1000000 10000000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.mlops_water_potability_prediction_project.classes.dataloadersaver import DATASET_FORMATS, \
+    dataset_loader_saver
+from src.mlops_water_potability_prediction_project.config.configuration import ConfigurationManager
+
+
+def make_dataset(n_rows, seed=42):
+    """
+    Builds a dataset shaped like the scaled training set, in schema.yaml column order.
+
+    Parameters:
+    - n_rows (int): The number of rows.
+    - seed (int): The random seed.
+
+    Returns:
+    - pd.DataFrame: Standard normal features and a 0/1 target, all float64.
+    """
+    manager = ConfigurationManager()
+    target_column = manager.schema.TARGET_COLUMN.name
+    features = [col for col in manager.schema.COLUMNS if col != target_column]
+    rng = np.random.default_rng(seed)
+    dataframe = pd.DataFrame(rng.standard_normal((n_rows, len(features))), columns=features)
+    dataframe[target_column] = rng.integers(0, 2, n_rows).astype("float64")
+    return dataframe
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--formats", nargs="+", default=[suffix.lstrip(".") for suffix in DATASET_FORMATS])
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'format':>8} {'write s':>8} {'read s':>8} {'read+scan s':>12} {'size MB':>8} "
+          f"{'exact':>6}")
+    for n_rows in args.rows:
+        dataframe = make_dataset(n_rows)
+        for dataset_format in args.formats:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                file_path = os.path.join(tmp_dir, f"train_set.{dataset_format}")
+                loader_saver = dataset_loader_saver(file_path)
+
+                start = time.perf_counter()
+                loader_saver.save(file_path, dataframe)
+                write_s = time.perf_counter() - start
+
+                start = time.perf_counter()
+                loaded = loader_saver.load(file_path)
+                read_s = time.perf_counter() - start
+                loaded.sum()
+                scan_s = time.perf_counter() - start
+
+                size = sum(entry.stat().st_size for entry in os.scandir(tmp_dir))
+                exact = loaded.equals(dataframe)
+                del loaded
+
+            print(f"{n_rows:>10} {dataset_format:>8} {write_s:>8.2f} {read_s:>8.3f} {scan_s:>12.3f} "
+                  f"{size / 1e6:>8.1f} {str(exact):>6}")
+
+
+if __name__ == '__main__':
+    main()
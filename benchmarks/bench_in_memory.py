@@ -0,0 +1,179 @@
+"""
+Benchmark the in-memory stage handoff (main.py --in-memory) against the CSV handoff between stages.
+
+For every size, a raw dataset is bootstrapped from the ingested water potability CSV (keeping its
+missing values) and both flows run cleaning, validation, transformation, training and the test set
+scoring in a temporary artifacts directory:
+- csv: every stage reads its input CSV and writes its output CSV, as `python main.py` does;
+- in-memory: the DataFrames and the model are handed from stage to stage, only the raw CSV is read.
+
+The MLflow logging of the evaluation stage is left out (it talks to the remote tracking server), the
+test set is scored with ModelEvaluation.evaluate_metrics instead. The number of pd.read_csv calls,
+the rows they parsed, the CSV bytes written and the wall time of every flow are reported.
+
+Usage (from the repository root, after running main.py):
+    python -m benchmarks.bench_in_memory --rows 3000 1000000 10000000 --iterations 10
+"""
+import argparse
+import dataclasses
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from src.mlops_water_potability_prediction_project.classes.dataloadersaver import dataset_loader_saver
+from src.mlops_water_potability_prediction_project.components.data_cleaning import DataCleaning
+from src.mlops_water_potability_prediction_project.components.data_transformation import DataTransformation
+from src.mlops_water_potability_prediction_project.components.data_validation import DataValidation
+from src.mlops_water_potability_prediction_project.components.model_evaluation import ModelEvaluation
+from src.mlops_water_potability_prediction_project.components.model_trainer import ModelTrainer
+from src.mlops_water_potability_prediction_project.config.configuration import ConfigurationManager
+
+WRITE_CHUNK_ROWS = 1_000_000
+
+
+class CSVCounter:
+    """
+    Counts the pd.read_csv calls and the rows they return, and the bytes written by DataFrame.to_csv.
+    """
+
+    def __init__(self):
+        self.parses = 0
+        self.rows_parsed = 0
+        self.bytes_written = 0
+        self._read_csv = pd.read_csv
+        self._to_csv = pd.DataFrame.to_csv
+
+    def __enter__(self):
+        counter = self
+
+        def read_csv(*args, **kwargs):
+            dataframe = counter._read_csv(*args, **kwargs)
+            counter.parses += 1
+            counter.rows_parsed += len(dataframe)
+            return dataframe
+
+        def to_csv(dataframe, path_or_buf=None, *args, **kwargs):
+            result = counter._to_csv(dataframe, path_or_buf, *args, **kwargs)
+            if isinstance(path_or_buf, (str, os.PathLike)):
+                counter.bytes_written += os.path.getsize(path_or_buf)
+            return result
+
+        pd.read_csv = read_csv
+        pd.DataFrame.to_csv = to_csv
+        return self
+
+    def __exit__(self, *exc):
+        pd.read_csv = self._read_csv
+        pd.DataFrame.to_csv = self._to_csv
+
+
+def write_raw_csv(path, source, n_rows, seed=42):
+    """
+    Bootstraps n_rows rows from the source dataset, missing values included, chunk by chunk.
+
+    Parameters:
+    - path (str): The output path.
+    - source (pd.DataFrame): The ingested raw dataset.
+    - n_rows (int): The number of rows.
+    - seed (int): The random seed.
+    """
+    for start in range(0, n_rows, WRITE_CHUNK_ROWS):
+        chunk = source.sample(n=min(WRITE_CHUNK_ROWS, n_rows - start), replace=True, random_state=seed + start)
+        chunk.to_csv(path, mode='w' if start == 0 else 'a', header=start == 0, index=False)
+
+
+def make_configs(tmp_dir, iterations):
+    """
+    Builds the stage configurations with every artifact path moved into a temporary directory.
+    The intermediate datasets are CSV whatever the configured dataset format, as in the flow compared against.
+
+    Parameters:
+    - tmp_dir (str): The temporary artifacts directory.
+    - iterations (int): The CatBoost iterations.
+
+    Returns:
+    - dict: The stage configurations.
+    """
+    manager = ConfigurationManager()
+    path = lambda name: os.path.join(tmp_dir, name)
+    return {
+        "cleaning": dataclasses.replace(manager.get_data_cleaning_config(), root_dir=tmp_dir,
+                                        unclean_data_path=path("raw.csv"), clean_data_path=path("clean.csv"),
+                                        watermark_file=path("cleaning_watermark.json")),
+        "validation": dataclasses.replace(manager.get_data_validation_config(), root_dir=tmp_dir,
+                                          data_path=path("clean.csv"), status_file=path("status.txt"),
+                                          watermark_file=path("validation_watermark.json"),
+                                          statistics_path=path("dataset_statistics.json"),
+                                          report_file=path("validation_report.json")),
+        "transformation": dataclasses.replace(manager.get_data_transformation_config(), root_dir=tmp_dir,
+                                              data_path=path("clean.csv"), status_file=path("status.txt"),
+                                              train_file_name="train_set.csv", test_file_name="test_set.csv"),
+        "trainer": dataclasses.replace(manager.get_model_trainer_config(), root_dir=tmp_dir,
+                                       train_data_path=path("train_set.csv"),
+                                       feature_scaler_path=path(manager.get_data_transformation_config().feature_scaler),
+                                       dataset_schema_path=path("dataset_schema.json"), iterations=iterations),
+        "evaluation": dataclasses.replace(manager.get_model_evaluation_config(), root_dir=tmp_dir,
+                                          test_data_path=path("test_set.csv")),
+    }
+
+
+def run_flow(configs, in_memory):
+    """
+    Runs the data and training stages with the CSV or the in-memory handoff.
+
+    Parameters:
+    - configs (dict): The stage configurations.
+    - in_memory (bool): Whether to hand the data over in memory.
+
+    Returns:
+    - float: The test set accuracy.
+    """
+    cleaned = DataCleaning(configs["cleaning"]).clean_data(checkpoint=not in_memory)
+    DataValidation(configs["validation"]).validate_all_columns(cleaned if in_memory else None)
+
+    transformation = DataTransformation(configs["transformation"])
+    transformation.split_dataset(cleaned if in_memory else None)
+    transformation.feature_scale_dataset()
+    if not in_memory:
+        transformation.save_transformation()
+    del cleaned
+
+    model = ModelTrainer(configs["trainer"]).train(transformation.train if in_memory else None)
+
+    test_df = transformation.test if in_memory else pd.read_csv(configs["evaluation"].test_data_path)
+    target_column = configs["evaluation"].target_column
+    accuracy, _ = ModelEvaluation.evaluate_metrics(test_df[[target_column]],
+                                                   model.predict(test_df.drop([target_column], axis=1)))
+    return accuracy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[3_000, 1_000_000, 10_000_000])
+    parser.add_argument("--iterations", type=int, default=10, help="CatBoost iterations, kept low so parsing shows")
+    args = parser.parse_args()
+
+    unclean_data_path = ConfigurationManager().get_data_cleaning_config().unclean_data_path
+    source = dataset_loader_saver(unclean_data_path).load(unclean_data_path)
+
+    print(f"{'rows':>10} {'flow':>10} {'CSV parses':>11} {'rows parsed':>12} {'CSV MB written':>15} "
+          f"{'wall s':>8} {'accuracy':>9}")
+    for n_rows in args.rows:
+        for in_memory in (False, True):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                configs = make_configs(tmp_dir, args.iterations)
+                write_raw_csv(configs["cleaning"].unclean_data_path, source, n_rows)
+
+                with CSVCounter() as counter:
+                    start = time.perf_counter()
+                    accuracy = run_flow(configs, in_memory)
+                    wall = time.perf_counter() - start
+
+            print(f"{n_rows:>10} {'in-memory' if in_memory else 'csv':>10} {counter.parses:>11} "
+                  f"{counter.rows_parsed:>12} {counter.bytes_written / 1e6:>15.1f} {wall:>8.2f} {accuracy:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark the incremental (delta) cleaning and validation against processing the whole dataset.
+
+A partitioned raw dataset like the one the multi-source ingestion writes (one feather partition per
+daily file, about 5% missing values) is cleaned and validated once. A new daily partition of
+--delta-fraction of the base is then appended and the following are compared:
+- full: the whole dataset (base and delta) cleaned and validated from scratch;
+- delta: only the new partition cleaned, validated and merged into the clean dataset and its schema.
+Both are run with a single clean file (rewritten with the new rows) and with a partitioned clean
+dataset (the new rows appended as a partition). The clean datasets, the dataset schemas and the
+validation statuses of both runs are checked to be identical.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_incremental --rows 10000000 --partitions 100 --delta-fraction 0.01
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.mlops_water_potability_prediction_project.classes.dataloadersaver import PARTITION_MANIFEST, \
+    PartitionedDataLoaderSaver, dataset_loader_saver
+from src.mlops_water_potability_prediction_project.components.data_cleaning import DataCleaning
+from src.mlops_water_potability_prediction_project.components.data_ingestion import file_sha256
+from src.mlops_water_potability_prediction_project.components.data_validation import DataValidation
+from src.mlops_water_potability_prediction_project.config.configuration import ConfigurationManager
+from src.mlops_water_potability_prediction_project.entity.config_entity import DataCleaningConfig, \
+    DataValidationConfig
+
+
+def write_partition(raw_dir, index, n_rows, schema):
+    """
+    Writes a raw partition of random values and appends it to the partition manifest.
+
+    Parameters:
+    - raw_dir (str): The partitioned raw dataset directory.
+    - index (int): The partition number, also the random seed.
+    - n_rows (int): The number of rows.
+    - schema (dict): The column dtypes from schema.yaml.
+    """
+    rng = np.random.default_rng(index)
+    features = [col for col, dtype in schema.items() if dtype == "float64"]
+    dataframe = pd.DataFrame(rng.uniform(0, 1000, (n_rows, len(features))), columns=features)
+    dataframe = dataframe.mask(rng.random(dataframe.shape) < 0.005)
+    for col, dtype in schema.items():
+        if dtype != "float64":
+            dataframe[col] = rng.integers(0, 2, n_rows).astype(dtype)
+
+    path = os.path.join(raw_dir, f"part-{index:05d}-day{index}.feather")
+    dataset_loader_saver(path).save(path, dataframe)
+    manifest = PartitionedDataLoaderSaver().read_manifest(raw_dir)
+    manifest["partitions"].append({"source": f"day{index}", "path": path, "rows": n_rows,
+                                   "sha256": file_sha256(path).hexdigest()})
+    with open(os.path.join(raw_dir, PARTITION_MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=4)
+
+
+def make_configs(tmp_dir, name, raw_dir, clean_path, schema, incremental):
+    root_dir = os.path.join(tmp_dir, name)
+    os.makedirs(root_dir, exist_ok=True)
+    clean_data_path = os.path.join(root_dir, clean_path)
+    cleaning = DataCleaningConfig(root_dir=root_dir, unclean_data_path=raw_dir, clean_data_path=clean_data_path,
+                                  watermark_file=os.path.join(root_dir, "cleaning_watermark.json"),
+                                  incremental=incremental, chunk_size=None, data_schema=schema,
+                                  dataset_format="feather")
+    validation = DataValidationConfig(root_dir=root_dir, data_path=clean_data_path,
+                                      status_file=os.path.join(root_dir, "status.txt"), data_schema=schema,
+                                      watermark_file=os.path.join(root_dir, "validation_watermark.json"),
+                                      incremental=incremental,
+                                      statistics_path=os.path.join(root_dir, "dataset_statistics.json"),
+                                      report_file=os.path.join(root_dir, "validation_report.json"))
+    return cleaning, validation
+
+
+def run(cleaning, validation):
+    """
+    Cleans and validates the dataset from disk, as the pipeline stages do.
+
+    Returns:
+    - tuple: The wall time in seconds and the validation status.
+    """
+    start = time.perf_counter()
+    DataCleaning(cleaning).clean_data()
+    status = DataValidation(validation).validate_all_columns()
+    return time.perf_counter() - start, status
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000_000, help="rows of the base dataset")
+    parser.add_argument("--partitions", type=int, default=100, help="partitions of the base dataset")
+    parser.add_argument("--delta-fraction", type=float, default=0.01)
+    args = parser.parse_args()
+
+    schema = dict(ConfigurationManager().schema.COLUMNS)
+    n_delta = int(args.rows * args.delta_fraction)
+    print(f"Base: {args.rows} rows in {args.partitions} partitions, delta: {n_delta} rows")
+    print(f"{'clean output':>13} {'full s':>8} {'delta s':>8} {'speedup':>8}")
+
+    for clean_path in ("water_potability_dataset.feather", "water_potability_dataset"):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            raw_dir = os.path.join(tmp_dir, "raw")
+            os.makedirs(raw_dir)
+            for index in range(args.partitions):
+                write_partition(raw_dir, index, args.rows // args.partitions, schema)
+
+            # Process the base, then append the daily partition
+            incremental = make_configs(tmp_dir, "incremental", raw_dir, clean_path, schema, incremental=True)
+            run(*incremental)
+            write_partition(raw_dir, args.partitions, n_delta, schema)
+
+            full = make_configs(tmp_dir, "full", raw_dir, clean_path, schema, incremental=False)
+            full_s, full_status = run(*full)
+            delta_s, delta_status = run(*incremental)
+
+            results = []
+            for cleaning, _ in (full, incremental):
+                with open(os.path.join(cleaning.root_dir, "dataset_schema.json"), 'r') as f:
+                    results.append((dataset_loader_saver(cleaning.clean_data_path).load(cleaning.clean_data_path),
+                                    json.load(f)))
+            assert results[0][0].equals(results[1][0]), "the clean datasets differ"
+            assert results[0][1] == results[1][1], "the dataset schemas differ"
+            assert full_status == delta_status
+
+        output = "partitioned" if clean_path.endswith("dataset") else "file"
+        print(f"{output:>13} {full_s:>8.2f} {delta_s:>8.2f} {full_s / delta_s:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
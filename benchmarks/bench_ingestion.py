@@ -0,0 +1,102 @@
+"""
+Benchmark the data ingestion stage against a local HTTP stand-in for the dataset server.
+
+The stand-in serves a generated zip archive with ETag/Last-Modified headers and supports
+conditional (If-None-Match/If-Modified-Since) and range (Range/If-Range) requests. It can drop the
+connection part way through a response to simulate a network failure. The scenarios are:
+- cold: no local archive, full download;
+- warm: the archive is current, the server answers 304 Not Modified;
+- resume: the first response is cut after half the archive, the retry resumes with a range request;
+- changed: the source changed since the last download, the archive is downloaded again.
+Every scenario checks the SHA-256 of the archive on disk. Then reading the CSV straight from the
+archive is compared with extracting it and reading the extracted file.
+
+Time, bytes transferred over HTTP and bytes written (/proc/self/io wchar) are reported per scenario.
+The resume time includes the one second backoff before the retry.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_ingestion --rows 1000000
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+from src.mlops_water_potability_prediction_project.classes.dataloadersaver import dataset_loader_saver
+from src.mlops_water_potability_prediction_project.classes.stage_profiler import read_proc_io
+from src.mlops_water_potability_prediction_project.components.data_ingestion import DataIngestion
+from src.mlops_water_potability_prediction_project.entity.config_entity import DataIngestionConfig
+from tests.dataset_source import DatasetSource, make_archive, make_handler
+
+def measure(func):
+    """
+    Runs a function and measures its wall time and the bytes the process wrote.
+
+    Returns:
+    - tuple: The function result, the wall time in seconds and the bytes written.
+    """
+    io_before = read_proc_io()
+    start = time.perf_counter()
+    result = func()
+    wall = time.perf_counter() - start
+    io_after = read_proc_io()
+    return result, wall, io_after.get("wchar", 0) - io_before.get("wchar", 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    source = DatasetSource()
+    source.publish(make_archive(args.rows, seed=1))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(source))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = DataIngestionConfig(
+            source_url=f"http://127.0.0.1:{server.server_port}/water_potability_dataset.zip",
+            root_dir=tmp_dir, unzip_dir=tmp_dir,
+            zip_data_path=os.path.join(tmp_dir, "water_potability_dataset.zip"),
+            metadata_path=os.path.join(tmp_dir, "download_metadata.json"),
+            sha256=None, extract_zip=True, chunk_size=1 << 20, timeout=30, retries=3,
+            sources=(), partitions_dir=os.path.join(tmp_dir, "partitions"), max_workers=1, dataset_format="csv")
+        ingestion = DataIngestion(config)
+
+        def scenario(name, prepare=None):
+            if prepare is not None:
+                prepare()
+            source.bytes_sent = 0
+            downloaded, wall, written = measure(ingestion.download_file)
+            with open(config.zip_data_path, 'rb') as f:
+                assert f.read() == source.payload, f"{name}: the archive on disk differs from the source"
+            print(f"{name:>10} {str(downloaded):>11} {wall * 1000:>9.1f} {source.bytes_sent / 1e6:>10.2f} "
+                  f"{written / 1e6:>10.2f}")
+
+        print(f"Archive: {len(source.payload) / 1e6:.2f} MB ({args.rows} rows)")
+        print(f"{'scenario':>10} {'downloaded':>11} {'wall ms':>9} {'HTTP MB':>10} {'written MB':>10}")
+        scenario("cold")
+        scenario("warm")
+        scenario("resume", prepare=lambda: (os.remove(config.zip_data_path), os.remove(config.metadata_path),
+                                            setattr(source, "drop_after", len(source.payload) // 2)))
+        scenario("changed", prepare=lambda: source.publish(make_archive(args.rows, seed=2)))
+
+        print(f"\n{'read':>10} {'wall ms':>9} {'written MB':>10}")
+        dataframe, wall, written = measure(lambda: dataset_loader_saver(config.zip_data_path).load(config.zip_data_path))
+        print(f"{'zip-direct':>10} {wall * 1000:>9.1f} {written / 1e6:>10.2f}")
+
+        def extract_and_read():
+            ingestion.extract_zip_file()
+            csv_path = os.path.join(tmp_dir, "water_potability_dataset.csv")
+            return dataset_loader_saver(csv_path).load(csv_path)
+        extracted, wall, written = measure(extract_and_read)
+        print(f"{'extracted':>10} {wall * 1000:>9.1f} {written / 1e6:>10.2f}")
+        assert dataframe.equals(extracted)
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
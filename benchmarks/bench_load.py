@@ -0,0 +1,316 @@
+"""
+Offline load generator for the Flask endpoints.
+
+Replays form-style payloads (dicts like app.SAMPLE_DATA) against the app at a configurable
+concurrency and (optionally) a fixed request rate, then reports throughput, p50/p95/p99 latency
+and the error rate. Results are written to a JSON file, so runs on different commits can be diffed.
+
+Targets:
+- test-client: the Flask test client, in process (no network, measures the app itself)
+- serve: starts serve.py on a local port and sends real HTTP requests
+- url: an already running server, e.g. `python app.py` on http://127.0.0.1:5000
+
+Usage (from the repository root, after running main.py):
+    python -m benchmarks.bench_load --target test-client --endpoint form --concurrency 4 --requests 5000
+    python -m benchmarks.bench_load --target serve --workers 4 --endpoint batch --rate 500 --duration 30
+    python -m benchmarks.bench_load --payloads recorded.jsonl --output artifacts/load_test.json
+"""
+import argparse
+import http.client
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlencode, urlsplit
+
+from benchmarks.common import latency_summary, load_frontend_config, load_schema, synthetic_records
+
+ENDPOINTS = {
+    "form": "/",
+    "batch": "/predict/batch",
+}
+# The form route renders error.html with a 200 status, so failures are recognised by its content
+FORM_ERROR_MARKER = b'class="error-details"'
+
+
+def load_payloads(args):
+    """
+    Loads recorded payloads, or draws synthetic ones from the dataset schema ranges.
+
+    Parameters:
+    - args (argparse.Namespace): The load test arguments.
+
+    Returns:
+    - list: A list of dicts mapping feature names to values.
+    """
+    if args.payloads:
+        with open(args.payloads, 'r') as f:
+            if args.payloads.endswith(".jsonl"):
+                return [json.loads(line) for line in f if line.strip()]
+            return json.load(f)
+    config = load_frontend_config()
+    schema = load_schema(config.dataset_schema)
+    return synthetic_records(schema, args.n_payloads, target_column=config.target_column, seed=args.seed)
+
+
+def encode_request(endpoint, payload, batch_size):
+    """
+    Builds the body and the content type of a request.
+
+    Parameters:
+    - endpoint (str): "form" or "batch".
+    - payload (list): The payloads of the request, one for the form endpoint.
+    - batch_size (int): The number of records per batch request.
+
+    Returns:
+    - tuple: The body (bytes) and the content type.
+    """
+    if endpoint == "form":
+        return urlencode(payload[0]).encode("utf-8"), "application/x-www-form-urlencoded"
+    return json.dumps(payload[:batch_size]).encode("utf-8"), "application/json"
+
+
+def is_error(endpoint, status, body):
+    """
+    Tells whether a response is a failure.
+
+    Parameters:
+    - endpoint (str): "form" or "batch".
+    - status (int): The HTTP status code.
+    - body (bytes): The response body.
+
+    Returns:
+    - bool: True if the request failed.
+    """
+    if status >= 400:
+        return True
+    return endpoint == "form" and FORM_ERROR_MARKER in body
+
+
+class TestClientTarget:
+    """
+    Sends requests through the Flask test client, one client per thread.
+    """
+
+    def __init__(self):
+        import app as web_app
+        self.app = web_app.app
+        self._local = threading.local()
+
+    def send(self, path, body, content_type):
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        response = client.post(path, data=body, content_type=content_type)
+        return response.status_code, response.get_data()
+
+    def close(self):
+        pass
+
+
+class HTTPTarget:
+    """
+    Sends requests over HTTP, with one keep-alive connection per thread.
+    """
+
+    def __init__(self, url):
+        parts = urlsplit(url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self._local = threading.local()
+
+    def send(self, path, body, content_type):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = http.client.HTTPConnection(self.host, self.port, timeout=30)
+        try:
+            connection.request("POST", path, body=body, headers={"Content-Type": content_type})
+            response = connection.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            # Reconnect on the next request, the server may have closed the connection
+            connection.close()
+            self._local.connection = None
+            raise
+
+    def wait_until_ready(self, timeout=60):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                connection = http.client.HTTPConnection(self.host, self.port, timeout=1)
+                connection.request("GET", "/")
+                connection.getresponse().read()
+                connection.close()
+                return
+            except OSError:
+                time.sleep(0.2)
+        raise TimeoutError(f"The server on {self.host}:{self.port} did not start within {timeout} seconds")
+
+    def close(self):
+        pass
+
+
+class ServeTarget(HTTPTarget):
+    """
+    Starts serve.py on a local port and sends requests to it over HTTP.
+    """
+
+    def __init__(self, port, workers):
+        super().__init__(f"http://127.0.0.1:{port}")
+        self.process = subprocess.Popen(
+            [sys.executable, "serve.py", "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.wait_until_ready()
+
+    def close(self):
+        self.process.terminate()
+        self.process.wait()
+
+
+def run_load(target, args, payloads):
+    """
+    Sends requests from args.concurrency threads until the request count or the duration is reached.
+
+    With a rate, request i is not sent before start + i / rate, so the offered load is fixed
+    instead of depending on the server's speed.
+
+    Parameters:
+    - target: The TestClientTarget, HTTPTarget or ServeTarget to send the requests to.
+    - args (argparse.Namespace): The load test arguments.
+    - payloads (list): The payloads to cycle through.
+
+    Returns:
+    - dict: The results of the run.
+    """
+    path = ENDPOINTS[args.endpoint]
+    per_request = 1 if args.endpoint == "form" else args.batch_size
+    bodies = [encode_request(args.endpoint, payloads[i:i + per_request] or payloads[:per_request], per_request)
+              for i in range(0, len(payloads), per_request)]
+
+    counter = itertools.count()
+    counter_lock = threading.Lock()
+    latencies, statuses = [], {}
+    n_errors = 0
+    results_lock = threading.Lock()
+    start = time.perf_counter()
+    deadline = start + args.duration if args.duration else None
+
+    def worker():
+        nonlocal n_errors
+        local_latencies, local_statuses, local_errors = [], {}, 0
+        while True:
+            with counter_lock:
+                i = next(counter)
+            if args.requests and i >= args.requests:
+                break
+            if args.rate:
+                delay = start + i / args.rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+            body, content_type = bodies[i % len(bodies)]
+            sent_at = time.perf_counter()
+            try:
+                status, response_body = target.send(path, body, content_type)
+                failed = is_error(args.endpoint, status, response_body)
+            except Exception as e:
+                status, failed = type(e).__name__, True
+            local_latencies.append(time.perf_counter() - sent_at)
+            local_statuses[str(status)] = local_statuses.get(str(status), 0) + 1
+            local_errors += failed
+
+        with results_lock:
+            latencies.extend(local_latencies)
+            for status, count in local_statuses.items():
+                statuses[status] = statuses.get(status, 0) + count
+            n_errors += local_errors
+
+    threads = [threading.Thread(target=worker) for _ in range(args.concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall_seconds = time.perf_counter() - start
+
+    summary = latency_summary(latencies, wall_seconds)
+    summary.update({
+        "rows_per_second": summary["throughput_rps"] * per_request,
+        "errors": n_errors,
+        "error_rate": n_errors / len(latencies) if latencies else 0.0,
+        "status_codes": statuses,
+        "wall_seconds": wall_seconds,
+    })
+    return summary
+
+
+def git_commit():
+    """
+    Returns the current git commit, so results can be matched to the code they measured.
+
+    Returns:
+    - str: The commit hash, or None outside a git checkout.
+    """
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", choices=["test-client", "serve", "url"], default="test-client")
+    parser.add_argument("--url", default="http://127.0.0.1:5000", help="The server of the url target.")
+    parser.add_argument("--port", type=int, default=8766, help="The port of the serve target.")
+    parser.add_argument("--workers", type=int, default=4, help="The worker count of the serve target.")
+    parser.add_argument("--endpoint", choices=sorted(ENDPOINTS), default="form")
+    parser.add_argument("--batch-size", type=int, default=100, help="Records per request on the batch endpoint.")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--rate", type=float, default=None, help="Requests per second, unlimited by default.")
+    parser.add_argument("--requests", type=int, default=None, help="Stop after this many requests.")
+    parser.add_argument("--duration", type=float, default=None, help="Stop after this many seconds.")
+    parser.add_argument("--payloads", default=None, help="A recorded .json list or .jsonl file of records.")
+    parser.add_argument("--n-payloads", type=int, default=1000, help="The number of synthetic records.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=os.path.join("artifacts", "load_test", "results.json"))
+    args = parser.parse_args()
+    if not args.requests and not args.duration:
+        args.requests = 2000
+
+    payloads = load_payloads(args)
+    if args.target == "test-client":
+        target = TestClientTarget()
+    elif args.target == "serve":
+        target = ServeTarget(args.port, args.workers)
+    else:
+        target = HTTPTarget(args.url)
+    try:
+        summary = run_load(target, args, payloads)
+    finally:
+        target.close()
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "settings": {key: value for key, value in vars(args).items() if key != "output"},
+        "results": summary,
+    }
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=4)
+
+    print(f"{summary['requests']} requests in {summary['wall_seconds']:.1f}s: "
+          f"{summary['throughput_rps']:.0f} req/s, p50 {summary['p50_ms']:.2f} ms, "
+          f"p95 {summary['p95_ms']:.2f} ms, p99 {summary['p99_ms']:.2f} ms, "
+          f"error rate {summary['error_rate']:.2%}")
+    print(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
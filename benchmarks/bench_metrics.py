@@ -0,0 +1,65 @@
+"""
+Benchmark the overhead of the serving metrics.
+
+A single-row form request records one route latency, one request count and four stage latencies
+(validate_input, feature_scale, model_predict, render_template), each behind a perf_counter call.
+The benchmark times exactly that work, single-threaded and from several threads at once, plus the
+cost of rendering /metrics. It needs no trained artifacts.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_metrics
+"""
+import threading
+import time
+
+from src.mlops_water_potability_prediction_project.classes.metrics import MetricsRegistry
+
+N_REQUESTS = 200_000
+THREAD_COUNTS = [1, 4, 8]
+STAGES = ("validate_input", "feature_scale", "model_predict", "render_template")
+
+
+def simulate_requests(stage_seconds, request_seconds, requests, n_requests):
+    """
+    Records the metrics of n_requests form requests.
+    """
+    perf_counter = time.perf_counter
+    for _ in range(n_requests):
+        # Stage boundaries share their timestamps, as in FrontendPrediction.form_response
+        start = previous = perf_counter()
+        for stage in STAGES:
+            now = perf_counter()
+            stage_seconds.observe((stage, "single"), now - previous)
+            previous = now
+        request_seconds.observe(("/", "POST"), perf_counter() - start)
+        requests.inc(("/", "POST", "200"))
+
+
+def main():
+    registry = MetricsRegistry()
+    stage_seconds = registry.histogram("stage_seconds", "Stage latency.", labelnames=("stage", "path"))
+    request_seconds = registry.histogram("request_seconds", "Route latency.", labelnames=("route", "method"))
+    requests = registry.counter("requests_total", "Requests.", labelnames=("route", "method", "status"))
+
+    print(f"{'threads':>8} {'us/request':>12}")
+    for n_threads in THREAD_COUNTS:
+        per_thread = N_REQUESTS // n_threads
+        threads = [threading.Thread(target=simulate_requests,
+                                    args=(stage_seconds, request_seconds, requests, per_thread))
+                   for _ in range(n_threads)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        print(f"{n_threads:>8} {elapsed / (per_thread * n_threads) * 1e6:>12.2f}")
+
+    start = time.perf_counter()
+    body = registry.render()
+    print(f"render /metrics: {(time.perf_counter() - start) * 1000:.2f} ms for {len(body)} bytes")
+    assert requests.collect()[("/", "POST", "200")] == sum((N_REQUESTS // n) * n for n in THREAD_COUNTS)
+
+
+if __name__ == '__main__':
+    main()
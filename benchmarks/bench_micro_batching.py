@@ -0,0 +1,87 @@
+"""
+Benchmark the micro-batching ASGI server against the per-request Flask path.
+
+Both apps are called in-process (Flask through its test client, the ASGI app directly), with the
+same number of concurrent callers each sending single-row prediction requests.
+
+Usage (from the repository root, after running main.py):
+    python -m benchmarks.bench_micro_batching
+"""
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import latency_summary, load_frontend_config, load_schema, synthetic_records
+
+CONCURRENCY = 64
+REQUESTS = 5_000
+
+
+async def call_asgi(app, path, payload):
+    """
+    Calls an ASGI app in-process and returns the response status.
+    """
+    body = json.dumps(payload).encode("utf-8")
+    status = None
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app({"type": "http", "path": path, "method": "POST"}, receive, send)
+    return status
+
+
+async def run_asgi(records):
+    import asgi
+
+    asgi.batcher.start()
+    queue = iter(records)
+    latencies = []
+
+    async def client():
+        for record in queue:
+            start = time.perf_counter()
+            await call_asgi(asgi.app, "/predict", record)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(CONCURRENCY)))
+    wall_seconds = time.perf_counter() - start
+    await asgi.batcher.stop()
+    return latency_summary(latencies, wall_seconds)
+
+
+def run_flask(records):
+    import app as flask_app
+
+    def call(record):
+        client = flask_app.app.test_client()
+        start = time.perf_counter()
+        client.post("/predict/batch", json=[record])
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+        latencies = list(executor.map(call, records))
+    return latency_summary(latencies, time.perf_counter() - start)
+
+
+def main():
+    config = load_frontend_config()
+    records = synthetic_records(load_schema(config.dataset_schema), REQUESTS, target_column=config.target_column)
+
+    results = {"flask per-request": run_flask(records), "asgi micro-batching": asyncio.run(run_asgi(records))}
+
+    print(f"{'mode':>20} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    for mode, summary in results.items():
+        print(f"{mode:>20} {summary['throughput_rps']:>10.0f} {summary['p50_ms']:>8.2f} {summary['p99_ms']:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark the parallel ingestion of many data sources into a partitioned dataset.
+
+A local HTTP stand-in serves N water potability like CSV shards (e.g. daily or regional files).
+Every response waits a fixed latency before the first byte and is then throttled to a bandwidth,
+so the benchmark behaves like a remote object store rather than the loopback interface. The shards
+are ingested with MultiSourceIngestion from a cold start for every max_workers value and the wall
+time, the speedup over one worker and the rows ingested are reported. A second, warm run with the
+largest worker count shows the cost of re-ingesting unchanged sources (304 answers, no decoding).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_multi_source --shards 32 --rows 20000 --latency 0.2 --bandwidth 20
+"""
+import argparse
+import email.utils
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.mlops_water_potability_prediction_project.classes.dataloadersaver import dataset_loader_saver
+from src.mlops_water_potability_prediction_project.components.multi_source_ingestion import MultiSourceIngestion
+from src.mlops_water_potability_prediction_project.entity.config_entity import DataIngestionConfig
+from tests.dataset_source import make_archive
+
+
+def make_handler(shards, latency, bandwidth):
+    last_modified = email.utils.formatdate(time.time(), usegmt=True)
+    etags = {name: f'"{hashlib.sha256(payload).hexdigest()[:16]}"' for name, payload in shards.items()}
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            name = self.path.lstrip("/")
+            if name not in shards:
+                self.send_error(404)
+                return
+            time.sleep(latency)
+            if self.headers.get("If-None-Match") == etags[name]:
+                self.send_response(304)
+                self.end_headers()
+                return
+
+            payload = shards[name]
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("ETag", etags[name])
+            self.send_header("Last-Modified", last_modified)
+            self.end_headers()
+            # Throttle every response to the configured bandwidth, in 64 KB blocks
+            block_size = 64 * 1024
+            for start in range(0, len(payload), block_size):
+                self.wfile.write(payload[start:start + block_size])
+                time.sleep(block_size / bandwidth)
+
+    return Handler
+
+
+def make_config(tmp_dir, sources, max_workers):
+    return DataIngestionConfig(
+        source_url="", root_dir=tmp_dir, unzip_dir=tmp_dir,
+        zip_data_path=os.path.join(tmp_dir, "water_potability_dataset.zip"),
+        metadata_path=os.path.join(tmp_dir, "download_metadata.json"),
+        sha256=None, extract_zip=False, chunk_size=1 << 20, timeout=30, retries=3,
+        sources=tuple(sources), partitions_dir=os.path.join(tmp_dir, "partitions"),
+        max_workers=max_workers, dataset_format="feather")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shards", type=int, default=32)
+    parser.add_argument("--rows", type=int, default=20_000, help="rows per shard")
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds before the first byte")
+    parser.add_argument("--bandwidth", type=float, default=20, help="MB/s per response")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    shards = {f"shard_{i:04d}.zip": make_archive(args.rows, seed=i) for i in range(args.shards)}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(shards, args.latency, args.bandwidth * 1e6))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    sources = [f"http://127.0.0.1:{server.server_port}/{name}" for name in shards]
+
+    print(f"{args.shards} shards of {args.rows} rows ({sum(map(len, shards.values())) / 1e6:.2f} MB), "
+          f"{args.latency * 1000:.0f} ms latency, {args.bandwidth} MB/s per response")
+    print(f"{'workers':>8} {'wall s':>8} {'speedup':>8} {'rows':>10}")
+    baseline = None
+    for max_workers in args.workers:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = make_config(tmp_dir, sources, max_workers)
+            start = time.perf_counter()
+            partitions = MultiSourceIngestion(config).ingest()
+            wall = time.perf_counter() - start
+            baseline = baseline or wall
+            rows = len(dataset_loader_saver(config.partitions_dir).load(config.partitions_dir))
+            assert rows == sum(entry["rows"] for entry in partitions) == args.shards * args.rows
+            print(f"{max_workers:>8} {wall:>8.2f} {baseline / wall:>7.1f}x {rows:>10}")
+
+            if max_workers == max(args.workers):
+                start = time.perf_counter()
+                MultiSourceIngestion(config).ingest()
+                print(f"{'warm':>8} {time.perf_counter() - start:>8.2f}")
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Measure the hit rate and latency saving of the prediction cache on a replayed request log.
+
+The log is a JSON-lines file with one form payload (feature name -> value) per line. Without a
+log, a synthetic one is generated: sensors re-reporting the same reading with tiny jitter.
+
+Usage (from the repository root, after running main.py):
+    python -m benchmarks.bench_prediction_cache [--log requests.jsonl]
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from benchmarks.common import load_frontend_config, load_schema, synthetic_records
+from src.mlops_water_potability_prediction_project.classes.prediction_cache import PredictionCache
+from src.mlops_water_potability_prediction_project.components.frontend import FrontendPrediction
+
+N_SENSORS = 500
+REPORTS_PER_SENSOR = 20
+
+
+def synthetic_log(schema, target_column):
+    """
+    Builds a request log of sensors re-reporting near-identical readings.
+    """
+    rng = np.random.default_rng(0)
+    sensors = synthetic_records(schema, N_SENSORS, target_column=target_column)
+    log = []
+    for _ in range(REPORTS_PER_SENSOR):
+        for sensor in rng.permutation(N_SENSORS):
+            log.append({col: str(float(val) * (1 + rng.normal(0, 1e-6))) for col, val in sensors[sensor].items()})
+    return log
+
+
+def replay(predictor, log):
+    """
+    Replays the log through the single-row path and returns the mean latency in microseconds.
+    """
+    start = time.perf_counter()
+    for record in log:
+        predictor.form_response(record)
+    return (time.perf_counter() - start) / len(log) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--log", help="JSON-lines request log to replay")
+    args = parser.parse_args()
+
+    config = load_frontend_config()
+    if args.log:
+        with open(args.log, 'r') as f:
+            log = [json.loads(line) for line in f if line.strip()]
+    else:
+        log = synthetic_log(load_schema(config.dataset_schema), config.target_column)
+
+    baseline = FrontendPrediction(config=config)
+    baseline.artifact_cache.get()
+    print(f"{'mode':>10} {'us/request':>12} {'hit rate':>9}")
+    print(f"{'no cache':>10} {replay(baseline, log):>12.1f} {'-':>9}")
+
+    for key_mode in PredictionCache.KEY_MODES:
+        cache = PredictionCache(max_size=len(log), ttl_seconds=3600, key_mode=key_mode)
+        predictor = FrontendPrediction(config=config, prediction_cache=cache)
+        latency_us = replay(predictor, log)
+        print(f"{key_mode:>10} {latency_us:>12.1f} {cache.stats()['hit_rate']:>9.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark the per-request conversion of form data into scaled features.
+
+Compares the original path (string array -> pandas DataFrame -> StandardScaler.transform) with the
+typed FeatureVectorizer path (float64 row in schema.yaml order -> inference bundle scaling).
+
+Usage (from the repository root, after running main.py):
+    python -m benchmarks.bench_request_conversion
+"""
+import joblib
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import best_time, load_frontend_config, load_schema, synthetic_records
+from src.mlops_water_potability_prediction_project.components.frontend import FrontendPrediction
+from src.mlops_water_potability_prediction_project.config.configuration import ConfigurationManager
+
+N_REQUESTS = 10_000
+
+
+def dataframe_path(record, scaler):
+    """
+    The original conversion: a string-dtype array wrapped in a DataFrame, cast while scaling.
+    """
+    data = np.array([list(record.values())])
+    return scaler.transform(pd.DataFrame(data))
+
+
+def vectorizer_path(record, artifacts):
+    """
+    The typed conversion: a float64 row filled by column position, scaled with one NumPy step.
+    """
+    row, _ = artifacts.vectorizer.row(record)
+    return artifacts.bundle.transform(row)
+
+
+def main():
+    config = load_frontend_config()
+    scaler = joblib.load(ConfigurationManager().get_model_trainer_config().feature_scaler_path)
+    predictor = FrontendPrediction(config=config)
+    artifacts = predictor.artifact_cache.get()
+    records = synthetic_records(load_schema(config.dataset_schema), N_REQUESTS, target_column=config.target_column)
+
+    # Both paths must produce the same scaled features
+    assert np.allclose(dataframe_path(records[0], scaler), vectorizer_path(records[0], artifacts))
+
+    dataframe_seconds = best_time(lambda: [dataframe_path(record, scaler) for record in records])
+    vectorizer_seconds = best_time(lambda: [vectorizer_path(record, artifacts) for record in records])
+    form_seconds = best_time(lambda: [predictor.form_response(record) for record in records])
+
+    print(f"{'path':<28} {'us/request':>12}")
+    print(f"{'DataFrame conversion':<28} {dataframe_seconds / N_REQUESTS * 1e6:>12.1f}")
+    print(f"{'FeatureVectorizer':<28} {vectorizer_seconds / N_REQUESTS * 1e6:>12.1f}")
+    print(f"{'full form_response':<28} {form_seconds / N_REQUESTS * 1e6:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
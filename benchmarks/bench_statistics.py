@@ -0,0 +1,96 @@
+"""
+Benchmark the fused column statistics (ColumnStatistics) against the separate scans they replace.
+
+On a water potability like dataset (nine float64 features with about 5% missing values and an int64
+target) the following are timed:
+- separate: describe() for the schema min/max, isna().sum() for the null counts and StandardScaler.fit
+  for the feature means and variances, three scans of the data;
+- fused: one ColumnStatistics pass giving all of them, and a StandardScaler built from it;
+- merged: the same statistics computed on --workers chunks in worker processes and merged.
+The min/max must be identical to describe(), and the means, variances and scaler attributes must
+match numpy and StandardScaler.fit to a relative 1e-9.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_statistics --rows 10000000 --workers 4
+"""
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from src.mlops_water_potability_prediction_project.classes.column_statistics import ColumnStatistics
+from src.mlops_water_potability_prediction_project.config.configuration import ConfigurationManager
+
+
+def make_dataset(n_rows, seed=42):
+    """
+    Builds a dataset shaped like the raw water potability data, in schema.yaml column order.
+
+    Parameters:
+    - n_rows (int): The number of rows.
+    - seed (int): The random seed.
+
+    Returns:
+    - pd.DataFrame: Features with missing values and a 0/1 int64 target.
+    """
+    manager = ConfigurationManager()
+    target_column = manager.schema.TARGET_COLUMN.name
+    features = [col for col in manager.schema.COLUMNS if col != target_column]
+    rng = np.random.default_rng(seed)
+    dataframe = pd.DataFrame(rng.normal(500, 200, (n_rows, len(features))), columns=features)
+    dataframe = dataframe.mask(rng.random(dataframe.shape) < 0.05)
+    dataframe[target_column] = rng.integers(0, 2, n_rows)
+    return dataframe
+
+
+def chunk_statistics(chunk):
+    return ColumnStatistics(chunk.columns).update(chunk)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    dataframe = make_dataset(args.rows)
+    features = list(dataframe.columns[:-1])
+    print(f"{args.rows} rows x {dataframe.shape[1]} columns")
+    print(f"{'method':>9} {'wall s':>8}")
+
+    start = time.perf_counter()
+    overview = dataframe.describe()
+    null_count = dataframe.isna().sum()
+    fitted = StandardScaler().fit(dataframe[features].to_numpy())
+    print(f"{'separate':>9} {time.perf_counter() - start:>8.2f}")
+
+    start = time.perf_counter()
+    statistics = ColumnStatistics(dataframe.columns).update(dataframe)
+    scaler = statistics.standard_scaler(features)
+    print(f"{'fused':>9} {time.perf_counter() - start:>8.2f}")
+
+    start = time.perf_counter()
+    chunks = np.array_split(np.arange(len(dataframe)), args.workers)
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        parts = list(pool.map(chunk_statistics, (dataframe.iloc[rows] for rows in chunks)))
+    merged = reduce(ColumnStatistics.merge, parts)
+    print(f"{'merged':>9} {time.perf_counter() - start:>8.2f}  ({args.workers} workers, pickling included)")
+
+    for result in (statistics, merged):
+        frame = result.to_frame()
+        assert frame.loc[["min", "max"]].equals(overview.loc[["min", "max"]]), "min/max differ from describe()"
+        assert (frame.loc["null_count"] == null_count).all()
+        assert np.allclose(frame.loc["mean"], dataframe.mean(), rtol=1e-9)
+        assert np.allclose(frame.loc["var"], dataframe.var(ddof=0), rtol=1e-9)
+    for name in ("mean_", "var_", "scale_"):
+        assert np.allclose(getattr(scaler, name), getattr(fitted, name), rtol=1e-9), name
+    assert np.array_equal(np.atleast_1d(scaler.n_samples_seen_), np.atleast_1d(fitted.n_samples_seen_))
+    print("Statistics match describe(), numpy and StandardScaler.fit")
+
+
+if __name__ == '__main__':
+    main()
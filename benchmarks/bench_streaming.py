@@ -0,0 +1,89 @@
+"""
+Benchmark the streaming CSV scoring endpoint.
+
+Writes synthetic lab CSV files in the schema.yaml column layout, streams them through
+POST /predict/stream with the Flask test client (request and response both unbuffered) and
+reports the time to the first results, the throughput and the peak RSS of the process.
+
+Usage (from the repository root, after running main.py):
+    python -m benchmarks.bench_streaming --rows 100000 1000000
+"""
+import argparse
+import os
+import resource
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.common import load_frontend_config, load_schema
+
+WRITE_CHUNK_ROWS = 100_000
+
+
+def write_csv(path, schema, n_rows, seed=42):
+    """
+    Writes a CSV of synthetic rows drawn from the schema min/max ranges, chunk by chunk.
+
+    Parameters:
+    - path (str): The output path.
+    - schema (dict): The dataset schema, in schema.yaml column order.
+    - n_rows (int): The number of rows.
+    - seed (int): The random seed.
+    """
+    rng = np.random.default_rng(seed)
+    columns = list(schema)
+    lows = np.array([schema[col]["min"] for col in columns])
+    highs = np.array([schema[col]["max"] for col in columns])
+    with open(path, 'w') as f:
+        f.write(",".join(columns) + "\n")
+        for start in range(0, n_rows, WRITE_CHUNK_ROWS):
+            rows = rng.uniform(lows, highs, size=(min(WRITE_CHUNK_ROWS, n_rows - start), len(columns)))
+            np.savetxt(f, rows, delimiter=",", fmt="%.6g")
+
+
+def peak_rss_mb():
+    """
+    Returns the peak resident set size of the process, in MB (Linux reports ru_maxrss in KB).
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    args = parser.parse_args()
+
+    import app as web_app
+    client = web_app.app.test_client()
+    schema = load_schema(load_frontend_config().dataset_schema)
+    web_app.frontend_predictor.artifact_cache.get()
+
+    print(f"{'rows':>10} {'file MB':>8} {'first ms':>9} {'total s':>8} {'rows/s':>10} {'out MB':>8} {'peak RSS MB':>12}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_rows in args.rows:
+            path = os.path.join(tmp_dir, f"samples_{n_rows}.csv")
+            write_csv(path, schema, n_rows)
+            size = os.path.getsize(path)
+
+            with open(path, 'rb') as f:
+                start = time.perf_counter()
+                response = client.post(f"/predict/stream?format={args.format}", input_stream=f,
+                                       content_type="text/csv", content_length=size, buffered=False)
+                # The CSV format sends its header line before any row is scored
+                first_results_chunk = 1 if args.format == "csv" else 0
+                first_results, out_bytes = None, 0
+                for i, chunk in enumerate(response.response):
+                    if i == first_results_chunk:
+                        first_results = time.perf_counter() - start
+                    out_bytes += len(chunk)
+                response.close()
+                total = time.perf_counter() - start
+
+            print(f"{n_rows:>10} {size / 1e6:>8.1f} {first_results * 1000:>9.1f} {total:>8.2f} "
+                  f"{n_rows / total:>10.0f} {out_bytes / 1e6:>8.1f} {peak_rss_mb():>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
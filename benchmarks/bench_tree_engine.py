@@ -0,0 +1,40 @@
+"""
+Benchmark the NumPy oblivious-tree engine against CatBoostClassifier.predict.
+
+Also checks that the engine's raw scores are bit-identical to CatBoost's on every batch.
+
+Usage (from the repository root, after running main.py):
+    python -m benchmarks.bench_tree_engine
+"""
+import joblib
+import numpy as np
+
+from benchmarks.common import best_time, load_frontend_config
+from src.mlops_water_potability_prediction_project.classes.oblivious_trees import ObliviousTreeEnsemble
+
+BATCH_SIZES = [1, 10, 100, 1_000, 10_000, 100_000, 1_000_000]
+
+
+def main():
+    config = load_frontend_config()
+    bundle = joblib.load(config.inference_bundle)
+    model = bundle.model
+    engine = getattr(bundle, "engine", None) or ObliviousTreeEnsemble.from_catboost(model)
+
+    rng = np.random.default_rng(42)
+    print(f"{'batch size':>12} {'catboost rows/s':>16} {'numpy rows/s':>14} {'speedup':>8} {'identical':>10}")
+    for batch_size in BATCH_SIZES:
+        # Scaled features are roughly standard normal
+        data = rng.standard_normal((batch_size, len(bundle.feature_names)))
+        repeat = 5 if batch_size <= 10_000 else 1
+
+        catboost_seconds = best_time(lambda: model.predict(data), repeat=repeat)
+        numpy_seconds = best_time(lambda: engine.predict(data), repeat=repeat)
+        identical = np.array_equal(engine.raw_predict(data), model.predict(data, prediction_type="RawFormulaVal"))
+
+        print(f"{batch_size:>12} {batch_size / catboost_seconds:>16.0f} {batch_size / numpy_seconds:>14.0f} "
+              f"{catboost_seconds / numpy_seconds:>7.1f}x {str(identical):>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark the compiled, vectorized schema validation against the original per-field loop.
+
+Usage (from the repository root, after running main.py):
+    python -m benchmarks.bench_validation
+"""
+from benchmarks.common import best_time, load_frontend_config, load_schema, synthetic_records
+from src.mlops_water_potability_prediction_project.components.frontend import FrontendPrediction
+
+ROW_COUNTS = [1, 100_000]
+
+
+def legacy_validate(records, schema):
+    """
+    The original validation: the schema dict is walked once per field, stopping at the first error.
+    """
+    for record in records:
+        for col, val in record.items():
+            if col not in schema.keys():
+                return False
+            if not (schema[col]["min"] <= float(val) <= schema[col]["max"]):
+                return False
+    return True
+
+
+def compiled_validate(records, artifacts):
+    """
+    The compiled validation: one matrix conversion and two vectorized comparisons, reporting every error.
+    """
+    compiled_schema = artifacts.compiled_schema
+    data, errors = artifacts.vectorizer.matrix(records)
+    violations = compiled_schema.violations(data)
+    FrontendPrediction.describe_violations(data, violations, compiled_schema)
+    return errors
+
+
+def main():
+    config = load_frontend_config()
+    predictor = FrontendPrediction(config=config)
+    schema = load_schema(config.dataset_schema)
+    artifacts = predictor.artifact_cache.get()
+
+    print(f"{'rows':>8} {'legacy ms':>12} {'compiled ms':>12} {'speedup':>9}")
+    for n_rows in ROW_COUNTS:
+        records = synthetic_records(schema, n_rows, target_column=config.target_column)
+        repeat = 1000 if n_rows == 1 else 3
+        legacy_seconds = best_time(lambda: [legacy_validate(records, schema) for _ in range(repeat)]) / repeat
+        compiled_seconds = best_time(
+            lambda: [compiled_validate(records, artifacts) for _ in range(repeat)]) / repeat
+        print(f"{n_rows:>8} {legacy_seconds * 1000:>12.3f} {compiled_seconds * 1000:>12.3f} "
+              f"{legacy_seconds / compiled_seconds:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
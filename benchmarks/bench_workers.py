@@ -0,0 +1,129 @@
+"""
+Benchmark the throughput of the pre-fork server with 1, 2, 4 and 8 workers.
+
+For every worker count, serve.py is started on a local port and hammered with single-record
+POST /predict/batch requests from several client processes.
+
+Usage (from the repository root, after running main.py):
+    python -m benchmarks.bench_workers --duration 10 --clients 16
+"""
+import argparse
+import http.client
+import json
+import multiprocessing
+import subprocess
+import sys
+import time
+
+from benchmarks.common import latency_summary, load_frontend_config, load_schema, synthetic_records
+
+WORKER_COUNTS = [1, 2, 4, 8]
+HOST = "127.0.0.1"
+
+
+def wait_until_ready(port, timeout=60):
+    """
+    Waits until the server accepts requests.
+
+    Parameters:
+    - port (int): The server port.
+    - timeout (float): The maximum wait, in seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection(HOST, port, timeout=1)
+            connection.request("GET", "/")
+            connection.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"The server on port {port} did not start within {timeout} seconds")
+
+
+def client(port, bodies, duration, results):
+    """
+    Sends requests in a loop for the given duration and reports the latencies.
+
+    Parameters:
+    - port (int): The server port.
+    - bodies (list): The JSON request bodies to cycle through.
+    - duration (float): The run time, in seconds.
+    - results (multiprocessing.Queue): The queue receiving (latencies, errors).
+    """
+    latencies, errors = [], 0
+    deadline = time.monotonic() + duration
+    i = 0
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        try:
+            connection = http.client.HTTPConnection(HOST, port, timeout=30)
+            connection.request("POST", "/predict/batch", body=bodies[i % len(bodies)],
+                               headers={"Content-Type": "application/json"})
+            if connection.getresponse().status != 200:
+                errors += 1
+            connection.close()
+        except OSError:
+            errors += 1
+        latencies.append(time.perf_counter() - start)
+        i += 1
+    results.put((latencies, errors))
+
+
+def run(workers, args, bodies):
+    """
+    Starts the server with the given number of workers and measures it.
+
+    Parameters:
+    - workers (int): The number of worker processes.
+    - args (argparse.Namespace): The benchmark arguments.
+    - bodies (list): The JSON request bodies.
+
+    Returns:
+    - dict: The latency summary and the error count.
+    """
+    server = subprocess.Popen([sys.executable, "serve.py", "--host", HOST, "--port", str(args.port),
+                               "--workers", str(workers), "--threads", "1", "--model-threads", "1"],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_until_ready(args.port)
+        results = multiprocessing.Queue()
+        clients = [multiprocessing.Process(target=client, args=(args.port, bodies, args.duration, results))
+                   for _ in range(args.clients)]
+        start = time.perf_counter()
+        for process in clients:
+            process.start()
+        collected = [results.get() for _ in clients]
+        wall_seconds = time.perf_counter() - start
+        for process in clients:
+            process.join()
+    finally:
+        server.terminate()
+        server.wait()
+
+    latencies = [latency for client_latencies, _ in collected for latency in client_latencies]
+    summary = latency_summary(latencies, wall_seconds)
+    summary["errors"] = sum(errors for _, errors in collected)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    config = load_frontend_config()
+    records = synthetic_records(load_schema(config.dataset_schema), 1000, target_column=config.target_column)
+    bodies = [json.dumps([record]) for record in records]
+
+    print(f"{'workers':>8} {'req/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for workers in WORKER_COUNTS:
+        summary = run(workers, args, bodies)
+        print(f"{workers:>8} {summary['throughput_rps']:>10.0f} {summary['p50_ms']:>9.2f} "
+              f"{summary['p95_ms']:>9.2f} {summary['p99_ms']:>9.2f} {summary['errors']:>7}")
+
+
+if __name__ == '__main__':
+    main()
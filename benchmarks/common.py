@@ -0,0 +1,97 @@
+"""
+Shared helpers for the benchmark scripts.
+
+The benchmarks expect the training pipeline (main.py) to have been run so that the artifacts exist,
+and must be run from the repository root, e.g. `python -m benchmarks.bench_batch_prediction`.
+"""
+import json
+import time
+
+import numpy as np
+
+from src.mlops_water_potability_prediction_project.config.configuration import ConfigurationManager
+
+
+def load_frontend_config():
+    """
+    Retrieves the model frontend configuration.
+
+    Returns:
+    - ModelFrontendConfig: The model frontend configuration.
+    """
+    return ConfigurationManager().get_frontend_config()
+
+
+def load_schema(schema_path):
+    """
+    Loads the dataset schema holding the min/max of every column.
+
+    Parameters:
+    - schema_path (Path): The path to the dataset schema file.
+
+    Returns:
+    - dict: The dataset schema.
+    """
+    with open(schema_path, 'r') as f:
+        return json.load(f)
+
+
+def synthetic_records(schema, n_rows, target_column="Potability", seed=42):
+    """
+    Draws input records uniformly from the schema min/max range of every feature.
+
+    Parameters:
+    - schema (dict): The dataset schema.
+    - n_rows (int): The number of records to draw.
+    - target_column (str): The target column, excluded from the records.
+    - seed (int): The random seed.
+
+    Returns:
+    - list: A list of dicts mapping feature names to string values, as submitted by a form.
+    """
+    rng = np.random.default_rng(seed)
+    columns = [col for col in schema if col != target_column]
+    lows = np.array([schema[col]["min"] for col in columns])
+    highs = np.array([schema[col]["max"] for col in columns])
+    values = rng.uniform(lows, highs, size=(n_rows, len(columns)))
+    return [{col: str(val) for col, val in zip(columns, row)} for row in values]
+
+
+def best_time(func, repeat=3):
+    """
+    Runs a function several times and returns the best wall time.
+
+    Parameters:
+    - func (callable): The function to time.
+    - repeat (int): The number of runs.
+
+    Returns:
+    - float: The best wall time in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def latency_summary(latencies, wall_seconds):
+    """
+    Summarizes request latencies.
+
+    Parameters:
+    - latencies (list): The latency of every request, in seconds.
+    - wall_seconds (float): The wall time of the whole run, in seconds.
+
+    Returns:
+    - dict: The request count, throughput and p50/p95/p99 latencies in milliseconds.
+    """
+    latencies_ms = np.asarray(latencies) * 1000
+    return {
+        "requests": len(latencies_ms),
+        "throughput_rps": len(latencies_ms) / wall_seconds if wall_seconds else 0.0,
+        "p50_ms": float(np.percentile(latencies_ms, 50)) if len(latencies_ms) else None,
+        "p95_ms": float(np.percentile(latencies_ms, 95)) if len(latencies_ms) else None,
+        "p99_ms": float(np.percentile(latencies_ms, 99)) if len(latencies_ms) else None,
+    }
@@ -1,4 +1,10 @@
+import argparse
+
 from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.classes.pipeline_runner import PipelineRunner
+from src.mlops_water_potability_prediction_project.classes.stage_profiler import StageProfiler
+from src.mlops_water_potability_prediction_project.config.configuration import ConfigurationManager
+from src.mlops_water_potability_prediction_project.pipeline.in_memory_pipeline import InMemoryTrainingPipeline
 from src.mlops_water_potability_prediction_project.pipeline.stage_01_data_ingestion import DataIngestionTrainingPipeline
 from src.mlops_water_potability_prediction_project.pipeline.stage_02_data_cleaning import DataCleaningTrainingPipeline
 from src.mlops_water_potability_prediction_project.pipeline.stage_03_data_validation import \
@@ -9,77 +15,90 @@ from src.mlops_water_potability_prediction_project.pipeline.stage_05_model_train
 from src.mlops_water_potability_prediction_project.pipeline.stage_06_model_evaluation import \
     ModelEvaluationTrainingPipeline
 from src.mlops_water_potability_prediction_project.pipeline.stage_07_model_prediction import ModelPredictionPipeline
+from src.mlops_water_potability_prediction_project.pipeline.stage_08_model_registry import \
+    ModelRegistryTrainingPipeline
+from src.mlops_water_potability_prediction_project.utilities.helpers import promote_file
 
 
-SAMPLE_DATA = [[-0.3178266699547379,-0.091211066334705,-0.8620216614125349,-0.6109023585675367,-0.45494327621466607,-1.0186105292775014,0.9252077219311549,-0.8142465077043499,-1.5108829669361032]]
-def main():
+# Raw (unscaled) feature values in training column order, scaled by the inference bundle
+SAMPLE_DATA = [[2, 75, 350, 2, 150, 250, 10, 10, 5]]
+
+STAGES = [
+    ("DATA INGESTION", lambda: DataIngestionTrainingPipeline().ingest_data()),
+    ("DATA CLEANING", lambda: DataCleaningTrainingPipeline().clean_data()),
+    ("DATA VALIDATION", lambda: DataValidationTrainingPipeline().validate_data()),
+    ("DATA TRANSFORMATION", lambda: DataTransformationTrainingPipeline().transform_data()),
+    ("MODEL TRAINER", lambda: ModelTrainerTrainingPipeline().train_model()),
+    ("MODEL EVALUATION", lambda: ModelEvaluationTrainingPipeline().evaluate_model()),
+    ("MODEL REGISTRY", lambda: ModelRegistryTrainingPipeline().register_model()),
+    ("MODEL PREDICTION", lambda: ModelPredictionPipeline().predict_model(SAMPLE_DATA)),
+]
+
+
+def run_stage(stage_name, stage):
     """
-    The main function runs different stages of the training pipeline
+    Runs a single stage of the training pipeline with the stage start/completion logging
+    Args:
+        stage_name: The name of the stage
+        stage: A callable running the stage
     Returns: None
     """
-
-    STAGE_NAME = "DATA INGESTION"
     try:
-        logger.info(f">>>>>> STAGE: {STAGE_NAME} started <<<<<<")
-        DataIngestionTrainingPipeline().ingest_data()
-        logger.info(f">>>>>> STAGE: {STAGE_NAME} completed <<<<<<\n\nX==========X")
+        logger.info(f">>>>>> STAGE: {stage_name} started <<<<<<")
+        stage()
+        logger.info(f">>>>>> STAGE: {stage_name} completed <<<<<<\n\nX==========X")
     except Exception as e:
         logger.error(f"Error during overall execution: {e}")
         raise e
 
-    STAGE_NAME = "DATA CLEANING"
-    try:
-        logger.info(f">>>>>> STAGE: {STAGE_NAME} started <<<<<<")
-        DataCleaningTrainingPipeline().clean_data()
-        logger.info(f">>>>>> STAGE: {STAGE_NAME} completed <<<<<<\n\nX==========X")
-    except Exception as e:
-        logger.error(f"Error during overall execution: {e}")
-        raise e
-
-    STAGE_NAME = "DATA VALIDATION"
-    try:
-        logger.info(f">>>>>> STAGE: {STAGE_NAME} started <<<<<<")
-        DataValidationTrainingPipeline().validate_data()
-        logger.info(f">>>>>> STAGE: {STAGE_NAME} completed <<<<<<\n\nX==========X")
-    except Exception as e:
-        logger.error(f"Error during overall execution: {e}")
-        raise e
 
-    STAGE_NAME = "DATA TRANSFORMATION"
-    try:
-        logger.info(f">>>>>> STAGE: {STAGE_NAME} started <<<<<<")
-        DataTransformationTrainingPipeline().transform_data()
-        logger.info(f">>>>>> STAGE: {STAGE_NAME} completed <<<<<<\n\nX==========X")
-    except Exception as e:
-        logger.error(f"Error during overall execution: {e}")
-        raise e
+def main():
+    """
+    The main function runs different stages of the training pipeline, skipping the stages whose
+    declared inputs (config/params/schema sections and files, see the pipeline section of
+    config/config.yaml) did not change since their last successful run
+    Returns: None
+    """
+    parser = argparse.ArgumentParser(description="Run the training pipeline.")
+    parser.add_argument("--from", dest="start", help="The first stage to consider, e.g. model_trainer")
+    parser.add_argument("--to", dest="end", help="The last stage to consider, e.g. model_evaluation")
+    parser.add_argument("--force", action="store_true", help="Run the selected stages even if they are up to date")
+    parser.add_argument("--in-memory", action="store_true",
+                        help="Hand the data from stage to stage in memory instead of through intermediate datasets")
+    parser.add_argument("--checkpoint", action="store_true",
+                        help="With --in-memory, still write the intermediate datasets")
+    parser.add_argument("--profile", action="store_true", default=None,
+                        help="Also dump a cProfile of every stage next to the run report")
+    args = parser.parse_args()
 
-    STAGE_NAME = "MODEL TRAINER"
-    try:
-        logger.info(f">>>>>> STAGE: {STAGE_NAME} started <<<<<<")
-        ModelTrainerTrainingPipeline().train_model()
-        logger.info(f">>>>>> STAGE: {STAGE_NAME} completed <<<<<<\n\nX==========X")
-    except Exception as e:
-        logger.error(f"Error during overall execution: {e}")
-        raise e
+    config = ConfigurationManager()
+    pipeline_config = config.get_pipeline_config()
+    runner = PipelineRunner(pipeline_config, config)
 
-    STAGE_NAME = "MODEL EVALUATION"
-    try:
-        logger.info(f">>>>>> STAGE: {STAGE_NAME} started <<<<<<")
-        ModelEvaluationTrainingPipeline().evaluate_model()
-        logger.info(f">>>>>> STAGE: {STAGE_NAME} completed <<<<<<\n\nX==========X")
-    except Exception as e:
-        logger.error(f"Error during overall execution: {e}")
-        raise e
+    stages, force, record = STAGES, args.force, True
+    if args.in_memory:
+        checkpoint = args.checkpoint or pipeline_config.in_memory_checkpoints
+        in_memory_stages = InMemoryTrainingPipeline(checkpoint=checkpoint).stages()
+        stages = [(stage_name, in_memory_stages.get(stage_name, stage)) for stage_name, stage in STAGES]
+        # Without checkpoints the intermediate datasets may be stale, so they cannot tell whether a stage is up to date,
+        # and the state of the stages that ran must not be recorded against them
+        force = force or not checkpoint
+        record = checkpoint
 
-    STAGE_NAME = "MODEL PREDICTION"
+    # Every stage is measured (wall/CPU time, peak RSS, Python allocations, I/O) into a run report
+    profiler = StageProfiler(config.get_profiling_config(), cprofile=args.profile)
     try:
-        logger.info(f">>>>>> STAGE: {STAGE_NAME} started <<<<<<")
-        ModelPredictionPipeline().predict_model(SAMPLE_DATA)
-        logger.info(f">>>>>> STAGE: {STAGE_NAME} completed <<<<<<\n\nX==========X")
-    except Exception as e:
-        logger.error(f"Error during overall execution: {e}")
-        raise e
+        outcomes = runner.run(stages, lambda stage_name, stage: run_stage(stage_name,
+                                                                          lambda: profiler.run_stage(stage_name, stage)),
+                              start=args.start, end=args.end, force=force, on_skip=profiler.record_skipped,
+                              record=record)
+        logger.info("Pipeline run: " + ", ".join(f"{name} {outcome}" for name, outcome in outcomes.items()))
+        # The trainer only stages the inference bundle, it is served once every selected stage succeeded
+        frontend_config = config.get_frontend_config()
+        promote_file(frontend_config.staged_inference_bundle, frontend_config.inference_bundle)
+    finally:
+        report_path = profiler.write_report()
+        logger.info(f"Stage resource usage (run report: {report_path}):\n{profiler.summary_table()}")
 
 
 if __name__ == '__main__':
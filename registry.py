@@ -0,0 +1,46 @@
+"""
+Command line interface to the local model registry.
+
+    python registry.py list
+    python registry.py current
+    python registry.py promote <version>
+    python registry.py rollback
+
+Serving processes watch the registry pointer, so a promotion or a rollback is picked up by the
+next request without a restart.
+"""
+import argparse
+import json
+
+from src.mlops_water_potability_prediction_project.classes.model_registry import ModelRegistry
+from src.mlops_water_potability_prediction_project.config.configuration import ConfigurationManager
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List the registered versions.")
+    commands.add_parser("current", help="Print the promoted version.")
+    promote = commands.add_parser("promote", help="Promote a registered version.")
+    promote.add_argument("version")
+    commands.add_parser("rollback", help="Promote the previously promoted version again.")
+    args = parser.parse_args()
+
+    registry = ModelRegistry(ConfigurationManager().get_model_registry_config().root_dir)
+    if args.command == "list":
+        current = registry.current_version()
+        for manifest in registry.list_versions():
+            marker = "*" if manifest["version"] == current else " "
+            print(f"{marker} {manifest['version']}  {manifest['created_at']}  "
+                  f"{json.dumps(manifest['metadata'].get('metrics', {}))}")
+    elif args.command == "current":
+        print(registry.current_version() or "No version promoted yet")
+    elif args.command == "promote":
+        registry.promote(args.version)
+        print(f"Promoted {args.version}")
+    elif args.command == "rollback":
+        print(f"Rolled back to {registry.rollback()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""
+Pre-fork production server for the Flask app.
+
+The parent process imports app.py and loads the inference bundle (model, scaler and schema) once,
+then forks the workers, which share those pages copy-on-write. gc.freeze() moves everything loaded
+so far out of the garbage collector's reach, so collections in the workers do not write to (and
+copy) the shared pages. Every worker caps its CatBoost/OpenMP/BLAS threads so that
+workers x model threads does not oversubscribe the cores.
+
+Worker counts and threads come from the web_app.server section of config/config.yaml:
+    python serve.py
+    python serve.py --workers 8 --model-threads 1
+
+Notes:
+- Every worker keeps its own prediction cache. Training jobs are shared: their states and the lock
+  that lets only one run at a time live in the web_app.training_jobs directory, so any worker
+  answers GET /train/<job_id>. The new model is swapped in by the worker that started the job, and
+  picked up by the others through the artifact cache.
+- Workers pick up a retrained or promoted model on their own, the artifact cache checks the bundle
+  file (or the model registry pointer) on every request.
+"""
+import argparse
+import gc
+import os
+
+from gunicorn.app.base import BaseApplication
+
+from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.config.configuration import ConfigurationManager
+
+THREAD_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+
+def limit_model_threads(model_threads):
+    """
+    Caps the number of threads the model and the numerical libraries may use in this process.
+
+    Parameters:
+    - model_threads (int): The number of threads.
+    """
+    for env_var in THREAD_ENV_VARS:
+        os.environ[env_var] = str(model_threads)
+
+    # Libraries already loaded have sized their thread pools, resize them as well
+    from threadpoolctl import threadpool_limits
+    threadpool_limits(limits=model_threads)
+
+    from src.mlops_water_potability_prediction_project.classes.inference_bundle import InferenceBundle
+    InferenceBundle.model_thread_count = model_threads
+
+
+class PreforkServer(BaseApplication):
+    """
+    A gunicorn application preloading the Flask app and its artifacts before forking the workers.
+
+    Attributes:
+    - options (dict): The gunicorn settings.
+    - model_threads (int): The number of model threads of every worker.
+
+    Methods:
+    - __init__: Initializes a PreforkServer instance.
+    - load_config: Passes the settings to gunicorn.
+    - load: Imports the Flask app and loads the artifacts in the parent process.
+    - post_fork: Caps the model threads of a freshly forked worker and resumes a failed warm-up.
+    """
+
+    def __init__(self, options, model_threads):
+        """
+        Initializes a PreforkServer instance.
+
+        Parameters:
+        - options (dict): The gunicorn settings.
+        - model_threads (int): The number of model threads of every worker.
+        """
+        self.options = options
+        self.model_threads = model_threads
+        super().__init__()
+
+    def load_config(self):
+        """
+        Passes the settings to gunicorn.
+        """
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+        self.cfg.set("post_fork", self.post_fork)
+
+    def load(self):
+        """
+        Imports the Flask app and loads the artifacts in the parent process.
+
+        Returns:
+        - Flask: The WSGI application.
+        """
+        import app as web_app
+
+        # Finish the warm-up started by app.py before forking, threads do not survive a fork
+        if web_app.warmup.wait():
+            artifacts = web_app.frontend_predictor.artifact_cache.get()
+            # The model is unpickled lazily, do it here so the workers share it instead of each loading a copy
+            artifacts.bundle.preload()
+            logger.info(f"Preloaded inference bundle {artifacts.bundle.version} before forking the workers")
+        else:
+            logger.warning(f"Serving warm-up failed before forking the workers, they retry it on their own: "
+                           f"{web_app.warmup.status()['error']}")
+
+        # Keep the collector away from the preloaded objects so the workers do not copy their pages
+        gc.collect()
+        gc.freeze()
+        return web_app.app
+
+    def post_fork(self, server, worker):
+        """
+        Caps the model threads of a freshly forked worker and resumes a failed warm-up.
+
+        Parameters:
+        - server (gunicorn.arbiter.Arbiter): The gunicorn arbiter.
+        - worker (gunicorn.workers.base.Worker): The forked worker.
+        """
+        limit_model_threads(self.model_threads)
+        # The retries of the parent's warm-up thread do not survive the fork
+        import app as web_app
+        web_app.warmup.start()
+        logger.info(f"Worker {worker.pid} started with {self.model_threads} model thread(s)")
+
+
+def main():
+    server_config = ConfigurationManager().get_server_config()
+
+    parser = argparse.ArgumentParser(description="Run the pre-fork production server.")
+    parser.add_argument("--host", default=server_config.host)
+    parser.add_argument("--port", type=int, default=server_config.port)
+    parser.add_argument("--workers", type=int, default=server_config.workers)
+    parser.add_argument("--threads", type=int, default=server_config.threads_per_worker)
+    parser.add_argument("--model-threads", type=int, default=server_config.model_threads_per_worker)
+    args = parser.parse_args()
+
+    # Inherited by the workers, and read by any OpenMP/BLAS runtime loaded from here on
+    for env_var in THREAD_ENV_VARS:
+        os.environ[env_var] = str(args.model_threads)
+
+    options = {
+        "bind": f"{args.host}:{args.port}",
+        "workers": args.workers,
+        "threads": args.threads,
+        "worker_class": "gthread" if args.threads > 1 else "sync",
+        "preload_app": True,
+        "timeout": server_config.timeout,
+    }
+    PreforkServer(options, model_threads=args.model_threads).run()
+
+
+if __name__ == '__main__':
+    main()
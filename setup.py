@@ -25,5 +25,24 @@ setuptools.setup(
         "Bug Tracker": f"https://github.com/{AUTHOR_USER_NAME}/{REPO_NAME}/issues",
     },
     package_dir={"": "src"},
-    packages=setuptools.find_packages(where="src")
+    packages=setuptools.find_packages(where="src"),
+    python_requires=">=3.10",
+    # The runtime dependencies of the pipeline and the server (serve.py), as in pyproject.toml, and catboost
+    # to load the trained model
+    install_requires=[
+        "pandas>=2.2.0,<3",
+        "numpy>=1.26.3,<2",
+        "pyarrow>=15.0.0,<16",
+        "scikit-learn>=1.4.0,<2",
+        "catboost",
+        "joblib>=1.3.2,<2",
+        "mlflow==2.5.0",
+        "python-box>=7.1.1,<8",
+        "ensure>=1.0.4,<2",
+        "pyyaml>=6.0.1,<7",
+        "flask==2.3.3",
+        "flask-cors>=4.0.0,<5",
+        "gunicorn>=21.2.0,<22",
+        "uvicorn>=0.27.0,<0.28",
+    ],
 )
\ No newline at end of file
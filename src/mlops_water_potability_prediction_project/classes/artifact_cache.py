@@ -0,0 +1,186 @@
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.classes.compiled_schema import CompiledSchema
+from src.mlops_water_potability_prediction_project.classes.feature_vectorizer import FeatureVectorizer
+from src.mlops_water_potability_prediction_project.classes.model_registry import ModelRegistry
+from src.mlops_water_potability_prediction_project.entity.config_entity import ModelFrontendConfig
+
+
+@dataclass(frozen=True)
+class ServingArtifacts:
+    """
+    An immutable snapshot of the artifacts needed to serve predictions.
+
+    Attributes:
+    - bundle (InferenceBundle): The inference bundle holding the scaler, the model and the schema.
+    - schema (dict): The dataset schema holding the min/max of every column.
+    - feature_names (list): The feature column names, in canonical schema.yaml order (the model order).
+    - vectorizer (FeatureVectorizer): Converts input records into feature vectors in that order.
+    - compiled_schema (CompiledSchema): The schema min/max compiled into arrays in feature order.
+    - version (int): Incremented every time the snapshot is reloaded.
+    """
+    bundle: Any
+    schema: dict
+    feature_names: list
+    vectorizer: FeatureVectorizer
+    compiled_schema: CompiledSchema
+    version: int
+
+
+def file_signature(file_path: Path) -> Tuple[int, int]:
+    """
+    Get a cheap signature of a file that changes whenever the file is rewritten.
+
+    Parameters:
+    - file_path (Path): The path to the file.
+
+    Returns:
+    - Tuple[int, int]: The modification time in nanoseconds and the size in bytes.
+    """
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ArtifactCache:
+    """
+    A process-wide cache for the inference bundle (model, feature scaler and dataset schema).
+
+    The artifacts are loaded once and reloaded only when the bundle file changes on disk.
+    When the model registry has a promoted version, that version's bundle is served and the
+    registry pointer is watched instead: versions are immutable, so a promotion or a rollback
+    (an atomic rewrite of the pointer) is the only change to look for. Readers always get a
+    complete ServingArtifacts snapshot: a reload builds a new snapshot and swaps it in with a
+    single reference assignment, so in-flight requests keep using the snapshot they started with.
+
+    Attributes:
+    - config (ModelFrontendConfig): The configuration for the model frontend.
+    - registry (ModelRegistry): The model registry the promoted bundle is resolved from.
+    - reloads (int): The number of times the artifacts were loaded from disk.
+
+    Methods:
+    - __init__: Initializes an ArtifactCache instance with the provided configuration.
+    - get: Returns the current snapshot, reloading it first if any artifact changed.
+    - reload: Unconditionally loads all artifacts and swaps in a new snapshot.
+    - signatures: Returns the current on-disk signatures of the artifacts.
+    - bundle_path: Returns the path of the inference bundle to serve.
+    """
+
+    def __init__(self, config: ModelFrontendConfig):
+        """
+        Initializes an ArtifactCache instance with the provided configuration.
+
+        Parameters:
+        - config (ModelFrontendConfig): The configuration for the model frontend.
+        """
+        self.config = config
+        self.registry = ModelRegistry(config.model_registry_dir)
+        self.reloads = 0
+        self._lock = threading.Lock()
+        # (signatures, artifacts) is swapped as a single reference so readers never see a mixed pair
+        self._state: Tuple[Optional[tuple], Optional[ServingArtifacts]] = (None, None)
+
+    def signatures(self) -> tuple:
+        """
+        Returns the current on-disk signatures of the serving artifact files.
+
+        Returns:
+        - tuple: One (mtime_ns, size) pair per artifact.
+        """
+        try:
+            return (
+                file_signature(self.registry.pointer_path),
+            )
+        except FileNotFoundError:
+            return (
+                file_signature(self.config.inference_bundle),
+            )
+
+    def bundle_path(self) -> Path:
+        """
+        Returns the path of the inference bundle to serve.
+
+        Returns:
+        - Path: The bundle of the promoted registry version, or the trainer's bundle if none was promoted.
+        """
+        return self.registry.bundle_path() or Path(self.config.inference_bundle)
+
+    def get(self) -> ServingArtifacts:
+        """
+        Returns the current snapshot, reloading it first if any artifact changed on disk.
+
+        Returns:
+        - ServingArtifacts: The current serving artifacts.
+        """
+        signatures, artifacts = self._state
+        if artifacts is not None and self.signatures() == signatures:
+            return artifacts
+        return self.reload(only_if_changed=True)
+
+    def reload(self, only_if_changed: bool = False) -> ServingArtifacts:
+        """
+        Loads all artifacts and swaps in a new snapshot.
+
+        Parameters:
+        - only_if_changed (bool): Skip the load if another thread already reloaded the current files.
+
+        Returns:
+        - ServingArtifacts: The newly loaded (or already current) serving artifacts.
+        """
+        with self._lock:
+            signatures = self.signatures()
+            current_signatures, current = self._state
+            if only_if_changed and current is not None and signatures == current_signatures:
+                return current
+
+            # Imported on first load, so importing the serving modules stays cheap
+            import joblib
+            bundle_path = self.bundle_path()
+            bundle = joblib.load(bundle_path)
+
+            # Re-check the signatures: a file rewritten while we were reading it will be picked up next time
+            if self.signatures() != signatures:
+                signatures = None
+
+            # Requests are vectorized in schema.yaml order, which must be the order the model was trained on
+            feature_names = list(self.config.feature_columns)
+            if bundle.feature_names != feature_names:
+                raise ValueError(f"The inference bundle features {bundle.feature_names} do not match "
+                                 f"the schema.yaml feature columns {feature_names}")
+
+            version = current.version + 1 if current is not None else 1
+            vectorizer = FeatureVectorizer(feature_names, columns=bundle.schema.keys())
+            compiled_schema = CompiledSchema.from_schema(bundle.schema, feature_names)
+            artifacts = ServingArtifacts(bundle=bundle, schema=bundle.schema, feature_names=feature_names,
+                                         vectorizer=vectorizer, compiled_schema=compiled_schema, version=version)
+
+            self._state = (signatures, artifacts)
+            self.reloads += 1
+            logger.info(f"Loaded inference bundle {bundle.version} from {bundle_path} (cache version {version})")
+            return artifacts
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_artifact_cache(config: ModelFrontendConfig) -> ArtifactCache:
+    """
+    Returns the process-wide ArtifactCache for the given configuration, creating it on first use.
+
+    Parameters:
+    - config (ModelFrontendConfig): The configuration for the model frontend.
+
+    Returns:
+    - ArtifactCache: The shared artifact cache.
+    """
+    with _caches_lock:
+        cache = _caches.get(config)
+        if cache is None:
+            cache = ArtifactCache(config)
+            _caches[config] = cache
+        return cache
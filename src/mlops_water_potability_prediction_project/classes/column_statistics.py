@@ -0,0 +1,184 @@
+import numpy as np
+import pandas as pd
+
+
+class ColumnStatistics:
+    """
+    Count, null count, min, max, mean and variance of numeric columns, accumulated in one pass and mergeable.
+
+    Every block of rows is reduced column-wise with vectorized numpy operations, and its count, mean and
+    sum of squared deviations (M2) are merged into the running ones with the pairwise formulas of
+    Chan et al.: with delta = mean_b - mean_a and n = n_a + n_b,
+        mean = mean_a + delta * n_b / n
+        M2 = M2_a + M2_b + delta^2 * n_a * n_b / n
+    which stay accurate over many blocks, unlike sums of squares. The same merge combines the partial
+    statistics of chunks, partitions or worker processes (the instances are plain numpy arrays, so
+    they pickle), in any order. Missing values are counted as nulls and left out of the other statistics.
+
+    Attributes:
+    - STATISTICS (list): The statistics, in the order of the rows of to_frame.
+    - columns (list): The column names.
+    - count (np.ndarray): The number of non-missing values of every column.
+    - null_count (np.ndarray): The number of missing values of every column.
+    - min (np.ndarray): The min of every column, inf while no value was seen.
+    - max (np.ndarray): The max of every column, -inf while no value was seen.
+    - mean (np.ndarray): The mean of every column.
+    - m2 (np.ndarray): The sum of squared deviations from the mean of every column.
+
+    Methods:
+    - __init__: Initializes empty statistics of the given columns.
+    - update: Adds the rows of a DataFrame to the statistics.
+    - merge: Adds the statistics of other rows of the same columns.
+    - variance: Returns the population variance of every column.
+    - to_frame: Returns the statistics as a DataFrame, one row per statistic.
+    - from_frame: Builds the statistics back from the DataFrame of to_frame.
+    - standard_scaler: Returns a StandardScaler fitted from the statistics.
+    """
+
+    STATISTICS = ["min", "max", "count", "null_count", "mean", "var"]
+
+    def __init__(self, columns: list, block_rows: int = 1 << 16):
+        """
+        Initializes empty statistics of the given columns.
+
+        Parameters:
+        - columns (list): The column names.
+        - block_rows (int): The number of rows converted to float64 and reduced at a time, bounding the memory used.
+        """
+        self.columns = list(columns)
+        self.block_rows = block_rows
+        self.count = np.zeros(len(self.columns))
+        self.null_count = np.zeros(len(self.columns))
+        self.min = np.full(len(self.columns), np.inf)
+        self.max = np.full(len(self.columns), -np.inf)
+        self.mean = np.zeros(len(self.columns))
+        self.m2 = np.zeros(len(self.columns))
+
+    def update(self, dataframe: pd.DataFrame) -> "ColumnStatistics":
+        """
+        Adds the rows of a DataFrame to the statistics.
+
+        Parameters:
+        - dataframe (pd.DataFrame): The rows, holding at least the columns of the statistics.
+
+        Returns:
+        - ColumnStatistics: The statistics itself.
+        """
+        for start in range(0, len(dataframe), self.block_rows):
+            values = dataframe.iloc[start:start + self.block_rows][self.columns].to_numpy(dtype="float64")
+            missing = np.isnan(values)
+            count = len(values) - missing.sum(axis=0)
+            seen = count > 0
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean = np.where(seen, np.where(missing, 0.0, values).sum(axis=0) / count, 0.0)
+            block = ColumnStatistics(self.columns)
+            block.count = count.astype("float64")
+            block.null_count = missing.sum(axis=0).astype("float64")
+            block.min = np.where(missing, np.inf, values).min(axis=0)
+            block.max = np.where(missing, -np.inf, values).max(axis=0)
+            block.mean = mean
+            block.m2 = (np.where(missing, 0.0, values - mean) ** 2).sum(axis=0)
+            self.merge(block)
+        return self
+
+    def merge(self, other: "ColumnStatistics") -> "ColumnStatistics":
+        """
+        Adds the statistics of other rows of the same columns.
+
+        Parameters:
+        - other (ColumnStatistics): The statistics of the other rows.
+
+        Returns:
+        - ColumnStatistics: The statistics itself.
+
+        Raises:
+        - ValueError: If the statistics are not of the same columns.
+        """
+        if other.columns != self.columns:
+            raise ValueError(f"Cannot merge the statistics of columns {other.columns} into {self.columns}")
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.mean = np.where(self.count == 0, other.mean,
+                                 np.where(total > 0, self.mean + delta * other.count / total, 0.0))
+            self.m2 = np.where(total > 0, self.m2 + other.m2 + delta ** 2 * self.count * other.count / total, 0.0)
+        self.count = total
+        self.null_count = self.null_count + other.null_count
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        return self
+
+    def variance(self) -> np.ndarray:
+        """
+        Returns the population variance (ddof=0, as StandardScaler) of every column.
+
+        Returns:
+        - np.ndarray: The variances, NaN for the columns without values.
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 0, self.m2 / self.count, np.nan)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Returns the statistics as a DataFrame, one row per statistic and one column per column.
+
+        Returns:
+        - pd.DataFrame: The statistics, min/max/mean/var are NaN for the columns without values.
+        """
+        seen = self.count > 0
+        rows = {
+            "min": np.where(seen, self.min, np.nan),
+            "max": np.where(seen, self.max, np.nan),
+            "count": self.count,
+            "null_count": self.null_count,
+            "mean": np.where(seen, self.mean, np.nan),
+            "var": self.variance(),
+        }
+        return pd.DataFrame([rows[name] for name in self.STATISTICS], index=self.STATISTICS, columns=self.columns)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "ColumnStatistics":
+        """
+        Builds the statistics back from the DataFrame of to_frame, e.g. to merge new rows into saved statistics.
+
+        Parameters:
+        - frame (pd.DataFrame): The statistics, one row per statistic.
+
+        Returns:
+        - ColumnStatistics: The statistics.
+        """
+        statistics = cls(frame.columns)
+        row = lambda name: frame.loc[name].to_numpy(dtype="float64")
+        statistics.count = row("count")
+        statistics.null_count = row("null_count") if "null_count" in frame.index else np.zeros(len(frame.columns))
+        seen = statistics.count > 0
+        statistics.min = np.where(seen, row("min"), np.inf)
+        statistics.max = np.where(seen, row("max"), -np.inf)
+        statistics.mean = np.where(seen, row("mean"), 0.0)
+        statistics.m2 = np.where(seen, row("var") * statistics.count, 0.0)
+        return statistics
+
+    def standard_scaler(self, columns: list = None):
+        """
+        Returns a StandardScaler fitted from the statistics, without another pass over the data.
+        The scaler is fitted on a numpy array (it has no feature names), as the transformation stage does.
+
+        Parameters:
+        - columns (list): The columns to scale, in order, all columns if not given.
+
+        Returns:
+        - StandardScaler: The scaler, with the attributes fit would have set.
+        """
+        from sklearn.preprocessing import StandardScaler
+        index = [self.columns.index(col) for col in (columns or self.columns)]
+        count, mean, var = self.count[index], self.mean[index], self.variance()[index]
+
+        scaler = StandardScaler()
+        scaler.mean_ = mean
+        scaler.var_ = var
+        # As StandardScaler, the features constant up to rounding errors are not scaled
+        constant = var <= count * np.finfo(np.float64).eps * var + (count * mean * np.finfo(np.float64).eps) ** 2
+        scaler.scale_ = np.where(constant | (var == 0), 1.0, np.sqrt(var))
+        scaler.n_features_in_ = len(index)
+        scaler.n_samples_seen_ = int(count[0]) if len(set(count)) == 1 else count.astype("int64")
+        return scaler
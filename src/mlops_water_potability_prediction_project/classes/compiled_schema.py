@@ -0,0 +1,62 @@
+import numpy as np
+
+
+class CompiledSchema:
+    """
+    The dataset schema compiled into NumPy arrays aligned with the model feature order.
+
+    The schema JSON is parsed once per artifacts version instead of once per request (or per
+    field), and a whole batch matrix is range-checked with two vectorized comparisons.
+
+    Attributes:
+    - feature_names (list): The feature column names, in model order.
+    - mins (numpy.ndarray): The minimum allowed value of every feature.
+    - maxs (numpy.ndarray): The maximum allowed value of every feature.
+
+    Methods:
+    - __init__: Initializes a CompiledSchema instance.
+    - from_schema: Compiles a dataset schema dict.
+    - violations: Returns the per-row, per-column violation mask of a matrix.
+    """
+
+    def __init__(self, feature_names, mins, maxs):
+        """
+        Initializes a CompiledSchema instance.
+
+        Parameters:
+        - feature_names (list): The feature column names, in model order.
+        - mins (array-like): The minimum allowed value of every feature.
+        - maxs (array-like): The maximum allowed value of every feature.
+        """
+        self.feature_names = list(feature_names)
+        self.mins = np.asarray(mins, dtype=np.float64)
+        self.maxs = np.asarray(maxs, dtype=np.float64)
+
+    @classmethod
+    def from_schema(cls, schema, feature_names):
+        """
+        Compiles a dataset schema dict.
+
+        Parameters:
+        - schema (dict): The dataset schema holding the min/max of every column.
+        - feature_names (list): The feature column names, in model order.
+
+        Returns:
+        - CompiledSchema: The compiled schema.
+        """
+        mins = [schema[col]["min"] for col in feature_names]
+        maxs = [schema[col]["max"] for col in feature_names]
+        return cls(feature_names=feature_names, mins=mins, maxs=maxs)
+
+    def violations(self, data):
+        """
+        Returns the per-row, per-column violation mask of a matrix.
+
+        Parameters:
+        - data (numpy.ndarray): The (n_rows, n_features) matrix, in model feature order.
+
+        Returns:
+        - numpy.ndarray: A boolean mask, True where a value is out of range or NaN.
+        """
+        # NaN fails both comparisons, so missing values are flagged as well
+        return ~((data >= self.mins) & (data <= self.maxs))
@@ -1,10 +1,10 @@
 import json
+import os
+import shutil
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
-import joblib
-
 
 class DataLoaderSaver(ABC):
     """
@@ -36,6 +36,112 @@ class DataLoaderSaver(ABC):
         pass
 
 
+    def iter_chunks(self, file_path: Path, chunk_size: int, dtype: dict = None):
+        """
+        A method to load a dataset in chunks of rows. This default loads the whole dataset and slices it,
+        the formats that can be read in parts override it.
+
+        Args:
+            file_path: path to the dataset to load
+            chunk_size: number of rows per chunk
+            dtype: column dtypes to convert the chunks to
+        Returns:
+            Iterator[pd.DataFrame]: the chunks
+        """
+        data = self.load(file_path)
+        if dtype:
+            data = data.astype({col: col_dtype for col, col_dtype in dtype.items() if col in data.columns})
+        for start in range(0, max(len(data), 1), chunk_size):
+            yield data.iloc[start:start + chunk_size]
+
+    def chunk_writer(self, file_path: Path, dtype: dict = None) -> "ChunkWriter":
+        """
+        A method to save a dataset chunk by chunk.
+
+        Args:
+            file_path: path to the dataset to save
+            dtype: column dtypes of the dataset, saved without rows if no chunk is written
+        Returns:
+            ChunkWriter: a context manager whose write method takes the chunks in order
+        """
+        return ChunkWriter(self, file_path, dtype)
+
+
+class ChunkWriter:
+    """
+    A class to save a dataset chunk by chunk, used as a context manager. The dataset is only complete
+    once the context exits without an error.
+
+    This default keeps the chunks and saves them at once on exit, the formats that can be appended
+    to write every chunk as it comes, so only one chunk is held in memory. If no chunk was written,
+    a dataset without rows with the given column dtypes is saved.
+    """
+    def __init__(self, loader_saver: DataLoaderSaver, file_path: Path, dtype: dict = None):
+        self.loader_saver = loader_saver
+        self.file_path = file_path
+        self.dtype = dtype
+        self.chunks = []
+
+    def write(self, chunk: Any) -> None:
+        """
+        A method to save the next chunk.
+
+        Args:
+            chunk: the DataFrame to save after the previous chunks
+        Returns:
+            None
+        """
+        self.chunks.append(chunk)
+
+    def close(self) -> None:
+        """
+        A method to complete the dataset once all chunks are written.
+        """
+        import pandas as pd
+        self.loader_saver.save(self.file_path, pd.concat(self.chunks or [empty_frame(self.dtype)], ignore_index=True))
+
+    def discard(self) -> None:
+        """
+        A method to release the resources of the writer after an error.
+        """
+        self.chunks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+def empty_frame(dtype: dict = None) -> Any:
+    """
+    A function to build a DataFrame without rows, what a dataset of no chunk is saved as.
+
+    Args:
+        dtype: the column dtypes
+    Returns:
+        pd.DataFrame: the empty DataFrame
+    """
+    import pandas as pd
+    return pd.DataFrame({col: pd.Series(dtype=col_dtype) for col, col_dtype in (dtype or {}).items()})
+
+
+def temporary_path(file_path: Path) -> Path:
+    """
+    A function to name the file a chunk writer writes to before renaming it into place, next to the target so
+    that the rename is atomic.
+
+    Args:
+        file_path: path to the dataset being written
+    Returns:
+        Path: the temporary path
+    """
+    return Path(file_path).with_name(f".tmp-{Path(file_path).name}")
+
+
 class JSONDataLoaderSaver(DataLoaderSaver):
     """
     A class to load and save JSON data.
@@ -91,6 +197,8 @@ class JobLibDataLoaderSaver(DataLoaderSaver):
         Returns:
             Any: object
         """
+        # Imported on use, so importing the helpers does not pull in joblib
+        import joblib
         try:
             content = joblib.load(file_path)
             return content
@@ -111,7 +219,651 @@ class JobLibDataLoaderSaver(DataLoaderSaver):
         Returns:
             None
         """
+        import joblib
         try:
             joblib.dump(value=data, filename=file_path)
         except Exception as e:
-            print(f"An error occurred while saving data: {e}")
\ No newline at end of file
+            print(f"An error occurred while saving data: {e}")
+
+
+class CSVDataLoaderSaver(DataLoaderSaver):
+    """
+    A class to load and save DataFrames as CSV text.
+    """
+    def load(self, file_path: Path) -> Any:
+        """
+        A method to load a DataFrame from the given file path.
+
+        Args:
+            file_path: path to the csv file to load
+        Returns:
+            pd.DataFrame: the dataset
+        """
+        import pandas as pd
+        return pd.read_csv(file_path)
+
+    def save(self, file_path: Path, data: Any) -> None:
+        """
+        A method to save a DataFrame to the given file path.
+
+        Args:
+            file_path: path to the csv file to save
+            data: the DataFrame to save
+        Returns:
+            None
+        """
+        data.to_csv(file_path, index=False)
+
+    def iter_chunks(self, file_path: Path, chunk_size: int, dtype: dict = None):
+        """
+        A method to parse the CSV file in chunks of rows.
+
+        Args:
+            file_path: path to the csv file to load
+            chunk_size: number of rows per chunk
+            dtype: column dtypes to parse into, so that every chunk gets the same dtypes
+        Returns:
+            Iterator[pd.DataFrame]: the chunks
+        """
+        import pandas as pd
+        with pd.read_csv(file_path, chunksize=chunk_size, dtype=dtype) as reader:
+            yield from reader
+
+    def chunk_writer(self, file_path: Path, dtype: dict = None) -> ChunkWriter:
+        """
+        A method to save a CSV file chunk by chunk, the header is written with the first chunk.
+
+        Args:
+            file_path: path to the csv file to save
+            dtype: column dtypes of the dataset, saved without rows if no chunk is written
+        Returns:
+            ChunkWriter: the writer
+        """
+        return CSVChunkWriter(file_path, dtype=dtype)
+
+
+class CSVChunkWriter(ChunkWriter):
+    """
+    A class to write CSV text chunk by chunk, to a plain file or to the CSV member of a zip archive. The file is
+    written under a temporary name and renamed into place on close, so an error never leaves a truncated file.
+    """
+    def __init__(self, file_path: Path, dtype: dict = None, archive_member: str = None):
+        import io
+        import zipfile
+        self.file_path = file_path
+        self.tmp_path = temporary_path(file_path)
+        self.dtype = dtype
+        self.header = True
+        self.archive = None
+        if archive_member is None:
+            self.file = open(self.tmp_path, 'w', encoding='utf-8', newline='')
+        else:
+            self.archive = zipfile.ZipFile(self.tmp_path, 'w', compression=zipfile.ZIP_DEFLATED)
+            member = self.archive.open(archive_member, 'w', force_zip64=True)
+            self.file = io.TextIOWrapper(member, encoding='utf-8', newline='')
+
+    def write(self, chunk: Any) -> None:
+        chunk.to_csv(self.file, index=False, header=self.header)
+        self.header = False
+
+    def close(self) -> None:
+        if self.header:
+            # No chunk was written, write the header alone
+            self.write(empty_frame(self.dtype))
+        self._close_files()
+        os.replace(self.tmp_path, self.file_path)
+
+    def discard(self) -> None:
+        self._close_files()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+    def _close_files(self) -> None:
+        self.file.close()
+        if self.archive is not None:
+            self.archive.close()
+
+
+class ParquetDataLoaderSaver(DataLoaderSaver):
+    """
+    A class to load and save DataFrames as Parquet (columnar, compressed, requires pyarrow).
+    """
+    def load(self, file_path: Path) -> Any:
+        """
+        A method to load a DataFrame from the given file path.
+
+        Args:
+            file_path: path to the parquet file to load
+        Returns:
+            pd.DataFrame: the dataset
+        """
+        import pyarrow.parquet as pq
+        return pq.read_table(file_path, memory_map=True).to_pandas(split_blocks=True, self_destruct=True)
+
+    def save(self, file_path: Path, data: Any) -> None:
+        """
+        A method to save a DataFrame to the given file path.
+
+        Args:
+            file_path: path to the parquet file to save
+            data: the DataFrame to save
+        Returns:
+            None
+        """
+        data.to_parquet(file_path, engine="pyarrow", index=False)
+
+    def iter_chunks(self, file_path: Path, chunk_size: int, dtype: dict = None):
+        """
+        A method to read the Parquet file in chunks of rows, one record batch at a time.
+
+        Args:
+            file_path: path to the parquet file to load
+            chunk_size: number of rows per chunk
+            dtype: column dtypes to convert the chunks to
+        Returns:
+            Iterator[pd.DataFrame]: the chunks
+        """
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(file_path, memory_map=True).iter_batches(batch_size=chunk_size):
+            chunk = batch.to_pandas()
+            yield chunk.astype({col: col_dtype for col, col_dtype in (dtype or {}).items() if col in chunk.columns})
+
+    def chunk_writer(self, file_path: Path, dtype: dict = None) -> ChunkWriter:
+        """
+        A method to save a Parquet file chunk by chunk, every chunk is a row group.
+
+        Args:
+            file_path: path to the parquet file to save
+            dtype: column dtypes of the dataset, saved without rows if no chunk is written
+        Returns:
+            ChunkWriter: the writer
+        """
+        import pyarrow.parquet as pq
+        return ArrowChunkWriter(file_path, pq.ParquetWriter, dtype)
+
+
+class FeatherDataLoaderSaver(DataLoaderSaver):
+    """
+    A class to load and save DataFrames as uncompressed Feather (Arrow IPC, requires pyarrow).
+
+    The file is memory-mapped on load and every column is converted into its own block, so the
+    numeric columns without missing values are not copied.
+    """
+    def load(self, file_path: Path) -> Any:
+        """
+        A method to load a DataFrame from the given file path.
+
+        Args:
+            file_path: path to the feather file to load
+        Returns:
+            pd.DataFrame: the dataset
+        """
+        import pyarrow.feather as feather
+        return feather.read_table(file_path, memory_map=True).to_pandas(split_blocks=True, self_destruct=True)
+
+    def save(self, file_path: Path, data: Any) -> None:
+        """
+        A method to save a DataFrame to the given file path.
+
+        Args:
+            file_path: path to the feather file to save
+            data: the DataFrame to save
+        Returns:
+            None
+        """
+        import pyarrow.feather as feather
+        feather.write_feather(data.reset_index(drop=True), file_path, compression="uncompressed")
+
+    def iter_chunks(self, file_path: Path, chunk_size: int, dtype: dict = None):
+        """
+        A method to read the memory-mapped Feather file in chunks of rows.
+
+        Args:
+            file_path: path to the feather file to load
+            chunk_size: number of rows per chunk
+            dtype: column dtypes to convert the chunks to
+        Returns:
+            Iterator[pd.DataFrame]: the chunks
+        """
+        import pyarrow.feather as feather
+        table = feather.read_table(file_path, memory_map=True)
+        for start in range(0, max(table.num_rows, 1), chunk_size):
+            chunk = table.slice(start, chunk_size).to_pandas(split_blocks=True)
+            yield chunk.astype({col: col_dtype for col, col_dtype in (dtype or {}).items() if col in chunk.columns})
+
+    def chunk_writer(self, file_path: Path, dtype: dict = None) -> ChunkWriter:
+        """
+        A method to save an uncompressed Feather file chunk by chunk, every chunk is a record batch.
+
+        Args:
+            file_path: path to the feather file to save
+            dtype: column dtypes of the dataset, saved without rows if no chunk is written
+        Returns:
+            ChunkWriter: the writer
+        """
+        import pyarrow as pa
+        return ArrowChunkWriter(file_path, pa.ipc.new_file, dtype)
+
+
+class ArrowChunkWriter(ChunkWriter):
+    """
+    A class to write chunks as Arrow tables to a Parquet or Arrow IPC (Feather) writer, opened with the
+    schema of the first chunk (or of the given column dtypes if no chunk is written). The file is written
+    under a temporary name and renamed into place on close, so an error never leaves a truncated file.
+    """
+    def __init__(self, file_path: Path, open_writer, dtype: dict = None):
+        self.file_path = file_path
+        self.tmp_path = temporary_path(file_path)
+        self.open_writer = open_writer
+        self.dtype = dtype
+        self.writer = None
+
+    def write(self, chunk: Any) -> None:
+        import pyarrow as pa
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if self.writer is None:
+            self.writer = self.open_writer(str(self.tmp_path), table.schema)
+        self.writer.write_table(table)
+
+    def close(self) -> None:
+        if self.writer is None:
+            self.write(empty_frame(self.dtype))
+        self.writer.close()
+        os.replace(self.tmp_path, self.file_path)
+
+    def discard(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+class NumpyDataLoaderSaver(DataLoaderSaver):
+    """
+    A class to load and save numeric DataFrames as a column-major float64 .npy array.
+
+    The column names and dtypes are kept in a "<file>.columns.json" sidecar. The array is
+    memory-mapped read-only on load, every float64 column is a view on the mapped file and only
+    the columns of other dtypes (e.g. an int64 target) are converted back.
+    """
+    def load(self, file_path: Path) -> Any:
+        """
+        A method to load a DataFrame from the given file path.
+
+        Args:
+            file_path: path to the npy file to load
+        Returns:
+            pd.DataFrame: the dataset
+        """
+        import numpy as np
+        import pandas as pd
+        with open(f"{file_path}.columns.json") as f:
+            dtypes = json.load(f)
+        array = np.load(file_path, mmap_mode='r')
+        # The transposed column-major array is the row-major block pandas stores, so no copy is made
+        dataframe = pd.DataFrame(array, columns=list(dtypes), copy=False)
+        for col, dtype in dtypes.items():
+            if dtype != "float64":
+                dataframe[col] = dataframe[col].astype(dtype)
+        return dataframe
+
+    def save(self, file_path: Path, data: Any) -> None:
+        """
+        A method to save a DataFrame to the given file path.
+
+        Args:
+            file_path: path to the npy file to save
+            data: the numeric DataFrame to save
+        Returns:
+            None
+        """
+        import numpy as np
+        # Column-major, so every column is one contiguous slice of the file
+        np.save(file_path, np.asfortranarray(data.to_numpy(dtype="float64")))
+        with open(f"{file_path}.columns.json", 'w') as f:
+            json.dump({col: str(dtype) for col, dtype in data.dtypes.items()}, f, indent=4)
+
+    def chunk_writer(self, file_path: Path, dtype: dict = None) -> ChunkWriter:
+        """
+        A method to save a column-major .npy file chunk by chunk. The number of rows is only known at
+        the end, so the chunks are spilled row-major to a temporary file and copied into the column-major
+        array block by block.
+
+        Args:
+            file_path: path to the npy file to save
+            dtype: column dtypes of the dataset, saved without rows if no chunk is written
+        Returns:
+            ChunkWriter: the writer
+        """
+        return NumpyChunkWriter(file_path, dtype)
+
+
+class NumpyChunkWriter(ChunkWriter):
+    """
+    A class to write a column-major float64 .npy file chunk by chunk through a row-major spill file. The array
+    and its columns sidecar are written under temporary names and renamed into place on close, so an error never
+    leaves a truncated file.
+    """
+    def __init__(self, file_path: Path, dtype: dict = None):
+        self.file_path = file_path
+        self.tmp_path = temporary_path(file_path)
+        self.spill_path = f"{file_path}.rows.tmp"
+        self.spill = open(self.spill_path, 'wb')
+        self.dtype = dtype
+        self.dtypes = None
+        self.rows = 0
+        self.block_rows = 1
+
+    def write(self, chunk: Any) -> None:
+        if self.dtypes is None:
+            self.dtypes = {col: str(dtype) for col, dtype in chunk.dtypes.items()}
+        self.spill.write(chunk.to_numpy(dtype="float64").tobytes(order='C'))
+        self.rows += len(chunk)
+        self.block_rows = max(self.block_rows, len(chunk))
+
+    def close(self) -> None:
+        import numpy as np
+        self.spill.close()
+        if self.dtypes is None:
+            # No chunk was written, the columns are the given ones
+            self.dtypes = {col: str(col_dtype) for col, col_dtype in (self.dtype or {}).items()}
+        n_columns = len(self.dtypes)
+        array = np.lib.format.open_memmap(self.tmp_path, mode='w+', dtype="float64",
+                                          shape=(self.rows, n_columns), fortran_order=True)
+        if self.rows and n_columns:
+            rows = np.memmap(self.spill_path, dtype="float64", mode='r', shape=(self.rows, n_columns))
+            for start in range(0, self.rows, self.block_rows):
+                array[start:start + self.block_rows] = rows[start:start + self.block_rows]
+            del rows
+        array.flush()
+        del array
+        os.remove(self.spill_path)
+        with open(f"{self.tmp_path}.columns.json", 'w') as f:
+            json.dump(self.dtypes, f, indent=4)
+        os.replace(self.tmp_path, self.file_path)
+        os.replace(f"{self.tmp_path}.columns.json", f"{self.file_path}.columns.json")
+
+    def discard(self) -> None:
+        self.spill.close()
+        for path in (self.spill_path, self.tmp_path, f"{self.tmp_path}.columns.json"):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+class ZipCSVDataLoaderSaver(DataLoaderSaver):
+    """
+    A class to load and save DataFrames as a CSV inside a zip archive.
+
+    The CSV member is decompressed while it is parsed, it is never extracted to disk.
+    """
+    def load(self, file_path: Path) -> Any:
+        """
+        A method to load a DataFrame from the CSV member of the given zip archive.
+
+        Args:
+            file_path: path to the zip archive holding one CSV file
+        Returns:
+            pd.DataFrame: the dataset
+        """
+        import zipfile
+        import pandas as pd
+        with zipfile.ZipFile(file_path, 'r') as archive:
+            members = [name for name in archive.namelist() if name.lower().endswith(".csv")]
+            if len(members) != 1:
+                raise ValueError(f"Expected exactly one CSV file in {file_path}, found {members}")
+            with archive.open(members[0]) as f:
+                return pd.read_csv(f)
+
+    def save(self, file_path: Path, data: Any) -> None:
+        """
+        A method to save a DataFrame as a CSV inside a zip archive at the given file path.
+
+        Args:
+            file_path: path to the zip archive to save
+            data: the DataFrame to save
+        Returns:
+            None
+        """
+        data.to_csv(file_path, index=False,
+                    compression={"method": "zip", "archive_name": Path(file_path).with_suffix(".csv").name})
+
+    def iter_chunks(self, file_path: Path, chunk_size: int, dtype: dict = None):
+        """
+        A method to parse the CSV member of the given zip archive in chunks of rows, as it is decompressed.
+
+        Args:
+            file_path: path to the zip archive holding one CSV file
+            chunk_size: number of rows per chunk
+            dtype: column dtypes to parse into, so that every chunk gets the same dtypes
+        Returns:
+            Iterator[pd.DataFrame]: the chunks
+        """
+        import zipfile
+        import pandas as pd
+        with zipfile.ZipFile(file_path, 'r') as archive:
+            members = [name for name in archive.namelist() if name.lower().endswith(".csv")]
+            if len(members) != 1:
+                raise ValueError(f"Expected exactly one CSV file in {file_path}, found {members}")
+            with archive.open(members[0]) as f, pd.read_csv(f, chunksize=chunk_size, dtype=dtype) as reader:
+                yield from reader
+
+    def chunk_writer(self, file_path: Path, dtype: dict = None) -> ChunkWriter:
+        """
+        A method to save a CSV inside a zip archive chunk by chunk, compressed as it is written.
+
+        Args:
+            file_path: path to the zip archive to save
+            dtype: column dtypes of the dataset, saved without rows if no chunk is written
+        Returns:
+            ChunkWriter: the writer
+        """
+        return CSVChunkWriter(file_path, dtype=dtype, archive_member=Path(file_path).with_suffix(".csv").name)
+
+
+PARTITION_MANIFEST = "_manifest.json"
+
+
+class PartitionedDataLoaderSaver(DataLoaderSaver):
+    """
+    A class to load and save a dataset split into partition files, listed in order in a "_manifest.json".
+
+    Every partition can be in any of the dataset formats, chosen by its extension, and the partitions saved
+    or appended are written in the partition format. New partitions can be appended without rewriting the
+    existing ones.
+    """
+    def __init__(self, partition_format: str = "feather"):
+        """
+        A method to create a loader/saver of partitioned datasets.
+
+        Args:
+            partition_format: the dataset format the partitions are written in, e.g. "feather" or "csv"
+        Returns:
+            None
+        """
+        if f".{partition_format}" not in DATASET_FORMATS:
+            raise ValueError(f"Unsupported partition format {partition_format!r}, "
+                             f"expected one of: {', '.join(suffix[1:] for suffix in DATASET_FORMATS)}")
+        self.partition_format = partition_format
+
+    def read_manifest(self, dir_path: Path) -> dict:
+        """
+        A method to read the partition manifest.
+
+        Args:
+            dir_path: path to the partitioned dataset directory
+        Returns:
+            dict: the manifest, with an empty partition list if there is none yet
+        """
+        try:
+            with open(Path(dir_path) / PARTITION_MANIFEST) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"partitions": []}
+
+    def iter_partitions(self, dir_path: Path):
+        """
+        A method to load the partitions one at a time, in manifest order.
+
+        Args:
+            dir_path: path to the partitioned dataset directory
+        Returns:
+            Iterator[pd.DataFrame]: the partitions
+        """
+        for partition in self.read_manifest(dir_path)["partitions"]:
+            yield dataset_loader_saver(partition["path"]).load(partition["path"])
+
+    def load(self, dir_path: Path) -> Any:
+        """
+        A method to load all partitions as one DataFrame.
+
+        Args:
+            dir_path: path to the partitioned dataset directory
+        Returns:
+            pd.DataFrame: the dataset
+        """
+        import pandas as pd
+        return pd.concat(self.iter_partitions(dir_path), ignore_index=True)
+
+    def save(self, dir_path: Path, data: Any) -> None:
+        """
+        A method to save a DataFrame as a single partition, in the partition format.
+
+        Args:
+            dir_path: path to the partitioned dataset directory
+            data: the DataFrame to save
+        Returns:
+            None
+        """
+        Path(dir_path).mkdir(parents=True, exist_ok=True)
+        partition_path = self._partition_path(dir_path, 0)
+        dataset_loader_saver(partition_path).save(partition_path, data)
+        manifest = {"partitions": [{"source": None, "path": partition_path, "rows": len(data)}]}
+        self._write_manifest(dir_path, manifest)
+        self._remove_unlisted_partitions(dir_path, manifest)
+
+    def append(self, dir_path: Path, data: Any, source: str = None) -> dict:
+        """
+        A method to save a DataFrame as a new partition after the existing ones, in the partition format.
+
+        Args:
+            dir_path: path to the partitioned dataset directory
+            data: the DataFrame to save
+            source: what the partition was made from, recorded in the manifest
+        Returns:
+            dict: the manifest entry of the new partition
+        """
+        Path(dir_path).mkdir(parents=True, exist_ok=True)
+        manifest = self.read_manifest(dir_path)
+        partition_path = self._partition_path(dir_path, len(manifest["partitions"]))
+        dataset_loader_saver(partition_path).save(partition_path, data)
+        entry = {"source": source, "path": partition_path, "rows": len(data)}
+        manifest["partitions"].append(entry)
+        self._write_manifest(dir_path, manifest)
+        return entry
+
+    def iter_chunks(self, dir_path: Path, chunk_size: int, dtype: dict = None):
+        """
+        A method to load the partitions in chunks of rows, in manifest order.
+
+        Args:
+            dir_path: path to the partitioned dataset directory
+            chunk_size: number of rows per chunk, a chunk never spans two partitions
+            dtype: column dtypes to convert the chunks to
+        Returns:
+            Iterator[pd.DataFrame]: the chunks
+        """
+        for partition in self.read_manifest(dir_path)["partitions"]:
+            yield from dataset_loader_saver(partition["path"]).iter_chunks(partition["path"], chunk_size, dtype)
+
+    def chunk_writer(self, dir_path: Path, dtype: dict = None) -> ChunkWriter:
+        """
+        A method to save a partitioned dataset chunk by chunk, every chunk is a partition. The previous partitions
+        are replaced once the context exits without an error.
+
+        Args:
+            dir_path: path to the partitioned dataset directory
+            dtype: column dtypes of the dataset, saved without rows if no chunk is written
+        Returns:
+            ChunkWriter: the writer
+        """
+        return PartitionChunkWriter(self, dir_path, dtype)
+
+    def _partition_path(self, dir_path: Path, index: int) -> str:
+        return str(Path(dir_path) / f"part-{index:05d}.{self.partition_format}")
+
+    @staticmethod
+    def _remove_unlisted_partitions(dir_path: Path, manifest: dict) -> None:
+        # Remove the partitions appended since the last save, and those of another format, with their sidecars
+        kept = {Path(partition["path"]).name for partition in manifest["partitions"]}
+        for stale_path in Path(dir_path).glob("part-*"):
+            if stale_path.name not in kept and stale_path.name.removesuffix(".columns.json") not in kept:
+                stale_path.unlink()
+
+    @staticmethod
+    def _write_manifest(dir_path: Path, manifest: dict) -> None:
+        # Replace the manifest atomically, a reader never sees a partition list that is half written
+        manifest_path = Path(dir_path) / PARTITION_MANIFEST
+        with open(f"{manifest_path}.tmp", 'w') as f:
+            json.dump(manifest, f, indent=4)
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+
+
+class PartitionChunkWriter(ChunkWriter):
+    """
+    A class to write every chunk as a new partition of a partitioned dataset. The partitions are appended to a
+    staging directory next to the dataset, and on close they are moved into it and the manifest is swapped for
+    theirs, so an error leaves the previous partitions and manifest as they were.
+    """
+    def __init__(self, loader_saver: PartitionedDataLoaderSaver, file_path: Path, dtype: dict = None):
+        super().__init__(loader_saver, file_path, dtype)
+        self.staging_path = temporary_path(file_path)
+        # The staging directory of a writer that was killed is left over, start from an empty one
+        shutil.rmtree(self.staging_path, ignore_errors=True)
+
+    def write(self, chunk: Any) -> None:
+        self.loader_saver.append(self.staging_path, chunk)
+
+    def close(self) -> None:
+        manifest = self.loader_saver.read_manifest(self.staging_path)
+        if not manifest["partitions"]:
+            self.write(empty_frame(self.dtype))
+            manifest = self.loader_saver.read_manifest(self.staging_path)
+        Path(self.file_path).mkdir(parents=True, exist_ok=True)
+        for staged_path in Path(self.staging_path).glob("part-*"):
+            os.replace(staged_path, Path(self.file_path) / staged_path.name)
+        for partition in manifest["partitions"]:
+            partition["path"] = str(Path(self.file_path) / Path(partition["path"]).name)
+        self.loader_saver._write_manifest(self.file_path, manifest)
+        self.loader_saver._remove_unlisted_partitions(self.file_path, manifest)
+        shutil.rmtree(self.staging_path)
+
+    def discard(self) -> None:
+        shutil.rmtree(self.staging_path, ignore_errors=True)
+
+
+DATASET_FORMATS = {
+    ".csv": CSVDataLoaderSaver,
+    ".zip": ZipCSVDataLoaderSaver,
+    ".parquet": ParquetDataLoaderSaver,
+    ".feather": FeatherDataLoaderSaver,
+    ".npy": NumpyDataLoaderSaver,
+}
+
+
+def dataset_loader_saver(file_path: Path, partition_format: str = "feather") -> DataLoaderSaver:
+    """
+    Returns the loader/saver of a dataset file, chosen by its extension (a directory is a partitioned dataset).
+
+    Args:
+        file_path: path to the dataset file
+        partition_format: the dataset format new partitions are written in, for a partitioned dataset
+    Returns:
+        DataLoaderSaver: the loader/saver of the file format
+    """
+    suffix = Path(file_path).suffix.lower()
+    if Path(file_path).is_dir() or not suffix:
+        return PartitionedDataLoaderSaver(partition_format)
+    if suffix not in DATASET_FORMATS:
+        raise ValueError(f"Unsupported dataset format {suffix!r} of {file_path}, "
+                         f"expected one of: {', '.join(DATASET_FORMATS)}")
+    return DATASET_FORMATS[suffix]()
@@ -0,0 +1,109 @@
+import numpy as np
+
+
+class FeatureVectorizer:
+    """
+    Converts input records straight into float64 feature vectors in the canonical schema.yaml column order.
+
+    Form and JSON values arrive as strings or numbers keyed by column name. They are parsed into a
+    preallocated float64 row (or matrix) by column position, so no intermediate string array or pandas
+    DataFrame is built and the result does not depend on the order of the submitted fields.
+
+    Attributes:
+    - UNKNOWN_COLUMN_MESSAGE (str): The prefix of the error reported for columns the schema does not know.
+    - NOT_A_MAPPING_MESSAGE (str): The error reported for a record that is not a mapping.
+    - feature_names (list): The feature column names, in canonical order.
+    - columns (frozenset): Every column name the schema knows, including the target.
+
+    Methods:
+    - __init__: Initializes a FeatureVectorizer instance.
+    - row: Converts a single record into a feature vector.
+    - matrix: Converts a list of records into a feature matrix.
+    """
+    UNKNOWN_COLUMN_MESSAGE = "Values entered are not in feature columns"
+    NOT_A_MAPPING_MESSAGE = "Row is not a mapping of feature names to values"
+
+    def __init__(self, feature_names, columns=None):
+        """
+        Initializes a FeatureVectorizer instance.
+
+        Parameters:
+        - feature_names (list): The feature column names, in canonical order.
+        - columns (iterable): Every column name the schema knows, defaults to the feature names.
+        """
+        self.feature_names = list(feature_names)
+        self.columns = frozenset(columns if columns is not None else feature_names)
+
+    def row(self, record, out=None):
+        """
+        Converts a single record into a feature vector.
+
+        Parameters:
+        - record (dict): A mapping of column names to values.
+        - out (numpy.ndarray): An optional preallocated float64 vector to fill.
+
+        Returns:
+        - tuple: The (n_features,) vector, with NaN for bad values, and the list of error messages.
+        """
+        if out is None:
+            out = np.empty(len(self.feature_names), dtype=np.float64)
+        errors = self._record_errors(record)
+        if not isinstance(record, dict):
+            out.fill(np.nan)
+            return out, errors
+
+        for j, col in enumerate(self.feature_names):
+            val = record.get(col)
+            out[j] = self._parse(val)
+            if out[j] != out[j]:
+                errors.append(self._value_error(col, val))
+        return out, errors
+
+    def matrix(self, records, out=None):
+        """
+        Converts a list of records into a feature matrix, one column at a time.
+
+        Parameters:
+        - records (list): A list of mappings of column names to values.
+        - out (numpy.ndarray): An optional preallocated (n_rows, n_features) float64 matrix to fill.
+
+        Returns:
+        - tuple: The (n_rows, n_features) matrix, with NaN for bad values, and a list of error messages per row.
+        """
+        if out is None:
+            out = np.empty((len(records), len(self.feature_names)), dtype=np.float64)
+        errors = [self._record_errors(record) for record in records]
+
+        for j, col in enumerate(self.feature_names):
+            values = [record.get(col) if isinstance(record, dict) else None for record in records]
+            try:
+                out[:, j] = np.array(values, dtype=np.float64)
+            except (TypeError, ValueError):
+                # Fall back to a per-value parse only for columns holding unparseable values
+                for row, val in enumerate(values):
+                    out[row, j] = self._parse(val)
+            # Every NaN left in the column is a missing, unparseable or literal NaN value
+            for row in np.flatnonzero(np.isnan(out[:, j])):
+                val = values[row]
+                if val is not None or isinstance(records[row], dict):
+                    errors[row].append(self._value_error(col, val))
+
+        return out, errors
+
+    def _record_errors(self, record):
+        # The errors of the record itself: not a mapping, or holding columns the schema does not know
+        if not isinstance(record, dict):
+            return [self.NOT_A_MAPPING_MESSAGE]
+        return [f"{self.UNKNOWN_COLUMN_MESSAGE}: {col}" for col in record if col not in self.columns]
+
+    @staticmethod
+    def _parse(val):
+        # The per-value conversion of row() and of the matrix() columns that NumPy cannot convert at once
+        try:
+            return float(val)
+        except (TypeError, ValueError):
+            return np.nan
+
+    @staticmethod
+    def _value_error(col, val):
+        return f"Missing feature column: {col}" if val is None else f"Value is not a number: {col}={val!r}"
@@ -0,0 +1,192 @@
+import pickle
+from datetime import datetime, timezone
+
+import numpy as np
+
+
+class InferenceBundle:
+    """
+    A single, versioned serving artifact holding the feature scaler, the model and the dataset schema.
+
+    The bundle takes raw (unscaled) feature vectors in training column order. The StandardScaler
+    is reduced to its mean and scale vectors and applied as one NumPy affine step right before
+    the model call, so no pandas DataFrame or separate scaler artifact is needed at inference time.
+
+    The model is pickled separately and only unpickled on first use. When the NumPy tree engine is
+    present, serving never touches the model, so loading the bundle does not import CatBoost (or
+    the pandas it pulls in) and cold starts stay short.
+
+    Attributes:
+    - FORMAT_VERSION (int): The version of the bundle layout, bumped on incompatible changes.
+    - model_thread_count (int): The number of threads the model may use per call, None for the model default.
+    - model: The trained machine learning model, expecting scaled features.
+    - engine (ObliviousTreeEnsemble): An optional NumPy evaluator of the model, used instead of it when set.
+    - mean (numpy.ndarray): The per-feature mean subtracted by the scaler.
+    - scale (numpy.ndarray): The per-feature scale divided by the scaler.
+    - feature_names (list): The feature column names, in model order.
+    - target_column (str): The name of the target column.
+    - schema (dict): The dataset schema holding the min/max of every column.
+    - version (str): The version of this bundle, set when it is built.
+
+    Methods:
+    - __init__: Initializes an InferenceBundle instance.
+    - from_scaler: Builds a bundle from a trained model and a fitted StandardScaler.
+    - preload: Unpickles the model now if predictions will use it, instead of on the first prediction.
+    - transform: Applies the feature scaling to raw feature vectors.
+    - predict_scaled: Makes predictions from already scaled feature vectors.
+    - predict: Makes predictions from raw feature vectors.
+    """
+    FORMAT_VERSION = 3
+    # Process-wide, set by the pre-fork server so the workers do not oversubscribe the cores
+    model_thread_count = None
+
+    def __init__(self, model, mean, scale, feature_names, target_column, schema, version=None, engine=None):
+        """
+        Initializes an InferenceBundle instance.
+
+        Parameters:
+        - model: The trained machine learning model, expecting scaled features.
+        - mean (array-like): The per-feature mean subtracted by the scaler.
+        - scale (array-like): The per-feature scale divided by the scaler.
+        - feature_names (list): The feature column names, in model order.
+        - target_column (str): The name of the target column.
+        - schema (dict): The dataset schema holding the min/max of every column.
+        - version (str): The version of this bundle, defaults to the current UTC timestamp.
+        - engine (ObliviousTreeEnsemble): An optional NumPy evaluator of the model, used instead of it when set.
+        """
+        self.format_version = InferenceBundle.FORMAT_VERSION
+        self.model = model
+        self.engine = engine
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.feature_names = list(feature_names)
+        self.target_column = target_column
+        self.schema = schema
+        self.version = version or datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+
+    @classmethod
+    def from_scaler(cls, model, scaler, feature_names, target_column, schema, engine=None):
+        """
+        Builds a bundle from a trained model and a fitted StandardScaler.
+
+        Parameters:
+        - model: The trained machine learning model, expecting scaled features.
+        - scaler (StandardScaler): The fitted feature scaler.
+        - feature_names (list): The feature column names, in model order.
+        - target_column (str): The name of the target column.
+        - schema (dict): The dataset schema holding the min/max of every column.
+        - engine (ObliviousTreeEnsemble): An optional NumPy evaluator of the model.
+
+        Returns:
+        - InferenceBundle: The inference bundle.
+        """
+        n_features = len(feature_names)
+        mean = scaler.mean_ if scaler.with_mean else np.zeros(n_features)
+        scale = scaler.scale_ if scaler.with_std else np.ones(n_features)
+        return cls(model=model, mean=mean, scale=scale, feature_names=feature_names,
+                   target_column=target_column, schema=schema, engine=engine)
+
+    @property
+    def model(self):
+        """
+        The trained model, unpickled on first access.
+
+        Returns:
+        - The trained machine learning model.
+        """
+        model_pickle = self.__dict__.get("_model_pickle")
+        if model_pickle is not None:
+            self._model = pickle.loads(model_pickle)
+            self._model_pickle = None
+        return self._model
+
+    @model.setter
+    def model(self, model):
+        self._model = model
+        self._model_pickle = None
+
+    def preload(self):
+        """
+        Unpickles the model now if predictions will use it, instead of on the first prediction (e.g. before
+        forking the workers, so they share it). With the NumPy tree engine the model stays pickled.
+
+        Returns:
+        - bool: Whether the model was unpickled.
+        """
+        if getattr(self, "engine", None) is not None or self.__dict__.get("_model_pickle") is None:
+            return False
+        self.model
+        return True
+
+    def __getstate__(self):
+        """
+        Pickles the model into bytes of its own, so unpickling the bundle does not import the model's library.
+
+        Returns:
+        - dict: The state to pickle.
+        """
+        state = self.__dict__.copy()
+        if state.get("_model_pickle") is None:
+            state["_model_pickle"] = pickle.dumps(state.get("_model"), protocol=pickle.HIGHEST_PROTOCOL)
+        state["_model"] = None
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores a pickled bundle, including bundles written before the model was pickled separately.
+
+        Parameters:
+        - state (dict): The pickled state.
+        """
+        if "model" in state:
+            state["_model"] = state.pop("model")
+            state.setdefault("_model_pickle", None)
+        self.__dict__.update(state)
+
+    def transform(self, data):
+        """
+        Applies the feature scaling to raw feature vectors.
+
+        Parameters:
+        - data (array-like): A raw feature vector or an (n_rows, n_features) matrix.
+
+        Returns:
+        - numpy.ndarray: The (n_rows, n_features) scaled matrix.
+        """
+        data = np.asarray(data, dtype=np.float64)
+        if data.ndim == 1:
+            data = data.reshape(1, -1)
+        if data.shape[1] != len(self.feature_names):
+            raise ValueError(f"Expected {len(self.feature_names)} features, got {data.shape[1]}")
+        # Same operations as StandardScaler.transform, so the results are bit-identical
+        return (data - self.mean) / self.scale
+
+    def predict_scaled(self, data):
+        """
+        Makes predictions from already scaled feature vectors.
+
+        Parameters:
+        - data (numpy.ndarray): The (n_rows, n_features) scaled matrix.
+
+        Returns:
+        - numpy.ndarray: The predicted class of every row.
+        """
+        # Bundles written before the NumPy engine existed do not have the attribute
+        engine = getattr(self, "engine", None)
+        if engine is not None:
+            return engine.predict(data)
+        if InferenceBundle.model_thread_count is not None:
+            return np.asarray(self.model.predict(data, thread_count=InferenceBundle.model_thread_count)).reshape(-1)
+        return np.asarray(self.model.predict(data)).reshape(-1)
+
+    def predict(self, data):
+        """
+        Makes predictions from raw feature vectors.
+
+        Parameters:
+        - data (array-like): A raw feature vector or an (n_rows, n_features) matrix.
+
+        Returns:
+        - numpy.ndarray: The predicted class of every row.
+        """
+        return self.predict_scaled(self.transform(data))
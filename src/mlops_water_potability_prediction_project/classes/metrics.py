@@ -0,0 +1,394 @@
+import math
+import operator
+import threading
+import weakref
+from bisect import bisect_left
+
+DEFAULT_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, math.inf)
+
+
+class _ShardOwner:
+    """
+    Kept in the thread-local storage of a thread only, so it is released when the thread exits.
+    """
+    __slots__ = ("__weakref__",)
+
+
+class _PerThreadShards:
+    """
+    Hands every thread its own dict of samples, so recording never takes a lock.
+
+    A shard is only ever written by the thread that owns it. Readers merge copies of all shards,
+    which may miss the samples recorded while they read but never see a half-written one. When a
+    thread exits, its shard is merged into a base shard and dropped, so a thread-per-request server
+    keeps as many shards as it has live threads.
+    """
+
+    def __init__(self, merge):
+        """
+        Parameters:
+        - merge (callable): Returns the sum of two samples of the same label values, without changing them.
+        """
+        self._merge = merge
+        self._local = threading.local()
+        self._base = {}
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def shard(self) -> dict:
+        """
+        Returns the shard of the calling thread, creating it on first use.
+
+        Returns:
+        - dict: The samples of the calling thread, keyed by label values.
+        """
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = {}
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            self._local.owner = _ShardOwner()
+            weakref.finalize(self._local.owner, self._retire, shard).atexit = False
+            return shard
+
+    def snapshots(self) -> list:
+        """
+        Returns copies of the base shard and of the shards of all live threads.
+
+        Returns:
+        - list: One dict of samples per shard.
+        """
+        with self._lock:
+            shards = [self._base] + self._shards
+        return [dict(shard) for shard in shards]
+
+    def _retire(self, shard: dict):
+        # The owner thread has exited, nothing writes to its shard anymore. The base shard is replaced,
+        # not updated, so a reader copying it never sees a half-merged sample
+        with self._lock:
+            base = dict(self._base)
+            for labels, sample in shard.items():
+                base[labels] = self._merge(base[labels], sample) if labels in base else sample
+            self._base = base
+            self._shards = [live for live in self._shards if live is not shard]
+
+
+class Counter:
+    """
+    A monotonically increasing counter with optional labels.
+
+    Attributes:
+    - name (str): The metric name.
+    - documentation (str): The help text of the metric.
+    - labelnames (tuple): The label names.
+
+    Methods:
+    - __init__: Initializes a Counter instance.
+    - inc: Increments the counter of a label combination.
+    - collect: Returns the merged value of every label combination.
+    - render: Renders the counter in the Prometheus text format.
+    """
+    TYPE = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        """
+        Initializes a Counter instance.
+
+        Parameters:
+        - name (str): The metric name.
+        - documentation (str): The help text of the metric.
+        - labelnames (tuple): The label names.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._shards = _PerThreadShards(merge=operator.add)
+
+    def inc(self, labels=(), amount=1):
+        """
+        Increments the counter of a label combination.
+
+        Parameters:
+        - labels (tuple): The label values, in labelnames order.
+        - amount (float): The increment.
+        """
+        shard = self._shards.shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def collect(self) -> dict:
+        """
+        Returns the merged value of every label combination.
+
+        Returns:
+        - dict: The counter value keyed by label values.
+        """
+        totals = {}
+        for shard in self._shards.snapshots():
+            for labels, value in shard.items():
+                totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+    def render(self) -> list:
+        """
+        Renders the counter in the Prometheus text format.
+
+        Returns:
+        - list: The exposition lines.
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"]
+        for labels, value in sorted(self.collect().items()):
+            lines.append(f"{self.name}{format_labels(self.labelnames, labels)} {format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """
+    A histogram of observed values (e.g. latencies in seconds) with optional labels.
+
+    Attributes:
+    - name (str): The metric name.
+    - documentation (str): The help text of the metric.
+    - labelnames (tuple): The label names.
+    - buckets (tuple): The sorted upper bounds of the buckets, ending with +inf.
+
+    Methods:
+    - __init__: Initializes a Histogram instance.
+    - observe: Records a value for a label combination.
+    - collect: Returns the merged bucket counts, sum and count of every label combination.
+    - render: Renders the histogram in the Prometheus text format.
+    """
+    TYPE = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """
+        Initializes a Histogram instance.
+
+        Parameters:
+        - name (str): The metric name.
+        - documentation (str): The help text of the metric.
+        - labelnames (tuple): The label names.
+        - buckets (tuple): The sorted upper bounds of the buckets, +inf is added if missing.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets) if buckets[-1] == math.inf else tuple(buckets) + (math.inf,)
+        self._shards = _PerThreadShards(merge=lambda a, b: [x + y for x, y in zip(a, b)])
+
+    def observe(self, labels, value):
+        """
+        Records a value for a label combination.
+
+        Parameters:
+        - labels (tuple): The label values, in labelnames order.
+        - value (float): The observed value.
+        """
+        shard = self._shards.shard()
+        sample = shard.get(labels)
+        if sample is None:
+            # Per-bucket (not cumulative) counts followed by the sum of the observed values
+            sample = shard[labels] = [0] * len(self.buckets) + [0.0]
+        sample[bisect_left(self.buckets, value)] += 1
+        sample[-1] += value
+
+    def collect(self) -> dict:
+        """
+        Returns the merged bucket counts, sum and count of every label combination.
+
+        Returns:
+        - dict: (cumulative bucket counts, sum, count) keyed by label values.
+        """
+        merged = {}
+        for shard in self._shards.snapshots():
+            for labels, sample in shard.items():
+                total = merged.setdefault(labels, [0] * len(sample))
+                for i, value in enumerate(list(sample)):
+                    total[i] += value
+
+        results = {}
+        for labels, total in merged.items():
+            cumulative, running = [], 0
+            for count in total[:-1]:
+                running += count
+                cumulative.append(running)
+            results[labels] = (cumulative, total[-1], running)
+        return results
+
+    def render(self) -> list:
+        """
+        Renders the histogram in the Prometheus text format.
+
+        Returns:
+        - list: The exposition lines.
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"]
+        for labels, (cumulative, total, count) in sorted(self.collect().items()):
+            for bound, bucket_count in zip(self.buckets, cumulative):
+                bucket_labels = format_labels(self.labelnames + ("le",), labels + (format_value(bound),))
+                lines.append(f"{self.name}_bucket{bucket_labels} {bucket_count}")
+            lines.append(f"{self.name}_sum{format_labels(self.labelnames, labels)} {format_value(total)}")
+            lines.append(f"{self.name}_count{format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+class CallbackMetric:
+    """
+    A metric whose values are read from a callback when it is rendered, e.g. counters kept by another object.
+
+    Attributes:
+    - name (str): The metric name.
+    - documentation (str): The help text of the metric.
+    - metric_type (str): The Prometheus metric type, "counter" or "gauge".
+    - callback (callable): Returns the current value, or a dict of values keyed by label values.
+    - labelnames (tuple): The label names.
+
+    Methods:
+    - __init__: Initializes a CallbackMetric instance.
+    - render: Renders the metric in the Prometheus text format.
+    """
+
+    def __init__(self, name, documentation, metric_type, callback, labelnames=()):
+        """
+        Initializes a CallbackMetric instance.
+
+        Parameters:
+        - name (str): The metric name.
+        - documentation (str): The help text of the metric.
+        - metric_type (str): The Prometheus metric type, "counter" or "gauge".
+        - callback (callable): Returns the current value, or a dict of values keyed by label values.
+        - labelnames (tuple): The label names.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.metric_type = metric_type
+        self.callback = callback
+        self.labelnames = tuple(labelnames)
+
+    def render(self) -> list:
+        """
+        Renders the metric in the Prometheus text format.
+
+        Returns:
+        - list: The exposition lines.
+        """
+        values = self.callback()
+        if not isinstance(values, dict):
+            values = {(): values}
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        for labels, value in sorted(values.items()):
+            lines.append(f"{self.name}{format_labels(self.labelnames, labels)} {format_value(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    A collection of metrics rendered together in the Prometheus text exposition format.
+
+    Methods:
+    - __init__: Initializes an empty MetricsRegistry.
+    - register: Adds a metric, or returns the one already registered under its name.
+    - counter: Creates and registers a Counter.
+    - histogram: Creates and registers a Histogram.
+    - callback: Creates and registers a CallbackMetric.
+    - render: Renders all metrics.
+    """
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        """
+        Initializes an empty MetricsRegistry.
+        """
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        """
+        Adds a metric, or returns the one already registered under its name.
+
+        Parameters:
+        - metric: A Counter, Histogram or CallbackMetric.
+
+        Returns:
+        - The registered metric.
+        """
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name, documentation, labelnames=()) -> Counter:
+        """
+        Creates and registers a Counter.
+        """
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS) -> Histogram:
+        """
+        Creates and registers a Histogram.
+        """
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(self, name, documentation, metric_type, callback, labelnames=()) -> CallbackMetric:
+        """
+        Creates and registers a CallbackMetric, replacing any previous callback of the same name.
+        """
+        metric = CallbackMetric(name, documentation, metric_type, callback, labelnames)
+        with self._lock:
+            self._metrics[name] = metric
+        return metric
+
+    def render(self) -> str:
+        """
+        Renders all metrics.
+
+        Returns:
+        - str: The metrics in the Prometheus text exposition format.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def format_labels(labelnames, labels) -> str:
+    """
+    Formats label values as a Prometheus label set.
+
+    Parameters:
+    - labelnames (tuple): The label names.
+    - labels (tuple): The label values.
+
+    Returns:
+    - str: The label set, e.g. '{stage="model_predict"}', or an empty string without labels.
+    """
+    if not labelnames:
+        return ""
+    pairs = []
+    for name, value in zip(labelnames, labels):
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def format_value(value) -> str:
+    """
+    Formats a sample value.
+
+    Parameters:
+    - value (float): The value.
+
+    Returns:
+    - str: The value in the Prometheus text format.
+    """
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value)) if abs(value) < 1e15 else repr(value)
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+# The process-wide registry exposed at /metrics
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,248 @@
+import hashlib
+import json
+import os
+import shutil
+import stat
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+
+class ModelVersionNotFound(Exception):
+    def __init__(self, version, message="Model version not found in the registry"):
+        self.version = version
+        self.message = f"{message}: {version}"
+        super().__init__(self.message)
+
+
+class ModelRegistry:
+    """
+    A local, content-addressed registry of immutable model versions.
+
+    Layout of the registry root:
+    - versions/<version>/: One read-only directory per version, holding the registered files
+      (inference bundle, model, scaler, schema, metrics) and a manifest.json. The version id is
+      the SHA-256 of the files' names and contents, so registering the same files twice gives
+      the same version.
+    - CURRENT: The pointer file naming the promoted version. It is replaced atomically with
+      os.replace, so readers see either the old or the new version, never a partial write.
+    - promotions.jsonl: An append-only log of promotions, used to roll back.
+
+    Attributes:
+    - POINTER_FILE_NAME (str): The name of the pointer file.
+    - BUNDLE_FILE_NAME (str): The name under which the inference bundle is registered.
+    - root_dir (Path): The registry root directory.
+
+    Methods:
+    - __init__: Initializes a ModelRegistry instance.
+    - register: Copies a set of files into a new immutable version directory.
+    - promote: Points the registry at a version.
+    - rollback: Points the registry back at the previously promoted version.
+    - current_version: Returns the promoted version.
+    - version_dir: Returns the directory of a version.
+    - bundle_path: Returns the inference bundle path of a version.
+    - list_versions: Returns the manifests of all versions.
+    - promotions: Returns the promotion log.
+    """
+    POINTER_FILE_NAME = "CURRENT"
+    BUNDLE_FILE_NAME = "inference_bundle.joblib"
+    VERSION_ID_LENGTH = 16
+
+    def __init__(self, root_dir):
+        """
+        Initializes a ModelRegistry instance.
+
+        Parameters:
+        - root_dir (Path): The registry root directory.
+        """
+        self.root_dir = Path(root_dir)
+        self.versions_dir = self.root_dir / "versions"
+        self.pointer_path = self.root_dir / ModelRegistry.POINTER_FILE_NAME
+        self.promotions_path = self.root_dir / "promotions.jsonl"
+
+    def register(self, files: dict, metadata: Optional[dict] = None) -> str:
+        """
+        Copies a set of files into a new immutable version directory.
+
+        The files are copied into a temporary directory inside the registry and renamed into
+        place, so a version directory is either complete or absent.
+
+        Parameters:
+        - files (dict): The registered file names mapped to the paths to copy them from.
+        - metadata (dict): Extra information stored in the manifest, e.g. the bundle version.
+
+        Returns:
+        - str: The version id.
+        """
+        if ModelRegistry.BUNDLE_FILE_NAME not in files:
+            raise ValueError(f"A model version must contain {ModelRegistry.BUNDLE_FILE_NAME}")
+
+        digest = hashlib.sha256()
+        file_hashes = {}
+        for name in sorted(files):
+            file_hash = ModelRegistry.file_sha256(files[name])
+            file_hashes[name] = file_hash
+            digest.update(name.encode("utf-8") + b"\0" + file_hash.encode("ascii") + b"\0")
+        version = digest.hexdigest()[:ModelRegistry.VERSION_ID_LENGTH]
+
+        version_dir = self.version_dir(version)
+        if version_dir.exists():
+            return version
+
+        self.versions_dir.mkdir(parents=True, exist_ok=True)
+        staging_dir = Path(tempfile.mkdtemp(prefix=f".{version}-", dir=self.versions_dir))
+        try:
+            for name, path in files.items():
+                shutil.copyfile(path, staging_dir / name)
+            manifest = {
+                "version": version,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "files": file_hashes,
+                "metadata": metadata or {},
+            }
+            with open(staging_dir / "manifest.json", 'w') as f:
+                json.dump(manifest, f, indent=4)
+
+            # Versions are immutable: make the files read-only before publishing the directory
+            for path in staging_dir.iterdir():
+                path.chmod(stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.rename(staging_dir, version_dir)
+        except OSError:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            # Another process may have registered the same content at the same time
+            if version_dir.exists():
+                return version
+            raise
+        return version
+
+    def promote(self, version: str, reason: str = "promote"):
+        """
+        Points the registry at a version.
+
+        Parameters:
+        - version (str): The version id.
+        - reason (str): Recorded in the promotion log, e.g. "promote" or "rollback".
+        """
+        if not (self.version_dir(version) / ModelRegistry.BUNDLE_FILE_NAME).exists():
+            raise ModelVersionNotFound(version)
+
+        previous = self.current_version()
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{ModelRegistry.POINTER_FILE_NAME}-", dir=self.root_dir)
+        with os.fdopen(fd, 'w') as f:
+            f.write(version + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.pointer_path)
+
+        with open(self.promotions_path, 'a') as f:
+            f.write(json.dumps({"version": version, "previous": previous, "reason": reason,
+                                "promoted_at": datetime.now(timezone.utc).isoformat()}) + "\n")
+
+    def rollback(self) -> str:
+        """
+        Points the registry back at the previously promoted version.
+
+        Returns:
+        - str: The version now promoted.
+        """
+        # Replay the log: promotions push a version, rollbacks pop the latest one
+        history = []
+        for promotion in self.promotions():
+            if promotion["reason"] == "rollback":
+                if history:
+                    history.pop()
+            elif not history or history[-1] != promotion["version"]:
+                history.append(promotion["version"])
+
+        if len(history) < 2:
+            raise ModelVersionNotFound(self.current_version(),
+                                       message="No earlier promoted version to roll back to from")
+        self.promote(history[-2], reason="rollback")
+        return history[-2]
+
+    def current_version(self) -> Optional[str]:
+        """
+        Returns the promoted version.
+
+        Returns:
+        - str: The version id, or None if no version was promoted yet.
+        """
+        try:
+            with open(self.pointer_path, 'r') as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def version_dir(self, version: str) -> Path:
+        """
+        Returns the directory of a version.
+
+        Parameters:
+        - version (str): The version id.
+
+        Returns:
+        - Path: The version directory.
+        """
+        return self.versions_dir / version
+
+    def bundle_path(self, version: Optional[str] = None) -> Optional[Path]:
+        """
+        Returns the inference bundle path of a version.
+
+        Parameters:
+        - version (str): The version id, defaults to the promoted version.
+
+        Returns:
+        - Path: The inference bundle path, or None if no version was promoted yet.
+        """
+        version = version or self.current_version()
+        if version is None:
+            return None
+        return self.version_dir(version) / ModelRegistry.BUNDLE_FILE_NAME
+
+    def list_versions(self) -> list:
+        """
+        Returns the manifests of all versions, oldest first.
+
+        Returns:
+        - list: The version manifests.
+        """
+        if not self.versions_dir.exists():
+            return []
+        manifests = []
+        for version_dir in self.versions_dir.iterdir():
+            manifest_path = version_dir / "manifest.json"
+            if not version_dir.name.startswith(".") and manifest_path.exists():
+                with open(manifest_path, 'r') as f:
+                    manifests.append(json.load(f))
+        return sorted(manifests, key=lambda manifest: manifest["created_at"])
+
+    def promotions(self) -> list:
+        """
+        Returns the promotion log, oldest first.
+
+        Returns:
+        - list: One dict per promotion.
+        """
+        if not self.promotions_path.exists():
+            return []
+        with open(self.promotions_path, 'r') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    @staticmethod
+    def file_sha256(file_path) -> str:
+        """
+        Computes the SHA-256 of a file.
+
+        Parameters:
+        - file_path (Path): The file path.
+
+        Returns:
+        - str: The hex digest.
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
@@ -0,0 +1,218 @@
+import json
+import os
+import tempfile
+
+import numpy as np
+
+
+class ObliviousTreeEnsemble:
+    """
+    A pure-NumPy evaluator for symmetric (oblivious) tree ensembles exported from CatBoost.
+
+    Every tree of depth D applies the same D splits to every row, so the leaf index of a row is
+    the D split results packed into an integer. The evaluator computes the split results of all
+    trees at once, packs them with bit shifts and gathers the leaf values. It reproduces
+    CatBoost's arithmetic exactly: features and borders are compared as float32, and leaf values
+    are accumulated in float64 tree by tree before the scale and bias are applied.
+
+    Attributes:
+    - split_features (numpy.ndarray): The (n_trees, max_depth) feature index of every split.
+    - split_borders (numpy.ndarray): The (n_trees, max_depth) float32 border of every split.
+    - leaf_values (numpy.ndarray): The (n_trees, 2 ** max_depth, dimension) leaf values.
+    - scale (float): The scale applied to the summed leaf values.
+    - bias (numpy.ndarray): The bias added to the scaled sum, one per dimension.
+    - nan_as_true (numpy.ndarray): Per feature, whether NaN values go to the right of every split.
+    - classes (numpy.ndarray): The class labels, for binary classifiers.
+
+    Methods:
+    - __init__: Initializes an ObliviousTreeEnsemble instance from the exported arrays.
+    - from_catboost: Exports a trained CatBoost model into an ObliviousTreeEnsemble.
+    - from_catboost_json: Builds an ObliviousTreeEnsemble from a CatBoost JSON model dictionary.
+    - raw_predict: Computes the raw formula values of the ensemble.
+    - predict: Predicts the class labels of a binary classifier.
+    - bucketize: Maps feature values to the border buckets the ensemble can distinguish.
+    """
+    CHUNK_ROWS = 65536
+
+    def __init__(self, split_features, split_borders, leaf_values, scale=1.0, bias=0.0,
+                 nan_as_true=None, classes=None):
+        """
+        Initializes an ObliviousTreeEnsemble instance from the exported arrays.
+
+        Parameters:
+        - split_features (array-like): The (n_trees, max_depth) feature index of every split.
+        - split_borders (array-like): The (n_trees, max_depth) border of every split, +inf for padding.
+        - leaf_values (array-like): The (n_trees, 2 ** max_depth, dimension) leaf values.
+        - scale (float): The scale applied to the summed leaf values.
+        - bias (float or array-like): The bias added to the scaled sum.
+        - nan_as_true (array-like): Per feature, whether NaN values go to the right of every split.
+        - classes (array-like): The class labels, for binary classifiers.
+        """
+        self.split_features = np.ascontiguousarray(split_features, dtype=np.int32)
+        self.split_borders = np.ascontiguousarray(split_borders, dtype=np.float32)
+        self.leaf_values = np.ascontiguousarray(leaf_values, dtype=np.float64)
+        self.scale = float(scale)
+        self.bias = np.atleast_1d(np.asarray(bias, dtype=np.float64))
+        self.nan_as_true = None if nan_as_true is None else np.asarray(nan_as_true, dtype=bool)
+        self.classes = None if classes is None else np.asarray(classes)
+
+        n_trees, max_depth = self.split_features.shape
+        self._depth_shifts = np.arange(max_depth, dtype=np.int64)
+        self._tree_offsets = np.arange(n_trees, dtype=np.int64) * self.leaf_values.shape[1]
+
+    @classmethod
+    def from_catboost(cls, model):
+        """
+        Exports a trained CatBoost model into an ObliviousTreeEnsemble.
+
+        Parameters:
+        - model (CatBoost): The trained model, with float features only.
+
+        Returns:
+        - ObliviousTreeEnsemble: The exported ensemble.
+        """
+        fd, json_path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            model.save_model(json_path, format="json")
+            with open(json_path, 'r') as f:
+                model_json = json.load(f)
+        finally:
+            os.remove(json_path)
+
+        classes = getattr(model, "classes_", None)
+        return cls.from_catboost_json(model_json, classes=classes)
+
+    @classmethod
+    def from_catboost_json(cls, model_json, classes=None):
+        """
+        Builds an ObliviousTreeEnsemble from a CatBoost JSON model dictionary.
+
+        Parameters:
+        - model_json (dict): The model, as written by CatBoost's save_model(format="json").
+        - classes (array-like): The class labels, for binary classifiers.
+
+        Returns:
+        - ObliviousTreeEnsemble: The exported ensemble.
+        """
+        features_info = model_json.get("features_info", {})
+        if features_info.get("categorical_features") or features_info.get("text_features"):
+            raise ValueError("Only models with float features can be exported")
+
+        float_features = features_info.get("float_features", [])
+        nan_as_true = np.zeros(len(float_features), dtype=bool)
+        for feature in float_features:
+            nan_as_true[feature["flat_feature_index"]] = feature.get("nan_value_treatment") == "AsTrue"
+
+        trees = model_json["oblivious_trees"]
+        max_depth = max(len(tree.get("splits") or []) for tree in trees)
+        dimension = len(trees[0]["leaf_values"]) // 2 ** len(trees[0].get("splits") or [])
+
+        split_features = np.zeros((len(trees), max_depth), dtype=np.int32)
+        # Padding splits compare against +inf, so they always evaluate to 0 and leave the leaf index unchanged
+        split_borders = np.full((len(trees), max_depth), np.inf, dtype=np.float32)
+        leaf_values = np.zeros((len(trees), 2 ** max_depth, dimension), dtype=np.float64)
+
+        for t, tree in enumerate(trees):
+            splits = tree.get("splits") or []
+            for depth, split in enumerate(splits):
+                if split.get("split_type", "FloatFeature") != "FloatFeature":
+                    raise ValueError(f"Unsupported split type: {split['split_type']}")
+                split_features[t, depth] = split["float_feature_index"]
+                split_borders[t, depth] = split["border"]
+            values = np.asarray(tree["leaf_values"], dtype=np.float64).reshape(2 ** len(splits), dimension)
+            leaf_values[t, :len(values)] = values
+
+        scale, bias = model_json.get("scale_and_bias", [1.0, [0.0]])
+        return cls(split_features=split_features, split_borders=split_borders, leaf_values=leaf_values,
+                   scale=scale, bias=bias, nan_as_true=nan_as_true, classes=classes)
+
+    def raw_predict(self, data):
+        """
+        Computes the raw formula values of the ensemble.
+
+        Parameters:
+        - data (array-like): A feature vector or an (n_rows, n_features) matrix.
+
+        Returns:
+        - numpy.ndarray: The raw values, shaped (n_rows,) for one-dimensional models
+          and (n_rows, dimension) otherwise.
+        """
+        data = np.asarray(data, dtype=np.float32)
+        if data.ndim == 1:
+            data = data.reshape(1, -1)
+        if self.nan_as_true is not None and self.nan_as_true.any():
+            data = data.copy()
+            nan_rows, nan_cols = np.nonzero(np.isnan(data) & self.nan_as_true)
+            data[nan_rows, nan_cols] = np.inf
+
+        n_trees, n_leaves, dimension = self.leaf_values.shape
+        flat_leaves = self.leaf_values.reshape(n_trees * n_leaves, dimension)
+        result = np.empty((len(data), dimension), dtype=np.float64)
+
+        # Rows are processed in chunks to bound the (rows, trees, depth) intermediate arrays
+        for start in range(0, len(data), self.CHUNK_ROWS):
+            chunk = data[start:start + self.CHUNK_ROWS]
+            bits = chunk[:, self.split_features] > self.split_borders
+            leaf_index = (bits.astype(np.int64) << self._depth_shifts).sum(axis=2)
+            values = flat_leaves[leaf_index + self._tree_offsets]
+
+            # Accumulate tree by tree, in model order, to match CatBoost's floating point sums
+            total = np.zeros((len(chunk), dimension), dtype=np.float64)
+            for t in range(n_trees):
+                total += values[:, t]
+            result[start:start + len(chunk)] = total
+
+        result = self.scale * result + self.bias
+        return result[:, 0] if dimension == 1 else result
+
+    def predict(self, data):
+        """
+        Predicts the class labels of a binary classifier.
+
+        Parameters:
+        - data (array-like): A feature vector or an (n_rows, n_features) matrix.
+
+        Returns:
+        - numpy.ndarray: The predicted class label of every row.
+        """
+        if self.leaf_values.shape[2] != 1:
+            raise ValueError("Class prediction is only supported for binary classifiers")
+        positive = self.raw_predict(data) > 0
+        if self.classes is None:
+            return positive.astype(np.int64)
+        return self.classes[positive.astype(np.int64)]
+
+    def bucketize(self, data):
+        """
+        Maps feature values to the border buckets the ensemble can distinguish.
+
+        Two rows with the same buckets take the same path through every tree, so they always get
+        the same prediction. The bucket of a value is the number of the feature's borders below it.
+
+        Parameters:
+        - data (array-like): A feature vector or an (n_rows, n_features) matrix.
+
+        Returns:
+        - numpy.ndarray: The (n_rows, n_features) int32 bucket indices.
+        """
+        data = np.asarray(data, dtype=np.float32)
+        if data.ndim == 1:
+            data = data.reshape(1, -1)
+
+        # Computed on first use, ensembles pickled by earlier versions do not carry it
+        feature_borders = self.__dict__.get("_feature_borders")
+        if feature_borders is None:
+            valid = np.isfinite(self.split_borders)
+            feature_borders = [np.unique(self.split_borders[valid & (self.split_features == f)])
+                               for f in range(data.shape[1])]
+            self._feature_borders = feature_borders
+
+        buckets = np.empty(data.shape, dtype=np.int32)
+        for f, borders in enumerate(feature_borders):
+            column = data[:, f]
+            buckets[:, f] = np.searchsorted(borders, column, side="left")
+            # NaN compares false against every border unless the model sends it to the right
+            nan_as_true = self.nan_as_true is not None and f < len(self.nan_as_true) and self.nan_as_true[f]
+            buckets[np.isnan(column), f] = len(borders) if nan_as_true else 0
+        return buckets
@@ -0,0 +1,266 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.entity.config_entity import PipelineConfig
+
+
+class PipelineRunner:
+    """
+    Runs the pipeline stages in order, skipping the stages whose inputs did not change since their last successful run.
+
+    Every stage declares its inputs and outputs in the pipeline section of config/config.yaml:
+    - config, params, schema: The sections of config.yaml, params.yaml and schema.yaml the stage reads.
+    - deps: The files the stage reads, its source code included.
+    - outs: The files the stage writes.
+    - always_run: Whether the stage runs every time, e.g. because it reads a remote source.
+
+    A stage is skipped when the hashes of all its inputs equal the ones recorded after its last successful
+    run and its outputs are still on disk, unchanged. Files are hashed by content (SHA-256), so an upstream
+    stage that reruns and writes identical outputs does not invalidate the stages after it. The hash of a
+    file is reused as long as its modification time and size are unchanged.
+
+    Attributes:
+    - config (PipelineConfig): The configuration for the pipeline runner.
+    - config_manager (ConfigurationManager): Provides the config, params and schema sections.
+    - state (dict): The recorded hashes, as read from (and written back to) the state file.
+
+    Methods:
+    - __init__: Initializes a PipelineRunner instance.
+    - select: Returns the names of the stages between two stages, both included.
+    - stage_key: Returns the pipeline configuration key of a stage.
+    - stage_inputs: Hashes the declared inputs of a stage.
+    - stage_outputs: Hashes the declared outputs of a stage.
+    - is_up_to_date: Tells whether a stage can be skipped.
+    - run: Runs or skips the selected stages.
+    - file_hash: Returns the SHA-256 of a file, reusing the recorded hash of an unchanged file.
+    - section_hash: Returns the SHA-256 of a configuration section.
+    """
+
+    def __init__(self, config: PipelineConfig, config_manager):
+        """
+        Initializes a PipelineRunner instance.
+
+        Parameters:
+        - config (PipelineConfig): The configuration for the pipeline runner.
+        - config_manager (ConfigurationManager): Provides the config, params and schema sections.
+        """
+        self.config = config
+        self.config_manager = config_manager
+        self.state = self._load_state()
+
+    def _load_state(self) -> dict:
+        try:
+            with open(self.config.state_file, 'r') as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            state = {}
+        state.setdefault("stages", {})
+        state.setdefault("files", {})
+        return state
+
+    def _save_state(self):
+        # Write to a temporary file and rename it, so an interrupted run never leaves a truncated state file
+        state_dir = os.path.dirname(self.config.state_file) or "."
+        fd, tmp_path = tempfile.mkstemp(prefix=".pipeline_state-", dir=state_dir)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self.state, f, indent=4)
+        os.replace(tmp_path, self.config.state_file)
+
+    @staticmethod
+    def select(stage_names: list, start: Optional[str] = None, end: Optional[str] = None) -> list:
+        """
+        Returns the names of the stages between two stages, both included.
+
+        Parameters:
+        - stage_names (list): All stage names, in run order.
+        - start (str): The first stage, defaults to the first stage of the pipeline.
+        - end (str): The last stage, defaults to the last stage of the pipeline.
+
+        Returns:
+        - list: The selected stage names, in run order.
+        """
+        keys = [PipelineRunner.stage_key(name) for name in stage_names]
+        for name in (start, end):
+            if name is not None and PipelineRunner.stage_key(name) not in keys:
+                raise ValueError(f"Unknown stage {name}, expected one of: {', '.join(keys)}")
+        first = keys.index(PipelineRunner.stage_key(start)) if start else 0
+        last = keys.index(PipelineRunner.stage_key(end)) if end else len(keys) - 1
+        if first > last:
+            raise ValueError(f"Stage {start} runs after stage {end}")
+        return stage_names[first:last + 1]
+
+    def stage_inputs(self, stage_key: str) -> dict:
+        """
+        Hashes the declared inputs of a stage.
+
+        Parameters:
+        - stage_key (str): The stage key.
+
+        Returns:
+        - dict: One hash per input, None for a missing file.
+        """
+        spec = self.config.stages[stage_key]
+        sources = {
+            "config": self.config_manager.config,
+            "params": self.config_manager.params,
+            "schema": self.config_manager.schema,
+        }
+        inputs = {}
+        for source, sections in sources.items():
+            for section in spec.get(source, []):
+                inputs[f"{source}:{section}"] = PipelineRunner.section_hash(sections[section])
+        for path in spec.get("deps", []):
+            inputs[f"file:{path}"] = self.file_hash(path)
+        return inputs
+
+    def stage_outputs(self, stage_key: str) -> dict:
+        """
+        Hashes the declared outputs of a stage.
+
+        Parameters:
+        - stage_key (str): The stage key.
+
+        Returns:
+        - dict: One hash per output file, None for a missing file.
+        """
+        return {path: self.file_hash(path) for path in self.config.stages[stage_key].get("outs", [])}
+
+    def is_up_to_date(self, stage_key: str, inputs: dict) -> bool:
+        """
+        Tells whether a stage can be skipped.
+
+        Parameters:
+        - stage_key (str): The stage key.
+        - inputs (dict): The current hashes of the stage inputs.
+
+        Returns:
+        - bool: True if the inputs match the last successful run and the outputs are unchanged.
+        """
+        if self.config.stages[stage_key].get("always_run", False):
+            return False
+        recorded = self.state["stages"].get(stage_key)
+        if recorded is None or None in inputs.values() or recorded["inputs"] != inputs:
+            return False
+        outputs = self.stage_outputs(stage_key)
+        return None not in outputs.values() and recorded["outputs"] == outputs
+
+    def run(self, stages: list, run_stage: Callable, start: Optional[str] = None, end: Optional[str] = None,
+            force: bool = False, on_skip: Optional[Callable] = None, record: bool = True) -> dict:
+        """
+        Runs or skips the selected stages.
+
+        Parameters:
+        - stages (list): The (name, callable) pairs of all stages, in run order.
+        - run_stage (Callable): Called with the name and the callable of every stage to run.
+        - start (str): The first stage to consider, defaults to the first stage of the pipeline.
+        - end (str): The last stage to consider, defaults to the last stage of the pipeline.
+        - force (bool): Run the selected stages even if they are up to date.
+        - on_skip (Callable): Called with the name of every skipped stage.
+        - record (bool): Record the state of the stages that ran. If False, their recorded state is dropped
+          instead, e.g. when their outputs stayed in memory and the files on disk are from an older run.
+
+        Returns:
+        - dict: The selected stage names mapped to "ran" or "skipped".
+        """
+        stage_callables = dict(stages)
+        outcomes = {}
+        for stage_name in PipelineRunner.select([name for name, _ in stages], start, end):
+            stage_key = PipelineRunner.stage_key(stage_name)
+            if stage_key not in self.config.stages:
+                # Undeclared stages cannot be fingerprinted, so they always run
+                logger.warning(f"Stage {stage_name} declares no inputs in the pipeline configuration, running it")
+                run_stage(stage_name, stage_callables[stage_name])
+                outcomes[stage_name] = "ran"
+                continue
+
+            inputs = self.stage_inputs(stage_key)
+            if not force and self.is_up_to_date(stage_key, inputs):
+                logger.info(f">>>>>> STAGE: {stage_name} skipped, inputs unchanged <<<<<<")
+                outcomes[stage_name] = "skipped"
+                if on_skip is not None:
+                    on_skip(stage_name)
+                continue
+
+            started = time.time()
+            run_stage(stage_name, stage_callables[stage_name])
+            if not record:
+                if self.state["stages"].pop(stage_key, None) is not None:
+                    self._save_state()
+                outcomes[stage_name] = "ran"
+                continue
+            self.state["stages"][stage_key] = {
+                "inputs": inputs,
+                "outputs": self.stage_outputs(stage_key),
+                "completed_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "duration_s": round(time.time() - started, 3),
+            }
+            self._save_state()
+            outcomes[stage_name] = "ran"
+        return outcomes
+
+    def file_hash(self, file_path) -> Optional[str]:
+        """
+        Returns the SHA-256 of a file, reusing the recorded hash of an unchanged file.
+
+        Parameters:
+        - file_path (Path): The file path.
+
+        Returns:
+        - str: The hex digest, or None if the file does not exist.
+        """
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        if os.path.isdir(file_path):
+            # A directory (e.g. a partitioned dataset) hashes the names and hashes of all its files
+            digest = hashlib.sha256()
+            for root, dirs, files in os.walk(file_path):
+                dirs.sort()
+                for name in sorted(files):
+                    path = os.path.join(root, name)
+                    digest.update(f"{os.path.relpath(path, file_path)}\0{self.file_hash(path)}\0".encode("utf-8"))
+            return digest.hexdigest()
+        key = str(Path(file_path))
+        cached = self.state["files"].get(key)
+        if cached is not None and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+            return cached["sha256"]
+
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        self.state["files"][key] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest.hexdigest()}
+        return digest.hexdigest()
+
+    @staticmethod
+    def stage_key(stage_name: str) -> str:
+        """
+        Returns the pipeline configuration key of a stage, e.g. "model_trainer" for "MODEL TRAINER".
+
+        Parameters:
+        - stage_name (str): The stage name.
+
+        Returns:
+        - str: The stage key.
+        """
+        return stage_name.strip().lower().replace(" ", "_").replace("-", "_")
+
+    @staticmethod
+    def section_hash(section) -> str:
+        """
+        Returns the SHA-256 of a configuration section.
+
+        Parameters:
+        - section: The section, as read from the YAML file.
+
+        Returns:
+        - str: The hex digest of its canonical JSON form.
+        """
+        return hashlib.sha256(json.dumps(section, sort_keys=True, default=str).encode("utf-8")).hexdigest()
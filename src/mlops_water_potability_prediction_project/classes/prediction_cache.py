@@ -0,0 +1,177 @@
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from src.mlops_water_potability_prediction_project.entity.config_entity import PredictionCacheConfig
+
+
+class PredictionCache:
+    """
+    A bounded, thread-safe LRU cache of predictions keyed on the scaled input vectors.
+
+    Keys are either the exact float64 bytes of a row, or (with key_mode "quantized") the border
+    buckets of the row when the inference bundle carries the NumPy tree engine. Rows in the same
+    buckets take the same path through every tree, so quantized keys never change a prediction
+    but let near-identical readings share an entry. Entries expire after ttl_seconds, and the
+    whole cache is dropped when a different artifacts version is used.
+
+    Attributes:
+    - max_size (int): The maximum number of entries.
+    - ttl_seconds (float): The lifetime of an entry, in seconds.
+    - key_mode (str): "exact" or "quantized".
+    - hits (int): The number of lookups answered from the cache.
+    - misses (int): The number of lookups that had to call the model.
+    - evictions (int): The number of entries dropped to stay within max_size.
+    - invalidations (int): The number of times the cache was dropped because the model changed.
+
+    Methods:
+    - __init__: Initializes a PredictionCache instance.
+    - make_keys: Builds the cache keys of a scaled input matrix.
+    - get_many: Looks up the cached predictions of a list of keys.
+    - put_many: Stores the predictions of a list of keys.
+    - clear: Drops all entries.
+    - stats: Returns the counters and the hit rate.
+    """
+    KEY_MODES = ("exact", "quantized")
+
+    def __init__(self, max_size, ttl_seconds, key_mode="exact"):
+        """
+        Initializes a PredictionCache instance.
+
+        Parameters:
+        - max_size (int): The maximum number of entries.
+        - ttl_seconds (float): The lifetime of an entry, in seconds.
+        - key_mode (str): "exact" or "quantized".
+        """
+        if key_mode not in PredictionCache.KEY_MODES:
+            raise ValueError(f"Unknown prediction cache key mode: {key_mode}")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.key_mode = key_mode
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+
+    def make_keys(self, scaled_data, bundle):
+        """
+        Builds the cache keys of a scaled input matrix.
+
+        Parameters:
+        - scaled_data (numpy.ndarray): The (n_rows, n_features) scaled matrix.
+        - bundle (InferenceBundle): The inference bundle the predictions come from.
+
+        Returns:
+        - list: One hashable key per row.
+        """
+        engine = getattr(bundle, "engine", None)
+        if self.key_mode == "quantized" and engine is not None:
+            rows = engine.bucketize(scaled_data)
+        else:
+            rows = np.ascontiguousarray(scaled_data, dtype=np.float64)
+        return [row.tobytes() for row in rows]
+
+    def get_many(self, keys, version):
+        """
+        Looks up the cached predictions of a list of keys.
+
+        Parameters:
+        - keys (list): The cache keys.
+        - version: The version of the artifacts the predictions must come from.
+
+        Returns:
+        - list: The cached prediction of every key, or None for misses.
+        """
+        now = time.monotonic()
+        results = []
+        with self._lock:
+            self._check_version(version)
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] > now:
+                    self._entries.move_to_end(key)
+                    results.append(entry[0])
+                    self.hits += 1
+                else:
+                    if entry is not None:
+                        del self._entries[key]
+                    results.append(None)
+                    self.misses += 1
+        return results
+
+    def put_many(self, keys, predictions, version):
+        """
+        Stores the predictions of a list of keys.
+
+        Parameters:
+        - keys (list): The cache keys.
+        - predictions (list): The prediction of every key.
+        - version: The version of the artifacts the predictions come from.
+        """
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._check_version(version)
+            for key, prediction in zip(keys, predictions):
+                self._entries[key] = (prediction, expires_at)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Drops all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns the counters and the hit rate.
+
+        Returns:
+        - dict: The cache counters.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
+
+    def _check_version(self, version):
+        """
+        Drops all entries if they come from a different artifacts version. Must be called with the lock held.
+
+        Parameters:
+        - version: The version of the artifacts in use.
+        """
+        if version != self._version:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._version = version
+
+
+def create_prediction_cache(config: PredictionCacheConfig):
+    """
+    Creates the prediction cache described by the configuration.
+
+    Parameters:
+    - config (PredictionCacheConfig): The prediction cache configuration.
+
+    Returns:
+    - PredictionCache: The prediction cache, or None if caching is disabled.
+    """
+    if not config.enabled:
+        return None
+    return PredictionCache(max_size=config.max_size, ttl_seconds=config.ttl_seconds, key_mode=config.key_mode)
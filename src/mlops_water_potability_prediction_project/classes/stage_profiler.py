@@ -0,0 +1,211 @@
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+from src.mlops_water_potability_prediction_project.entity.config_entity import ProfilingConfig
+
+MB = 1024 * 1024
+
+
+def read_proc_io() -> dict:
+    """
+    Reads the I/O counters of the process from /proc/self/io (Linux only).
+
+    Returns:
+    - dict: rchar/wchar (bytes passed to read/write calls, page cache included) and read_bytes/write_bytes
+      (bytes fetched from or sent to storage), empty where /proc is not available.
+    """
+    try:
+        with open("/proc/self/io", 'r') as f:
+            counters = dict(line.split(":") for line in f.read().splitlines() if ":" in line)
+        return {key: int(counters[key]) for key in ("rchar", "wchar", "read_bytes", "write_bytes") if key in counters}
+    except OSError:
+        return {}
+
+
+def reset_peak_rss() -> bool:
+    """
+    Resets the peak resident set size of the process (Linux only, writes 5 to /proc/self/clear_refs).
+
+    Returns:
+    - bool: True if the peak was reset, so the next reading is the peak of the stage alone.
+    """
+    try:
+        with open("/proc/self/clear_refs", 'w') as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def read_rss() -> tuple:
+    """
+    Reads the current and peak resident set sizes of the process.
+
+    Returns:
+    - tuple: The current and peak RSS in bytes. The current RSS is None and the peak is the
+      process-wide peak from getrusage where /proc is not available.
+    """
+    try:
+        with open("/proc/self/status", 'r') as f:
+            status = dict(line.split(":", 1) for line in f.read().splitlines() if ":" in line)
+        return int(status["VmRSS"].split()[0]) * 1024, int(status["VmHWM"].split()[0]) * 1024
+    except (OSError, KeyError, ValueError):
+        # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return None, peak if sys.platform == "darwin" else peak * 1024
+
+
+class StageProfiler:
+    """
+    Measures the resources used by every pipeline stage and writes them as a run report.
+
+    For every stage it records the wall time, the CPU time (user + system, all threads), the peak RSS,
+    the peak of the Python allocations (tracemalloc) and the bytes read and written (/proc/self/io).
+    The peak RSS is reset before every stage where Linux allows it, so it is the peak of that stage
+    rather than of the whole run ("peak_rss_scope" tells which). With cProfile on, the profile of
+    every stage is dumped next to the report and can be opened with pstats or snakeviz.
+
+    Attributes:
+    - config (ProfilingConfig): The configuration for stage profiling.
+    - cprofile (bool): Whether every stage is also run under cProfile.
+    - run_id (str): The run timestamp, used in the report file name.
+    - stages (list): The measurements of every stage, in run order.
+
+    Methods:
+    - __init__: Initializes a StageProfiler instance.
+    - run_stage: Runs a stage and records its measurements.
+    - record_skipped: Records a stage skipped by the pipeline runner.
+    - write_report: Writes the run report as JSON.
+    - summary_table: Formats the measurements as a table.
+    """
+
+    def __init__(self, config: ProfilingConfig, cprofile: Optional[bool] = None):
+        """
+        Initializes a StageProfiler instance.
+
+        Parameters:
+        - config (ProfilingConfig): The configuration for stage profiling.
+        - cprofile (bool): Whether every stage is also run under cProfile, defaults to the configuration.
+        """
+        self.config = config
+        self.cprofile = config.cprofile if cprofile is None else cprofile
+        self.started_at = datetime.now(timezone.utc)
+        self.run_id = self.started_at.strftime("%Y%m%dT%H%M%SZ")
+        self.stages = []
+
+    def run_stage(self, stage_name: str, stage: Callable):
+        """
+        Runs a stage and records its measurements, also when the stage fails.
+
+        Parameters:
+        - stage_name (str): The stage name.
+        - stage (Callable): The stage to run.
+
+        Returns:
+        - Any: The return value of the stage.
+        """
+        profile = None
+        if self.cprofile:
+            import cProfile
+            profile = cProfile.Profile()
+
+        peak_scope = "stage" if reset_peak_rss() else "process"
+        if self.config.tracemalloc:
+            tracemalloc.start()
+        io_before = read_proc_io()
+        cpu_before = time.process_time()
+        wall_before = time.perf_counter()
+
+        status = "failed"
+        try:
+            if profile is not None:
+                result = profile.runcall(stage)
+            else:
+                result = stage()
+            status = "ran"
+            return result
+        finally:
+            wall_s = time.perf_counter() - wall_before
+            cpu_s = time.process_time() - cpu_before
+            io_after = read_proc_io()
+            python_peak = None
+            if self.config.tracemalloc:
+                python_peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            rss, peak_rss = read_rss()
+
+            measurement = {
+                "stage": stage_name,
+                "status": status,
+                "wall_s": round(wall_s, 4),
+                "cpu_s": round(cpu_s, 4),
+                "peak_rss_mb": round(peak_rss / MB, 1),
+                "peak_rss_scope": peak_scope,
+                "rss_after_mb": round(rss / MB, 1) if rss is not None else None,
+                "python_peak_mb": round(python_peak / MB, 1) if python_peak is not None else None,
+            }
+            measurement.update({key: io_after[key] - io_before[key] for key in io_after if key in io_before})
+            if profile is not None:
+                stage_key = stage_name.lower().replace(" ", "_")
+                profile_path = Path(self.config.report_dir) / f"run_{self.run_id}_{stage_key}.prof"
+                profile.dump_stats(profile_path)
+                measurement["profile"] = str(profile_path)
+            self.stages.append(measurement)
+
+    def record_skipped(self, stage_name: str):
+        """
+        Records a stage skipped by the pipeline runner.
+
+        Parameters:
+        - stage_name (str): The stage name.
+        """
+        self.stages.append({"stage": stage_name, "status": "skipped"})
+
+    def write_report(self) -> Path:
+        """
+        Writes the run report as JSON, and as the latest report.
+
+        Returns:
+        - Path: The path of the run report.
+        """
+        report = {
+            "run_id": self.run_id,
+            "started_at": self.started_at.isoformat(),
+            "argv": sys.argv,
+            "pid": os.getpid(),
+            "cpu_count": os.cpu_count(),
+            "tracemalloc": self.config.tracemalloc,
+            "total_wall_s": round(sum(stage.get("wall_s", 0) for stage in self.stages), 4),
+            "stages": self.stages,
+        }
+        report_path = Path(self.config.report_dir) / f"run_{self.run_id}.json"
+        for path in (report_path, Path(self.config.report_dir) / "latest.json"):
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=4)
+        return report_path
+
+    def summary_table(self) -> str:
+        """
+        Formats the measurements as a table.
+
+        Returns:
+        - str: One line per stage and a total line.
+        """
+        columns = [("stage", "{:<22}"), ("status", "{:>8}"), ("wall_s", "{:>9}"), ("cpu_s", "{:>9}"),
+                   ("peak_rss_mb", "{:>12}"), ("python_peak_mb", "{:>15}"), ("read_bytes", "{:>12}"),
+                   ("write_bytes", "{:>12}")]
+        lines = [" ".join(fmt.format(name) for name, fmt in columns)]
+        for stage in self.stages:
+            lines.append(" ".join(fmt.format("" if stage.get(name) is None else str(stage[name]))
+                                  for name, fmt in columns))
+        total = {"stage": "TOTAL", "wall_s": round(sum(stage.get("wall_s", 0) for stage in self.stages), 4),
+                 "cpu_s": round(sum(stage.get("cpu_s", 0) for stage in self.stages), 4)}
+        lines.append(" ".join(fmt.format(str(total.get(name, ""))) for name, fmt in columns))
+        return "\n".join(lines)
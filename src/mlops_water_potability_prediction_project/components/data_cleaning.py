@@ -1,7 +1,13 @@
+import json
 import os.path
+from datetime import datetime, timezone
+from pathlib import Path
 
 import pandas as pd
 from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.classes.column_statistics import ColumnStatistics
+from src.mlops_water_potability_prediction_project.classes.dataloadersaver import PartitionedDataLoaderSaver, \
+    dataset_loader_saver
 from src.mlops_water_potability_prediction_project.entity.config_entity import DataCleaningConfig
 
 
@@ -9,11 +15,32 @@ class DataCleaning:
     """
     DataCleaning class for cleaning data.
 
+    With a chunk size configured, the unclean data is streamed in chunks of rows: every chunk is cleaned,
+    appended to the clean dataset and added to the running statistics, so the memory used is bounded by
+    the chunk size. The columns are parsed into their schema.yaml dtypes, so that every chunk gets the
+    same dtypes and the clean dataset is identical to the one cleaned in memory. An integer column may hold
+    missing values, so it is parsed into a nullable integer and cast to its schema dtype once the rows with
+    missing values are dropped. In memory, such a column is read as floats and cast back the same way.
+
+    The min/max of every column are saved as the dataset schema, and their count, mean and variance
+    as the dataset statistics, computed in one pass without sorting (unlike describe()). These are the
+    statistics of the clean rows, except the null counts, which are counted on the unclean rows before
+    the rows with missing values are dropped.
+
+    When the unclean data is a partitioned dataset and incremental processing is on, a watermark file
+    records the partitions already cleaned. A later run only cleans the partitions added since, appends
+    their clean rows to the clean dataset and merges their min/max into the dataset schema, without
+    cleaning the history again. If a partition already cleaned changed or disappeared, or the clean
+    outputs are missing, the whole dataset is cleaned again. New clean rows are appended as partitions
+    to a partitioned clean dataset, while a single clean file is read back and rewritten in full.
+
     Attributes:
         config (DataCleaningConfig): The configuration for data cleaning.
 
     Methods:
-        clean_data(): Reads unclean data, removes any rows with missing values, and saves the cleaned data.
+        clean_data(dataframe, checkpoint): Removes any rows with missing values, saves and returns the cleaned data.
+        clean_in_chunks(loader): Removes the rows with missing values chunk by chunk, saving every clean chunk.
+        unprocessed_partitions(loader): Returns the partitions of the unclean data added since the last run.
 
     Note:
         This class assumes the use of a logger instance from the 'src.mlops_water_potability_prediction_project' module.
@@ -28,30 +55,218 @@ class DataCleaning:
         """
         self.config = config
 
-    def clean_data(self):
+    def clean_data(self, dataframe: pd.DataFrame = None, checkpoint: bool = True) -> pd.DataFrame:
         """
         Clean the data by removing rows with missing values.
 
+        Args:
+            dataframe (pd.DataFrame): The unclean data, read from the unclean data path if not given.
+            checkpoint (bool): Whether to save the cleaned data. The dataset schema is always saved.
+
+        Returns:
+            pd.DataFrame: The cleaned data, None if it was cleaned in chunks or incrementally (it is then
+            only on disk).
+
         Raises:
             Exception: If an error occurs during the cleaning process.
         """
         try:
             # Read the unclean data
-            dataframe = pd.read_csv(self.config.unclean_data_path)
+            partitions = None
+            if dataframe is None:
+                loader = dataset_loader_saver(self.config.unclean_data_path)
+                if isinstance(loader, PartitionedDataLoaderSaver):
+                    partitions = loader.read_manifest(self.config.unclean_data_path)["partitions"]
+                    if self.config.incremental and checkpoint:
+                        delta = self.unprocessed_partitions(loader)
+                        if delta is not None:
+                            # Only the new partitions are cleaned, the clean dataset is not loaded
+                            self._clean_delta(delta)
+                            return None
+
+                if self.config.chunk_size and checkpoint:
+                    statistics = self.clean_in_chunks(loader)
+                elif partitions is not None:
+                    # Clean a partitioned dataset partition by partition, only the clean rows are kept in memory
+                    statistics, cleaned = None, []
+                    for partition in loader.iter_partitions(self.config.unclean_data_path):
+                        clean, statistics = self._clean_chunk(partition, statistics)
+                        cleaned.append(clean)
+                    dataframe = pd.concat(cleaned, ignore_index=True)
+                else:
+                    dataframe, statistics = self._clean_chunk(loader.load(self.config.unclean_data_path))
+            else:
+                # Remove rows with any missing values
+                dataframe, statistics = self._clean_chunk(dataframe)
 
-            # Remove rows with any missing values
-            dataframe = dataframe.dropna(how='any', axis=0)
+            # Save the cleaned data in the configured dataset format
+            if dataframe is not None and checkpoint:
+                self._clean_loader().save(self.config.clean_data_path, dataframe)
 
-            # Save the cleaned data
-            dataframe.to_csv(self.config.clean_data_path, index=False)
+            # Save the cleaned data schema and statistics
+            self._write_statistics(statistics)
 
-            # Save the cleaned data schema
-            overview = dataframe.describe()
-            overview.loc[["min", "max"]].to_json(os.path.join(self.config.root_dir, "dataset_schema.json"))
+            # Record the partitions cleaned, a single file cannot be processed incrementally
+            if checkpoint and partitions is not None:
+                self._write_watermark(partitions)
+            elif os.path.exists(self.config.watermark_file):
+                os.remove(self.config.watermark_file)
 
             # Log information about the cleaning process
             logger.info("Cleaned the dataset")
+            return dataframe
 
         except Exception as e:
             # Raise an exception if an error occurs during cleaning
-            raise e
\ No newline at end of file
+            raise e
+
+    def clean_in_chunks(self, loader) -> ColumnStatistics:
+        """
+        Removes the rows with missing values chunk by chunk, saving every clean chunk as it comes.
+
+        Args:
+            loader (DataLoaderSaver): The loader of the unclean data.
+
+        Returns:
+            ColumnStatistics: The statistics of the clean data.
+        """
+        statistics = None
+        clean_loader = self._clean_loader()
+        with clean_loader.chunk_writer(self.config.clean_data_path, dtype=dict(self.config.data_schema)) as writer:
+            for chunk in loader.iter_chunks(self.config.unclean_data_path, self.config.chunk_size,
+                                            dtype=self._parse_dtypes()):
+                chunk, statistics = self._clean_chunk(chunk, statistics)
+                writer.write(chunk)
+        # An empty dataset has no chunk to take the columns from
+        statistics = statistics or ColumnStatistics(list(self.config.data_schema))
+        logger.info(f"Cleaned the dataset in chunks of {self.config.chunk_size} rows "
+                    f"({int(statistics.count.max(initial=0))} clean rows)")
+        return statistics
+
+    def unprocessed_partitions(self, loader: PartitionedDataLoaderSaver):
+        """
+        Returns the partitions of the unclean data added since the last run.
+
+        Args:
+            loader (PartitionedDataLoaderSaver): The loader of the unclean data.
+
+        Returns:
+            list: The manifest entries of the new partitions, or None if the whole dataset must be cleaned again.
+        """
+        watermark = self._read_watermark()
+        if (watermark.get("unclean_data_path") != str(self.config.unclean_data_path)
+                or watermark.get("clean_data_path") != str(self.config.clean_data_path)
+                or not os.path.exists(self.config.clean_data_path) or not os.path.exists(self._statistics_path)):
+            return None
+
+        current = loader.read_manifest(self.config.unclean_data_path)["partitions"]
+        if any(partition.get("sha256") is None for partition in current):
+            # Without a checksum a rewritten partition cannot be told apart from an unchanged one
+            return None
+        processed = {(partition["path"], partition["sha256"]) for partition in watermark["partitions"]}
+        if not processed <= {(partition["path"], partition["sha256"]) for partition in current}:
+            logger.info("Partitions already cleaned changed or were removed, cleaning the whole dataset")
+            return None
+        return [partition for partition in current if (partition["path"], partition["sha256"]) not in processed]
+
+    def _clean_delta(self, delta: list):
+        if not delta:
+            logger.info("No new partitions since the last run, the clean dataset is up to date")
+            return None
+
+        # Merge the statistics of the new rows into the dataset schema and statistics
+        with open(self._statistics_path, 'r') as f:
+            statistics = ColumnStatistics.from_frame(pd.DataFrame(json.load(f)))
+        cleaned = []
+        for partition in delta:
+            clean, statistics = self._clean_chunk(dataset_loader_saver(partition["path"]).load(partition["path"]),
+                                                  statistics)
+            cleaned.append(clean)
+        delta_frame = pd.concat(cleaned, ignore_index=True)
+
+        clean_loader = self._clean_loader()
+        if isinstance(clean_loader, PartitionedDataLoaderSaver):
+            # Every new partition becomes a clean partition, the history is not rewritten
+            for partition, frame in zip(delta, cleaned):
+                clean_loader.append(self.config.clean_data_path, frame, source=partition["path"])
+        else:
+            # A single file is rewritten, but the history is only read back, not cleaned again
+            logger.info(f"Rewriting the single clean file {self.config.clean_data_path} in full with the new rows, "
+                        f"a clean_data_path without extension appends them as partitions instead")
+            self._replace_file(clean_loader, pd.concat([clean_loader.load(self.config.clean_data_path), delta_frame],
+                                                       ignore_index=True))
+
+        self._write_statistics(statistics)
+
+        self._write_watermark(self._read_watermark()["partitions"] + delta)
+        logger.info(f"Cleaned {len(delta)} new partitions ({len(delta_frame)} clean rows)")
+        return delta_frame
+
+    def _parse_dtypes(self) -> dict:
+        # An integer column with missing values cannot be parsed into int64, the nullable Int64 can (and
+        # still rejects non-integral values)
+        return {col: str(dtype).replace("uint", "UInt").replace("int", "Int")
+                if pd.api.types.is_integer_dtype(str(dtype)) else dtype
+                for col, dtype in self.config.data_schema.items()}
+
+    def _clean_chunk(self, dataframe: pd.DataFrame, statistics: ColumnStatistics = None) -> tuple:
+        clean = self._drop_missing(dataframe)
+        if statistics is None:
+            statistics = ColumnStatistics(clean.select_dtypes("number").columns)
+        # The nulls are the missing values of the unclean rows, the other statistics are of the clean rows
+        statistics.update(clean)
+        statistics.null_count += dataframe[statistics.columns].isna().sum().to_numpy(dtype="float64")
+        return clean, statistics
+
+    def _drop_missing(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        dataframe = dataframe.dropna(how='any', axis=0)
+        # Without their missing values, the integer columns read as floats or nullable integers get their schema
+        # dtype back. A column with non-integral values is left as it is, for the validation to report
+        dtypes = {}
+        for col, dtype in self.config.data_schema.items():
+            if (col in dataframe.columns and pd.api.types.is_integer_dtype(str(dtype))
+                    and dataframe[col].dtype != dtype and pd.api.types.is_numeric_dtype(dataframe[col])
+                    and not pd.api.types.is_bool_dtype(dataframe[col]) and (dataframe[col] % 1 == 0).all()):
+                dtypes[col] = str(dtype)
+        return dataframe.astype(dtypes) if dtypes else dataframe
+
+    def _clean_loader(self):
+        # A clean_data_path without extension is a partitioned dataset, its partitions are in the dataset format
+        return dataset_loader_saver(self.config.clean_data_path, self.config.dataset_format)
+
+    @property
+    def _statistics_path(self) -> str:
+        return os.path.join(self.config.root_dir, "dataset_statistics.json")
+
+    def _write_statistics(self, statistics: ColumnStatistics):
+        overview = statistics.to_frame()
+        overview.loc[["min", "max"]].to_json(os.path.join(self.config.root_dir, "dataset_schema.json"))
+        overview.to_json(self._statistics_path)
+
+    def _replace_file(self, clean_loader, dataframe: pd.DataFrame):
+        # Write next to the clean data and rename, the file being replaced may still be memory-mapped
+        clean_path = Path(self.config.clean_data_path)
+        tmp_path = clean_path.with_name(f".tmp-{clean_path.name}")
+        clean_loader.save(tmp_path, dataframe)
+        os.replace(tmp_path, clean_path)
+        if os.path.exists(f"{tmp_path}.columns.json"):
+            os.replace(f"{tmp_path}.columns.json", f"{clean_path}.columns.json")
+
+    def _read_watermark(self) -> dict:
+        try:
+            with open(self.config.watermark_file, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_watermark(self, partitions: list):
+        watermark = {
+            "unclean_data_path": str(self.config.unclean_data_path),
+            "clean_data_path": str(self.config.clean_data_path),
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "partitions": [{"path": partition["path"], "sha256": partition.get("sha256"),
+                            "rows": partition.get("rows")} for partition in partitions],
+        }
+        with open(f"{self.config.watermark_file}.tmp", 'w') as f:
+            json.dump(watermark, f, indent=4)
+        os.replace(f"{self.config.watermark_file}.tmp", self.config.watermark_file)
\ No newline at end of file
@@ -1,24 +1,72 @@
+import hashlib
+import http.client
+import json
 import os
-from pathlib import Path
+import time
+import urllib.error
 import urllib.request as request
 import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
 
 from src.mlops_water_potability_prediction_project import logger
 from src.mlops_water_potability_prediction_project.entity.config_entity import DataIngestionConfig
 from src.mlops_water_potability_prediction_project.utilities.helpers import get_file_size
 
 
+class ChecksumMismatch(Exception):
+    def __init__(self, file_path, expected, actual, message="SHA-256 checksum mismatch"):
+        self.file_path = file_path
+        self.expected = expected
+        self.actual = actual
+        self.message = f"{message} for {file_path}: expected {expected}, got {actual}"
+        super().__init__(self.message)
+
+
+class IncompleteDownload(Exception):
+    def __init__(self, file_path, expected_size, actual_size, message="Incomplete download"):
+        self.file_path = file_path
+        self.message = f"{message} of {file_path}: expected {expected_size} bytes, got {actual_size}"
+        super().__init__(self.message)
+
+
+def file_sha256(file_path, digest=None):
+    """
+    Computes the SHA-256 of a file, block by block.
+
+    Parameters:
+    - file_path (Path): The file path.
+    - digest: A hashlib object to update instead of a new one.
+
+    Returns:
+    - hashlib object: The updated digest.
+    """
+    digest = digest or hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest
+
+
 class DataIngestion:
     """
     A class for handling the data ingestion process.
 
+    The archive is streamed into a "<zip>.part" file and only renamed into place once its size and
+    (if configured) its SHA-256 are verified, so the archive on disk is never truncated. An interrupted
+    download resumes from the end of the partial file with an HTTP Range request, guarded by If-Range
+    so a source that changed in between is downloaded again from the start. The ETag and Last-Modified
+    of every download are kept in a metadata file: a later run sends them back as a conditional request
+    and only downloads again when the source changed (or when the local archive no longer matches them).
+
     Attributes:
     - config (DataIngestionConfig): The configuration for data ingestion.
 
     Methods:
     - __init__: Initializes a DataIngestion instance with the provided configuration.
-    - download_file: Downloads the data file from the specified source URL to the configured path.
-    - extract_zip_file: Extracts the contents of the downloaded zip file to the specified directory.
+    - download_file: Downloads the data file from the specified source URL to the configured path, if it changed.
+    - extract_zip_file: Extracts the contents of the downloaded zip file to the specified directory, if enabled.
+    - is_local_file_current: Tells whether the local archive still matches the recorded download.
     """
 
     def __init__(self, config: DataIngestionConfig):
@@ -29,38 +77,196 @@ class DataIngestion:
         - config (DataIngestionConfig): The configuration for data ingestion.
         """
         self.config = config
+        self.part_path = f"{config.zip_data_path}.part"
+        self.part_metadata_path = f"{config.zip_data_path}.part.json"
 
-    def download_file(self):
+    def download_file(self) -> bool:
         """
         Downloads the data file from the specified source URL to the configured path.
-        If the file already exists, logs its size; otherwise, logs the successful download.
+        The download is skipped if the configured SHA-256 matches the local file, or if the server
+        reports the source unchanged since the recorded download.
 
         Returns:
-        - None
+        - bool: True if a new file was downloaded.
+
+        Raises:
+        - ChecksumMismatch: If the downloaded file does not match the configured SHA-256.
+        - urllib.error.URLError: If the source stays unreachable after the configured retries.
         """
+        if os.path.exists(self.config.zip_data_path) and self.config.sha256:
+            if file_sha256(self.config.zip_data_path).hexdigest() == self.config.sha256:
+                logger.info(f"File already exists and matches the configured SHA-256. "
+                            f"Size: {get_file_size(Path(self.config.zip_data_path))}")
+                return False
+
+        metadata = self._read_json(self.config.metadata_path)
+        validators = {}
+        # A local file not matching the configured SHA-256 must be downloaded again, whatever the server says
+        if (not self.config.sha256 and metadata.get("source_url") == self.config.source_url
+                and self.is_local_file_current(metadata)):
+            if metadata.get("etag"):
+                validators["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified"):
+                validators["If-Modified-Since"] = metadata["last_modified"]
+
+        for attempt in range(1, self.config.retries + 1):
+            try:
+                return self._download(validators)
+            except (urllib.error.URLError, http.client.HTTPException, OSError, IncompleteDownload) as e:
+                if isinstance(e, urllib.error.HTTPError) and e.code < 500:
+                    raise
+                if attempt == self.config.retries:
+                    raise
+                logger.warning(f"Download attempt {attempt} of {self.config.source_url} failed ({e}), "
+                               f"resuming in {2 ** (attempt - 1)}s")
+                time.sleep(2 ** (attempt - 1))
+        return False
+
+    def _download(self, validators: dict) -> bool:
+        headers = {}
+        offset = 0
+        part_metadata = self._read_json(self.part_metadata_path)
+        if os.path.exists(self.part_path) and part_metadata.get("source_url") == self.config.source_url:
+            # Resume the partial download, but only if the source is still the same file
+            validator = part_metadata.get("etag") or part_metadata.get("last_modified")
+            if validator:
+                offset = os.path.getsize(self.part_path)
+                headers["Range"] = f"bytes={offset}-"
+                headers["If-Range"] = validator
+        if offset == 0:
+            # A conditional request only makes sense when there is no partial download to complete
+            headers.update(validators)
+
+        req = request.Request(self.config.source_url, headers=headers)
         try:
-            if not os.path.exists(self.config.zip_data_path):
-                filename, headers = request.urlretrieve(
-                    url=self.config.source_url,
-                    filename=self.config.zip_data_path
-                )
-                logger.info(f"{filename} download! \nWith the following info: \n{headers}")
+            response = request.urlopen(req, timeout=self.config.timeout)
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                logger.info(f"Source unchanged since the last download. "
+                            f"Size: {get_file_size(Path(self.config.zip_data_path))}")
+                return False
+            if e.code == 416 and offset:
+                # The partial file is not a prefix of the source anymore, start over
+                self._remove_partial()
+                return self._download(validators)
+            raise
+
+        with response:
+            if response.status == 206:
+                digest = file_sha256(self.part_path)
+                mode = 'ab'
+                logger.info(f"Resuming the download of {self.config.source_url} at byte {offset}")
             else:
-                logger.info(f"File already exists. Size: {get_file_size(Path(self.config.zip_data_path))}")
-        except Exception as e:
-            logger.error(f"Error during file download: {e}")
+                # A 200 answer to a range request means the source changed (If-Range) or ranges are unsupported
+                digest, mode, offset = hashlib.sha256(), 'wb', 0
+
+            total_size = self._total_size(response, offset)
+            self._write_json(self.part_metadata_path, {
+                "source_url": self.config.source_url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            })
+
+            with open(self.part_path, mode) as f:
+                for block in iter(lambda: response.read(self.config.chunk_size), b""):
+                    f.write(block)
+                    digest.update(block)
+                f.flush()
+                os.fsync(f.fileno())
+
+            size = os.path.getsize(self.part_path)
+            if total_size is not None and size != total_size:
+                raise IncompleteDownload(self.part_path, total_size, size)
+
+            sha256 = digest.hexdigest()
+            if self.config.sha256 and sha256 != self.config.sha256:
+                self._remove_partial()
+                raise ChecksumMismatch(self.config.zip_data_path, self.config.sha256, sha256)
+
+            os.replace(self.part_path, self.config.zip_data_path)
+            stat = os.stat(self.config.zip_data_path)
+            self._write_json(self.config.metadata_path, {
+                "source_url": self.config.source_url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": sha256,
+                "downloaded_at": datetime.now(timezone.utc).isoformat(),
+            })
+            self._remove_partial()
+
+        logger.info(f"{self.config.zip_data_path} downloaded. Size: {get_file_size(Path(self.config.zip_data_path))}, "
+                    f"SHA-256: {sha256}")
+        return True
+
+    def is_local_file_current(self, metadata: dict) -> bool:
+        """
+        Tells whether the local archive still matches the recorded download.
+
+        Parameters:
+        - metadata (dict): The recorded download metadata.
+
+        Returns:
+        - bool: True if the archive exists and its size and SHA-256 match the metadata.
+        """
+        try:
+            stat = os.stat(self.config.zip_data_path)
+        except FileNotFoundError:
+            return False
+        if stat.st_size != metadata.get("size"):
+            return False
+        if stat.st_mtime_ns == metadata.get("mtime_ns"):
+            return True
+        return file_sha256(self.config.zip_data_path).hexdigest() == metadata.get("sha256")
 
     def extract_zip_file(self):
         """
         Extracts the contents of the downloaded zip file to the specified directory.
+        Skipped when extraction is disabled (the CSV is then read straight from the archive)
+        and for members already extracted from the current archive.
 
         Returns:
         - None
         """
+        if not self.config.extract_zip:
+            logger.info(f"Extraction disabled, the dataset is read straight from {self.config.zip_data_path}")
+            return
+
+        unzip_path = self.config.unzip_dir
+        os.makedirs(unzip_path, exist_ok=True)
+        zip_mtime = os.path.getmtime(self.config.zip_data_path)
+        with zipfile.ZipFile(self.config.zip_data_path, 'r') as zip_ref:
+            for member in zip_ref.infolist():
+                target = os.path.join(unzip_path, member.filename)
+                if (os.path.exists(target) and os.path.getsize(target) == member.file_size
+                        and os.path.getmtime(target) >= zip_mtime):
+                    continue
+                zip_ref.extract(member, unzip_path)
+
+    @staticmethod
+    def _total_size(response, offset):
+        content_range = response.headers.get("Content-Range")
+        if content_range and "/" in content_range and not content_range.endswith("/*"):
+            return int(content_range.rsplit("/", 1)[1])
+        content_length = response.headers.get("Content-Length")
+        return offset + int(content_length) if content_length is not None else None
+
+    def _remove_partial(self):
+        for path in (self.part_path, self.part_metadata_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    @staticmethod
+    def _read_json(path) -> dict:
         try:
-            unzip_path = self.config.unzip_dir
-            os.makedirs(unzip_path, exist_ok=True)
-            with zipfile.ZipFile(self.config.zip_data_path, 'r') as zip_ref:
-                zip_ref.extractall(unzip_path)
-        except Exception as e:
-            logger.error(f"Error during zip file extraction: {e}")
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def _write_json(path, data: dict):
+        with open(f"{path}.tmp", 'w') as f:
+            json.dump(data, f, indent=4)
+        os.replace(f"{path}.tmp", path)
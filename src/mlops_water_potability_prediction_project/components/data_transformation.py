@@ -3,9 +3,10 @@ import os
 import joblib
 import pandas as pd
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
 
 from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.classes.column_statistics import ColumnStatistics
+from src.mlops_water_potability_prediction_project.classes.dataloadersaver import dataset_loader_saver
 from src.mlops_water_potability_prediction_project.entity.config_entity import DataTransformationConfig
 
 
@@ -22,7 +23,7 @@ class DataTransformation:
     - __init__: Initializes a DataTransformation instance with the provided configuration.
     - split_dataset: Splits the dataset into training and test sets.
     - feature_scale_dataset: Applies feature scaling to the datasets.
-    - save_transformation: Saves the transformed datasets as CSV files.
+    - save_transformation: Saves the transformed datasets in the configured dataset format.
     """
 
     def __init__(self, config: DataTransformationConfig):
@@ -36,15 +37,19 @@ class DataTransformation:
         self.train = None
         self.test = None
 
-    def split_dataset(self):
+    def split_dataset(self, dataframe: pd.DataFrame = None):
         """
         Splits the dataset into training and test sets.
 
+        Parameters:
+        - dataframe (pd.DataFrame): The cleaned data, read from the data path if not given.
+
         Returns:
         - None
         """
         try:
-            dataframe = pd.read_csv(self.config.data_path)
+            if dataframe is None:
+                dataframe = dataset_loader_saver(self.config.data_path).load(self.config.data_path)
 
             self.train, self.test = train_test_split(dataframe)
 
@@ -59,16 +64,22 @@ class DataTransformation:
         """
         Applies feature scaling to the datasets.
 
+        The StandardScaler is built from the feature statistics of the training set, accumulated in one
+        vectorized pass (see ColumnStatistics) and saved next to the scaler, rather than fitted.
+
         Returns:
         - None
         """
         try:
-            sc = StandardScaler()
+            features = list(self.train.columns[:-1])
+            statistics = ColumnStatistics(features).update(self.train)
+            statistics.to_frame().to_json(os.path.join(self.config.root_dir, "feature_statistics.json"))
+            sc = statistics.standard_scaler()
 
             train_array = self.train.to_numpy()
             test_array = self.test.to_numpy()
 
-            train_array[:, :-1] = sc.fit_transform(train_array[:, :-1])
+            train_array[:, :-1] = sc.transform(train_array[:, :-1])
             test_array[:, :-1] = sc.transform(test_array[:, :-1])
 
             self.train = pd.DataFrame(train_array, columns=list(self.train.columns))
@@ -84,15 +95,17 @@ class DataTransformation:
 
     def save_transformation(self):
         """
-        Saves the transformed datasets as CSV files.
+        Saves the transformed datasets in the configured dataset format.
 
         Returns:
         - None
         """
         try:
-            self.train.to_csv(os.path.join(self.config.root_dir, "train_set.csv"), index=False)
-            self.test.to_csv(os.path.join(self.config.root_dir, "test_set.csv"), index=False)
+            for dataframe, file_name in ((self.train, self.config.train_file_name),
+                                         (self.test, self.config.test_file_name)):
+                file_path = os.path.join(self.config.root_dir, file_name)
+                dataset_loader_saver(file_path).save(file_path, dataframe)
 
-            logger.info("Saved the transformations as csv")
+            logger.info(f"Saved the transformations as {self.config.train_file_name} and {self.config.test_file_name}")
         except Exception as e:
             raise e
\ No newline at end of file
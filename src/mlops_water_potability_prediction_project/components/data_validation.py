@@ -1,6 +1,12 @@
+import json
+import math
+import os
+
 import pandas as pd
 
 from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.classes.dataloadersaver import PartitionedDataLoaderSaver, \
+    dataset_loader_saver
 from src.mlops_water_potability_prediction_project.entity.config_entity import DataValidationConfig
 
 
@@ -8,12 +14,23 @@ class DataValidation:
     """
     A class for performing data validation based on specified configuration.
 
+    When the cleaned data is a partitioned dataset and incremental processing is on, a watermark file
+    records the partitions already validated and their combined status. A later run only validates the
+    partitions appended since and combines their status with the recorded one.
+
+    Besides the status file, a validation report gives the dtype check of every column together with
+    its count, null count, min, max, mean and standard deviation. These are taken from the dataset
+    statistics the cleaning stage accumulated, the data is not scanned again for them.
+
     Attributes:
     - config (DataValidationConfig): The configuration for data validation.
 
     Methods:
     - __init__: Initializes a DataValidation instance with the provided configuration.
     - validate_all_columns: Validates all columns in the dataset against the specified data schema.
+    - validate_columns: Validates the columns of one DataFrame against the specified data schema.
+    - column_report: Checks the dtype of every column of one DataFrame against the specified data schema.
+    - write_report: Writes the validation report.
     """
 
     def __init__(self, config: DataValidationConfig):
@@ -25,35 +42,146 @@ class DataValidation:
         """
         self.config = config
 
-    def validate_all_columns(self) -> bool:
+    def validate_all_columns(self, dataframe: pd.DataFrame = None) -> bool:
         """
         Validates all columns in the dataset against the specified data schema.
 
+        Parameters:
+        - dataframe (pd.DataFrame): The cleaned data, read from the data path if not given.
+
         Returns:
         - bool: True if all columns pass validation, False otherwise.
         """
         try:
-            validation_status = None
-            dataframe = pd.read_csv(self.config.data_path)
-            all_columns = list(dataframe.columns)
-            data_schema_keys = self.config.data_schema.keys()
-
-            for col in all_columns:
-                if col not in data_schema_keys:
-                    validation_status = False
-                elif dataframe[col].dtype != self.config.data_schema[col]:
-                    validation_status = False
+            partitions = None
+            if dataframe is None:
+                loader = dataset_loader_saver(self.config.data_path)
+                if isinstance(loader, PartitionedDataLoaderSaver) and self.config.incremental:
+                    partitions = [self._partition_key(partition)
+                                  for partition in loader.read_manifest(self.config.data_path)["partitions"]]
+                    columns = self._validate_delta(partitions)
                 else:
-                    continue
-
-            if validation_status == None:
-                validation_status = True
+                    columns = self.column_report(loader.load(self.config.data_path))
+            else:
+                columns = self.column_report(dataframe)
+            validation_status = all(column["valid"] for column in columns.values())
 
             with open(self.config.status_file, 'w') as f:
                 f.write(f"Validation status: {str(validation_status)}")
+            self.write_report(validation_status, columns)
+
+            if partitions is not None:
+                self._write_watermark(partitions, columns)
+            elif os.path.exists(self.config.watermark_file):
+                os.remove(self.config.watermark_file)
 
             logger.info(f"Validation status: {str(validation_status)}")
             return validation_status
         except Exception as e:
             logger.error(f"Error during data validation: {e}")
-            raise e
\ No newline at end of file
+            raise e
+
+    def validate_columns(self, dataframe: pd.DataFrame) -> bool:
+        """
+        Validates the columns of one DataFrame against the specified data schema.
+
+        Parameters:
+        - dataframe (pd.DataFrame): The data to validate.
+
+        Returns:
+        - bool: True if all columns are in the schema with the expected dtype, False otherwise.
+        """
+        return all(column["valid"] for column in self.column_report(dataframe).values())
+
+    def column_report(self, dataframe: pd.DataFrame) -> dict:
+        """
+        Checks the dtype of every column of one DataFrame against the specified data schema.
+
+        Parameters:
+        - dataframe (pd.DataFrame): The data to validate.
+
+        Returns:
+        - dict: For every column, its dtype, the dtype expected by the schema (None if the column is
+          not in the schema) and whether it is valid.
+        """
+        return {col: {"dtype": str(dataframe[col].dtype),
+                      "expected_dtype": self.config.data_schema.get(col),
+                      "valid": col in self.config.data_schema and dataframe[col].dtype == self.config.data_schema[col]}
+                for col in dataframe.columns}
+
+    def write_report(self, validation_status: bool, columns: dict):
+        """
+        Writes the validation report, with the statistics of every column from the dataset statistics.
+
+        Parameters:
+        - validation_status (bool): The validation status.
+        - columns (dict): The column checks from column_report.
+        """
+        try:
+            with open(self.config.statistics_path, 'r') as f:
+                statistics = json.load(f)
+        except FileNotFoundError:
+            logger.warning(f"No dataset statistics at {self.config.statistics_path}, the report has none")
+            statistics = {}
+
+        report = {
+            "status": validation_status,
+            "missing_columns": [col for col in self.config.data_schema if col not in columns],
+            "columns": {},
+        }
+        for col, column in columns.items():
+            column = dict(column)
+            values = statistics.get(col, {})
+            for name in ("count", "null_count", "min", "max", "mean"):
+                if values.get(name) is not None:
+                    column[name] = int(values[name]) if name.endswith("count") else values[name]
+            if values.get("var") is not None:
+                column["std"] = math.sqrt(values["var"])
+            report["columns"][col] = column
+
+        with open(self.config.report_file, 'w') as f:
+            json.dump(report, f, indent=4)
+
+    def _validate_delta(self, partitions: list) -> dict:
+        watermark = self._read_watermark()
+        validated = [tuple(partition) for partition in watermark.get("partitions", [])]
+        # Validate everything again if the schema changed, or a validated partition was rewritten or removed
+        if (watermark.get("data_path") != str(self.config.data_path)
+                or watermark.get("data_schema") != dict(self.config.data_schema) or "columns" not in watermark
+                or partitions[:len(validated)] != validated):
+            validated = []
+            columns = {}
+        else:
+            columns = watermark["columns"]
+
+        delta = partitions[len(validated):]
+        for path, _, _ in delta:
+            for col, column in self.column_report(dataset_loader_saver(path).load(path)).items():
+                if col in columns:
+                    column = dict(columns[col], valid=columns[col]["valid"] and column["valid"])
+                columns[col] = column
+        logger.info(f"Validated {len(delta)} new partitions, {len(validated)} already validated")
+        return columns
+
+    @staticmethod
+    def _partition_key(partition: dict) -> tuple:
+        stat = os.stat(partition["path"])
+        return partition["path"], stat.st_size, stat.st_mtime_ns
+
+    def _read_watermark(self) -> dict:
+        try:
+            with open(self.config.watermark_file, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_watermark(self, partitions: list, columns: dict):
+        watermark = {
+            "data_path": str(self.config.data_path),
+            "data_schema": dict(self.config.data_schema),
+            "columns": columns,
+            "partitions": [list(partition) for partition in partitions],
+        }
+        with open(f"{self.config.watermark_file}.tmp", 'w') as f:
+            json.dump(watermark, f, indent=4)
+        os.replace(f"{self.config.watermark_file}.tmp", self.config.watermark_file)
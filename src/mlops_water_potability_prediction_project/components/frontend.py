@@ -1,48 +1,79 @@
-import joblib
-import json
+import time
 import numpy as np
-import pandas as pd
 from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.classes.artifact_cache import ServingArtifacts, get_artifact_cache
+from src.mlops_water_potability_prediction_project.classes.compiled_schema import CompiledSchema
+from src.mlops_water_potability_prediction_project.classes.feature_vectorizer import FeatureVectorizer
+from src.mlops_water_potability_prediction_project.classes.metrics import REGISTRY, Counter, Histogram
+from src.mlops_water_potability_prediction_project.classes.prediction_cache import PredictionCache
 from src.mlops_water_potability_prediction_project.entity.config_entity import ModelFrontendConfig
 
 
 class NotInRange(Exception):
-    def __init__(self, message="Values entered are not in range"):
+    def __init__(self, message="Values entered are not in range", errors=None):
         self.message = message
+        self.errors = errors or []
         super().__init__(self.message)
 
 
 class NotInFeatureColumn(Exception):
-    def __init__(self, message="Values entered are not in feature columns"):
+    def __init__(self, message=FeatureVectorizer.UNKNOWN_COLUMN_MESSAGE, errors=None):
         self.message = message
+        self.errors = errors or []
         super().__init__(self.message)
 
 
+STAGE_SECONDS = REGISTRY.histogram("water_potability_stage_seconds",
+                                   "Latency of the serving stages, in seconds.", labelnames=("stage", "path"))
+VALIDATION_ERRORS = REGISTRY.counter("water_potability_validation_errors_total",
+                                     "Rejected inputs (requests or batch rows) by exception type.",
+                                     labelnames=("exception",))
+
+
 class FrontendPrediction:
     """
     A class for making predictions using a machine learning model in the frontend.
 
     Attributes:
     - config (ModelFrontendConfig): The configuration for the model frontend.
+    - artifact_cache (ArtifactCache): The process-wide cache holding the inference bundle and schema.
+    - prediction_cache (PredictionCache): An optional cache of prediction results.
+    - stage_seconds (Histogram): The latency of the serving stages, STAGE_SECONDS unless metrics are off.
+    - validation_errors (Counter): The rejected inputs, VALIDATION_ERRORS unless metrics are off.
 
     Methods:
     - __init__: Initializes a FrontendPrediction instance with the provided configuration.
     - form_response: Forms a response based on the prediction result.
+    - batch_response: Forms per-row responses for a batch of input records.
+    - describe_violations: Describes the out-of-range values of a validated matrix.
     - model_predict: Makes predictions using the loaded machine learning model.
+    - cached_predict: Makes predictions for a scaled matrix, answering repeated inputs from the prediction cache.
     - validate_input: Validates the input data against the dataset schema.
+    - validate_row: Validates an already vectorized input row against the dataset schema.
     - feature_scale: Applies feature scaling to the input data.
-    - get_schema: Retrieves the dataset schema from a specified path.
-    - create_dataframe: Creates a Pandas DataFrame from a dictionary of input data.
     """
 
-    def __init__(self, config: ModelFrontendConfig):
+    def __init__(self, config: ModelFrontendConfig, prediction_cache: PredictionCache = None,
+                 record_metrics: bool = True):
         """
         Initializes a FrontendPrediction instance with the provided configuration.
 
         Parameters:
         - config (ModelFrontendConfig): The configuration for the model frontend.
+        - prediction_cache (PredictionCache): An optional cache of prediction results.
+        - record_metrics (bool): Whether the predictions are reported in the serving metrics. When off
+          (e.g. for the warm-up), they are recorded into metrics of their own, which are not exposed.
         """
         self.config = config
+        self.artifact_cache = get_artifact_cache(config)
+        self.prediction_cache = prediction_cache
+        if record_metrics:
+            self.stage_seconds, self.validation_errors = STAGE_SECONDS, VALIDATION_ERRORS
+        else:
+            self.stage_seconds = Histogram(STAGE_SECONDS.name, STAGE_SECONDS.documentation,
+                                           labelnames=STAGE_SECONDS.labelnames)
+            self.validation_errors = Counter(VALIDATION_ERRORS.name, VALIDATION_ERRORS.documentation,
+                                             labelnames=VALIDATION_ERRORS.labelnames)
 
     def form_response(self, dict_request):
         """
@@ -54,28 +85,125 @@ class FrontendPrediction:
         Returns:
         - str: The response indicating whether the water is "Potable" or "Not Potable".
         """
-        if self.validate_input(dict_request):
-            scaled_data = self.feature_scale(dict_request)
-            prediction_result = self.model_predict(scaled_data)
+        # Use a single snapshot for the whole request so a concurrent reload cannot mix artifacts
+        artifacts = self.artifact_cache.get()
+        start = time.perf_counter()
+        try:
+            # The request is parsed once, straight into a float64 row in schema.yaml column order
+            row, errors = artifacts.vectorizer.row(dict_request)
+            valid = self.validate_row(row, errors, artifacts)
+        except (NotInFeatureColumn, NotInRange) as e:
+            self.validation_errors.inc((type(e).__name__,))
+            raise
+        finally:
+            validated_at = time.perf_counter()
+            self.stage_seconds.observe(("validate_input", "single"), validated_at - start)
+        if valid:
+            scaled_data = artifacts.bundle.transform(row)
+            scaled_at = time.perf_counter()
+            self.stage_seconds.observe(("feature_scale", "single"), scaled_at - validated_at)
+            prediction_result = self.model_predict(scaled_data, artifacts)
+            self.stage_seconds.observe(("model_predict", "single"), time.perf_counter() - scaled_at)
             if prediction_result == 1:
                 response = "Potable"
             else:
                 response = "Not Potable"
             return response
 
-    def model_predict(self, data):
+    def batch_response(self, records, artifacts: ServingArtifacts = None):
+        """
+        Forms per-row responses for a batch of input records.
+
+        All valid rows are scaled with a single scaler call and predicted with a single model call.
+        Invalid rows are reported individually and do not affect the rest of the batch.
+
+        Parameters:
+        - records (list): A list of dicts mapping feature names to values.
+        - artifacts (ServingArtifacts): The artifacts snapshot to use, defaults to the current one.
+
+        Returns:
+        - list: One dict per input row, holding either "prediction" and "potability" or "errors".
+        """
+        artifacts = artifacts or self.artifact_cache.get()
+        compiled_schema = artifacts.compiled_schema
+        start = time.perf_counter()
+
+        data, errors = artifacts.vectorizer.matrix(records)
+        violations = compiled_schema.violations(data)
+        range_errors = self.describe_violations(data, violations, compiled_schema)
+
+        # Every invalid row is counted once, under its first error, as validate_row raises it for a single row
+        n_column_errors = n_range_errors = 0
+        for row_errors, row_range_errors in zip(errors, range_errors):
+            if row_errors:
+                n_column_errors += 1
+            elif row_range_errors:
+                n_range_errors += 1
+            row_errors.extend(row_range_errors)
+        if n_column_errors:
+            self.validation_errors.inc(("NotInFeatureColumn",), n_column_errors)
+        if n_range_errors:
+            self.validation_errors.inc(("NotInRange",), n_range_errors)
+        valid = np.array([not row_errors for row_errors in errors], dtype=bool)
+        predictions = np.empty(len(records), dtype=np.int64)
+        validated_at = time.perf_counter()
+        self.stage_seconds.observe(("validate_input", "batch"), validated_at - start)
+
+        if valid.any():
+            scaled_data = artifacts.bundle.transform(data[valid])
+            scaled_at = time.perf_counter()
+            self.stage_seconds.observe(("feature_scale", "batch"), scaled_at - validated_at)
+            predictions[valid] = self.cached_predict(scaled_data, artifacts)
+            self.stage_seconds.observe(("model_predict", "batch"), time.perf_counter() - scaled_at)
+
+        results = []
+        for row, row_errors in enumerate(errors):
+            if row_errors:
+                results.append({"row": row, "errors": row_errors})
+            else:
+                potability = int(predictions[row])
+                results.append({
+                    "row": row,
+                    "potability": potability,
+                    "prediction": "Potable" if potability == 1 else "Not Potable"
+                })
+        return results
+
+    @staticmethod
+    def describe_violations(data, violations, compiled_schema: CompiledSchema):
+        """
+        Describes the out-of-range values of a validated matrix.
+
+        NaN values are skipped, the FeatureVectorizer already reports them as missing or not a number.
+
+        Parameters:
+        - data (numpy.ndarray): The (n_rows, n_features) input matrix.
+        - violations (numpy.ndarray): The violation mask returned by CompiledSchema.violations.
+        - compiled_schema (CompiledSchema): The compiled dataset schema.
+
+        Returns:
+        - list: The error messages per row.
+        """
+        errors = [[] for _ in range(len(data))]
+        for row, j in zip(*np.nonzero(violations & ~np.isnan(data))):
+            errors[row].append(f"{NotInRange().message}: {compiled_schema.feature_names[j]}={data[row, j]} "
+                               f"(expected {compiled_schema.mins[j]} to {compiled_schema.maxs[j]})")
+        return errors
+
+    def model_predict(self, data, artifacts: ServingArtifacts = None):
         """
         Makes predictions using the loaded machine learning model.
 
         Parameters:
         - data (numpy.ndarray): The input data for making predictions.
+        - artifacts (ServingArtifacts): The artifacts snapshot to use, defaults to the current one.
 
         Returns:
         - int: The prediction result (0 or 1).
         """
         try:
-            model = joblib.load(self.config.model_path)
-            prediction = model.predict(data)[0]
+            artifacts = artifacts or self.artifact_cache.get()
+            prediction = self.cached_predict(data, artifacts)[0]
             if 0 <= prediction <= 1:
                 return prediction
             else:
@@ -85,76 +213,91 @@ class FrontendPrediction:
         except Exception as e:
             raise e
 
-    def validate_input(self, data):
+    def cached_predict(self, data, artifacts: ServingArtifacts):
         """
-        Validates the input data against the dataset schema.
+        Makes predictions for a scaled matrix, answering repeated inputs from the prediction cache.
+
+        Only the rows missing from the cache are sent to the model, in a single call.
 
         Parameters:
-        - data (dict): The input data for making predictions.
+        - data (numpy.ndarray): The (n_rows, n_features) scaled matrix.
+        - artifacts (ServingArtifacts): The artifacts snapshot to use.
 
         Returns:
-        - bool: True if the input data is valid, False otherwise.
+        - numpy.ndarray: The prediction of every row.
         """
-
-        def _validate_cols(col):
-            schema = FrontendPrediction.get_schema(self.config.dataset_schema)
-            actual_cols = schema.keys()
-            if col not in actual_cols:
-                raise NotInFeatureColumn
-
-        def _validate_values(col, val):
-            schema = FrontendPrediction.get_schema(self.config.dataset_schema)
-            if not (schema[col]["min"] <= float(val) <= schema[col]["max"]):
-                raise NotInRange
-
-        for col, val in data.items():
-            _validate_cols(col)
-            _validate_values(col, val)
-
-        return True
-
-    def feature_scale(self, data):
+        if self.prediction_cache is None:
+            return artifacts.bundle.predict_scaled(data)
+
+        keys = self.prediction_cache.make_keys(data, artifacts.bundle)
+        predictions = self.prediction_cache.get_many(keys, artifacts.version)
+        missing = [row for row, prediction in enumerate(predictions) if prediction is None]
+        if missing:
+            fresh = artifacts.bundle.predict_scaled(data[missing]).tolist()
+            self.prediction_cache.put_many([keys[row] for row in missing], fresh, artifacts.version)
+            for row, prediction in zip(missing, fresh):
+                predictions[row] = prediction
+        return np.asarray(predictions)
+
+    def validate_input(self, data, artifacts: ServingArtifacts = None):
         """
-        Applies feature scaling to the input data.
+        Validates the input data against the dataset schema.
 
         Parameters:
         - data (dict): The input data for making predictions.
+        - artifacts (ServingArtifacts): The artifacts snapshot to use, defaults to the current one.
 
         Returns:
-        - numpy.ndarray: The scaled input data.
+        - bool: True if the input data is valid.
+
+        Raises:
+        - NotInFeatureColumn: If a column is unknown, missing or not a number, listing every problem found.
+        - NotInRange: If values are out of range, listing every one of them.
         """
-        df = FrontendPrediction.create_dataframe(data)
-        sc = joblib.load(self.config.feature_scaler)
-        data = sc.transform(df)
-        return data
+        artifacts = artifacts or self.artifact_cache.get()
+        row, errors = artifacts.vectorizer.row(data)
+        return self.validate_row(row, errors, artifacts)
 
-    @staticmethod
-    def get_schema(schema_path):
+    def validate_row(self, row, errors, artifacts: ServingArtifacts):
         """
-        Retrieves the dataset schema from a specified path.
+        Validates an already vectorized input row against the dataset schema.
 
         Parameters:
-        - schema_path (str): The path to the dataset schema file.
+        - row (numpy.ndarray): The (n_features,) input row, as returned by FeatureVectorizer.row.
+        - errors (list): The conversion errors of the row, as returned by FeatureVectorizer.row.
+        - artifacts (ServingArtifacts): The artifacts snapshot to use.
 
         Returns:
-        - dict: The dataset schema.
+        - bool: True if the input row is valid.
+
+        Raises:
+        - NotInFeatureColumn: If a column is unknown, missing or not a number, listing every problem found.
+        - NotInRange: If values are out of range, listing every one of them.
         """
-        with open(schema_path, 'r') as f:
-            schema = json.load(f)
-        return schema
+        compiled_schema = artifacts.compiled_schema
+        matrix = row.reshape(1, -1)
+        column_errors = list(errors)
+        range_errors = self.describe_violations(matrix, compiled_schema.violations(matrix), compiled_schema)[0]
+
+        if column_errors:
+            raise NotInFeatureColumn("; ".join(column_errors + range_errors), errors=column_errors + range_errors)
+        if range_errors:
+            raise NotInRange("; ".join(range_errors), errors=range_errors)
+        return True
 
-    @staticmethod
-    def create_dataframe(dict):
+    def feature_scale(self, data, artifacts: ServingArtifacts = None):
         """
-        Creates a Pandas DataFrame from a dictionary of input data.
+        Applies feature scaling to the input data.
 
         Parameters:
-        - dict (dict): The input data for making predictions.
+        - data (dict): The input data for making predictions.
+        - artifacts (ServingArtifacts): The artifacts snapshot to use, defaults to the current one.
 
         Returns:
-        - pandas.DataFrame: The created DataFrame.
+        - numpy.ndarray: The scaled input data.
         """
-        data = np.array([list(dict.values())])
-        headers = list(dict.keys())
-        df = pd.DataFrame(data, columns=headers)
-        return df
\ No newline at end of file
+        artifacts = artifacts or self.artifact_cache.get()
+        row, errors = artifacts.vectorizer.row(data)
+        if errors:
+            raise NotInFeatureColumn("; ".join(errors), errors=errors)
+        return artifacts.bundle.transform(row)
@@ -0,0 +1,145 @@
+import asyncio
+import time
+
+from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.entity.config_entity import MicroBatchingConfig
+
+
+class InferenceQueueFull(Exception):
+    def __init__(self, message="Inference queue is full, try again later"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class MicroBatcher:
+    """
+    An asyncio inference queue that coalesces concurrent requests into vectorized model calls.
+
+    Callers submit a list of records and await their results. A single worker task collects
+    queued requests until either max_batch_size rows are gathered or max_wait_ms has passed since
+    the first one arrived, scores all of them with one call to the batch prediction function
+    (run in a worker thread so the event loop stays responsive), and hands every caller back
+    its own slice of the results.
+
+    Attributes:
+    - config (MicroBatchingConfig): The configuration for the micro-batching queue.
+    - predict_fn (callable): Takes a list of records and returns one result per record.
+
+    Methods:
+    - __init__: Initializes a MicroBatcher instance.
+    - start: Starts the worker task on the running event loop.
+    - stop: Stops the worker task, failing any request still waiting.
+    - submit: Queues records for prediction and waits for their results.
+    """
+
+    def __init__(self, config: MicroBatchingConfig, predict_fn):
+        """
+        Initializes a MicroBatcher instance.
+
+        Parameters:
+        - config (MicroBatchingConfig): The configuration for the micro-batching queue.
+        - predict_fn (callable): Takes a list of records and returns one result per record.
+        """
+        self.config = config
+        self.predict_fn = predict_fn
+        self._queue = None
+        self._worker = None
+        # The (records, future) pairs taken off the queue and not answered yet
+        self._batch = []
+
+    def start(self):
+        """
+        Starts the worker task on the running event loop.
+        """
+        self._queue = asyncio.Queue(maxsize=self.config.max_queue_depth)
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+        logger.info(f"Started the micro-batching worker: {self.config}")
+
+    async def stop(self):
+        """
+        Stops the worker task, failing any request still waiting: those of the batch being gathered or
+        scored, and those in the queue.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        pending, self._batch = self._batch, []
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("Inference server is shutting down"))
+
+    async def submit(self, records):
+        """
+        Queues records for prediction and waits for their results.
+
+        Parameters:
+        - records (list): A list of dicts mapping feature names to values.
+
+        Returns:
+        - list: One result per record.
+
+        Raises:
+        - InferenceQueueFull: If max_queue_depth requests are already waiting.
+        """
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((records, future))
+        except asyncio.QueueFull:
+            raise InferenceQueueFull
+        return await future
+
+    async def _next_batch(self):
+        """
+        Waits for the first request, then gathers more until the batch is full or the wait time is up.
+
+        Returns:
+        - list: The (records, future) pairs of the batch.
+        """
+        batch = self._batch = [await self._queue.get()]
+        n_rows = len(batch[0][0])
+        deadline = time.monotonic() + self.config.max_wait_ms / 1000
+
+        while n_rows < self.config.max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            batch.append(item)
+            n_rows += len(item[0])
+        return batch
+
+    async def _run(self):
+        """
+        Scores batches until cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            records = [record for request_records, _ in batch for record in request_records]
+            try:
+                results = await loop.run_in_executor(None, self.predict_fn, records)
+            except Exception as e:
+                logger.error(f"Error during micro-batched prediction: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                self._batch = []
+                continue
+
+            start = 0
+            for request_records, future in batch:
+                end = start + len(request_records)
+                # A caller that gave up (e.g. client disconnect) has a cancelled future
+                if not future.done():
+                    future.set_result(results[start:end])
+                start = end
+            self._batch = []
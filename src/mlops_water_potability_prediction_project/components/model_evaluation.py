@@ -1,6 +1,4 @@
 import joblib
-import mlflow
-import mlflow.sklearn
 import numpy as np
 import os
 import pandas as pd
@@ -9,6 +7,7 @@ from sklearn.metrics import accuracy_score, confusion_matrix
 from urllib.parse import urlparse
 
 from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.classes.dataloadersaver import dataset_loader_saver
 from src.mlops_water_potability_prediction_project.entity.config_entity import ModelEvaluationConfig
 from src.mlops_water_potability_prediction_project.utilities.helpers import save_json
 
@@ -25,7 +24,7 @@ class ModelEvaluation:
         config (ModelEvaluationConfig): The configuration for model evaluation.
 
     Methods:
-        evaluate(): Evaluates the model using the provided configuration and logs metrics with MLflow.
+        evaluate(test_df, model): Evaluates the model using the provided configuration and logs metrics with MLflow.
 
     Note:
         This class assumes the use of a logger instance from the 'src.mlops_water_potability_prediction_project' module.
@@ -40,17 +39,27 @@ class ModelEvaluation:
         """
         self.config = config
 
-    def evaluate(self):
+    def evaluate(self, test_df: pd.DataFrame = None, model=None):
         """
         Evaluate the model and log metrics with MLflow.
 
+        Args:
+            test_df (pd.DataFrame): The scaled test set, read from the test data path if not given.
+            model: The trained model, loaded from the model path if not given.
+
         Raises:
             Exception: If an error occurs during the evaluation process.
         """
         try:
+            # MLflow (and its dependencies) is only imported by the evaluation stage itself
+            import mlflow
+            import mlflow.sklearn
+
             # Read testing data and load the model
-            test_df = pd.read_csv(self.config.test_data_path)
-            model = joblib.load(self.config.model_path)
+            if test_df is None:
+                test_df = dataset_loader_saver(self.config.test_data_path).load(self.config.test_data_path)
+            if model is None:
+                model = joblib.load(self.config.model_path)
 
             # Extract features and target variables
             X_test = test_df.drop([self.config.target_column], axis=1)
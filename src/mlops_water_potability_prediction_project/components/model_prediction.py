@@ -1,5 +1,6 @@
 import joblib
 from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.classes.feature_vectorizer import FeatureVectorizer
 from src.mlops_water_potability_prediction_project.entity.config_entity import ModelPredictionConfig
 
 
@@ -9,6 +10,7 @@ class ModelPrediction:
 
     Attributes:
         config (ModelPredictionConfig): The configuration for model prediction.
+        vectorizer (FeatureVectorizer): Converts input records into feature vectors in schema.yaml column order.
 
     Methods:
         predict(data): Makes predictions using the provided data and the trained model.
@@ -25,13 +27,15 @@ class ModelPrediction:
             config (ModelPredictionConfig): The configuration for model prediction.
         """
         self.config = config
+        self.vectorizer = FeatureVectorizer(config.feature_columns)
 
     def predict(self, data):
         """
         Make predictions using the trained model.
 
         Args:
-            data: The input data for making predictions.
+            data: The raw (unscaled) feature vectors in training column order, or a record (dict)
+                or list of records mapping feature names to values.
 
         Returns:
             The predictions made by the model.
@@ -40,11 +44,20 @@ class ModelPrediction:
             Exception: If an error occurs during the prediction process.
         """
         try:
-            # Load the trained model
-            model = joblib.load(self.config.model_path)
+            # Convert records straight into a float64 matrix in schema.yaml column order
+            if isinstance(data, dict):
+                data = [data]
+            if isinstance(data, list) and data and isinstance(data[0], dict):
+                data, errors = self.vectorizer.matrix(data)
+                invalid = [f"row {row}: {'; '.join(row_errors)}" for row, row_errors in enumerate(errors) if row_errors]
+                if invalid:
+                    raise ValueError("Invalid input records: " + " | ".join(invalid))
+
+            # Load the inference bundle, which scales the features before calling the model
+            bundle = joblib.load(self.config.inference_bundle)
 
             # Make predictions using the model
-            prediction = model.predict(data)
+            prediction = bundle.predict(data)
 
             # Log information about the prediction process
             logger.info("Predict data using the model")
@@ -0,0 +1,67 @@
+import json
+import os
+
+from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.classes.model_registry import ModelRegistry
+from src.mlops_water_potability_prediction_project.entity.config_entity import ModelRegistryConfig
+
+
+class ModelRegistration:
+    """
+    ModelRegistration class for publishing the trained artifacts to the local model registry.
+
+    Attributes:
+        config (ModelRegistryConfig): The configuration for the model registry.
+        registry (ModelRegistry): The model registry.
+
+    Methods:
+        register(): Registers the trained artifacts as a new version and promotes it if configured.
+
+    Note:
+        This class assumes the use of a logger instance from the 'src.mlops_water_potability_prediction_project' module.
+    """
+
+    def __init__(self, config: ModelRegistryConfig):
+        """
+        Initialize ModelRegistration instance.
+
+        Args:
+            config (ModelRegistryConfig): The configuration for the model registry.
+        """
+        self.config = config
+        self.registry = ModelRegistry(config.root_dir)
+
+    def register(self) -> str:
+        """
+        Register the inference bundle, model, feature scaler, dataset schema and metrics as a new version.
+
+        Returns:
+            str: The registered version id.
+
+        Raises:
+            Exception: If an error occurs while registering or promoting the version.
+        """
+        try:
+            files = {
+                ModelRegistry.BUNDLE_FILE_NAME: self.config.inference_bundle_path,
+                os.path.basename(self.config.model_path): self.config.model_path,
+                os.path.basename(self.config.feature_scaler_path): self.config.feature_scaler_path,
+                os.path.basename(self.config.dataset_schema_path): self.config.dataset_schema_path,
+            }
+            metadata = {}
+            if os.path.exists(self.config.metrics_path):
+                files[os.path.basename(self.config.metrics_path)] = self.config.metrics_path
+                with open(self.config.metrics_path, 'r') as f:
+                    metadata["metrics"] = json.load(f)
+
+            version = self.registry.register(files, metadata)
+            logger.info(f"Registered model version {version}")
+
+            if self.config.auto_promote:
+                if self.registry.current_version() != version:
+                    self.registry.promote(version)
+                logger.info(f"Promoted model version {version}")
+            return version
+
+        except Exception as e:
+            raise e
@@ -1,8 +1,13 @@
 import joblib
+import json
+import numpy as np
 import os
 import pandas as pd
 from catboost import CatBoostClassifier
 from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.classes.dataloadersaver import dataset_loader_saver
+from src.mlops_water_potability_prediction_project.classes.inference_bundle import InferenceBundle
+from src.mlops_water_potability_prediction_project.classes.oblivious_trees import ObliviousTreeEnsemble
 from src.mlops_water_potability_prediction_project.entity.config_entity import ModelTrainerConfig
 
 
@@ -14,7 +19,9 @@ class ModelTrainer:
         config (ModelTrainerConfig): The configuration for model training.
 
     Methods:
-        train(): Reads training and testing data, trains a CatBoostClassifier, and saves the trained model.
+        train(train_df): Trains a CatBoostClassifier on the training data, saves and returns the trained model.
+        save_inference_bundle(classifier, X_train): Stages the scaler, model and schema as one serving artifact.
+        export_tree_engine(classifier, X_train): Exports the model to a NumPy evaluator, verified on the training data.
 
     Note:
         This class assumes the use of a logger instance from the 'src.mlops_water_potability_prediction_project' module.
@@ -29,16 +36,23 @@ class ModelTrainer:
         """
         self.config = config
 
-    def train(self):
+    def train(self, train_df: pd.DataFrame = None):
         """
         Train a CatBoostClassifier using the provided configuration.
 
+        Args:
+            train_df (pd.DataFrame): The scaled training set, read from the training data path if not given.
+
+        Returns:
+            CatBoostClassifier: The trained model.
+
         Raises:
             Exception: If an error occurs during the training process.
         """
         try:
-            # Read training and testing data
-            train_df = pd.read_csv(self.config.train_data_path)
+            # Read the training data
+            if train_df is None:
+                train_df = dataset_loader_saver(self.config.train_data_path).load(self.config.train_data_path)
 
             # Extract features and target variables
             X_train = train_df.drop([self.config.target_column], axis=1)
@@ -58,6 +72,70 @@ class ModelTrainer:
             # Log information about the training process
             logger.info("Trained and saved the model")
 
+            # Save the serving artifact taking raw feature vectors
+            self.save_inference_bundle(classifier, X_train)
+            return classifier
+
         except Exception as e:
             # Raise an exception if an error occurs during training
-            raise e
\ No newline at end of file
+            raise e
+
+    def save_inference_bundle(self, classifier, X_train):
+        """
+        Fold the fitted feature scaler, the trained model and the dataset schema into one inference bundle.
+
+        Args:
+            classifier: The trained model, expecting scaled features.
+            X_train (pd.DataFrame): The scaled training features, in model order.
+
+        Raises:
+            Exception: If an error occurs while building or saving the bundle.
+        """
+        try:
+            scaler = joblib.load(self.config.feature_scaler_path)
+            with open(self.config.dataset_schema_path, 'r') as f:
+                schema = json.load(f)
+
+            bundle = InferenceBundle.from_scaler(model=classifier,
+                                                 scaler=scaler,
+                                                 feature_names=list(X_train.columns),
+                                                 target_column=self.config.target_column,
+                                                 schema=schema,
+                                                 engine=self.export_tree_engine(classifier, X_train))
+
+            # The bundle is only staged: the served one is replaced once the whole pipeline succeeded (see
+            # promote_file), so the serving processes never pick up a model that was not evaluated yet
+            bundle_path = os.path.join(self.config.root_dir, self.config.bundle_file_name)
+            joblib.dump(bundle, f"{bundle_path}.tmp")
+            os.replace(f"{bundle_path}.tmp", bundle_path)
+
+            logger.info(f"Staged the inference bundle (version {bundle.version}) at {bundle_path}")
+
+        except Exception as e:
+            raise e
+
+    @staticmethod
+    def export_tree_engine(classifier, X_train):
+        """
+        Export the trained model to a NumPy oblivious-tree evaluator.
+
+        The exported evaluator is only returned if its raw scores on the training data are
+        bit-identical to CatBoost's, otherwise the bundle keeps using the CatBoost model.
+
+        Args:
+            classifier (CatBoostClassifier): The trained model.
+            X_train (pd.DataFrame): The scaled training features, in model order.
+
+        Returns:
+            ObliviousTreeEnsemble: The exported evaluator, or None if it could not be verified.
+        """
+        try:
+            engine = ObliviousTreeEnsemble.from_catboost(classifier)
+            expected = classifier.predict(X_train, prediction_type="RawFormulaVal")
+            if np.array_equal(engine.raw_predict(X_train.to_numpy()), expected):
+                logger.info("Exported the model to the NumPy tree engine")
+                return engine
+            logger.warning("NumPy tree engine does not match CatBoost, serving with CatBoost")
+        except Exception as e:
+            logger.warning(f"Could not export the model to the NumPy tree engine: {e}")
+        return None
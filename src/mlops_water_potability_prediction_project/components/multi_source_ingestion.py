@@ -0,0 +1,214 @@
+import dataclasses
+import glob
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlparse
+
+from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.classes.dataloadersaver import PARTITION_MANIFEST, \
+    dataset_loader_saver
+from src.mlops_water_potability_prediction_project.components.data_ingestion import DataIngestion, file_sha256
+from src.mlops_water_potability_prediction_project.entity.config_entity import DataIngestionConfig
+
+
+class SourceIngestionFailed(Exception):
+    def __init__(self, failures: dict, message="Some data sources could not be ingested"):
+        self.failures = failures
+        self.message = f"{message}: " + "; ".join(f"{source}: {error}" for source, error in failures.items())
+        super().__init__(self.message)
+
+
+class MultiSourceIngestion:
+    """
+    A class for ingesting many data sources (e.g. daily or regional shard files) into one partitioned dataset.
+
+    Every source is a URL, a local path or a local glob pattern. The sources are fetched and decoded
+    concurrently by a bounded thread pool, every source into its own partition file (in the configured
+    dataset format) of the partitions directory. URLs are downloaded with DataIngestion, so downloads
+    are resumable, verified and skipped when the source is unchanged. A source whose content did not
+    change since its partition was written is not decoded again.
+
+    Every source is retried on its own and a failing source does not stop the others. The partition
+    manifest lists the partitions in source order, so the cleaning stage reads them one by one. The
+    partition and download file names are keyed by a hash of the source, not by its position, so adding
+    or removing a source does not rename (and make the cleaning stage process again) the other partitions.
+
+    Attributes:
+    - config (DataIngestionConfig): The configuration for data ingestion.
+    - downloads_dir (Path): The directory the remote sources are downloaded to.
+
+    Methods:
+    - __init__: Initializes a MultiSourceIngestion instance with the provided configuration.
+    - resolve_sources: Expands the configured sources into a list of URLs and local paths.
+    - ingest: Fetches and decodes all sources concurrently and writes the partition manifest.
+    - ingest_source: Fetches and decodes one source into its partition.
+    - source_key: Returns the key of a source in its partition and download file names.
+    """
+
+    def __init__(self, config: DataIngestionConfig):
+        """
+        Initializes a MultiSourceIngestion instance with the provided configuration.
+
+        Parameters:
+        - config (DataIngestionConfig): The configuration for data ingestion.
+        """
+        self.config = config
+        self.downloads_dir = Path(config.root_dir) / "downloads"
+        self.manifest_path = Path(config.partitions_dir) / PARTITION_MANIFEST
+
+    def resolve_sources(self) -> list:
+        """
+        Expands the configured sources into a list of URLs and local paths.
+
+        Returns:
+        - list: The sources, in configuration order, glob matches sorted by name.
+        """
+        sources = []
+        for source in self.config.sources:
+            if urlparse(str(source)).scheme in ("http", "https"):
+                sources.append(str(source))
+            elif glob.has_magic(str(source)):
+                matches = sorted(glob.glob(str(source)))
+                if not matches:
+                    logger.warning(f"No file matches the data source pattern {source}")
+                sources.extend(matches)
+            else:
+                sources.append(str(source))
+        return list(dict.fromkeys(sources))
+
+    def ingest(self) -> list:
+        """
+        Fetches and decodes all sources concurrently and writes the partition manifest.
+
+        Returns:
+        - list: The manifest entries of the partitions.
+
+        Raises:
+        - SourceIngestionFailed: If some sources still failed after their retries. The partitions of
+          the other sources are written (and listed in the manifest) before raising.
+        """
+        sources = self.resolve_sources()
+        os.makedirs(self.config.partitions_dir, exist_ok=True)
+        os.makedirs(self.downloads_dir, exist_ok=True)
+        previous = {entry["source"]: entry for entry in self._read_manifest().get("partitions", [])}
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.config.max_workers, thread_name_prefix="ingestion") as pool:
+            futures = [pool.submit(self._ingest_with_retries, source, previous.get(source)) for source in sources]
+            results = [future.result() for future in futures]
+
+        partitions = [entry for entry, _ in results if entry is not None]
+        failures = {source: error for source, (_, error) in zip(sources, results) if error is not None}
+
+        # Keep the partitions of failed sources from an earlier run, so a transient failure does not drop data
+        for source in failures:
+            if source in previous and os.path.exists(previous[source]["path"]):
+                partitions.append(previous[source])
+        partitions.sort(key=lambda entry: sources.index(entry["source"]))
+        self._remove_stale_partitions(partitions)
+        self._write_manifest(partitions, failures)
+
+        logger.info(f"Ingested {len(partitions)} of {len(sources)} sources "
+                    f"({sum(entry['rows'] for entry in partitions)} rows) in {time.perf_counter() - start:.2f}s "
+                    f"with {self.config.max_workers} workers")
+        if failures:
+            raise SourceIngestionFailed(failures)
+        return partitions
+
+    def _ingest_with_retries(self, source: str, previous) -> tuple:
+        for attempt in range(1, self.config.retries + 1):
+            try:
+                return self.ingest_source(source, previous), None
+            except Exception as e:
+                if attempt == self.config.retries:
+                    logger.error(f"Giving up on data source {source} after {attempt} attempts: {e}")
+                    return None, f"{type(e).__name__}: {e}"
+                logger.warning(f"Attempt {attempt} to ingest {source} failed ({e}), retrying")
+                time.sleep(2 ** (attempt - 1))
+
+    def ingest_source(self, source: str, previous=None) -> dict:
+        """
+        Fetches and decodes one source into its partition.
+
+        Parameters:
+        - source (str): A URL or a local path.
+        - previous (dict): The manifest entry of the source from the last run, if any.
+
+        Returns:
+        - dict: The manifest entry of the partition.
+        """
+        local_path = self._fetch(source)
+        sha256 = file_sha256(local_path).hexdigest()
+        if previous is not None and previous.get("sha256") == sha256 and os.path.exists(previous["path"]):
+            return previous
+
+        dataframe = dataset_loader_saver(local_path).load(local_path)
+        stem = Path(urlparse(source).path).name.split(".")[0] or "source"
+        partition_path = os.path.join(self.config.partitions_dir,
+                                      f"part-{self.source_key(source)}-{stem}.{self.config.dataset_format}")
+        # Write under a temporary name first, a partition in the manifest is always complete
+        tmp_path = os.path.join(self.config.partitions_dir,
+                                f".tmp-{self.source_key(source)}-{stem}.{self.config.dataset_format}")
+        dataset_loader_saver(tmp_path).save(tmp_path, dataframe)
+        os.replace(tmp_path, partition_path)
+        if os.path.exists(f"{tmp_path}.columns.json"):
+            os.replace(f"{tmp_path}.columns.json", f"{partition_path}.columns.json")
+
+        return {"source": source, "path": partition_path, "rows": len(dataframe), "sha256": sha256}
+
+    @staticmethod
+    def source_key(source: str) -> str:
+        """
+        Returns the key of a source in its partition and download file names.
+
+        Parameters:
+        - source (str): A URL or a local path.
+
+        Returns:
+        - str: The first 16 hex digits of the SHA-256 of the source.
+        """
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+
+    def _fetch(self, source: str) -> str:
+        if urlparse(source).scheme not in ("http", "https"):
+            return source
+        file_name = f"{self.source_key(source)}-{Path(urlparse(source).path).name or 'source'}"
+        download_config = dataclasses.replace(
+            self.config, source_url=source,
+            zip_data_path=str(self.downloads_dir / file_name),
+            metadata_path=str(self.downloads_dir / f"{file_name}.metadata.json"),
+            # The expected checksum is the one of the single source_url archive
+            sha256=None,
+            # The retries of a source are handled by the ingestion of that source
+            retries=1)
+        DataIngestion(download_config).download_file()
+        return download_config.zip_data_path
+
+    def _remove_stale_partitions(self, partitions: list):
+        current = {os.path.basename(entry["path"]) for entry in partitions}
+        for entry in os.scandir(self.config.partitions_dir):
+            name = entry.name[:-len(".columns.json")] if entry.name.endswith(".columns.json") else entry.name
+            if entry.name != PARTITION_MANIFEST and name not in current:
+                os.remove(entry.path)
+
+    def _read_manifest(self) -> dict:
+        try:
+            with open(self.manifest_path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_manifest(self, partitions: list, failures: dict):
+        manifest = {
+            "written_at": datetime.now(timezone.utc).isoformat(),
+            "partitions": partitions,
+            "failed_sources": failures,
+        }
+        with open(f"{self.manifest_path}.tmp", 'w') as f:
+            json.dump(manifest, f, indent=4)
+        os.replace(f"{self.manifest_path}.tmp", self.manifest_path)
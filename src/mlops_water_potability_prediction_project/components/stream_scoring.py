@@ -0,0 +1,147 @@
+import codecs
+import csv
+import io
+import json
+from itertools import islice
+
+from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.entity.config_entity import StreamingConfig
+
+
+class InvalidCSVHeader(Exception):
+    def __init__(self, message="The CSV header does not match the schema.yaml column layout"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class StreamingScorer:
+    """
+    Scores arbitrarily large CSV uploads chunk by chunk and streams the results back.
+
+    The upload is decoded and parsed lazily, line by line, so only one chunk of rows and its
+    results are held in memory at any time. Every chunk goes through the vectorized batch path
+    (one validation pass, one scaling step and one model call). The first chunk is small so the
+    first results leave quickly, later chunks grow up to chunk_size.
+
+    Attributes:
+    - OUTPUT_FORMATS (tuple): The supported response formats.
+    - config (StreamingConfig): The configuration for the streaming endpoint.
+    - frontend_predictor (FrontendPrediction): The predictor scoring every chunk.
+
+    Methods:
+    - __init__: Initializes a StreamingScorer instance.
+    - open_csv: Starts parsing a CSV byte stream and checks its header.
+    - iter_chunks: Groups the parsed rows into chunks of records.
+    - stream: Scores the rows of an opened CSV and yields the formatted results.
+    - format_results: Formats a chunk of results.
+    """
+    OUTPUT_FORMATS = ("csv", "ndjson")
+    CSV_COLUMNS = ["row", "potability", "prediction", "errors"]
+
+    def __init__(self, config: StreamingConfig, frontend_predictor):
+        """
+        Initializes a StreamingScorer instance.
+
+        Parameters:
+        - config (StreamingConfig): The configuration for the streaming endpoint.
+        - frontend_predictor (FrontendPrediction): The predictor scoring every chunk.
+        """
+        self.config = config
+        self.frontend_predictor = frontend_predictor
+
+    def open_csv(self, binary_stream, artifacts):
+        """
+        Starts parsing a CSV byte stream and checks its header.
+
+        Parameters:
+        - binary_stream: An iterable of the uploaded bytes, line by line (e.g. the WSGI input stream).
+        - artifacts (ServingArtifacts): The artifacts snapshot the upload is scored with.
+
+        Returns:
+        - tuple: The header and the csv reader positioned on the first data row.
+
+        Raises:
+        - InvalidCSVHeader: If the upload is empty or lacks feature columns.
+        """
+        reader = csv.reader(codecs.iterdecode(binary_stream, "utf-8-sig"))
+        header = next(reader, None)
+        if not header:
+            raise InvalidCSVHeader("The CSV upload is empty")
+        header = [col.strip() for col in header]
+        missing = [col for col in artifacts.feature_names if col not in header]
+        if missing:
+            raise InvalidCSVHeader(f"{InvalidCSVHeader().message}, missing columns: {', '.join(missing)}")
+        return header, reader
+
+    def iter_chunks(self, header, reader):
+        """
+        Groups the parsed rows into chunks of records.
+
+        Parameters:
+        - header (list): The CSV column names.
+        - reader: The csv reader positioned on the first data row.
+
+        Yields:
+        - list: A chunk of dicts mapping column names to values.
+        """
+        chunk_size = min(self.config.first_chunk_size, self.config.chunk_size)
+        while True:
+            rows = list(islice(reader, chunk_size))
+            if not rows:
+                return
+            yield [dict(zip(header, row)) for row in rows]
+            chunk_size = min(chunk_size * 2, self.config.chunk_size)
+
+    def stream(self, header, reader, artifacts, output_format="csv"):
+        """
+        Scores the rows of an opened CSV and yields the formatted results.
+
+        Parameters:
+        - header (list): The CSV column names.
+        - reader: The csv reader positioned on the first data row.
+        - artifacts (ServingArtifacts): The artifacts snapshot every chunk is scored with.
+        - output_format (str): "csv" or "ndjson".
+
+        Yields:
+        - str: The header line (CSV only), then the results of one chunk at a time.
+        """
+        if output_format not in StreamingScorer.OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format: {output_format}")
+        if output_format == "csv":
+            yield ",".join(StreamingScorer.CSV_COLUMNS) + "\r\n"
+
+        offset = 0
+        try:
+            for records in self.iter_chunks(header, reader):
+                results = self.frontend_predictor.batch_response(records, artifacts)
+                for result in results:
+                    result["row"] += offset
+                offset += len(records)
+                yield self.format_results(results, output_format)
+        except (csv.Error, UnicodeDecodeError) as e:
+            # The status line has already been sent, so the failure is reported in the body
+            logger.warning(f"Streaming upload failed after {offset} rows: {e}")
+            yield self.format_results([{"row": offset, "errors": [f"Could not parse the CSV upload: {e}"]}],
+                                      output_format)
+
+    @staticmethod
+    def format_results(results, output_format):
+        """
+        Formats a chunk of results.
+
+        Parameters:
+        - results (list): The per-row results of FrontendPrediction.batch_response.
+        - output_format (str): "csv" or "ndjson".
+
+        Returns:
+        - str: The formatted results.
+        """
+        if output_format == "ndjson":
+            return "".join(json.dumps(result) + "\n" for result in results)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for result in results:
+            writer.writerow([result["row"], result.get("potability", ""), result.get("prediction", ""),
+                             "; ".join(result.get("errors", []))])
+        return buffer.getvalue()
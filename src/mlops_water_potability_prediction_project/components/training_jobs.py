@@ -0,0 +1,296 @@
+import fcntl
+import json
+import multiprocessing
+import os
+import queue
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field, asdict
+from typing import Optional
+
+from src.mlops_water_potability_prediction_project import logger
+
+
+class TrainingAlreadyRunning(Exception):
+    def __init__(self, job_id, message="A training job is already running"):
+        self.job_id = job_id
+        self.message = message
+        super().__init__(self.message)
+
+
+@dataclass
+class StageProgress:
+    """
+    Progress of a single stage of a training job.
+
+    Attributes:
+    - name (str): The stage name.
+    - status (str): One of "pending", "running", "completed" or "failed".
+    - started_at (float): The UNIX time the stage started at.
+    - duration_s (float): The wall time of the stage, in seconds, once it has finished.
+    """
+    name: str
+    status: str = "pending"
+    started_at: Optional[float] = None
+    duration_s: Optional[float] = None
+
+
+@dataclass
+class TrainingJob:
+    """
+    State of a training job.
+
+    Attributes:
+    - job_id (str): The job identifier.
+    - status (str): One of "running", "succeeded" or "failed".
+    - created_at (float): The UNIX time the job was created at.
+    - finished_at (float): The UNIX time the job finished at.
+    - stages (list): The progress of every pipeline stage.
+    - error (str): The error message of a failed job.
+    """
+    job_id: str
+    status: str = "running"
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    stages: list = field(default_factory=list)
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """
+        Converts the job state to a JSON-serializable dict.
+
+        Returns:
+        - dict: The job state.
+        """
+        return asdict(self)
+
+
+def run_training_pipeline(events):
+    """
+    Runs the stages of main.py in the worker process and reports progress through the events queue.
+
+    The pipeline (pandas, sklearn, catboost, mlflow) is only imported here, in the worker process.
+
+    Parameters:
+    - events (multiprocessing.Queue): The queue receiving the progress events.
+    """
+    import main as training_pipeline
+
+    events.put(("stages", [stage_name for stage_name, _ in training_pipeline.STAGES]))
+    for stage_name, stage in training_pipeline.STAGES:
+        events.put(("stage_started", stage_name, time.time()))
+        start = time.perf_counter()
+        try:
+            training_pipeline.run_stage(stage_name, stage)
+        except Exception as e:
+            events.put(("stage_failed", stage_name, time.perf_counter() - start, f"{type(e).__name__}: {e}"))
+            return
+        events.put(("stage_completed", stage_name, time.perf_counter() - start))
+    events.put(("succeeded",))
+
+
+class TrainingJobManager:
+    """
+    Runs the training pipeline in a background worker process, one job at a time across all server processes.
+
+    The serving process only starts the worker and follows its progress events from a monitor
+    thread, so request handling is not blocked and does not compete for the GIL with training.
+    Under the pre-fork server every worker has its own manager, so the job states live in JSON files
+    of the jobs directory, where any worker can read them, and a job only starts once its manager
+    holds an exclusive lock on the lock file of that directory. The lock is released when the job
+    finishes, or by the operating system when the process holding it dies.
+
+    Attributes:
+    - config (TrainingJobsConfig): The training jobs configuration.
+    - on_success (callable): Called without arguments after a job succeeds, e.g. to swap in the new model.
+
+    Methods:
+    - __init__: Initializes a TrainingJobManager instance.
+    - start: Starts a new training job unless one is already running.
+    - get: Returns a snapshot of the state of a job.
+    """
+
+    LOCK_FILE = "training.lock"
+
+    def __init__(self, config, on_success=None):
+        """
+        Initializes a TrainingJobManager instance.
+
+        Parameters:
+        - config (TrainingJobsConfig): The training jobs configuration.
+        - on_success (callable): Called without arguments after a job succeeds.
+        """
+        self.config = config
+        self.on_success = on_success
+        self._lock = threading.Lock()
+        # Spawn a fresh interpreter, forking a multi-threaded web server is not safe
+        self._context = multiprocessing.get_context("spawn")
+        os.makedirs(config.jobs_dir, exist_ok=True)
+
+    def start(self) -> dict:
+        """
+        Starts a new training job unless one is already running.
+
+        Returns:
+        - dict: A snapshot of the state of the new job.
+
+        Raises:
+        - TrainingAlreadyRunning: If a job is already running, in this or another server process.
+        """
+        lock_file = open(os.path.join(self.config.jobs_dir, self.LOCK_FILE), 'a+')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            # The holder writes the id of its job into the lock file
+            lock_file.seek(0)
+            running_job_id = lock_file.read().strip() or None
+            lock_file.close()
+            raise TrainingAlreadyRunning(running_job_id)
+
+        try:
+            job = TrainingJob(job_id=uuid.uuid4().hex)
+            lock_file.truncate(0)
+            lock_file.write(job.job_id)
+            lock_file.flush()
+            self._save(job)
+
+            events = self._context.Queue()
+            process = self._context.Process(target=run_training_pipeline, args=(events,), daemon=True)
+            process.start()
+        except Exception:
+            lock_file.close()
+            raise
+
+        threading.Thread(target=self._monitor, args=(job, process, events, lock_file), daemon=True).start()
+        logger.info(f"Started training job {job.job_id}")
+        return job.to_dict()
+
+    def get(self, job_id) -> Optional[dict]:
+        """
+        Returns a snapshot of the state of a job, whichever server process started it.
+
+        Parameters:
+        - job_id (str): The job identifier.
+
+        Returns:
+        - dict: The job state, or None if the job does not exist.
+        """
+        # Job ids are uuid4 hex strings, anything else could point outside the jobs directory
+        if re.fullmatch(r"[0-9a-f]{32}", job_id) is None:
+            return None
+        # Checked before reading: a job records how it ended before releasing the lock
+        locked = self._is_locked()
+        try:
+            with open(self._job_path(job_id), 'r') as f:
+                job = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        if job["status"] == "running" and not locked:
+            # The process monitoring the job died before recording how it ended
+            job["status"] = "failed"
+            job["error"] = "The server process running the job exited"
+        return job
+
+    def _job_path(self, job_id) -> str:
+        return os.path.join(self.config.jobs_dir, f"{job_id}.json")
+
+    def _save(self, job):
+        """
+        Writes the state file of a job, atomically so readers in other processes never see a partial file.
+
+        Parameters:
+        - job (TrainingJob): The job to save.
+        """
+        path = self._job_path(job.job_id)
+        tmp_path = f"{path}.tmp"
+        with self._lock:
+            state = job.to_dict()
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f, indent=4)
+        os.replace(tmp_path, path)
+
+    def _is_locked(self) -> bool:
+        """
+        Tells whether a server process holds the training lock.
+
+        Returns:
+        - bool: True if a job is running.
+        """
+        with open(os.path.join(self.config.jobs_dir, self.LOCK_FILE), 'a+') as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return True
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            return False
+
+    def _monitor(self, job, process, events, lock_file):
+        """
+        Follows the progress events of a job until it finishes, then releases the training lock.
+
+        Parameters:
+        - job (TrainingJob): The job to update.
+        - process (multiprocessing.Process): The worker process.
+        - events (multiprocessing.Queue): The queue receiving the progress events.
+        - lock_file (file): The lock file, locked for this job.
+        """
+        try:
+            self._follow(job, process, events)
+        finally:
+            lock_file.close()
+
+    def _follow(self, job, process, events):
+        """
+        Updates the state file of a job from its progress events until it finishes.
+
+        Parameters:
+        - job (TrainingJob): The job to update.
+        - process (multiprocessing.Process): The worker process.
+        - events (multiprocessing.Queue): The queue receiving the progress events.
+        """
+        stages = {}
+        status, error = None, None
+        while status is None:
+            try:
+                event = events.get(timeout=1)
+            except queue.Empty:
+                if not process.is_alive():
+                    status, error = "failed", f"Training process exited with code {process.exitcode}"
+                continue
+
+            kind = event[0]
+            with self._lock:
+                if kind == "stages":
+                    job.stages = [StageProgress(name=name) for name in event[1]]
+                    stages = {stage.name: stage for stage in job.stages}
+                elif kind == "stage_started":
+                    stages[event[1]].status = "running"
+                    stages[event[1]].started_at = event[2]
+                elif kind == "stage_completed":
+                    stages[event[1]].status = "completed"
+                    stages[event[1]].duration_s = event[2]
+                elif kind == "stage_failed":
+                    stages[event[1]].status = "failed"
+                    stages[event[1]].duration_s = event[2]
+                    status, error = "failed", event[3]
+                elif kind == "succeeded":
+                    status = "succeeded"
+            if status is None:
+                self._save(job)
+
+        process.join()
+        if status == "succeeded" and self.on_success is not None:
+            try:
+                self.on_success()
+            except Exception as e:
+                status, error = "failed", f"Could not load the new model: {e}"
+
+        with self._lock:
+            job.status = status
+            job.error = error
+            job.finished_at = time.time()
+        self._save(job)
+        logger.info(f"Training job {job.job_id} {status}" + (f": {error}" if error else ""))
@@ -0,0 +1,156 @@
+import threading
+import time
+
+import numpy as np
+
+from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.components.frontend import FrontendPrediction
+from src.mlops_water_potability_prediction_project.entity.config_entity import WarmupConfig
+
+
+class ServingWarmup:
+    """
+    Loads the serving artifacts and primes the inference path before the first real request.
+
+    Warm-up draws synthetic inputs uniformly from the dataset schema min/max ranges and sends them
+    through both the single-row and the batch paths. This pays for the bundle load, the model's
+    lazy initialization and the first allocations up front. Readiness is only reported once
+    warm-up has finished, and a failed warm-up (e.g. no bundle trained yet) is retried with an
+    exponential backoff. The synthetic predictions go through a predictor of their own on the same
+    artifact cache, without the prediction cache and outside the serving metrics, so they are
+    neither cached nor counted as requests.
+
+    Attributes:
+    - STATES (tuple): The possible warm-up states.
+    - config (WarmupConfig): The warm-up configuration.
+    - frontend_predictor (FrontendPrediction): The predictor to warm up.
+
+    Methods:
+    - __init__: Initializes a ServingWarmup instance.
+    - start: Runs the warm-up in a background thread, retrying it until it succeeds.
+    - wait: Waits for the first attempt of a started warm-up to finish.
+    - run: Runs the warm-up in the calling thread and updates the readiness state.
+    - prime: Sends synthetic predictions through the serving paths.
+    - is_ready: Tells whether warm-up has finished successfully.
+    - status: Returns the warm-up state and timings.
+    """
+    STATES = ("pending", "running", "ready", "failed")
+
+    def __init__(self, config: WarmupConfig, frontend_predictor):
+        """
+        Initializes a ServingWarmup instance.
+
+        Parameters:
+        - config (WarmupConfig): The warm-up configuration.
+        - frontend_predictor (FrontendPrediction): The predictor to warm up.
+        """
+        self.config = config
+        self.frontend_predictor = frontend_predictor
+        self._warmup_predictor = FrontendPrediction(frontend_predictor.config, prediction_cache=None,
+                                                    record_metrics=False)
+        self._state = "pending"
+        self._duration_s = None
+        self._error = None
+        self._thread = None
+        self._attempted = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        Runs the warm-up in a background thread, retrying it with an exponential backoff until it succeeds.
+        Does nothing if the warm-up is ready or its thread is running, e.g. still retrying.
+        """
+        with self._lock:
+            if self._state == "ready" or (self._thread is not None and self._thread.is_alive()):
+                return
+            self._attempted.clear()
+            self._thread = threading.Thread(target=self._run_until_ready, name="serving-warmup", daemon=True)
+            self._thread.start()
+
+    def wait(self, timeout=None) -> bool:
+        """
+        Waits for the first attempt of a started warm-up to finish, the retries of a failed one are not awaited.
+
+        Parameters:
+        - timeout (float): The maximum wait, in seconds, None to wait forever.
+
+        Returns:
+        - bool: True if the serving path is ready.
+        """
+        if self._thread is not None:
+            self._attempted.wait(timeout)
+        return self.is_ready()
+
+    def _run_until_ready(self):
+        backoff = self.config.retry_backoff_s
+        while True:
+            self.run()
+            self._attempted.set()
+            if self.is_ready():
+                return
+            logger.info(f"Retrying the serving warm-up in {backoff:g}s")
+            time.sleep(backoff)
+            backoff = min(2 * backoff, self.config.max_retry_backoff_s)
+
+    def run(self):
+        """
+        Runs the warm-up in the calling thread and updates the readiness state.
+        """
+        with self._lock:
+            if self._state in ("running", "ready"):
+                return
+            self._state = "running"
+
+        start = time.perf_counter()
+        try:
+            artifacts = self.frontend_predictor.artifact_cache.get()
+            if self.config.enabled:
+                self.prime()
+            state, error = "ready", None
+            logger.info(f"Serving warm-up of bundle {artifacts.bundle.version} finished "
+                        f"in {time.perf_counter() - start:.3f}s")
+        except Exception as e:
+            state, error = "failed", f"{type(e).__name__}: {e}"
+            logger.exception(e)
+
+        with self._lock:
+            self._state = state
+            self._error = error
+            self._duration_s = time.perf_counter() - start
+
+    def prime(self):
+        """
+        Sends synthetic predictions through the single-row and batch paths of the current artifacts.
+        """
+        artifacts = self._warmup_predictor.artifact_cache.get()
+        compiled_schema = artifacts.compiled_schema
+        rng = np.random.default_rng(self.config.seed)
+
+        n_rows = max(self.config.n_predictions, self.config.batch_size)
+        values = rng.uniform(compiled_schema.mins, compiled_schema.maxs,
+                             size=(n_rows, len(compiled_schema.feature_names)))
+        # Form submissions carry strings, so the warm-up exercises the same parsing
+        records = [{col: str(val) for col, val in zip(compiled_schema.feature_names, row)} for row in values]
+
+        for record in records[:self.config.n_predictions]:
+            self._warmup_predictor.form_response(record)
+        self._warmup_predictor.batch_response(records[:self.config.batch_size], artifacts)
+
+    def is_ready(self) -> bool:
+        """
+        Tells whether warm-up has finished successfully.
+
+        Returns:
+        - bool: True if the serving path is ready.
+        """
+        return self._state == "ready"
+
+    def status(self) -> dict:
+        """
+        Returns the warm-up state and timings.
+
+        Returns:
+        - dict: The state, the warm-up duration in seconds and the error of a failed warm-up.
+        """
+        with self._lock:
+            return {"status": self._state, "warmup_duration_s": self._duration_s, "error": self._error}
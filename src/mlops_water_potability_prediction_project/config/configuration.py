@@ -1,7 +1,10 @@
+from functools import cached_property
+
 from src.mlops_water_potability_prediction_project.constants import *
 from src.mlops_water_potability_prediction_project.entity.config_entity import DataIngestionConfig, \
     DataValidationConfig, DataTransformationConfig, DataCleaningConfig, ModelTrainerConfig, ModelEvaluationConfig, \
-    ModelPredictionConfig, ModelFrontendConfig
+    ModelPredictionConfig, ModelFrontendConfig, MicroBatchingConfig, PredictionCacheConfig, ServerConfig, \
+    StreamingConfig, WarmupConfig, ModelRegistryConfig, PipelineConfig, ProfilingConfig, TrainingJobsConfig
 from src.mlops_water_potability_prediction_project.utilities.helpers import read_yaml, create_directories
 
 
@@ -17,10 +20,19 @@ class ConfigurationManager:
     Methods:
     - __init__: Initializes the ConfigurationManager instance with default or provided filepaths,
                 reads YAML files, and creates necessary directories.
+    - dataset_path: Substitutes the configured dataset format into an intermediate dataset path.
     - get_data_ingestion_config: Retrieves the data ingestion configuration from the main configuration.
     - get_data_validation_config: Retrieves the data validation configuration from the main configuration.
     - get_data_transformation_config: Retrieves data transformation configuration from the main configuration.
     - get_frontend_config: Retrieves the model frontend configuration from the main configuration.
+    - get_micro_batching_config: Retrieves the micro-batching configuration of the async server.
+    - get_model_registry_config: Retrieves the model registry configuration from the main configuration.
+    - get_pipeline_config: Retrieves the stage declarations of the incremental pipeline runner.
+    - get_profiling_config: Retrieves the per-stage profiling configuration of the pipeline runs.
+    - get_prediction_cache_config: Retrieves the prediction cache configuration of the model frontend.
+    - get_server_config: Retrieves the pre-fork production server configuration.
+    - get_streaming_config: Retrieves the streaming CSV scoring configuration.
+    - get_warmup_config: Retrieves the serving warm-up configuration.
 
     """
     def __init__(self, config_filepath=CONFIG_FILE_PATH, params_filepath=PARAMS_FILE_PATH, schema_filepath=SCHEMA_FILE_PATH):
@@ -33,11 +45,37 @@ class ConfigurationManager:
         - schema_filepath [Path]: The filepath for the schema file.
         """
         self.config = read_yaml(config_filepath)
-        self.params = read_yaml(params_filepath)
-        self.schema = read_yaml(schema_filepath)
+        self.params_filepath = params_filepath
+        self.schema_filepath = schema_filepath
 
         create_directories(directories_path_list=[self.config.artifacts_root])
 
+    @cached_property
+    def params(self):
+        """
+        The training parameters, read on first use (serving never needs them).
+        """
+        return read_yaml(self.params_filepath)
+
+    @cached_property
+    def schema(self):
+        """
+        The dataset schema, read on first use.
+        """
+        return read_yaml(self.schema_filepath)
+
+    def dataset_path(self, path) -> str:
+        """
+        Substitutes the configured dataset format (csv, parquet, feather or npy) into an intermediate dataset path.
+
+        Parameters:
+        - path (str): The path, e.g. "artifacts/data_transformation/train_set.{dataset_format}".
+
+        Returns:
+        - str: The path with the format extension, e.g. "artifacts/data_transformation/train_set.feather".
+        """
+        return str(path).format(dataset_format=self.config.dataset_format)
+
     def get_data_ingestion_config(self) -> DataIngestionConfig:
         """
         Retrieves the data ingestion configuration from the main configuration.
@@ -53,7 +91,17 @@ class ConfigurationManager:
             source_url=config.source_url,
             root_dir=config.root_dir,
             unzip_dir=config.unzip_dir,
-            zip_data_path=config.zip_data_path
+            zip_data_path=config.zip_data_path,
+            metadata_path=config.metadata_path,
+            sha256=config.sha256,
+            extract_zip=config.extract_zip,
+            chunk_size=config.chunk_size,
+            timeout=config.timeout,
+            retries=config.retries,
+            sources=tuple(config.sources or ()),
+            partitions_dir=config.partitions_dir,
+            max_workers=config.max_workers,
+            dataset_format=self.config.dataset_format
         )
 
         return data_ingestion_config
@@ -78,7 +126,12 @@ class ConfigurationManager:
         data_cleaning_config = DataCleaningConfig(
             root_dir=config.root_dir,
             unclean_data_path=config.unclean_data_path,
-            clean_data_path=config.clean_data_path
+            clean_data_path=self.dataset_path(config.clean_data_path),
+            watermark_file=config.watermark_file,
+            incremental=self.config.incremental,
+            chunk_size=config.chunk_size,
+            data_schema=self.schema.COLUMNS,
+            dataset_format=self.config.dataset_format
         )
 
         return data_cleaning_config
@@ -97,9 +150,13 @@ class ConfigurationManager:
 
         data_validation_config = DataValidationConfig(
             root_dir=config.root_dir,
-            data_path=config.data_path,
+            data_path=self.dataset_path(config.data_path),
             status_file=config.status_file,
-            data_schema=schema
+            data_schema=schema,
+            watermark_file=config.watermark_file,
+            incremental=self.config.incremental,
+            statistics_path=config.statistics_path,
+            report_file=config.report_file
         )
 
         return data_validation_config
@@ -117,9 +174,11 @@ class ConfigurationManager:
 
         data_transformation_config = DataTransformationConfig(
             root_dir=config.root_dir,
-            data_path=config.data_path,
+            data_path=self.dataset_path(config.data_path),
             status_file=config.status_file,
-            feature_scaler=config.feature_scaler_file_name
+            feature_scaler=config.feature_scaler_file_name,
+            train_file_name=self.dataset_path(config.train_file_name),
+            test_file_name=self.dataset_path(config.test_file_name)
         )
 
         return data_transformation_config
@@ -145,8 +204,11 @@ class ConfigurationManager:
         # Create and return a ModelTrainerConfig instance
         model_trainer_config = ModelTrainerConfig(
             root_dir=config.root_dir,
-            train_data_path=config.train_data_path,
+            train_data_path=self.dataset_path(config.train_data_path),
             model_file_name=config.model_file_name,
+            feature_scaler_path=config.feature_scaler_path,
+            dataset_schema_path=config.dataset_schema_path,
+            bundle_file_name=config.bundle_file_name,
             iterations=params.iterations,
             learning_rate=params.learning_rate,
             random_seed=params.random_seed,
@@ -178,7 +240,7 @@ class ConfigurationManager:
         # Create and return a ModelEvaluationConfig instance
         model_evaluation_config = ModelEvaluationConfig(
             root_dir=config.root_dir,
-            test_data_path=config.test_data_path,
+            test_data_path=self.dataset_path(config.test_data_path),
             model_path=config.model_path,
             metric_file_name=config.metric_file_name,
             parameters=params,
@@ -188,6 +250,78 @@ class ConfigurationManager:
 
         return model_evaluation_config
 
+    def get_model_registry_config(self) -> ModelRegistryConfig:
+        """
+        Retrieve the model registry configuration.
+
+        Returns:
+        - ModelRegistryConfig: An instance of ModelRegistryConfig containing the configuration settings.
+        """
+        config = self.config.model_registry
+
+        # Ensure the root directory exists
+        create_directories([config.root_dir])
+
+        # Create and return a ModelRegistryConfig instance
+        model_registry_config = ModelRegistryConfig(
+            root_dir=config.root_dir,
+            inference_bundle_path=config.inference_bundle_path,
+            model_path=config.model_path,
+            feature_scaler_path=config.feature_scaler_path,
+            dataset_schema_path=config.dataset_schema_path,
+            metrics_path=config.metrics_path,
+            auto_promote=config.auto_promote
+        )
+
+        return model_registry_config
+
+    def get_pipeline_config(self) -> PipelineConfig:
+        """
+        Retrieve the incremental pipeline runner configuration.
+
+        Returns:
+        - PipelineConfig: An instance of PipelineConfig containing the configuration settings.
+        """
+        config = self.config.pipeline
+
+        # Resolve the dataset format in the declared dependencies and outputs
+        stages = {}
+        for stage_name, spec in config.stages.items():
+            stages[stage_name] = dict(spec)
+            for key in ("deps", "outs"):
+                if key in spec:
+                    stages[stage_name][key] = [self.dataset_path(path) for path in spec[key]]
+
+        # Create and return a PipelineConfig instance
+        pipeline_config = PipelineConfig(
+            state_file=config.state_file,
+            stages=stages,
+            in_memory_checkpoints=config.in_memory_checkpoints
+        )
+
+        return pipeline_config
+
+    def get_profiling_config(self) -> ProfilingConfig:
+        """
+        Retrieve the per-stage profiling configuration of the pipeline runs.
+
+        Returns:
+        - ProfilingConfig: An instance of ProfilingConfig containing the configuration settings.
+        """
+        config = self.config.pipeline.profiling
+
+        # Ensure the report directory exists
+        create_directories([config.report_dir])
+
+        # Create and return a ProfilingConfig instance
+        profiling_config = ProfilingConfig(
+            report_dir=config.report_dir,
+            tracemalloc=config.tracemalloc,
+            cprofile=config.cprofile
+        )
+
+        return profiling_config
+
     def get_model_prediction_config(self) -> ModelPredictionConfig:
         """
         Retrieve the model prediction configuration.
@@ -196,10 +330,13 @@ class ConfigurationManager:
         - ModelPredictionConfig: An instance of ModelPredictionConfig containing the configuration settings.
         """
         config = self.config.model_prediction
+        schema = self.schema.TARGET_COLUMN
 
         # Create and return a ModelPredictionConfig instance
         model_prediction_config = ModelPredictionConfig(
             model_path=config.model_path,
+            inference_bundle=config.inference_bundle,
+            feature_columns=tuple(col for col in self.schema.COLUMNS if col != schema.name)
         )
 
         return model_prediction_config
@@ -212,13 +349,126 @@ class ConfigurationManager:
         - ModelFrontendConfig: An instance of ModelFrontendConfig with the specified configuration.
         """
         config = self.config.web_app
+        schema = self.schema.TARGET_COLUMN
 
         model_frontend_config = ModelFrontendConfig(
             static_dir=config.static_dir,
             template_dir=config.template_dir,
             dataset_schema=config.dataset_schema,
-            feature_scaler=config.feature_scaler,
-            model_path=config.model_path
+            inference_bundle=config.inference_bundle,
+            staged_inference_bundle=config.staged_inference_bundle,
+            model_registry_dir=config.model_registry_dir,
+            target_column=schema.name,
+            feature_columns=tuple(col for col in self.schema.COLUMNS if col != schema.name)
+        )
+
+        return model_frontend_config
+
+    def get_micro_batching_config(self) -> MicroBatchingConfig:
+        """
+        Retrieves the micro-batching configuration of the async server from the main configuration.
+
+        Returns:
+        - MicroBatchingConfig: An instance of MicroBatchingConfig with the specified configuration.
+        """
+        config = self.config.web_app.micro_batching
+
+        micro_batching_config = MicroBatchingConfig(
+            max_batch_size=config.max_batch_size,
+            max_wait_ms=config.max_wait_ms,
+            max_queue_depth=config.max_queue_depth
+        )
+
+        return micro_batching_config
+
+    def get_prediction_cache_config(self) -> PredictionCacheConfig:
+        """
+        Retrieves the prediction cache configuration of the model frontend from the main configuration.
+
+        Returns:
+        - PredictionCacheConfig: An instance of PredictionCacheConfig with the specified configuration.
+        """
+        config = self.config.web_app.prediction_cache
+
+        prediction_cache_config = PredictionCacheConfig(
+            enabled=config.enabled,
+            max_size=config.max_size,
+            ttl_seconds=config.ttl_seconds,
+            key_mode=config.key_mode
+        )
+
+        return prediction_cache_config
+
+    def get_server_config(self) -> ServerConfig:
+        """
+        Retrieves the pre-fork production server configuration from the main configuration.
+
+        Returns:
+        - ServerConfig: An instance of ServerConfig with the specified configuration.
+        """
+        config = self.config.web_app.server
+
+        server_config = ServerConfig(
+            host=config.host,
+            port=config.port,
+            workers=config.workers,
+            threads_per_worker=config.threads_per_worker,
+            model_threads_per_worker=config.model_threads_per_worker,
+            timeout=config.timeout
+        )
+
+        return server_config
+
+    def get_streaming_config(self) -> StreamingConfig:
+        """
+        Retrieves the streaming CSV scoring configuration from the main configuration.
+
+        Returns:
+        - StreamingConfig: An instance of StreamingConfig with the specified configuration.
+        """
+        config = self.config.web_app.streaming
+
+        streaming_config = StreamingConfig(
+            chunk_size=config.chunk_size,
+            first_chunk_size=config.first_chunk_size
+        )
+
+        return streaming_config
+
+    def get_warmup_config(self) -> WarmupConfig:
+        """
+        Retrieves the serving warm-up configuration from the main configuration.
+
+        Returns:
+        - WarmupConfig: An instance of WarmupConfig with the specified configuration.
+        """
+        config = self.config.web_app.warmup
+
+        warmup_config = WarmupConfig(
+            enabled=config.enabled,
+            n_predictions=config.n_predictions,
+            batch_size=config.batch_size,
+            seed=config.seed,
+            retry_backoff_s=config.retry_backoff_s,
+            max_retry_backoff_s=config.max_retry_backoff_s
+        )
+
+        return warmup_config
+
+    def get_training_jobs_config(self) -> TrainingJobsConfig:
+        """
+        Retrieves the configuration of the training jobs started through the web app.
+
+        Returns:
+        - TrainingJobsConfig: An instance of TrainingJobsConfig with the specified configuration.
+        """
+        config = self.config.web_app.training_jobs
+
+        # Ensure the jobs directory exists
+        create_directories([config.jobs_dir])
+
+        training_jobs_config = TrainingJobsConfig(
+            jobs_dir=config.jobs_dir
         )
 
-        return model_frontend_config
\ No newline at end of file
+        return training_jobs_config
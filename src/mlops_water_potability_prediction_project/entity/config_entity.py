@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 
 @dataclass(frozen=True)
@@ -12,6 +13,16 @@ class DataIngestionConfig:
     - root_dir (Path): The root directory where data will be stored.
     - unzip_dir (Path): The directory where ingested data will be unzipped.
     - zip_data_path (Path): The path where zipped data will be stored.
+    - metadata_path (Path): The path of the ETag/Last-Modified/SHA-256 metadata of the last download.
+    - sha256 (str): The expected SHA-256 of the downloaded file, None to accept any content.
+    - extract_zip (bool): Whether the archive is extracted, rather than read directly by the cleaning stage.
+    - chunk_size (int): The number of bytes streamed to disk at a time.
+    - timeout (int): The timeout of the HTTP requests, in seconds.
+    - retries (int): The number of download attempts, every attempt resuming the previous one.
+    - sources (tuple): URLs, local paths or local glob patterns ingested into a partitioned dataset instead of source_url.
+    - partitions_dir (Path): The directory of the partitioned dataset.
+    - max_workers (int): The number of sources fetched and decoded concurrently.
+    - dataset_format (str): The format of the partition files.
 
     Note:
         This class is decorated with @dataclass, making instances immutable (frozen).
@@ -21,6 +32,16 @@ class DataIngestionConfig:
     root_dir: Path
     unzip_dir: Path
     zip_data_path: Path
+    metadata_path: Path
+    sha256: Optional[str]
+    extract_zip: bool
+    chunk_size: int
+    timeout: int
+    retries: int
+    sources: tuple
+    partitions_dir: Path
+    max_workers: int
+    dataset_format: str
 
 
 @dataclass(frozen=True)
@@ -32,6 +53,11 @@ class DataCleaningConfig:
     - root_dir (Path): The root directory where the data is located.
     - unclean_data_path (Path): The path to the unclean/raw data file.
     - clean_data_path (Path): The path where the cleaned data will be saved.
+    - watermark_file (Path): The file recording the partitions of the unclean data already cleaned.
+    - incremental (bool): Whether only the partitions added since the last run are cleaned.
+    - chunk_size (int): The number of rows cleaned at a time, None to clean the whole dataset in memory.
+    - data_schema (dict): The dtype of every column, the chunks are parsed into.
+    - dataset_format (str): The format of the clean partitions, when the clean data is a partitioned dataset.
 
     Note:
         This class is decorated with @dataclass, making instances immutable (frozen).
@@ -41,6 +67,11 @@ class DataCleaningConfig:
     root_dir: Path
     unclean_data_path: Path
     clean_data_path: Path
+    watermark_file: Path
+    incremental: bool
+    chunk_size: Optional[int]
+    data_schema: dict
+    dataset_format: str
 
 
 @dataclass(frozen=True)
@@ -53,6 +84,10 @@ class DataValidationConfig:
     - unzip_data_path (Path): The path where unzipped data will be stored for validation.
     - status_file (str): The file containing status information of the validation process.
     - data_schema (dict): A dictionary representing the expected schema for the validation data.
+    - watermark_file (Path): The file recording the partitions of the cleaned data already validated.
+    - incremental (bool): Whether only the partitions added since the last run are validated.
+    - statistics_path (Path): The column statistics of the cleaned data, added to the validation report.
+    - report_file (Path): The validation report, the checks and statistics of every column.
 
     Note:
         This class is decorated with @dataclass, making instances immutable (frozen).
@@ -62,6 +97,10 @@ class DataValidationConfig:
     data_path: Path
     status_file: str
     data_schema: dict
+    watermark_file: Path
+    incremental: bool
+    statistics_path: Path
+    report_file: Path
 
 
 @dataclass(frozen=True)
@@ -73,6 +112,8 @@ class DataTransformationConfig:
     - root_dir (Path): The root directory for data transformation.
     - data_path (Path): The path to the data for transformation.
     - status_file (str): The file containing status information of the validation process.
+    - train_file_name (str): The file name of the scaled training set, its extension selects the dataset format.
+    - test_file_name (str): The file name of the scaled test set, its extension selects the dataset format.
 
     Note:
         This class is decorated with @dataclass, making instances immutable (frozen).
@@ -82,6 +123,8 @@ class DataTransformationConfig:
     data_path: Path
     status_file: Path
     feature_scaler: Path
+    train_file_name: str
+    test_file_name: str
 
 
 @dataclass(frozen=True)
@@ -94,6 +137,9 @@ class ModelTrainerConfig:
     - train_data_path (Path): The path to the training data file.
     - test_data_path (Path): The path to the testing data file.
     - model_file_name (str): The name of the file to save the trained model.
+    - feature_scaler_path (Path): The path to the fitted feature scaler, folded into the inference bundle.
+    - dataset_schema_path (Path): The path to the dataset schema, embedded in the inference bundle.
+    - bundle_file_name (str): The name of the file to save the inference bundle.
     - iterations (int): The number of iterations for model training.
     - learning_rate (float): The learning rate for the model training.
     - random_seed (int): The random seed for reproducibility.
@@ -107,6 +153,9 @@ class ModelTrainerConfig:
     root_dir: Path
     train_data_path: Path
     model_file_name: str
+    feature_scaler_path: Path
+    dataset_schema_path: Path
+    bundle_file_name: str
     iterations: int
     learning_rate: float
     random_seed: int
@@ -141,6 +190,62 @@ class ModelEvaluationConfig:
     mlflow_uri: str
 
 
+@dataclass(frozen=True)
+class ModelRegistryConfig:
+    """
+    Configuration class for the local model registry.
+
+    Attributes:
+    - root_dir (Path): The registry root directory.
+    - inference_bundle_path (Path): The inference bundle written by the model trainer.
+    - model_path (Path): The trained model file.
+    - feature_scaler_path (Path): The fitted feature scaler file.
+    - dataset_schema_path (Path): The dataset schema file.
+    - metrics_path (Path): The evaluation metrics file.
+    - auto_promote (bool): Whether a newly registered version is promoted right away.
+    """
+
+    root_dir: Path
+    inference_bundle_path: Path
+    model_path: Path
+    feature_scaler_path: Path
+    dataset_schema_path: Path
+    metrics_path: Path
+    auto_promote: bool
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    """
+    Configuration class for the incremental pipeline runner.
+
+    Attributes:
+    - state_file (Path): The file recording the input and output hashes of the last successful run of every stage.
+    - stages (dict): The stage names mapped to their declared config/params/schema sections, dependency files and outputs.
+    - in_memory_checkpoints (bool): Whether the in-memory mode still writes the intermediate datasets.
+    """
+
+    state_file: Path
+    stages: dict
+    in_memory_checkpoints: bool
+
+
+@dataclass(frozen=True)
+class ProfilingConfig:
+    """
+    Configuration class for the per-stage resource profiling of the pipeline runs.
+
+    Attributes:
+    - report_dir (Path): The directory of the JSON run reports and the cProfile dumps.
+    - tracemalloc (bool): Whether the peak of the Python allocations of every stage is traced.
+    - cprofile (bool): Whether every stage is also run under cProfile.
+    """
+
+    report_dir: Path
+    tracemalloc: bool
+    cprofile: bool
+
+
 @dataclass(frozen=True)
 class ModelPredictionConfig:
     """
@@ -148,12 +253,16 @@ class ModelPredictionConfig:
 
     Attributes:
     - model_path (Path): The path to the trained model file.
+    - inference_bundle (Path): The path to the inference bundle taking raw feature vectors.
+    - feature_columns (tuple): The feature column names, in canonical schema.yaml order.
 
     Note:
         This class is decorated with @dataclass, making instances immutable (frozen).
         Immutable instances are useful for configuration settings to prevent accidental modification.
     """
     model_path: Path
+    inference_bundle: Path
+    feature_columns: tuple
 
 
 @dataclass(frozen=True)
@@ -165,12 +274,123 @@ class ModelFrontendConfig:
     - static_dir (Path): The directory containing static files for the frontend.
     - template_dir (Path): The directory containing template files for the frontend.
     - dataset_schema (Path): The path to the dataset schema used by the model frontend.
-    - feature_scaler (Path): The path to the feature scaler file used by the model frontend.
-    - model_path (Path): The path to the trained machine learning model used by the model frontend.
+    - inference_bundle (Path): The path to the inference bundle (scaler, model and schema) used by the model frontend.
+    - staged_inference_bundle (Path): The inference bundle written by the model trainer, copied over the served one
+      once the training pipeline succeeded.
+    - model_registry_dir (Path): The model registry root, whose promoted version is served when there is one.
+    - target_column (str): The name of the target column, excluded from the model features.
+    - feature_columns (tuple): The feature column names, in canonical schema.yaml order.
     """
 
     static_dir: Path
     template_dir: Path
     dataset_schema: Path
-    feature_scaler: Path
-    model_path: Path
+    inference_bundle: Path
+    staged_inference_bundle: Path
+    model_registry_dir: Path
+    target_column: str
+    feature_columns: tuple
+
+
+@dataclass(frozen=True)
+class MicroBatchingConfig:
+    """
+    Configuration class for the micro-batching inference queue of the async server.
+
+    Attributes:
+    - max_batch_size (int): The maximum number of rows scored in one model call.
+    - max_wait_ms (float): The maximum time, in milliseconds, a request waits for other requests to join its batch.
+    - max_queue_depth (int): The maximum number of requests waiting in the queue before new ones are rejected.
+    """
+
+    max_batch_size: int
+    max_wait_ms: float
+    max_queue_depth: int
+
+
+@dataclass(frozen=True)
+class WarmupConfig:
+    """
+    Configuration class for the serving warm-up run at startup.
+
+    Attributes:
+    - enabled (bool): Whether synthetic predictions are run, the artifacts are loaded either way.
+    - n_predictions (int): The number of single-row predictions.
+    - batch_size (int): The number of rows of the batch prediction.
+    - seed (int): The random seed of the synthetic inputs.
+    - retry_backoff_s (float): The wait before retrying a failed warm-up, doubled after every failure.
+    - max_retry_backoff_s (float): The longest wait between two retries.
+    """
+
+    enabled: bool
+    n_predictions: int
+    batch_size: int
+    seed: int
+    retry_backoff_s: float
+    max_retry_backoff_s: float
+
+
+@dataclass(frozen=True)
+class TrainingJobsConfig:
+    """
+    Configuration class for the training jobs started through the web app.
+
+    Attributes:
+    - jobs_dir (str): The directory holding the state file of every job and the lock of the running one.
+    """
+
+    jobs_dir: str
+
+
+@dataclass(frozen=True)
+class StreamingConfig:
+    """
+    Configuration class for the streaming CSV scoring endpoint.
+
+    Attributes:
+    - chunk_size (int): The number of CSV rows parsed, validated and predicted together.
+    - first_chunk_size (int): The size of the first chunk, kept small for a low time to first byte.
+    """
+
+    chunk_size: int
+    first_chunk_size: int
+
+
+@dataclass(frozen=True)
+class ServerConfig:
+    """
+    Configuration class for the pre-fork production server.
+
+    Attributes:
+    - host (str): The interface to bind to.
+    - port (int): The port to bind to.
+    - workers (int): The number of worker processes forked from the preloaded parent.
+    - threads_per_worker (int): The number of request handling threads of every worker.
+    - model_threads_per_worker (int): The number of CatBoost/OpenMP/BLAS threads of every worker.
+    - timeout (int): The number of seconds a silent worker is given before it is restarted.
+    """
+
+    host: str
+    port: int
+    workers: int
+    threads_per_worker: int
+    model_threads_per_worker: int
+    timeout: int
+
+
+@dataclass(frozen=True)
+class PredictionCacheConfig:
+    """
+    Configuration class for the prediction result cache of the model frontend.
+
+    Attributes:
+    - enabled (bool): Whether predictions are cached.
+    - max_size (int): The maximum number of cached predictions.
+    - ttl_seconds (float): The lifetime of a cached prediction, in seconds.
+    - key_mode (str): "exact" to key on the exact input vector, "quantized" to key on the model's border buckets.
+    """
+
+    enabled: bool
+    max_size: int
+    ttl_seconds: float
+    key_mode: str
@@ -0,0 +1,70 @@
+from src.mlops_water_potability_prediction_project.pipeline.stage_01_data_ingestion import DataIngestionTrainingPipeline
+from src.mlops_water_potability_prediction_project.pipeline.stage_02_data_cleaning import DataCleaningTrainingPipeline
+from src.mlops_water_potability_prediction_project.pipeline.stage_03_data_validation import \
+    DataValidationTrainingPipeline
+from src.mlops_water_potability_prediction_project.pipeline.stage_04_data_transformation import \
+    DataTransformationTrainingPipeline
+from src.mlops_water_potability_prediction_project.pipeline.stage_05_model_trainer import ModelTrainerTrainingPipeline
+from src.mlops_water_potability_prediction_project.pipeline.stage_06_model_evaluation import \
+    ModelEvaluationTrainingPipeline
+
+
+class InMemoryTrainingPipeline:
+    """
+    InMemoryTrainingPipeline class for running the data and training stages in one process without re-reading the
+    intermediate datasets.
+
+    The cleaned data, the train/test sets and the trained model are handed from stage to stage in memory, so the
+    raw data is the only dataset read in a full run. The intermediate datasets (cleaned data, train and test sets)
+    are only written when checkpointing is on. The small artifacts later stages and the serving side rely on (dataset
+    schema, validation status, feature scaler, model, inference bundle and metrics) are always written.
+
+    A stage whose input is not in memory, e.g. when the run starts at a later stage, reads it from disk.
+
+    Attributes:
+        checkpoint (bool): Whether the intermediate datasets are written.
+        handoff (dict): The objects handed from stage to stage.
+
+    Methods:
+        stages(): Returns the (name, callable) pairs of the in-memory stages, named like the main.py stages.
+    """
+
+    def __init__(self, checkpoint: bool = False):
+        """
+        Initialize InMemoryTrainingPipeline instance.
+
+        Args:
+            checkpoint (bool): Whether the intermediate datasets are written.
+        """
+        self.checkpoint = checkpoint
+        self.handoff = {}
+
+    def stages(self) -> dict:
+        """
+        Returns the in-memory stages.
+
+        Returns:
+            dict: The stage names mapped to callables running the stage on the in-memory handoff.
+        """
+        return {
+            "DATA INGESTION": lambda: DataIngestionTrainingPipeline().ingest_data(),
+            "DATA CLEANING": self._clean,
+            "DATA VALIDATION": lambda: DataValidationTrainingPipeline().validate_data(self.handoff.get("clean")),
+            "DATA TRANSFORMATION": self._transform,
+            "MODEL TRAINER": self._train,
+            "MODEL EVALUATION": lambda: ModelEvaluationTrainingPipeline().evaluate_model(self.handoff.get("test"),
+                                                                                         self.handoff.get("model")),
+        }
+
+    def _clean(self):
+        self.handoff["clean"] = DataCleaningTrainingPipeline().clean_data(checkpoint=self.checkpoint)
+
+    def _transform(self):
+        self.handoff["train"], self.handoff["test"] = DataTransformationTrainingPipeline().transform_data(
+            self.handoff.get("clean"), checkpoint=self.checkpoint)
+        # The cleaned data is not needed anymore, release it before training
+        self.handoff.pop("clean", None)
+
+    def _train(self):
+        self.handoff["model"] = ModelTrainerTrainingPipeline().train_model(self.handoff.get("train"))
+        self.handoff.pop("train", None)
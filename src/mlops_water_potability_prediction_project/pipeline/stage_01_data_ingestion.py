@@ -1,5 +1,6 @@
 from src.mlops_water_potability_prediction_project import logger
 from src.mlops_water_potability_prediction_project.components.data_ingestion import DataIngestion
+from src.mlops_water_potability_prediction_project.components.multi_source_ingestion import MultiSourceIngestion
 from src.mlops_water_potability_prediction_project.config.configuration import ConfigurationManager
 
 STAGE_NAME = "DATA INGESTION"
@@ -31,6 +32,9 @@ class DataIngestionTrainingPipeline:
         try:
             config = ConfigurationManager()
             data_ingestion_config = config.get_data_ingestion_config()
+            if data_ingestion_config.sources:
+                MultiSourceIngestion(config=data_ingestion_config).ingest()
+                return
             data_ingestion = DataIngestion(config=data_ingestion_config)
             data_ingestion.download_file()
             data_ingestion.extract_zip_file()
@@ -22,10 +22,17 @@ class DataCleaningTrainingPipeline:
         """
         pass
 
-    def clean_data(self):
+    def clean_data(self, dataframe=None, checkpoint=True):
         """
         Clean the data as part of the training pipeline.
 
+        Args:
+            dataframe (pd.DataFrame): The unclean data, read from disk if not given.
+            checkpoint (bool): Whether to save the cleaned data as CSV.
+
+        Returns:
+            pd.DataFrame: The cleaned data.
+
         Raises:
             Exception: If an error occurs during the data cleaning process.
         """
@@ -38,7 +45,7 @@ class DataCleaningTrainingPipeline:
             data_cleaning = DataCleaning(config=data_cleaning_config)
 
             # Initiate the data cleaning process
-            data_cleaning.clean_data()
+            return data_cleaning.clean_data(dataframe, checkpoint=checkpoint)
 
         except Exception as e:
             logger.error(f"Error during data cleaning training pipeline: {e}")
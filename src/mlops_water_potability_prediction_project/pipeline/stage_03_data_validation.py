@@ -20,19 +20,22 @@ class DataValidationTrainingPipeline:
         """
         pass
 
-    def validate_data(self):
+    def validate_data(self, dataframe=None):
         """
         Executes the validation steps of the data validation training pipeline.
         Retrieves configuration, performs data validation, and logs errors if any.
 
+        Parameters:
+        - dataframe (pd.DataFrame): The cleaned data, read from disk if not given.
+
         Returns:
-        - None
+        - bool: The validation status.
         """
         try:
             config = ConfigurationManager()
             data_validation_config = config.get_data_validation_config()
             data_validation = DataValidation(config=data_validation_config)
-            data_validation.validate_all_columns()
+            return data_validation.validate_all_columns(dataframe)
         except Exception as e:
             logger.error(f"Error during data validation training pipeline: {e}")
             raise e
@@ -24,12 +24,16 @@ class DataTransformationTrainingPipeline:
         """
         pass
 
-    def transform_data(self):
+    def transform_data(self, dataframe=None, checkpoint=True):
         """
         Executes the transformation steps of the data transformation training pipeline.
 
+        Parameters:
+        - dataframe (pd.DataFrame): The cleaned data, read from disk if not given.
+        - checkpoint (bool): Whether to save the train and test sets as CSV.
+
         Returns:
-        - None
+        - tuple: The scaled train and test sets.
         """
         try:
             config = ConfigurationManager()
@@ -38,9 +42,11 @@ class DataTransformationTrainingPipeline:
 
             if DataTransformationTrainingPipeline.validate_data(status_file_path):
                 data_transformation = DataTransformation(config=data_transformation_config)
-                data_transformation.split_dataset()
+                data_transformation.split_dataset(dataframe)
                 data_transformation.feature_scale_dataset()
-                data_transformation.save_transformation()
+                if checkpoint:
+                    data_transformation.save_transformation()
+                return data_transformation.train, data_transformation.test
             else:
                 logger.error("Invalid Data schema")
                 raise Exception("Invalid Data schema")
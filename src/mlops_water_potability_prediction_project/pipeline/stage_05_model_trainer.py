@@ -22,10 +22,16 @@ class ModelTrainerTrainingPipeline:
         """
         pass
 
-    def train_model(self):
+    def train_model(self, train_df=None):
         """
         Train the model as part of the training pipeline.
 
+        Args:
+            train_df (pd.DataFrame): The scaled training set, read from disk if not given.
+
+        Returns:
+            CatBoostClassifier: The trained model.
+
         Raises:
             Exception: If an error occurs during the model training process.
         """
@@ -38,7 +44,7 @@ class ModelTrainerTrainingPipeline:
             model_trainer = ModelTrainer(config=model_trainer_config)
 
             # Initiate the model training process
-            model_trainer.train()
+            return model_trainer.train(train_df)
 
         except Exception as e:
             # Log an error message and raise an exception if an error occurs
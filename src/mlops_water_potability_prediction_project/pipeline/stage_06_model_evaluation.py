@@ -22,10 +22,14 @@ class ModelEvaluationTrainingPipeline:
         """
         pass
 
-    def evaluate_model(self):
+    def evaluate_model(self, test_df=None, model=None):
         """
         Evaluate the model as part of the training pipeline.
 
+        Args:
+            test_df (pd.DataFrame): The scaled test set, read from disk if not given.
+            model: The trained model, loaded from disk if not given.
+
         Raises:
             Exception: If an error occurs during the model evaluation process.
         """
@@ -38,7 +42,7 @@ class ModelEvaluationTrainingPipeline:
             model_evaluation = ModelEvaluation(config=model_evaluation_config)
 
             # Initiate the model evaluation process
-            model_evaluation.evaluate()
+            model_evaluation.evaluate(test_df, model)
 
         except Exception as e:
             # Log an error message and raise an exception if an error occurs
@@ -0,0 +1,56 @@
+from src.mlops_water_potability_prediction_project import logger
+from src.mlops_water_potability_prediction_project.components.model_registration import ModelRegistration
+from src.mlops_water_potability_prediction_project.config.configuration import ConfigurationManager
+
+STAGE_NAME = "MODEL REGISTRY"
+
+
+class ModelRegistryTrainingPipeline:
+    """
+    ModelRegistryTrainingPipeline class for orchestrating the model registration process in the training pipeline.
+
+    Methods:
+        register_model(): Initiates the model registration process using the configuration and ModelRegistration class.
+
+    Note:
+        This class assumes the use of a logger instance from the 'src.mlops_water_potability_prediction_project' module.
+    """
+
+    def __init__(self):
+        """
+        Initialize ModelRegistryTrainingPipeline instance.
+        """
+        pass
+
+    def register_model(self):
+        """
+        Register the trained model as part of the training pipeline.
+
+        Raises:
+            Exception: If an error occurs during the model registration process.
+        """
+        try:
+            # Retrieve the model registry configuration
+            config = ConfigurationManager()
+            model_registry_config = config.get_model_registry_config()
+
+            # Create a ModelRegistration instance with the retrieved configuration
+            model_registration = ModelRegistration(config=model_registry_config)
+
+            # Initiate the model registration process
+            model_registration.register()
+
+        except Exception as e:
+            # Log an error message and raise an exception if an error occurs
+            logger.error(f"Error during model registry training pipeline: {e}")
+            raise e
+
+
+if __name__ == '__main__':
+    try:
+        logger.info(f">>>>>> STAGE: {STAGE_NAME} started <<<<<<")
+        ModelRegistryTrainingPipeline().register_model()
+        logger.info(f">>>>>> STAGE: {STAGE_NAME} completed <<<<<<\n\nX==========X")
+    except Exception as e:
+        logger.error(f"Error during overall execution: {e}")
+        raise e
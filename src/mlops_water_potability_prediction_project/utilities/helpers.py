@@ -1,8 +1,10 @@
 from box import ConfigBox
 from box.exceptions import BoxValueError
 from ensure import ensure_annotations
+import filecmp
 import os
 from pathlib import Path
+import shutil
 from typing import Any
 import yaml
 
@@ -132,6 +134,27 @@ def save_json(file_path: Path, data: dict, verbose=True):
             logger.error(f"Error saving JSON file at {file_path}: {e}")
 
 
+def promote_file(staged_path, target_path) -> bool:
+    """
+    Copy a staged file over its target atomically, a reader of the target sees either file in full.
+
+    Args:
+        staged_path (Path): Path to the staged file
+        target_path (Path): Path to replace
+    Returns:
+        bool: Whether the target was replaced, False if nothing is staged or the target already holds the same content
+    """
+    if not os.path.exists(staged_path):
+        return False
+    if os.path.exists(target_path) and filecmp.cmp(staged_path, target_path, shallow=False):
+        return False
+    tmp_path = f"{target_path}.tmp"
+    shutil.copyfile(staged_path, tmp_path)
+    os.replace(tmp_path, target_path)
+    logger.info(f"Promoted {staged_path} to {target_path}")
+    return True
+
+
 @ensure_annotations
 def read_yaml(path_to_yaml: Path) -> ConfigBox:
     """
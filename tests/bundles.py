@@ -0,0 +1,85 @@
+"""
+Small inference bundles for the serving tests, trained on synthetic data in the schema.yaml column layout.
+"""
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.mlops_water_potability_prediction_project.classes.column_statistics import ColumnStatistics
+from src.mlops_water_potability_prediction_project.classes.inference_bundle import InferenceBundle
+from src.mlops_water_potability_prediction_project.classes.oblivious_trees import ObliviousTreeEnsemble
+from src.mlops_water_potability_prediction_project.entity.config_entity import ModelFrontendConfig
+
+FEATURES = ["ph", "Hardness", "Solids", "Chloramines", "Sulfate", "Conductivity", "Organic_carbon",
+            "Trihalomethanes", "Turbidity"]
+TARGET = "Potability"
+# The min/max of every feature in the synthetic data
+RANGES = {"ph": (0, 14), "Hardness": (50, 320), "Solids": (300, 60000), "Chloramines": (0.5, 13),
+          "Sulfate": (130, 480), "Conductivity": (180, 750), "Organic_carbon": (2, 28),
+          "Trihalomethanes": (1, 124), "Turbidity": (1.5, 6.7)}
+
+
+def synthetic_frame(n_rows=400, seed=0) -> pd.DataFrame:
+    """
+    Draws a dataset with the features uniform in their range and a target depending on ph and Sulfate.
+    """
+    rng = np.random.default_rng(seed)
+    dataframe = pd.DataFrame({col: rng.uniform(low, high, n_rows) for col, (low, high) in RANGES.items()})
+    dataframe[TARGET] = ((dataframe["ph"] > 7) ^ (dataframe["Sulfate"] > 300)).astype("int64")
+    return dataframe
+
+
+def train_bundle(seed=0, engine=True) -> InferenceBundle:
+    """
+    Trains a small CatBoost model on synthetic data and builds its inference bundle, as the model trainer does.
+
+    Args:
+        seed (int): The random seed of the data and the model.
+        engine (bool): Whether to export the model to the NumPy tree engine.
+
+    Returns:
+        InferenceBundle: The bundle, its schema holding the min/max of the synthetic data.
+    """
+    from catboost import CatBoostClassifier
+
+    dataframe = synthetic_frame(seed=seed)
+    statistics = ColumnStatistics(dataframe.columns).update(dataframe)
+    scaler = statistics.standard_scaler(FEATURES)
+    classifier = CatBoostClassifier(iterations=20, depth=3, random_seed=seed, thread_count=1, verbose=False,
+                                    allow_writing_files=False)
+    classifier.fit(scaler.transform(dataframe[FEATURES].to_numpy()), dataframe[TARGET])
+    schema = statistics.to_frame().loc[["min", "max"]].to_dict()
+    return InferenceBundle.from_scaler(model=classifier, scaler=scaler, feature_names=FEATURES, target_column=TARGET,
+                                       schema=schema,
+                                       engine=ObliviousTreeEnsemble.from_catboost(classifier) if engine else None)
+
+
+def frontend_config(root_dir) -> ModelFrontendConfig:
+    """
+    A model frontend configuration serving the bundle of root_dir/inference_bundle.joblib, with its own registry.
+    """
+    root_dir = str(root_dir)
+    return ModelFrontendConfig(static_dir=root_dir, template_dir=root_dir,
+                               dataset_schema=os.path.join(root_dir, "dataset_schema.json"),
+                               inference_bundle=os.path.join(root_dir, "inference_bundle.joblib"),
+                               staged_inference_bundle=os.path.join(root_dir, "staged_inference_bundle.joblib"),
+                               model_registry_dir=os.path.join(root_dir, "model_registry"), target_column=TARGET,
+                               feature_columns=tuple(FEATURES))
+
+
+def save_bundle(path, bundle):
+    """
+    Saves a bundle where a serving process or a pipeline stage reads it.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    joblib.dump(bundle, path)
+
+
+def record(bundle, row=0) -> dict:
+    """
+    Returns a valid input record, with string values as a form submits them.
+    """
+    values = synthetic_frame(n_rows=row + 1, seed=100).iloc[row]
+    return {col: str(values[col]) for col in bundle.feature_names}
@@ -0,0 +1,95 @@
+import importlib
+import shutil
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from src.mlops_water_potability_prediction_project.classes import artifact_cache
+from src.mlops_water_potability_prediction_project.entity.config_entity import DataIngestionConfig
+from tests.bundles import save_bundle, train_bundle
+from tests.dataset_source import DatasetSource, make_handler
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def dataset_server():
+    """
+    A local HTTP stand-in for the dataset server, with ETag/Last-Modified, conditional and range requests.
+
+    Yields:
+    - tuple: The DatasetSource to publish archives with and the URL of the archive.
+    """
+    source = DatasetSource()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(source))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield source, f"http://127.0.0.1:{server.server_address[1]}/water_potability_dataset.zip"
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def ingestion_config(tmp_path):
+    """
+    A factory of data ingestion configurations writing under tmp_path.
+
+    Yields:
+    - callable: Builds a DataIngestionConfig, keyword arguments override the defaults (no source, one
+      attempt, one worker, feather partitions, the archive is not extracted).
+    """
+    def make(**overrides):
+        config = dict(source_url="", root_dir=str(tmp_path), unzip_dir=str(tmp_path / "unzipped"),
+                      zip_data_path=str(tmp_path / "water_potability_dataset.zip"),
+                      metadata_path=str(tmp_path / "download_metadata.json"), sha256=None, extract_zip=False,
+                      chunk_size=1 << 12, timeout=10, retries=1, sources=(),
+                      partitions_dir=str(tmp_path / "partitions"), max_workers=1, dataset_format="feather")
+        config.update(overrides)
+        return DataIngestionConfig(**config)
+
+    return make
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """
+    Skips the waits between the retries of the ingestion (both ingestion modules sleep through time.sleep).
+    """
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+
+
+@pytest.fixture(scope="session")
+def inference_bundle():
+    """
+    An inference bundle of a small model trained on synthetic data.
+    """
+    return train_bundle()
+
+
+@pytest.fixture
+def serving_app(tmp_path, monkeypatch, inference_bundle):
+    """
+    Imports app.py in a copy of the repository configuration under tmp_path, serving the inference bundle.
+
+    Yields:
+    - module: The app module, once its warm-up finished.
+    """
+    for name in ("config", "web_app"):
+        shutil.copytree(REPO_ROOT / name, tmp_path / name)
+    for name in ("params.yaml", "schema.yaml"):
+        shutil.copy(REPO_ROOT / name, tmp_path / name)
+    monkeypatch.chdir(tmp_path)
+    save_bundle("artifacts/model_trainer/inference_bundle.joblib", inference_bundle)
+
+    # A fresh app module, and artifact caches that are not shared with the apps of other tests
+    monkeypatch.setattr(artifact_cache, "_caches", {})
+    monkeypatch.delitem(sys.modules, "app", raising=False)
+    app = importlib.import_module("app")
+    assert app.warmup.wait(timeout=60)
+    yield app
+    sys.modules.pop("app", None)
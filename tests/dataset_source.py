@@ -0,0 +1,109 @@
+"""
+A local HTTP stand-in for the dataset server and the archives it serves, shared by the tests and the benchmarks.
+
+The stand-in serves a zip archive with ETag/Last-Modified headers and supports conditional
+(If-None-Match/If-Modified-Since) and range (Range/If-Range) requests. It can drop the connection
+part way through a response to simulate a network failure.
+"""
+import email.utils
+import hashlib
+import io
+import random
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler
+
+COLUMNS = ["ph", "Hardness", "Solids", "Chloramines", "Sulfate", "Conductivity", "Organic_carbon",
+           "Trihalomethanes", "Turbidity", "Potability"]
+
+
+class DatasetSource:
+    """
+    The archive served by the stand-in server, replaceable to simulate a changed source.
+    """
+
+    def __init__(self):
+        self.payload = b""
+        self.etag = None
+        self.last_modified = None
+        self.drop_after = None
+        self.bytes_sent = 0
+        self.lock = threading.Lock()
+
+    def publish(self, payload):
+        with self.lock:
+            self.payload = payload
+            self.etag = f'"{hashlib.sha256(payload).hexdigest()[:16]}"'
+            self.last_modified = email.utils.formatdate(time.time(), usegmt=True)
+
+
+def make_handler(source):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            with source.lock:
+                payload, etag, last_modified = source.payload, source.etag, source.last_modified
+                drop_after, source.drop_after = source.drop_after, None
+
+            if self.headers.get("If-None-Match") == etag or (
+                    self.headers.get("If-None-Match") is None
+                    and self.headers.get("If-Modified-Since") == last_modified):
+                self.send_response(304)
+                self.end_headers()
+                return
+
+            start = 0
+            range_header = self.headers.get("Range")
+            if range_header and self.headers.get("If-Range") in (None, etag, last_modified):
+                start = int(range_header.split("=")[1].split("-")[0])
+                if start >= len(payload):
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{len(payload)}")
+                    self.end_headers()
+                    return
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{len(payload) - 1}/{len(payload)}")
+            else:
+                self.send_response(200)
+            body = payload[start:]
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            self.send_header("Accept-Ranges", "bytes")
+            self.end_headers()
+
+            if drop_after is not None:
+                body = body[:drop_after]
+            self.wfile.write(body)
+            source.bytes_sent += len(body)
+            if drop_after is not None:
+                # Cut the connection short, the client sees fewer bytes than announced
+                self.close_connection = True
+
+    return Handler
+
+
+def make_archive(n_rows, seed):
+    """
+    Builds a zip archive holding a water potability like CSV of random values.
+
+    Parameters:
+    - n_rows (int): The number of rows.
+    - seed (int): The random seed.
+
+    Returns:
+    - bytes: The zip archive.
+    """
+    rng = random.Random(seed)
+    text = io.StringIO()
+    text.write(",".join(COLUMNS) + "\n")
+    for _ in range(n_rows):
+        values = [f"{rng.uniform(0, 1000):.6f}" if rng.random() > 0.05 else "" for _ in COLUMNS[:-1]]
+        text.write(",".join(values) + f",{rng.randint(0, 1)}\n")
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("water_potability_dataset.csv", text.getvalue())
+    return buffer.getvalue()
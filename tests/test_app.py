@@ -0,0 +1,66 @@
+import filecmp
+
+import numpy as np
+
+from tests.bundles import record, save_bundle, train_bundle
+
+
+def test_train_only_accepts_post(serving_app):
+    client = serving_app.app.test_client()
+    assert client.get("/train").status_code == 405
+
+
+def test_staged_bundle_is_served_once_promoted(serving_app, inference_bundle):
+    config = serving_app.frontend_config
+    cache = serving_app.frontend_predictor.artifact_cache
+    staged = train_bundle(seed=1)
+    save_bundle(config.staged_inference_bundle, staged)
+
+    # The trainer only stages the bundle, the pipeline may still fail after it
+    assert cache.get().bundle.version == inference_bundle.version
+
+    serving_app.swap_in_new_model()
+    assert cache.get().bundle.version == staged.version
+    assert filecmp.cmp(config.staged_inference_bundle, config.inference_bundle, shallow=False)
+    assert serving_app.warmup.is_ready()
+
+    client = serving_app.app.test_client()
+    response = client.post("/predict/batch", json=[record(staged)])
+    assert response.status_code == 200
+    assert response.get_json()["n_errors"] == 0
+
+
+def test_batch_rows_are_predicted_together_and_errors_reported_per_row(serving_app, inference_bundle):
+    client = serving_app.app.test_client()
+    records = [record(inference_bundle, row) for row in range(5)]
+    records[2] = {**records[2], "ph": "not a number"}
+
+    response = client.post("/predict/batch", json={"records": records})
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert (body["n_rows"], body["n_errors"]) == (5, 1)
+    assert body["results"][2] == {"row": 2, "errors": ["Value is not a number: ph='not a number'"]}
+    valid = [0, 1, 3, 4]
+    expected = inference_bundle.predict(np.array([[float(records[row][col]) for col in inference_bundle.feature_names]
+                                                  for row in valid]))
+    assert [body["results"][row]["potability"] for row in valid] == expected.tolist()
+
+
+def test_batch_accepts_a_csv_body(serving_app, inference_bundle):
+    client = serving_app.app.test_client()
+    records = [record(inference_bundle, row) for row in range(3)]
+    csv_body = "\n".join([",".join(inference_bundle.feature_names)] +
+                         [",".join(row[col] for col in inference_bundle.feature_names) for row in records])
+
+    from_csv = client.post("/predict/batch", data=csv_body, content_type="text/csv")
+    from_json = client.post("/predict/batch", json=records)
+
+    assert from_csv.status_code == 200
+    assert from_csv.get_json() == from_json.get_json()
+
+
+def test_batch_rejects_a_body_that_is_not_a_list_of_records(serving_app):
+    client = serving_app.app.test_client()
+    assert client.post("/predict/batch", json={"ph": 7}).status_code == 400
+    assert client.post("/predict/batch", data="{not json", content_type="application/json").status_code == 400
@@ -0,0 +1,66 @@
+import copy
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.mlops_water_potability_prediction_project.classes.artifact_cache import ArtifactCache, get_artifact_cache
+from tests.bundles import frontend_config, save_bundle
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_importing_the_cache_does_not_import_joblib():
+    code = ("import sys\n"
+            "import src.mlops_water_potability_prediction_project.classes.artifact_cache\n"
+            "print('joblib' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def bundle_version(bundle, version):
+    other = copy.copy(bundle)
+    other.version = version
+    return other
+
+
+def rewrite(path, bundle):
+    # A new mtime even on file systems with a coarse clock
+    mtime_ns = os.stat(path).st_mtime_ns
+    save_bundle(path, bundle)
+    os.utime(path, ns=(mtime_ns + 10 ** 9, mtime_ns + 10 ** 9))
+
+
+def test_artifacts_are_reloaded_only_when_the_bundle_changes(tmp_path, inference_bundle):
+    config = frontend_config(tmp_path)
+    save_bundle(config.inference_bundle, bundle_version(inference_bundle, "v1"))
+    cache = ArtifactCache(config)
+
+    first = cache.get()
+    assert cache.get() is first
+    assert (first.version, first.bundle.version, cache.reloads) == (1, "v1", 1)
+
+    rewrite(config.inference_bundle, bundle_version(inference_bundle, "v2"))
+    second = cache.get()
+    assert (second.version, second.bundle.version, cache.reloads) == (2, "v2", 2)
+    # Requests in flight keep the snapshot they started with
+    assert first.bundle.version == "v1"
+    assert cache.get() is second
+
+
+def test_bundle_of_other_features_is_not_served(tmp_path, inference_bundle):
+    config = frontend_config(tmp_path)
+    other = bundle_version(inference_bundle, "v2")
+    other.feature_names = list(reversed(other.feature_names))
+    save_bundle(config.inference_bundle, other)
+
+    with pytest.raises(ValueError, match="do not match"):
+        ArtifactCache(config).get()
+
+
+def test_get_artifact_cache_is_shared_per_configuration(tmp_path):
+    config = frontend_config(tmp_path)
+    assert get_artifact_cache(config) is get_artifact_cache(frontend_config(tmp_path))
+    assert get_artifact_cache(config) is not get_artifact_cache(frontend_config(tmp_path / "other"))
@@ -0,0 +1,67 @@
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import StandardScaler
+
+from src.mlops_water_potability_prediction_project.classes.column_statistics import ColumnStatistics
+
+
+@pytest.fixture
+def dataframe():
+    rng = np.random.default_rng(0)
+    dataframe = pd.DataFrame({"ph": rng.normal(7, 1.5, 1000), "Hardness": rng.normal(1e6, 1, 1000),
+                              "Potability": rng.integers(0, 2, 1000)})
+    return dataframe.mask(rng.random(dataframe.shape) < 0.1).astype({"Potability": "float64"})
+
+
+def assert_statistics_equal(statistics, expected):
+    pd.testing.assert_frame_equal(statistics.to_frame(), expected.to_frame(), rtol=1e-12)
+
+
+def test_merged_blocks_match_one_pass(dataframe):
+    whole = ColumnStatistics(dataframe.columns).update(dataframe)
+    parts = [ColumnStatistics(dataframe.columns).update(dataframe.iloc[start:start + 300])
+             for start in range(0, len(dataframe), 300)]
+    # Empty statistics merge as a no-op, in any position
+    parts.insert(2, ColumnStatistics(dataframe.columns))
+
+    assert_statistics_equal(reduce(ColumnStatistics.merge, parts[::-1]), whole)
+    assert_statistics_equal(ColumnStatistics(dataframe.columns, block_rows=7).update(dataframe), whole)
+    frame = whole.to_frame()
+    assert frame.loc["null_count"].tolist() == dataframe.isna().sum().tolist()
+    pd.testing.assert_series_equal(frame.loc["mean"], dataframe.mean(), check_names=False)
+    pd.testing.assert_series_equal(frame.loc["var"], dataframe.var(ddof=0), check_names=False)
+
+    with pytest.raises(ValueError):
+        whole.merge(ColumnStatistics(["ph"]))
+
+
+def test_statistics_round_trip_through_their_frame(dataframe):
+    statistics = ColumnStatistics(list(dataframe.columns) + ["empty"]).update(dataframe.assign(empty=np.nan))
+    restored = ColumnStatistics.from_frame(statistics.to_frame())
+
+    assert_statistics_equal(restored, statistics)
+    # The restored statistics keep accumulating as the original ones
+    more = dataframe.iloc[:100].assign(empty=1.0)
+    assert_statistics_equal(restored.update(more), statistics.update(more))
+
+
+def test_standard_scaler_matches_a_fitted_one(dataframe):
+    dataframe = dataframe.dropna()
+    features = ["ph", "Hardness"]
+    scaler = ColumnStatistics(dataframe.columns).update(dataframe).standard_scaler(features)
+    fitted = StandardScaler().fit(dataframe[features].to_numpy())
+
+    for attribute in ("mean_", "var_", "scale_"):
+        np.testing.assert_allclose(getattr(scaler, attribute), getattr(fitted, attribute), rtol=1e-9)
+    assert scaler.n_features_in_ == fitted.n_features_in_
+    assert scaler.n_samples_seen_ == fitted.n_samples_seen_
+    np.testing.assert_allclose(scaler.transform(dataframe[features].to_numpy()),
+                               fitted.transform(dataframe[features].to_numpy()), rtol=1e-9)
+
+    # A constant column is left unscaled, as StandardScaler does
+    constant = dataframe.assign(ph=7.0)
+    assert ColumnStatistics(["ph"]).update(constant).standard_scaler().scale_.tolist() == \
+           StandardScaler().fit(constant[["ph"]].to_numpy()).scale_.tolist()
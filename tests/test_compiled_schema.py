@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from src.mlops_water_potability_prediction_project.classes.compiled_schema import CompiledSchema
+from src.mlops_water_potability_prediction_project.components.frontend import FrontendPrediction, NotInFeatureColumn, \
+    NotInRange
+from tests.bundles import frontend_config, record, save_bundle
+
+
+def test_schema_is_compiled_in_feature_order():
+    schema = {"Sulfate": {"min": 130.0, "max": 480.0}, "Potability": {"min": 0, "max": 1},
+              "ph": {"min": 0.0, "max": 14.0}}
+    compiled = CompiledSchema.from_schema(schema, ["ph", "Sulfate"])
+
+    np.testing.assert_array_equal(compiled.mins, [0.0, 130.0])
+    np.testing.assert_array_equal(compiled.maxs, [14.0, 480.0])
+    # The bounds are allowed, NaN is not
+    data = np.array([[0.0, 480.0], [14.0, 130.0], [14.5, 300.0], [np.nan, 129.9]])
+    np.testing.assert_array_equal(compiled.violations(data),
+                                  [[False, False], [False, False], [True, False], [True, True]])
+
+
+def test_every_violation_of_a_row_is_reported(tmp_path, inference_bundle):
+    config = frontend_config(tmp_path)
+    save_bundle(config.inference_bundle, inference_bundle)
+    predictor = FrontendPrediction(config, record_metrics=False)
+    valid = record(inference_bundle)
+    assert predictor.validate_input(valid)
+
+    with pytest.raises(NotInRange) as e:
+        predictor.validate_input({**valid, "ph": "-1", "Turbidity": "1e6"})
+    assert [error.split(":")[1].split("=")[0].strip() for error in e.value.errors] == ["ph", "Turbidity"]
+
+    # The column errors come first, the range errors are reported with them
+    missing = {**valid, "ph": "-1"}
+    del missing["Sulfate"]
+    with pytest.raises(NotInFeatureColumn) as e:
+        predictor.validate_input(missing)
+    assert e.value.errors[0] == "Missing feature column: Sulfate"
+    assert e.value.errors[1].startswith("Values entered are not in range: ph=-1.0")
@@ -0,0 +1,218 @@
+import dataclasses
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.mlops_water_potability_prediction_project.classes.dataloadersaver import PARTITION_MANIFEST, \
+    PartitionedDataLoaderSaver, dataset_loader_saver
+from src.mlops_water_potability_prediction_project.components.data_cleaning import DataCleaning
+from src.mlops_water_potability_prediction_project.components.data_ingestion import file_sha256
+from src.mlops_water_potability_prediction_project.components.data_validation import DataValidation
+from src.mlops_water_potability_prediction_project.entity.config_entity import DataCleaningConfig, \
+    DataValidationConfig
+
+SCHEMA = {"ph": "float64", "Hardness": "float64", "Potability": "int64"}
+
+
+def make_frame(n_rows, seed):
+    rng = np.random.default_rng(seed)
+    dataframe = pd.DataFrame(rng.uniform(0, 14, (n_rows, 2)), columns=["ph", "Hardness"])
+    dataframe = dataframe.mask(rng.random(dataframe.shape) < 0.2)
+    dataframe["Potability"] = rng.integers(0, 2, n_rows)
+    return dataframe
+
+
+def write_partition(raw_dir, index, dataframe):
+    """
+    Writes a raw partition and adds it to the partition manifest, with its checksum as the ingestion does.
+    """
+    os.makedirs(raw_dir, exist_ok=True)
+    path = os.path.join(raw_dir, f"part-{index:05d}-day{index}.feather")
+    dataset_loader_saver(path).save(path, dataframe)
+    manifest = PartitionedDataLoaderSaver().read_manifest(raw_dir)
+    manifest["partitions"] = [partition for partition in manifest["partitions"] if partition["path"] != path]
+    manifest["partitions"].append({"source": f"day{index}", "path": path, "rows": len(dataframe),
+                                   "sha256": file_sha256(path).hexdigest()})
+    with open(os.path.join(raw_dir, PARTITION_MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=4)
+    return path
+
+
+def cleaning_config(root_dir, unclean_data_path, clean_name, incremental=True):
+    os.makedirs(root_dir, exist_ok=True)
+    return DataCleaningConfig(root_dir=root_dir, unclean_data_path=unclean_data_path,
+                              clean_data_path=os.path.join(root_dir, clean_name),
+                              watermark_file=os.path.join(root_dir, "watermark.json"),
+                              incremental=incremental, chunk_size=None, data_schema=SCHEMA,
+                              dataset_format="feather")
+
+
+def read_json(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def raw_dir(tmp_path):
+    raw_dir = str(tmp_path / "raw")
+    for index in range(3):
+        write_partition(raw_dir, index, make_frame(200, seed=index))
+    return raw_dir
+
+
+@pytest.mark.parametrize("clean_name", ["clean.feather", "clean"])
+def test_delta_matches_full_cleaning(tmp_path, raw_dir, clean_name):
+    incremental = cleaning_config(str(tmp_path / "incremental"), raw_dir, clean_name)
+    DataCleaning(incremental).clean_data()
+    write_partition(raw_dir, 3, make_frame(50, seed=3))
+
+    delta = DataCleaning(incremental).clean_data()
+    full = cleaning_config(str(tmp_path / "full"), raw_dir, clean_name, incremental=False)
+    expected = DataCleaning(full).clean_data()
+
+    # The incremental run only reports the data on disk, it does not load the clean dataset back
+    assert delta is None
+    cleaned = dataset_loader_saver(incremental.clean_data_path).load(incremental.clean_data_path)
+    pd.testing.assert_frame_equal(cleaned, expected.reset_index(drop=True))
+    assert read_json(os.path.join(incremental.root_dir, "dataset_schema.json")) == \
+           read_json(os.path.join(full.root_dir, "dataset_schema.json"))
+    statistics = pd.DataFrame(read_json(os.path.join(incremental.root_dir, "dataset_statistics.json")))
+    pd.testing.assert_frame_equal(statistics,
+                                  pd.DataFrame(read_json(os.path.join(full.root_dir, "dataset_statistics.json"))))
+    watermark = read_json(incremental.watermark_file)
+    assert [partition["path"] for partition in watermark["partitions"]] == \
+           [partition["path"] for partition in PartitionedDataLoaderSaver().read_manifest(raw_dir)["partitions"]]
+
+
+def test_no_new_partitions_leaves_the_clean_dataset_untouched(tmp_path, raw_dir):
+    config = cleaning_config(str(tmp_path / "clean"), raw_dir, "clean.feather")
+    DataCleaning(config).clean_data()
+    mtime_ns = os.stat(config.clean_data_path).st_mtime_ns
+
+    assert DataCleaning(config).clean_data() is None
+    assert os.stat(config.clean_data_path).st_mtime_ns == mtime_ns
+
+
+def test_rewritten_partition_cleans_everything_again(tmp_path, raw_dir):
+    config = cleaning_config(str(tmp_path / "clean"), raw_dir, "clean.feather")
+    DataCleaning(config).clean_data()
+    replaced = make_frame(100, seed=10)
+    write_partition(raw_dir, 1, replaced)
+
+    cleaned = DataCleaning(config).clean_data()
+
+    # A full run returns the whole clean dataset, without the rows of the replaced partition
+    frames = [make_frame(200, seed=0), make_frame(200, seed=2), replaced]
+    assert len(cleaned) == sum(len(frame.dropna()) for frame in frames)
+    assert cleaned.equals(dataset_loader_saver(config.clean_data_path).load(config.clean_data_path))
+
+
+def test_single_file_source_has_no_watermark(tmp_path):
+    raw_path = str(tmp_path / "raw.feather")
+    dataset_loader_saver(raw_path).save(raw_path, make_frame(100, seed=0))
+    config = cleaning_config(str(tmp_path / "clean"), raw_path, "clean.feather")
+    with open(config.watermark_file, 'w') as f:
+        json.dump({"partitions": []}, f)
+
+    cleaned = DataCleaning(config).clean_data()
+
+    assert len(cleaned) == len(make_frame(100, seed=0).dropna())
+    assert not os.path.exists(config.watermark_file)
+
+
+def test_delta_validation(tmp_path, raw_dir):
+    root_dir = str(tmp_path / "validation")
+    os.makedirs(root_dir)
+    config = DataValidationConfig(root_dir=root_dir, data_path=raw_dir,
+                                  status_file=os.path.join(root_dir, "status.txt"), data_schema=SCHEMA,
+                                  watermark_file=os.path.join(root_dir, "watermark.json"), incremental=True,
+                                  statistics_path=os.path.join(root_dir, "dataset_statistics.json"),
+                                  report_file=os.path.join(root_dir, "report.json"))
+    assert DataValidation(config).validate_all_columns()
+    assert len(read_json(config.watermark_file)["partitions"]) == 3
+
+    # A new partition with a wrong dtype fails the validation of the whole dataset
+    write_partition(raw_dir, 3, make_frame(50, seed=3).astype({"Potability": "float64"}))
+    assert not DataValidation(config).validate_all_columns()
+    assert read_json(config.report_file)["columns"]["Potability"]["valid"] is False
+    assert len(read_json(config.watermark_file)["partitions"]) == 4
+
+
+@pytest.mark.parametrize("clean_name", ["clean.csv", "clean.feather"])
+def test_chunked_cleaning_matches_in_memory_cleaning(tmp_path, clean_name):
+    dataframe = make_frame(500, seed=1)
+    # An int64 column with missing values is parsed as floats in memory, and cannot be parsed into int64 in chunks
+    dataframe["Potability"] = dataframe["Potability"].astype("float64").mask(np.arange(500) % 17 == 0)
+    raw_path = str(tmp_path / "raw.csv")
+    dataframe.to_csv(raw_path, index=False)
+
+    outputs = []
+    for chunk_size in (None, 64):
+        config = cleaning_config(str(tmp_path / f"clean_{chunk_size}"), raw_path, clean_name, incremental=False)
+        config = dataclasses.replace(config, chunk_size=chunk_size)
+        DataCleaning(config).clean_data()
+        outputs.append((dataset_loader_saver(config.clean_data_path).load(config.clean_data_path),
+                        read_json(os.path.join(config.root_dir, "dataset_schema.json")),
+                        read_json(os.path.join(config.root_dir, "dataset_statistics.json"))))
+
+    (in_memory, *in_memory_statistics), (chunked, *chunked_statistics) = outputs
+    pd.testing.assert_frame_equal(chunked, in_memory)
+    assert str(chunked["Potability"].dtype) == "int64"
+    assert len(chunked) == len(dataframe.dropna())
+    assert chunked_statistics == in_memory_statistics
+
+
+def expected_null_counts(frames):
+    return {col: int(sum(frame[col].isna().sum() for frame in frames)) for col in SCHEMA}
+
+
+@pytest.mark.parametrize("layout", ["partitioned", "incremental", "file", "chunked"])
+def test_null_counts_are_those_of_the_unclean_data(tmp_path, raw_dir, layout):
+    frames = [make_frame(200, seed=index) for index in range(3)]
+    if layout in ("file", "chunked"):
+        unclean_data_path = str(tmp_path / "raw.csv")
+        pd.concat(frames, ignore_index=True).to_csv(unclean_data_path, index=False)
+    else:
+        unclean_data_path = raw_dir
+    config = cleaning_config(str(tmp_path / "clean"), unclean_data_path, "clean.feather",
+                             incremental=layout == "incremental")
+    config = dataclasses.replace(config, chunk_size=64 if layout == "chunked" else None)
+    DataCleaning(config).clean_data()
+    if layout == "incremental":
+        frames.append(make_frame(50, seed=3))
+        write_partition(raw_dir, 3, frames[-1])
+        DataCleaning(config).clean_data()
+
+    statistics = read_json(os.path.join(config.root_dir, "dataset_statistics.json"))
+    assert {col: statistics[col]["null_count"] for col in SCHEMA} == expected_null_counts(frames)
+    # The other statistics are those of the clean rows
+    clean = pd.concat(frames, ignore_index=True).dropna()
+    assert {col: statistics[col]["count"] for col in SCHEMA} == {col: len(clean) for col in SCHEMA}
+    assert statistics["ph"]["mean"] == pytest.approx(clean["ph"].mean())
+
+
+def test_validation_report_holds_the_dataset_statistics(tmp_path, raw_dir):
+    cleaning = cleaning_config(str(tmp_path / "clean"), raw_dir, "clean.feather", incremental=False)
+    DataCleaning(cleaning).clean_data()
+    root_dir = str(tmp_path / "validation")
+    os.makedirs(root_dir)
+    config = DataValidationConfig(root_dir=root_dir, data_path=cleaning.clean_data_path,
+                                  status_file=os.path.join(root_dir, "status.txt"), data_schema=SCHEMA,
+                                  watermark_file=os.path.join(root_dir, "watermark.json"), incremental=False,
+                                  statistics_path=os.path.join(cleaning.root_dir, "dataset_statistics.json"),
+                                  report_file=os.path.join(root_dir, "report.json"))
+    assert DataValidation(config).validate_all_columns()
+
+    report = read_json(config.report_file)
+    frames = [make_frame(200, seed=index) for index in range(3)]
+    clean = pd.concat(frames, ignore_index=True).dropna()
+    assert report["status"] is True and report["missing_columns"] == []
+    assert report["columns"]["ph"] == {"dtype": "float64", "expected_dtype": "float64", "valid": True,
+                                       "count": len(clean), "null_count": expected_null_counts(frames)["ph"],
+                                       "min": pytest.approx(clean["ph"].min()),
+                                       "max": pytest.approx(clean["ph"].max()),
+                                       "mean": pytest.approx(clean["ph"].mean()),
+                                       "std": pytest.approx(clean["ph"].std(ddof=0))}
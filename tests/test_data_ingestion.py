@@ -0,0 +1,105 @@
+import hashlib
+import io
+import json
+import os
+import zipfile
+
+import pandas as pd
+import pytest
+
+from src.mlops_water_potability_prediction_project.classes.dataloadersaver import dataset_loader_saver
+from src.mlops_water_potability_prediction_project.components.data_ingestion import ChecksumMismatch, DataIngestion, \
+    IncompleteDownload
+from tests.dataset_source import make_archive
+
+pytestmark = pytest.mark.usefixtures("no_backoff")
+
+
+def sha256_of(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def test_truncated_transfer_resumes_with_a_range_request(ingestion_config, dataset_server):
+    source, url = dataset_server
+    payload = make_archive(2000, seed=1)
+    source.publish(payload)
+    source.drop_after = len(payload) // 2
+
+    ingestion = DataIngestion(ingestion_config(source_url=url, retries=2))
+    assert ingestion.download_file()
+
+    # The retry only asked for the bytes the first attempt did not get
+    assert source.bytes_sent == len(payload)
+    assert sha256_of(ingestion.config.zip_data_path) == hashlib.sha256(payload).hexdigest()
+    assert not os.path.exists(ingestion.part_path)
+    assert not os.path.exists(ingestion.part_metadata_path)
+
+
+def test_checksum_mismatch_leaves_no_partial_file(ingestion_config, dataset_server):
+    source, url = dataset_server
+    source.publish(make_archive(100, seed=1))
+
+    ingestion = DataIngestion(ingestion_config(source_url=url, sha256="0" * 64))
+    with pytest.raises(ChecksumMismatch):
+        ingestion.download_file()
+
+    assert not os.path.exists(ingestion.part_path)
+    assert not os.path.exists(ingestion.part_metadata_path)
+    assert not os.path.exists(ingestion.config.zip_data_path)
+
+
+def test_unchanged_source_is_not_downloaded_again(ingestion_config, dataset_server):
+    source, url = dataset_server
+    source.publish(make_archive(100, seed=1))
+    config = ingestion_config(source_url=url)
+    assert DataIngestion(config).download_file()
+    bytes_sent = source.bytes_sent
+    mtime_ns = os.stat(config.zip_data_path).st_mtime_ns
+
+    # The server answers the conditional request with 304 Not Modified
+    assert not DataIngestion(config).download_file()
+    assert source.bytes_sent == bytes_sent
+    assert os.stat(config.zip_data_path).st_mtime_ns == mtime_ns
+
+    # A changed source is downloaded again
+    payload = make_archive(100, seed=2)
+    source.publish(payload)
+    assert DataIngestion(config).download_file()
+    assert sha256_of(config.zip_data_path) == hashlib.sha256(payload).hexdigest()
+
+
+def test_changed_source_restarts_the_partial_download(ingestion_config, dataset_server):
+    source, url = dataset_server
+    source.publish(make_archive(2000, seed=1))
+    source.drop_after = 1000
+
+    ingestion = DataIngestion(ingestion_config(source_url=url))
+    with pytest.raises(IncompleteDownload):
+        ingestion.download_file()
+    assert os.path.getsize(ingestion.part_path) == 1000
+
+    # The If-Range validator does not match the new archive, the server sends it whole from byte 0
+    payload = make_archive(2000, seed=2)
+    source.publish(payload)
+    assert ingestion.download_file()
+    assert source.bytes_sent == 1000 + len(payload)
+    assert sha256_of(ingestion.config.zip_data_path) == hashlib.sha256(payload).hexdigest()
+    with open(ingestion.config.metadata_path, 'r') as f:
+        assert json.load(f)["etag"] == source.etag
+
+
+def test_archive_is_read_without_extraction(ingestion_config, dataset_server):
+    source, url = dataset_server
+    payload = make_archive(500, seed=1)
+    source.publish(payload)
+
+    ingestion = DataIngestion(ingestion_config(source_url=url, extract_zip=False))
+    ingestion.download_file()
+    ingestion.extract_zip_file()
+
+    assert not os.path.exists(ingestion.config.unzip_dir)
+    zip_path = ingestion.config.zip_data_path
+    with zipfile.ZipFile(io.BytesIO(payload)) as archive:
+        expected = pd.read_csv(archive.open("water_potability_dataset.csv"))
+    pd.testing.assert_frame_equal(dataset_loader_saver(zip_path).load(zip_path), expected)
@@ -0,0 +1,37 @@
+import json
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.mlops_water_potability_prediction_project.components.data_transformation import DataTransformation
+from src.mlops_water_potability_prediction_project.entity.config_entity import DataTransformationConfig
+
+
+def test_feature_statistics_are_those_of_the_train_set(tmp_path):
+    rng = np.random.default_rng(0)
+    dataframe = pd.DataFrame({"ph": rng.uniform(0, 14, 400), "Hardness": rng.uniform(50, 300, 400),
+                              "Potability": rng.integers(0, 2, 400)})
+    config = DataTransformationConfig(root_dir=str(tmp_path), data_path=str(tmp_path / "clean.feather"),
+                                      status_file=str(tmp_path / "status.txt"), feature_scaler="scaler.joblib",
+                                      train_file_name="train.feather", test_file_name="test.feather")
+    transformation = DataTransformation(config)
+    transformation.split_dataset(dataframe)
+    train = transformation.train.copy()
+    transformation.feature_scale_dataset()
+
+    with open(tmp_path / "feature_statistics.json", 'r') as f:
+        statistics = pd.DataFrame(json.load(f))
+    # The label is not a feature
+    assert list(statistics.columns) == ["ph", "Hardness"]
+    assert statistics.loc["count"].tolist() == [len(train)] * 2
+    assert statistics.loc["null_count"].tolist() == [0, 0]
+    np.testing.assert_allclose(statistics.loc["mean"], train[["ph", "Hardness"]].mean())
+    np.testing.assert_allclose(statistics.loc["var"], train[["ph", "Hardness"]].var(ddof=0))
+    np.testing.assert_allclose(statistics.loc["min"], train[["ph", "Hardness"]].min())
+
+    # The saved scaler is the one built from these statistics
+    scaler = joblib.load(os.path.join(tmp_path, "scaler.joblib"))
+    np.testing.assert_allclose(scaler.mean_, statistics.loc["mean"])
+    np.testing.assert_allclose(transformation.train[["ph", "Hardness"]].mean(), 0, atol=1e-12)
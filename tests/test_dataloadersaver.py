@@ -0,0 +1,76 @@
+import os
+
+import pandas as pd
+import pytest
+
+from src.mlops_water_potability_prediction_project.classes.dataloadersaver import dataset_loader_saver
+
+DTYPE = {"ph": "float64", "Potability": "int64"}
+
+
+@pytest.mark.parametrize("file_name", ["clean.feather", "clean.parquet", "clean.csv", "clean.npy", "clean"])
+def test_no_chunk_saves_an_empty_dataset(tmp_path, file_name):
+    path = str(tmp_path / file_name)
+    loader = dataset_loader_saver(path)
+    with loader.chunk_writer(path, dtype=DTYPE):
+        pass
+
+    dataframe = loader.load(path)
+    assert len(dataframe) == 0
+    assert list(dataframe.columns) == list(DTYPE)
+    if not file_name.endswith(".csv"):
+        # A CSV file without rows has no dtypes to keep
+        assert dict(dataframe.dtypes.astype(str)) == DTYPE
+
+
+def list_files(root):
+    return sorted(os.path.relpath(os.path.join(dir_path, name), root)
+                  for dir_path, _, names in os.walk(root) for name in names)
+
+
+@pytest.mark.parametrize("file_name", ["clean.feather", "clean.parquet", "clean.csv", "clean.zip", "clean.npy",
+                                       "clean"])
+def test_failed_write_keeps_the_previous_file(tmp_path, file_name):
+    path = str(tmp_path / file_name)
+    loader = dataset_loader_saver(path)
+    previous = pd.DataFrame({"ph": [7.0], "Potability": [1]})
+    loader.save(path, previous)
+    files = list_files(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        with loader.chunk_writer(path, dtype=DTYPE) as writer:
+            writer.write(pd.DataFrame({"ph": [6.5, 8.0], "Potability": [0, 1]}))
+            raise RuntimeError("interrupted")
+
+    # Neither a truncated file nor a temporary one is left
+    pd.testing.assert_frame_equal(loader.load(path), previous)
+    assert list_files(tmp_path) == files
+
+    with loader.chunk_writer(path, dtype=DTYPE) as writer:
+        for start in range(0, 4, 2):
+            writer.write(pd.DataFrame({"ph": [6.0 + start, 7.0 + start], "Potability": [0, 1]}))
+    assert loader.load(path)["ph"].tolist() == [6.0, 7.0, 8.0, 9.0]
+    assert not [name for name in list_files(tmp_path) if ".tmp" in name]
+
+
+@pytest.mark.parametrize("partition_format", ["feather", "parquet", "csv", "npy"])
+def test_partitioned_dataset_is_written_in_the_partition_format(tmp_path, partition_format):
+    dir_path = str(tmp_path / "clean")
+    dataframe = pd.DataFrame({"ph": [6.5, 7.0], "Potability": [0, 1]})
+    dataset_loader_saver(dir_path).append(dir_path, dataframe)
+    loader = dataset_loader_saver(dir_path, partition_format)
+
+    loader.save(dir_path, dataframe)
+    loader.append(dir_path, dataframe)
+
+    # The feather partition of the earlier format is gone with the save
+    assert [os.path.basename(partition["path"]) for partition in loader.read_manifest(dir_path)["partitions"]] == \
+           [f"part-00000.{partition_format}", f"part-00001.{partition_format}"]
+    assert sorted(name for name in os.listdir(dir_path) if not name.endswith(".columns.json")) == \
+           ["_manifest.json", f"part-00000.{partition_format}", f"part-00001.{partition_format}"]
+    pd.testing.assert_frame_equal(loader.load(dir_path), pd.concat([dataframe, dataframe], ignore_index=True))
+
+
+def test_unknown_partition_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        dataset_loader_saver(str(tmp_path / "clean"), "xlsx")
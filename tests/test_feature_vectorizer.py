@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from src.mlops_water_potability_prediction_project.classes.feature_vectorizer import FeatureVectorizer
+
+VECTORIZER = FeatureVectorizer(["ph", "Sulfate", "Turbidity"], columns=["ph", "Sulfate", "Turbidity", "Potability"])
+
+RECORDS = [
+    {"Turbidity": "3.5", "ph": "7.0", "Sulfate": 300},
+    {"ph": 7, "Sulfate": "300", "Turbidity": 3.5, "Potability": 1},
+    {"ph": "7.0", "Turbidity": "3.5"},
+    {"ph": "seven", "Sulfate": None, "Turbidity": float("nan"), "colour": "clear"},
+    ["7.0", "300", "3.5"],
+]
+
+
+@pytest.mark.parametrize("record", RECORDS)
+def test_row_matches_a_one_row_matrix(record):
+    row, row_errors = VECTORIZER.row(record)
+    matrix, matrix_errors = VECTORIZER.matrix([record])
+
+    np.testing.assert_array_equal(row, matrix[0])
+    assert row_errors == matrix_errors[0]
+
+
+def test_values_are_placed_by_column_name():
+    matrix, errors = VECTORIZER.matrix(RECORDS)
+
+    # The submitted field order does not matter, the target is a known column
+    np.testing.assert_array_equal(matrix[:2], [[7.0, 300.0, 3.5], [7.0, 300.0, 3.5]])
+    assert errors[:2] == [[], []]
+    assert errors[2:] == [
+        ["Missing feature column: Sulfate"],
+        ["Values entered are not in feature columns: colour", "Value is not a number: ph='seven'",
+         "Missing feature column: Sulfate", "Value is not a number: Turbidity=nan"],
+        ["Row is not a mapping of feature names to values"],
+    ]
+    assert np.isnan(matrix[4]).all()
+
+
+def test_row_fills_the_given_vector():
+    out = np.zeros(3)
+    row, errors = VECTORIZER.row({"ph": "7.0", "Sulfate": "300", "Turbidity": "3.5"}, out=out)
+
+    assert row is out
+    np.testing.assert_array_equal(out, [7.0, 300.0, 3.5])
+    assert errors == []
@@ -0,0 +1,19 @@
+from src.mlops_water_potability_prediction_project.components.frontend import FrontendPrediction
+from tests.bundles import frontend_config, record, save_bundle
+
+
+def test_invalid_row_is_counted_once_under_its_first_error(tmp_path, inference_bundle):
+    config = frontend_config(tmp_path)
+    save_bundle(config.inference_bundle, inference_bundle)
+    predictor = FrontendPrediction(config, record_metrics=False)
+    valid = record(inference_bundle)
+    missing_and_out_of_range = {**valid, "ph": "99"}
+    del missing_and_out_of_range["Sulfate"]
+
+    results = predictor.batch_response([valid, {**valid, "ph": "99"}, missing_and_out_of_range])
+
+    assert "prediction" in results[0]
+    assert len(results[1]["errors"]) == 1
+    # Both errors are reported, the row is counted once
+    assert len(results[2]["errors"]) == 2
+    assert predictor.validation_errors.collect() == {("NotInRange",): 1, ("NotInFeatureColumn",): 1}
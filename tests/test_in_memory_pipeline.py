@@ -0,0 +1,66 @@
+import pytest
+
+from src.mlops_water_potability_prediction_project.pipeline import in_memory_pipeline
+from src.mlops_water_potability_prediction_project.pipeline.in_memory_pipeline import InMemoryTrainingPipeline
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """
+    Replaces the stage pipelines with fakes recording what every stage was handed.
+
+    Yields:
+    - list: The (stage, arguments) of every call, in order.
+    """
+    calls = []
+
+    class Fake:
+        def __init__(self, method, result):
+            self.method, self.result = method, result
+
+        def __call__(self):
+            return self
+
+        def __getattr__(self, name):
+            if name != self.method:
+                raise AttributeError(name)
+            return lambda *args, **kwargs: calls.append((name, args, kwargs)) or self.result
+
+    fakes = {
+        "DataIngestionTrainingPipeline": Fake("ingest_data", None),
+        "DataCleaningTrainingPipeline": Fake("clean_data", "clean"),
+        "DataValidationTrainingPipeline": Fake("validate_data", True),
+        "DataTransformationTrainingPipeline": Fake("transform_data", ("train", "test")),
+        "ModelTrainerTrainingPipeline": Fake("train_model", "model"),
+        "ModelEvaluationTrainingPipeline": Fake("evaluate_model", None),
+    }
+    for name, fake in fakes.items():
+        monkeypatch.setattr(in_memory_pipeline, name, fake)
+    return calls
+
+
+def test_stages_hand_their_outputs_over_in_memory(calls):
+    pipeline = InMemoryTrainingPipeline(checkpoint=False)
+    for stage in pipeline.stages().values():
+        stage()
+
+    assert calls == [
+        ("ingest_data", (), {}),
+        ("clean_data", (), {"checkpoint": False}),
+        ("validate_data", ("clean",), {}),
+        ("transform_data", ("clean",), {"checkpoint": False}),
+        ("train_model", ("train",), {}),
+        ("evaluate_model", ("test", "model"), {}),
+    ]
+    # The cleaned data and the train set are released once the stage reading them ran
+    assert pipeline.handoff == {"test": "test", "model": "model"}
+
+
+def test_stage_without_a_handoff_reads_from_disk(calls):
+    pipeline = InMemoryTrainingPipeline(checkpoint=True)
+    stages = pipeline.stages()
+    stages["MODEL TRAINER"]()
+    stages["MODEL EVALUATION"]()
+
+    # A run starting at the trainer has no train set in memory, the stage pipelines then load it
+    assert calls == [("train_model", (None,), {}), ("evaluate_model", (None, "model"), {})]
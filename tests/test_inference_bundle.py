@@ -0,0 +1,68 @@
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sklearn.preprocessing import StandardScaler
+
+from src.mlops_water_potability_prediction_project.classes.inference_bundle import InferenceBundle
+from tests.bundles import FEATURES, TARGET, save_bundle, synthetic_frame, train_bundle
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_preload_unpickles_the_model_only_without_the_engine(inference_bundle):
+    without_engine = pickle.loads(pickle.dumps(train_bundle(engine=False)))
+    assert without_engine.__dict__["_model_pickle"] is not None
+
+    assert without_engine.preload()
+    assert without_engine.__dict__["_model_pickle"] is None
+    # Already unpickled
+    assert not without_engine.preload()
+
+    # The NumPy engine serves the predictions, the model is never needed
+    with_engine = pickle.loads(pickle.dumps(inference_bundle))
+    assert not with_engine.preload()
+    assert with_engine.__dict__["_model_pickle"] is not None
+
+
+def test_bundle_applies_the_scaler_and_the_model(inference_bundle):
+    data = synthetic_frame(n_rows=50, seed=7)[FEATURES].to_numpy()
+    scaler = StandardScaler().fit(synthetic_frame(seed=3)[FEATURES].to_numpy())
+    bundle = InferenceBundle.from_scaler(model=inference_bundle.model, scaler=scaler, feature_names=FEATURES,
+                                         target_column=TARGET, schema=inference_bundle.schema)
+
+    # The scaling is bit-identical to the scaler's
+    np.testing.assert_array_equal(bundle.transform(data), scaler.transform(data))
+    np.testing.assert_array_equal(bundle.predict(data),
+                                  np.asarray(inference_bundle.model.predict(scaler.transform(data))).reshape(-1))
+    # A single row is a one-row matrix
+    assert bundle.transform(data[0]).shape == (1, len(FEATURES))
+    with pytest.raises(ValueError, match="Expected 9 features"):
+        bundle.transform(data[:, :3])
+
+
+def test_loading_a_bundle_with_the_engine_does_not_import_catboost(tmp_path, inference_bundle):
+    path = tmp_path / "inference_bundle.joblib"
+    save_bundle(path, inference_bundle)
+    code = ("import sys\n"
+            "import joblib\n"
+            f"bundle = joblib.load({str(path)!r})\n"
+            "bundle.predict([[7.0, 200, 20000, 7, 330, 420, 14, 66, 4]])\n"
+            "print('catboost' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_bundle_pickled_with_its_model_inline_is_restored(inference_bundle):
+    # The layout of the bundles written before the model was pickled on its own
+    state = {key: value for key, value in inference_bundle.__dict__.items() if key not in ("_model", "_model_pickle")}
+    state["model"] = inference_bundle.model
+    bundle = InferenceBundle.__new__(InferenceBundle)
+    bundle.__setstate__(state)
+
+    data = synthetic_frame(n_rows=20, seed=7)[FEATURES].to_numpy()
+    np.testing.assert_array_equal(bundle.predict(data), inference_bundle.predict(data))
+    assert bundle.model is inference_bundle.model
@@ -0,0 +1,65 @@
+import math
+import threading
+
+from src.mlops_water_potability_prediction_project.classes.metrics import Counter, Histogram, MetricsRegistry
+
+
+def run_threads(target, n_threads):
+    threads = [threading.Thread(target=target) for _ in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_shards_of_exited_threads_are_merged_and_dropped():
+    counter = Counter("requests_total", "Requests.", labelnames=("route",))
+    histogram = Histogram("latency_seconds", "Latency.", labelnames=("route",), buckets=(0.1, 1.0))
+
+    def record():
+        counter.inc(("/predict",))
+        histogram.observe(("/predict",), 0.5)
+
+    run_threads(record, 500)
+    record()
+
+    # Only the shard of the calling thread is left besides the base shard
+    assert len(counter._shards.snapshots()) == 2
+    assert len(histogram._shards.snapshots()) == 2
+    assert counter.collect() == {("/predict",): 501}
+    assert histogram.collect() == {("/predict",): ([0, 501, 501], 0.5 * 501, 501)}
+
+
+def test_counter_and_histogram_render():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Handled requests.", labelnames=("status",))
+    histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    registry.callback("reloads_total", "Reloads.", "counter", lambda: 3)
+    counter.inc(("200",), 2)
+    counter.inc(("500",))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe((), value)
+
+    assert histogram.buckets == (0.1, 1.0, math.inf)
+    assert registry.render().splitlines() == [
+        "# HELP requests_total Handled requests.",
+        "# TYPE requests_total counter",
+        'requests_total{status="200"} 2',
+        'requests_total{status="500"} 1',
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1"} 2',
+        'latency_seconds_bucket{le="+Inf"} 3',
+        "latency_seconds_sum 5.55",
+        "latency_seconds_count 3",
+        "# HELP reloads_total Reloads.",
+        "# TYPE reloads_total counter",
+        "reloads_total 3",
+    ]
+
+
+def test_registering_a_name_again_returns_the_first_metric():
+    registry = MetricsRegistry()
+    first = registry.counter("requests_total", "Handled requests.")
+    assert registry.counter("requests_total", "Handled requests.") is first
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.mlops_water_potability_prediction_project.components.micro_batching import InferenceQueueFull, \
+    MicroBatcher
+from src.mlops_water_potability_prediction_project.entity.config_entity import MicroBatchingConfig
+
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, timeout=10))
+
+
+def test_concurrent_requests_are_scored_in_one_call():
+    calls = []
+
+    def predict(records):
+        calls.append(list(records))
+        return [record * 10 for record in records]
+
+    async def scenario():
+        batcher = MicroBatcher(MicroBatchingConfig(max_batch_size=100, max_wait_ms=200, max_queue_depth=10), predict)
+        batcher.start()
+        results = await asyncio.gather(batcher.submit([1, 2]), batcher.submit([3]), batcher.submit([4, 5, 6]))
+        await batcher.stop()
+        return results
+
+    # Every caller gets its own slice of the results
+    assert run(scenario()) == [[10, 20], [30], [40, 50, 60]]
+    assert calls == [[1, 2, 3, 4, 5, 6]]
+
+
+def test_batch_is_closed_at_the_maximum_size():
+    calls = []
+
+    def predict(records):
+        calls.append(len(records))
+        return records
+
+    async def scenario():
+        batcher = MicroBatcher(MicroBatchingConfig(max_batch_size=3, max_wait_ms=200, max_queue_depth=10), predict)
+        batcher.start()
+        await asyncio.gather(*(batcher.submit([i, i]) for i in range(3)))
+        await batcher.stop()
+
+    run(scenario())
+    assert calls == [4, 2]
+
+
+def test_prediction_error_fails_every_request_of_the_batch():
+    def predict(records):
+        raise ValueError("model failed")
+
+    async def scenario():
+        batcher = MicroBatcher(MicroBatchingConfig(max_batch_size=100, max_wait_ms=50, max_queue_depth=10), predict)
+        batcher.start()
+        results = await asyncio.gather(batcher.submit([1]), batcher.submit([2]), return_exceptions=True)
+        # The worker keeps serving after a failed batch
+        results.append(await asyncio.gather(batcher.submit([3]), return_exceptions=True))
+        await batcher.stop()
+        return results
+
+    first, second, third = run(scenario())
+    assert isinstance(first, ValueError) and isinstance(second, ValueError)
+    assert isinstance(third[0], ValueError)
+
+
+def test_full_queue_rejects_the_request():
+    async def scenario():
+        batcher = MicroBatcher(MicroBatchingConfig(max_batch_size=100, max_wait_ms=50, max_queue_depth=1),
+                               lambda records: records)
+        # Without the worker, nothing is taken off the queue
+        batcher._queue = asyncio.Queue(maxsize=1)
+        waiting = asyncio.ensure_future(batcher.submit([1]))
+        await asyncio.sleep(0)
+        with pytest.raises(InferenceQueueFull):
+            await batcher.submit([2])
+        await batcher.stop()
+        with pytest.raises(RuntimeError):
+            await waiting
+
+    run(scenario())
+
+
+def test_stop_fails_the_requests_of_the_batch_being_scored():
+    scoring, release = threading.Event(), threading.Event()
+
+    def predict(records):
+        scoring.set()
+        release.wait(timeout=10)
+        return records
+
+    async def scenario():
+        batcher = MicroBatcher(MicroBatchingConfig(max_batch_size=1, max_wait_ms=50, max_queue_depth=10), predict)
+        batcher.start()
+        scored = asyncio.ensure_future(batcher.submit([1]))
+        queued = asyncio.ensure_future(batcher.submit([2]))
+        while not scoring.is_set():
+            await asyncio.sleep(0.01)
+
+        await batcher.stop()
+        release.set()
+        # Neither caller is left waiting forever
+        for request in (scored, queued):
+            with pytest.raises(RuntimeError, match="shutting down"):
+                await request
+
+    run(scenario())
@@ -0,0 +1,78 @@
+import copy
+import os
+import stat
+
+import pytest
+
+from src.mlops_water_potability_prediction_project.classes.artifact_cache import ArtifactCache
+from src.mlops_water_potability_prediction_project.classes.model_registry import ModelRegistry, \
+    ModelVersionNotFound
+from tests.bundles import frontend_config, save_bundle
+
+
+@pytest.fixture
+def register(tmp_path, inference_bundle):
+    """
+    Registers a copy of the inference bundle under a bundle version of its own.
+
+    Yields:
+    - callable: Takes the registry and the bundle version, returns the registry version id.
+    """
+    def register_version(registry, bundle_version):
+        bundle = copy.copy(inference_bundle)
+        bundle.version = bundle_version
+        path = tmp_path / "bundles" / f"{bundle_version}.joblib"
+        save_bundle(path, bundle)
+        return registry.register({ModelRegistry.BUNDLE_FILE_NAME: path}, {"bundle_version": bundle_version})
+
+    return register_version
+
+
+def test_version_is_the_content_of_its_files(tmp_path, register):
+    registry = ModelRegistry(tmp_path / "registry")
+    version = register(registry, "v1")
+
+    assert register(registry, "v1") == version
+    assert register(registry, "v2") != version
+    assert [manifest["metadata"]["bundle_version"] for manifest in registry.list_versions()] == ["v1", "v2"]
+    # Versions are immutable
+    assert stat.S_IMODE(os.stat(registry.bundle_path(version)).st_mode) & 0o222 == 0
+    assert registry.current_version() is None
+    with pytest.raises(ValueError, match=ModelRegistry.BUNDLE_FILE_NAME):
+        registry.register({"model.joblib": registry.bundle_path(version)})
+
+
+def test_rollback_walks_back_the_promotions(tmp_path, register):
+    registry = ModelRegistry(tmp_path / "registry")
+    v1, v2, v3 = (register(registry, name) for name in ("v1", "v2", "v3"))
+    for version in (v1, v2, v3):
+        registry.promote(version)
+
+    assert registry.rollback() == v2
+    assert registry.rollback() == v1
+    with pytest.raises(ModelVersionNotFound, match="No earlier promoted version"):
+        registry.rollback()
+
+    # A rolled back version promoted again is rolled back to the version before it
+    registry.promote(v3)
+    assert registry.rollback() == v1
+    assert [promotion["reason"] for promotion in registry.promotions()] == \
+           ["promote", "promote", "promote", "rollback", "rollback", "promote", "rollback"]
+    with pytest.raises(ModelVersionNotFound):
+        registry.promote("0" * ModelRegistry.VERSION_ID_LENGTH)
+
+
+def test_serving_follows_the_registry_pointer(tmp_path, inference_bundle, register):
+    config = frontend_config(tmp_path)
+    save_bundle(config.inference_bundle, inference_bundle)
+    registry = ModelRegistry(config.model_registry_dir)
+    cache = ArtifactCache(config)
+    assert cache.get().bundle.version == inference_bundle.version
+
+    v1, v2 = register(registry, "v1"), register(registry, "v2")
+    registry.promote(v1)
+    assert cache.get().bundle.version == "v1"
+    registry.promote(v2)
+    assert cache.get().bundle.version == "v2"
+    registry.rollback()
+    assert cache.get().bundle.version == "v1"
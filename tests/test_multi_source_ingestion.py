@@ -0,0 +1,92 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from src.mlops_water_potability_prediction_project.classes.dataloadersaver import PartitionedDataLoaderSaver
+from src.mlops_water_potability_prediction_project.components.multi_source_ingestion import MultiSourceIngestion, \
+    SourceIngestionFailed
+from tests.dataset_source import make_archive
+
+pytestmark = pytest.mark.usefixtures("no_backoff")
+
+
+def write_source(path, n_rows, seed):
+    with open(path, 'wb') as f:
+        f.write(make_archive(n_rows, seed))
+    return str(path)
+
+
+def read_manifest(config):
+    with open(os.path.join(config.partitions_dir, "_manifest.json"), 'r') as f:
+        return json.load(f)
+
+
+def test_failing_source_does_not_stop_the_others(tmp_path, ingestion_config, dataset_server):
+    source, url = dataset_server
+    source.publish(make_archive(300, seed=3))
+    day1 = write_source(tmp_path / "day1.zip", 100, seed=1)
+    day2 = write_source(tmp_path / "day2.zip", 200, seed=2)
+    missing = str(tmp_path / "missing.zip")
+    config = ingestion_config(sources=tuple([day1, missing, url, day2]), retries=2, max_workers=4)
+
+    with pytest.raises(SourceIngestionFailed) as error:
+        MultiSourceIngestion(config).ingest()
+
+    assert list(error.value.failures) == [missing]
+    manifest = read_manifest(config)
+    assert [entry["source"] for entry in manifest["partitions"]] == [day1, url, day2]
+    assert [entry["rows"] for entry in manifest["partitions"]] == [100, 300, 200]
+    assert list(manifest["failed_sources"]) == [missing]
+    # The partitions are read in source order
+    dataset = PartitionedDataLoaderSaver().load(config.partitions_dir)
+    assert len(dataset) == 600
+
+
+def test_failed_source_keeps_its_earlier_partition(tmp_path, ingestion_config):
+    day1 = write_source(tmp_path / "day1.zip", 100, seed=1)
+    day2 = write_source(tmp_path / "day2.zip", 200, seed=2)
+    config = ingestion_config(sources=tuple([day1, day2]), retries=2, max_workers=4)
+    partitions = MultiSourceIngestion(config).ingest()
+    expected = pd.read_feather(partitions[1]["path"])
+
+    # The second source is now unreadable: its partition from the first run stays in the dataset
+    with open(day2, 'wb') as f:
+        f.write(b"not a zip archive")
+    with pytest.raises(SourceIngestionFailed):
+        MultiSourceIngestion(config).ingest()
+
+    manifest = read_manifest(config)
+    assert manifest["partitions"] == partitions
+    assert list(manifest["failed_sources"]) == [day2]
+    pd.testing.assert_frame_equal(pd.read_feather(partitions[1]["path"]), expected)
+
+
+def test_unchanged_source_is_not_decoded_again(tmp_path, ingestion_config):
+    day1 = write_source(tmp_path / "day1.zip", 100, seed=1)
+    config = ingestion_config(sources=tuple([str(tmp_path / "day*.zip")]), retries=2, max_workers=4)
+    first = MultiSourceIngestion(config).ingest()
+    mtime_ns = os.stat(first[0]["path"]).st_mtime_ns
+
+    day2 = write_source(tmp_path / "day2.zip", 200, seed=2)
+    second = MultiSourceIngestion(config).ingest()
+
+    assert [entry["source"] for entry in second] == [day1, day2]
+    assert second[0] == first[0]
+    assert os.stat(second[0]["path"]).st_mtime_ns == mtime_ns
+
+
+def test_new_source_does_not_rename_the_other_partitions(tmp_path, ingestion_config):
+    day1 = write_source(tmp_path / "day1.zip", 100, seed=1)
+    day2 = write_source(tmp_path / "day2.zip", 200, seed=2)
+    first = MultiSourceIngestion(ingestion_config(sources=tuple([day1, day2]), retries=2, max_workers=4)).ingest()
+
+    # A source added in front shifts the positions of the others, not their partition files
+    day0 = write_source(tmp_path / "day0.zip", 50, seed=0)
+    second = MultiSourceIngestion(ingestion_config(sources=tuple([day0, day1, day2]), retries=2, max_workers=4)).ingest()
+
+    assert second[1:] == first
+    assert os.path.basename(second[0]["path"]) == f"part-{MultiSourceIngestion.source_key(day0)}-day0.feather"
+    assert sorted(os.listdir(tmp_path / "partitions")) == \
+           sorted(["_manifest.json"] + [os.path.basename(entry["path"]) for entry in second])
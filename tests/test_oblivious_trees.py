@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from src.mlops_water_potability_prediction_project.classes.oblivious_trees import ObliviousTreeEnsemble
+from tests.bundles import FEATURES, synthetic_frame
+
+
+def scaled_data(bundle, n_rows=300):
+    """
+    Scaled rows of the synthetic data, plus rows sitting exactly on split borders and rows with NaN values.
+    """
+    data = bundle.transform(synthetic_frame(n_rows=n_rows, seed=11)[FEATURES].to_numpy())
+    engine = bundle.engine
+    on_borders = data[:len(FEATURES)].copy()
+    for t in range(len(engine.split_features)):
+        feature, border = engine.split_features[t, 0], engine.split_borders[t, 0]
+        on_borders[t % len(on_borders), feature] = border
+    with_nan = data[:len(FEATURES)].copy()
+    with_nan[np.arange(len(FEATURES)), np.arange(len(FEATURES))] = np.nan
+    return np.vstack([data, on_borders, with_nan])
+
+
+def test_engine_matches_catboost(inference_bundle):
+    model, engine = inference_bundle.model, inference_bundle.engine
+    data = scaled_data(inference_bundle)
+
+    np.testing.assert_allclose(engine.raw_predict(data), model.predict(data, prediction_type="RawFormulaVal"),
+                               rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(engine.predict(data), np.asarray(model.predict(data)).reshape(-1))
+
+
+def test_multiclass_raw_values_match_catboost():
+    from catboost import CatBoostClassifier
+
+    dataframe = synthetic_frame(seed=5)
+    target = np.digitize(dataframe["ph"], [5, 9])
+    model = CatBoostClassifier(iterations=15, depth=4, loss_function="MultiClass", random_seed=0, thread_count=1,
+                               verbose=False, allow_writing_files=False)
+    model.fit(dataframe[FEATURES].to_numpy(), target)
+    engine = ObliviousTreeEnsemble.from_catboost(model)
+    data = synthetic_frame(n_rows=100, seed=6)[FEATURES].to_numpy()
+
+    np.testing.assert_allclose(engine.raw_predict(data), model.predict(data, prediction_type="RawFormulaVal"),
+                               rtol=0, atol=1e-12)
+    with pytest.raises(ValueError, match="binary"):
+        engine.predict(data)
+
+
+def test_rows_in_the_same_buckets_get_the_same_prediction(inference_bundle):
+    engine = inference_bundle.engine
+    data = scaled_data(inference_bundle)
+    buckets = engine.bucketize(data)
+    raw = engine.raw_predict(data)
+
+    _, first_rows, groups = np.unique(buckets, axis=0, return_index=True, return_inverse=True)
+    np.testing.assert_array_equal(raw, raw[first_rows][groups.reshape(-1)])
+
+
+def test_model_with_categorical_features_is_not_exported():
+    model_json = {"features_info": {"categorical_features": [{"feature_index": 0}]}, "oblivious_trees": []}
+    with pytest.raises(ValueError, match="float features"):
+        ObliviousTreeEnsemble.from_catboost_json(model_json)
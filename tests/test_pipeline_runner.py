@@ -0,0 +1,102 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from src.mlops_water_potability_prediction_project.classes.pipeline_runner import PipelineRunner
+from src.mlops_water_potability_prediction_project.entity.config_entity import PipelineConfig
+
+
+def write(path, text):
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    """
+    A two stage pipeline: "prepare" copies raw.txt into prepared.txt, "train" copies prepared.txt into model.txt.
+
+    Yields:
+    - SimpleNamespace: make_runner() builds a runner on the state file, run(runner, **kwargs) runs both stages
+      and returns their outcomes, calls lists the stages that actually ran, config and params are the sections.
+    """
+    raw, prepared, model = (str(tmp_path / name) for name in ("raw.txt", "prepared.txt", "model.txt"))
+    write(raw, "raw data")
+    params = {"Train": {"depth": 4}}
+    stages = {
+        "prepare": {"deps": [raw], "outs": [prepared]},
+        "train": {"config": ["incremental"], "params": ["Train"], "deps": [prepared], "outs": [model]},
+    }
+    calls = []
+
+    def copy(stage_name, source, target):
+        calls.append(stage_name)
+        with open(source) as f:
+            write(target, f.read())
+
+    stage_callables = [("PREPARE", lambda: copy("PREPARE", raw, prepared)),
+                       ("TRAIN", lambda: copy("TRAIN", prepared, model))]
+    config_manager = SimpleNamespace(config={"incremental": True}, params=params, schema={})
+
+    def make_runner():
+        return PipelineRunner(PipelineConfig(state_file=str(tmp_path / "state.json"), stages=stages,
+                                             in_memory_checkpoints=False), config_manager)
+
+    def run(runner, **kwargs):
+        return runner.run(stage_callables, lambda name, stage: stage(), **kwargs)
+
+    return SimpleNamespace(make_runner=make_runner, run=run, calls=calls, config=config_manager.config, params=params,
+                           raw=raw,
+                           prepared=prepared, model=model)
+
+
+def test_unrecorded_run_drops_the_state_of_the_stages(pipeline):
+    pipeline.run(pipeline.make_runner())
+    assert pipeline.run(pipeline.make_runner()) == {"PREPARE": "skipped", "TRAIN": "skipped"}
+
+    # An in-memory run without checkpoints: the stages run, but the files on disk are not their outputs
+    pipeline.params["Train"]["depth"] = 6
+    runner = pipeline.make_runner()
+    assert pipeline.run(runner, force=True, record=False) == {"PREPARE": "ran", "TRAIN": "ran"}
+    assert runner.state["stages"] == {}
+
+    # A later plain run cannot take the stale files for this run's outputs
+    pipeline.calls.clear()
+    assert pipeline.run(pipeline.make_runner()) == {"PREPARE": "ran", "TRAIN": "ran"}
+    assert os.path.exists(pipeline.model)
+
+
+def test_stages_are_skipped_until_an_input_changes(pipeline):
+    assert pipeline.run(pipeline.make_runner()) == {"PREPARE": "ran", "TRAIN": "ran"}
+    assert pipeline.run(pipeline.make_runner()) == {"PREPARE": "skipped", "TRAIN": "skipped"}
+
+    # A top-level scalar of config.yaml is an input of the stages declaring it
+    pipeline.config["incremental"] = False
+    assert pipeline.run(pipeline.make_runner()) == {"PREPARE": "skipped", "TRAIN": "ran"}
+
+    # A changed file reruns its stage, and the stages reading its outputs since they changed too
+    write(pipeline.raw, "new raw data")
+    assert pipeline.run(pipeline.make_runner()) == {"PREPARE": "ran", "TRAIN": "ran"}
+
+    # A missing output reruns the stage writing it
+    os.remove(pipeline.model)
+    assert pipeline.run(pipeline.make_runner()) == {"PREPARE": "skipped", "TRAIN": "ran"}
+
+
+def test_rerun_with_identical_outputs_does_not_invalidate_the_next_stage(pipeline):
+    pipeline.run(pipeline.make_runner())
+    pipeline.calls.clear()
+
+    # The forced PREPARE rewrites prepared.txt with the same content, which TRAIN hashes as unchanged
+    assert pipeline.run(pipeline.make_runner(), force=True, end="PREPARE") == {"PREPARE": "ran"}
+    assert pipeline.run(pipeline.make_runner()) == {"PREPARE": "skipped", "TRAIN": "skipped"}
+    assert pipeline.calls == ["PREPARE"]
+
+
+def test_force_runs_the_selected_stages(pipeline):
+    pipeline.run(pipeline.make_runner())
+    pipeline.calls.clear()
+
+    assert pipeline.run(pipeline.make_runner(), start="TRAIN", force=True) == {"TRAIN": "ran"}
+    assert pipeline.calls == ["TRAIN"]
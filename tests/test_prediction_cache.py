@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.mlops_water_potability_prediction_project.classes import prediction_cache
+from src.mlops_water_potability_prediction_project.classes.prediction_cache import PredictionCache, \
+    create_prediction_cache
+from src.mlops_water_potability_prediction_project.components.frontend import FrontendPrediction
+from src.mlops_water_potability_prediction_project.entity.config_entity import PredictionCacheConfig
+from tests.bundles import frontend_config, record, save_bundle
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    A settable clock for the entry lifetimes.
+
+    Yields:
+    - list: The current time, in seconds, as its only element.
+    """
+    now = [0.0]
+    monkeypatch.setattr(prediction_cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = PredictionCache(max_size=2, ttl_seconds=60)
+    cache.put_many([b"a", b"b"], [0, 1], version=1)
+    assert cache.get_many([b"a"], version=1) == [0]
+
+    cache.put_many([b"c"], [1], version=1)
+    assert cache.get_many([b"a", b"b", b"c"], version=1) == [0, None, 1]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_and_are_dropped_with_the_model(clock):
+    cache = PredictionCache(max_size=10, ttl_seconds=60)
+    cache.put_many([b"a"], [1], version=1)
+    clock[0] = 59
+    assert cache.get_many([b"a"], version=1) == [1]
+    clock[0] = 61
+    assert cache.get_many([b"a"], version=1) == [None]
+
+    cache.put_many([b"a"], [1], version=1)
+    # Another artifacts version: the entries of the earlier model are never answered
+    assert cache.get_many([b"a"], version=2) == [None]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["invalidations"], stats["size"]) == (1, 2, 1, 0)
+
+
+@pytest.mark.parametrize("key_mode", PredictionCache.KEY_MODES)
+def test_cached_predictions_equal_the_model_predictions(tmp_path, inference_bundle, key_mode):
+    config = frontend_config(tmp_path)
+    save_bundle(config.inference_bundle, inference_bundle)
+    cache = PredictionCache(max_size=1000, ttl_seconds=60, key_mode=key_mode)
+    cached = FrontendPrediction(config, prediction_cache=cache, record_metrics=False)
+    uncached = FrontendPrediction(config, record_metrics=False)
+    records = [record(inference_bundle, row) for row in range(200)]
+    # Readings a hair apart, which only the quantized keys share
+    records += [{**values, "ph": str(float(values["ph"]) + 1e-9)} for values in records[:50]]
+
+    expected = uncached.batch_response(records)
+    assert cached.batch_response(records) == expected
+    assert cached.batch_response(records) == expected
+
+    # Rows outside the schema ranges are not predicted, so not cached
+    n_valid = sum("prediction" in result for result in expected)
+    stats = cache.stats()
+    assert stats["hits"] >= n_valid
+    if key_mode == "quantized":
+        assert stats["size"] <= sum("prediction" in result for result in expected[:200])
+    else:
+        assert stats["size"] == n_valid
+    assert np.isclose(stats["hit_rate"], stats["hits"] / (stats["hits"] + stats["misses"]))
+
+
+def test_disabled_cache_is_not_created():
+    assert create_prediction_cache(PredictionCacheConfig(enabled=False, max_size=10, ttl_seconds=1,
+                                                         key_mode="exact")) is None
+    with pytest.raises(ValueError, match="key mode"):
+        PredictionCache(max_size=10, ttl_seconds=1, key_mode="rounded")
@@ -0,0 +1,41 @@
+import gc
+import os
+from types import SimpleNamespace
+
+import threadpoolctl
+
+import serve
+from src.mlops_water_potability_prediction_project.classes.inference_bundle import InferenceBundle
+from tests.bundles import save_bundle, train_bundle
+
+
+def test_parent_preloads_the_model_before_forking(serving_app):
+    config = serving_app.frontend_config
+    mtime_ns = os.stat(config.inference_bundle).st_mtime_ns
+    save_bundle(config.inference_bundle, train_bundle(engine=False))
+    os.utime(config.inference_bundle, ns=(mtime_ns + 10 ** 9, mtime_ns + 10 ** 9))
+
+    try:
+        assert serve.PreforkServer({}, model_threads=1).load() is serving_app.app
+    finally:
+        gc.unfreeze()
+
+    # The workers inherit the unpickled model instead of each unpickling a copy
+    bundle = serving_app.frontend_predictor.artifact_cache.get().bundle
+    assert bundle.engine is None
+    assert bundle.__dict__["_model_pickle"] is None
+
+
+def test_forked_worker_caps_its_model_threads(serving_app, monkeypatch):
+    thread_limits = []
+    monkeypatch.setattr(threadpoolctl, "threadpool_limits", lambda limits=None: thread_limits.append(limits))
+    for env_var in serve.THREAD_ENV_VARS:
+        monkeypatch.setenv(env_var, "8")
+    monkeypatch.setattr(InferenceBundle, "model_thread_count", None)
+
+    serve.PreforkServer({}, model_threads=2).post_fork(server=None, worker=SimpleNamespace(pid=os.getpid()))
+
+    assert [os.environ[env_var] for env_var in serve.THREAD_ENV_VARS] == ["2", "2", "2"]
+    assert thread_limits == [2]
+    assert InferenceBundle.model_thread_count == 2
+    assert serving_app.warmup.is_ready()
@@ -0,0 +1,49 @@
+import json
+import pstats
+
+import pytest
+
+from src.mlops_water_potability_prediction_project.classes.stage_profiler import StageProfiler
+from src.mlops_water_potability_prediction_project.entity.config_entity import ProfilingConfig
+
+
+def allocate():
+    block = bytearray(8 * 1024 * 1024)
+    return len(block)
+
+
+def fail():
+    raise RuntimeError("The stage failed")
+
+
+def test_run_report_holds_every_stage(tmp_path):
+    profiler = StageProfiler(ProfilingConfig(report_dir=tmp_path, tracemalloc=True, cprofile=True))
+    assert profiler.run_stage("DATA CLEANING", allocate) == 8 * 1024 * 1024
+    profiler.record_skipped("DATA VALIDATION")
+    with pytest.raises(RuntimeError):
+        profiler.run_stage("MODEL TRAINER", fail)
+
+    report_path = profiler.write_report()
+    with open(report_path) as f:
+        report = json.load(f)
+    with open(tmp_path / "latest.json") as f:
+        assert json.load(f) == report
+
+    cleaning, validation, trainer = report["stages"]
+    assert [stage["status"] for stage in report["stages"]] == ["ran", "skipped", "failed"]
+    assert cleaning["python_peak_mb"] >= 8
+    assert cleaning["wall_s"] >= 0 and cleaning["cpu_s"] >= 0 and cleaning["peak_rss_mb"] > 0
+    assert validation == {"stage": "DATA VALIDATION", "status": "skipped"}
+    # The profile of every stage that ran is dumped next to the report, a failed stage included
+    for stage in (cleaning, trainer):
+        assert pstats.Stats(stage["profile"]).total_calls > 0
+
+    lines = profiler.summary_table().splitlines()
+    assert [line.split()[0] for line in lines] == ["stage", "DATA", "DATA", "MODEL", "TOTAL"]
+
+
+def test_tracemalloc_can_be_turned_off(tmp_path):
+    profiler = StageProfiler(ProfilingConfig(report_dir=tmp_path, tracemalloc=False, cprofile=False))
+    profiler.run_stage("DATA CLEANING", allocate)
+    assert profiler.stages[0]["python_peak_mb"] is None
+    assert "profile" not in profiler.stages[0]
@@ -0,0 +1,76 @@
+import io
+import json
+
+import pytest
+
+from src.mlops_water_potability_prediction_project.components.frontend import FrontendPrediction
+from src.mlops_water_potability_prediction_project.components.stream_scoring import InvalidCSVHeader, \
+    StreamingScorer
+from src.mlops_water_potability_prediction_project.entity.config_entity import StreamingConfig
+from tests.bundles import frontend_config, record, save_bundle
+
+
+def csv_upload(bundle, n_rows, columns=None):
+    columns = columns or bundle.feature_names
+    lines = [",".join(columns)] + [",".join(record(bundle, row)[col] for col in columns) for row in range(n_rows)]
+    return ("\r\n".join(lines) + "\r\n").encode("utf-8")
+
+
+@pytest.fixture
+def scorer(tmp_path, inference_bundle):
+    """
+    A streaming scorer with chunks growing from 3 to 10 rows.
+    """
+    config = frontend_config(tmp_path)
+    save_bundle(config.inference_bundle, inference_bundle)
+    return StreamingScorer(StreamingConfig(chunk_size=10, first_chunk_size=3),
+                           FrontendPrediction(config, record_metrics=False))
+
+
+def test_chunks_grow_up_to_the_chunk_size(scorer, inference_bundle):
+    artifacts = scorer.frontend_predictor.artifact_cache.get()
+    header, reader = scorer.open_csv(io.BytesIO(csv_upload(inference_bundle, 30)), artifacts)
+    assert [len(chunk) for chunk in scorer.iter_chunks(header, reader)] == [3, 6, 10, 10, 1]
+
+
+def test_streamed_results_equal_the_batch_results(scorer, inference_bundle):
+    artifacts = scorer.frontend_predictor.artifact_cache.get()
+    header, reader = scorer.open_csv(io.BytesIO(csv_upload(inference_bundle, 25)), artifacts)
+
+    lines = "".join(scorer.stream(header, reader, artifacts, "ndjson")).splitlines()
+
+    # The row numbers run on across the chunks
+    expected = scorer.frontend_predictor.batch_response([record(inference_bundle, row) for row in range(25)])
+    assert [json.loads(line) for line in lines] == expected
+
+
+def test_upload_without_the_feature_columns_is_rejected(scorer, inference_bundle):
+    artifacts = scorer.frontend_predictor.artifact_cache.get()
+    with pytest.raises(InvalidCSVHeader, match="missing columns: Turbidity"):
+        scorer.open_csv(io.BytesIO(csv_upload(inference_bundle, 2, columns=inference_bundle.feature_names[:-1])),
+                        artifacts)
+    with pytest.raises(InvalidCSVHeader, match="empty"):
+        scorer.open_csv(io.BytesIO(b""), artifacts)
+
+
+def test_stream_endpoint_accepts_a_body_or_a_file_upload(serving_app, inference_bundle):
+    client = serving_app.app.test_client()
+    upload = csv_upload(inference_bundle, 20)
+
+    def post(**kwargs):
+        # A streamed response holds its request context until it is read and closed
+        response = client.post("/predict/stream", **kwargs)
+        body = response.get_data(as_text=True)
+        response.close()
+        return response, body
+
+    response, from_body = post(data=upload, content_type="text/csv")
+    assert response.status_code == 200 and response.mimetype == "text/csv"
+    lines = from_body.splitlines()
+    assert lines[0] == "row,potability,prediction,errors"
+    assert len(lines) == 21
+    _, from_file = post(data={"file": (io.BytesIO(upload), "readings.csv")}, content_type="multipart/form-data")
+    assert from_file == from_body
+
+    assert post(query_string={"format": "xml"}, data=upload, content_type="text/csv")[0].status_code == 400
+    assert post(data=b"ph\r\n7\r\n", content_type="text/csv")[0].status_code == 400
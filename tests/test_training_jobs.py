@@ -0,0 +1,101 @@
+import json
+import queue
+import threading
+import time
+
+import pytest
+
+from src.mlops_water_potability_prediction_project.components import training_jobs
+from src.mlops_water_potability_prediction_project.components.training_jobs import TrainingAlreadyRunning, \
+    TrainingJobManager
+from src.mlops_water_potability_prediction_project.entity.config_entity import TrainingJobsConfig
+
+
+class ThreadProcess:
+    """
+    Runs the process target in a thread, so tests do not spawn interpreters.
+    """
+
+    def __init__(self, target, args, daemon):
+        self._thread = threading.Thread(target=target, args=args, daemon=daemon)
+        self.exitcode = 0
+
+    def start(self):
+        self._thread.start()
+
+    def is_alive(self):
+        return self._thread.is_alive()
+
+    def join(self):
+        self._thread.join()
+
+
+@pytest.fixture
+def finish_training(monkeypatch):
+    """
+    Replaces the training pipeline with two stages, the second one waiting for the returned event.
+    """
+    finish = threading.Event()
+
+    def run_training_pipeline(events):
+        events.put(("stages", ["DATA INGESTION", "MODEL TRAINER"]))
+        for stage_name in ("DATA INGESTION", "MODEL TRAINER"):
+            events.put(("stage_started", stage_name, time.time()))
+            if stage_name == "MODEL TRAINER":
+                finish.wait(timeout=10)
+            events.put(("stage_completed", stage_name, 0.0))
+        events.put(("succeeded",))
+
+    monkeypatch.setattr(training_jobs, "run_training_pipeline", run_training_pipeline)
+    return finish
+
+
+def make_manager(jobs_dir, on_success=None):
+    manager = TrainingJobManager(TrainingJobsConfig(jobs_dir=jobs_dir), on_success=on_success)
+    manager._context = type("ThreadContext", (), {"Queue": queue.Queue, "Process": ThreadProcess})()
+    return manager
+
+
+def wait_until(condition):
+    deadline = time.monotonic() + 10
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_jobs_are_shared_by_the_managers_of_all_workers(tmp_path, finish_training):
+    # Two workers of the pre-fork server, each with its own manager on the same jobs directory
+    swapped = []
+    first, second = make_manager(str(tmp_path), on_success=lambda: swapped.append(True)), make_manager(str(tmp_path))
+    job_id = first.start()["job_id"]
+
+    with pytest.raises(TrainingAlreadyRunning) as e:
+        second.start()
+    assert e.value.job_id == job_id
+    assert second.get(job_id)["status"] == "running"
+
+    finish_training.set()
+    wait_until(lambda: not second._is_locked())
+    job = second.get(job_id)
+    assert job["status"] == "succeeded"
+    assert [stage["status"] for stage in job["stages"]] == ["completed", "completed"]
+    assert swapped == [True]
+
+    # The lock is released with the job, any worker can start the next one
+    next_job_id = second.start()["job_id"]
+    wait_until(lambda: first.get(next_job_id)["status"] != "running")
+    assert first.get(next_job_id)["status"] == "succeeded"
+
+
+def test_job_of_a_dead_worker_is_reported_failed(tmp_path):
+    manager = make_manager(str(tmp_path))
+    job_id = "0" * 32
+    with open(tmp_path / f"{job_id}.json", 'w') as f:
+        json.dump(training_jobs.TrainingJob(job_id=job_id).to_dict(), f)
+
+    # Nobody holds the lock, so the job will never record how it ended
+    job = manager.get(job_id)
+    assert job["status"] == "failed"
+    assert job["error"] == "The server process running the job exited"
+    assert manager.get("1" * 32) is None
+    assert manager.get("../" + job_id) is None
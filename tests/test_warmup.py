@@ -0,0 +1,64 @@
+import dataclasses
+import time
+
+import pytest
+
+from src.mlops_water_potability_prediction_project.classes.prediction_cache import PredictionCache
+from src.mlops_water_potability_prediction_project.components.frontend import FrontendPrediction, STAGE_SECONDS, \
+    VALIDATION_ERRORS
+from src.mlops_water_potability_prediction_project.components.warmup import ServingWarmup
+from src.mlops_water_potability_prediction_project.entity.config_entity import WarmupConfig
+from tests.bundles import frontend_config, record, save_bundle
+
+WARMUP_CONFIG = WarmupConfig(enabled=True, n_predictions=4, batch_size=16, seed=0, retry_backoff_s=0.01,
+                             max_retry_backoff_s=0.05)
+
+
+def test_failed_warmup_is_retried(tmp_path, inference_bundle):
+    config = frontend_config(tmp_path)
+    warmup = ServingWarmup(WARMUP_CONFIG, FrontendPrediction(config))
+    warmup.start()
+
+    # No bundle was trained yet
+    assert not warmup.wait(timeout=10)
+    assert warmup.status()["status"] in ("failed", "running")
+
+    save_bundle(config.inference_bundle, inference_bundle)
+    deadline = time.monotonic() + 10
+    while not warmup.is_ready():
+        assert time.monotonic() < deadline, warmup.status()
+        time.sleep(0.01)
+    assert warmup.status()["error"] is None
+
+
+def test_warmup_leaves_the_prediction_cache_and_the_metrics_alone(tmp_path, inference_bundle):
+    config = frontend_config(tmp_path)
+    save_bundle(config.inference_bundle, inference_bundle)
+    prediction_cache = PredictionCache(max_size=100, ttl_seconds=60)
+    predictor = FrontendPrediction(config, prediction_cache=prediction_cache)
+    warmup = ServingWarmup(WARMUP_CONFIG, predictor)
+    predictor.batch_response([record(inference_bundle)])
+
+    stage_seconds, validation_errors = STAGE_SECONDS.collect(), VALIDATION_ERRORS.collect()
+    cache_stats = prediction_cache.stats()
+    warmup.start()
+    assert warmup.wait(timeout=30)
+
+    # The entry of the real request is still cached, and nothing of the warm-up was added or counted
+    assert prediction_cache.stats() == cache_stats
+    assert STAGE_SECONDS.collect() == stage_seconds
+    assert VALIDATION_ERRORS.collect() == validation_errors
+    predictor.batch_response([record(inference_bundle)])
+    assert prediction_cache.stats()["hits"] == cache_stats["hits"] + 1
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_ready_warmup_is_not_started_again(tmp_path, inference_bundle, enabled):
+    config = frontend_config(tmp_path)
+    save_bundle(config.inference_bundle, inference_bundle)
+    warmup = ServingWarmup(dataclasses.replace(WARMUP_CONFIG, enabled=enabled), FrontendPrediction(config))
+    warmup.start()
+    assert warmup.wait(timeout=30)
+    thread = warmup._thread
+    warmup.start()
+    assert warmup._thread is thread